@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark for the rate limiter window engines.
+Times can_make_request + record_request per call at growing request rates for each engine.
+"""
+
+import argparse
+import os
+import sys
+import time
+
+# Add backend to path so `src` imports resolve when run as a script
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from src.utils.rate_windows import ENGINES, create_window
+
+WINDOW_SECONDS = 60
+
+
+def time_engine(engine: str, requests_per_window: int) -> float:
+    """Microseconds per check-and-record once the window holds the given load."""
+    window = create_window(engine, requests_per_window * 2, WINDOW_SECONDS)
+    now = 1_000_000.0
+    step = WINDOW_SECONDS / requests_per_window
+    # Fill one full window so every timed call sees a steady-state window
+    for _ in range(requests_per_window):
+        now += step
+        window.add(now)
+
+    calls = min(requests_per_window, 2_000)
+    started = time.perf_counter()
+    for _ in range(calls):
+        now += step
+        window.usage(now)
+        window.add(now)
+    return (time.perf_counter() - started) / calls * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--rates",
+        type=int,
+        nargs="+",
+        default=[100, 1_000, 10_000, 100_000],
+        help="requests per 60-second window",
+    )
+    args = parser.parse_args()
+
+    print(f"{'requests/window':>16}" + "".join(f"{e:>16}" for e in ENGINES))
+    for rate in args.rates:
+        timings = [time_engine(engine, rate) for engine in ENGINES]
+        print(f"{rate:>16,}" + "".join(f"{t:>14.2f}us" for t in timings))
+
+
+if __name__ == "__main__":
+    main()
@@ -62,7 +62,7 @@ async def search_businesses(
             )
 
         # Execute search
-        result = service.search_businesses(request)
+        result = await service.search_businesses_async(request)
 
         # Handle error responses
         if isinstance(result, BusinessSearchError):
@@ -160,7 +160,7 @@ async def search_businesses_get(
             )
 
         # Execute search
-        result = service.search_businesses(request)
+        result = await service.search_businesses_async(request)
 
         # Handle error responses
         if isinstance(result, BusinessSearchError):
@@ -3,8 +3,10 @@ Website scoring API endpoints for Lighthouse integration.
 Provides endpoints for triggering website performance audits.
 """
 
-from fastapi import APIRouter, HTTPException, Depends, BackgroundTasks
-from typing import Optional
+from fastapi import APIRouter, HTTPException, Depends, BackgroundTasks, Query
+from fastapi.responses import StreamingResponse
+from typing import Dict, Optional
+import json
 import uuid
 import time
 from datetime import datetime
@@ -13,11 +15,21 @@ from src.schemas.website_scoring import (
     LighthouseAuditRequest,
     LighthouseAuditResponse,
     LighthouseAuditError,
+    AuditStrategy,
+    LighthouseBatchRequest,
+    LighthouseBatchStatus,
+    TrendBucket,
+    VitalsComparisonRequest,
+    VitalsComparisonResponse,
+    VitalsHistoryResponse,
+    VitalsTrendResponse,
     WebsiteScoringSummary,
     ConfidenceLevel,
     HeuristicEvaluationRequest,
     HeuristicEvaluationResponse,
     HeuristicEvaluationError,
+    HeuristicBatchRequest,
+    HeuristicBatchSummary,
     FallbackScoringRequest,
     FallbackScoringResponse,
     FallbackScoringError,
@@ -25,12 +37,26 @@ from src.schemas.website_scoring import (
     FallbackScore,
     ScoreValidationRequest,
     ScoreValidationResponse,
+    WebsiteScoringRequest,
+    WebsiteScoringResponse,
 )
 from src.services.lighthouse_service import LighthouseService
+from src.services.lighthouse_scheduler import (
+    LighthouseBatchScheduler,
+    get_lighthouse_scheduler,
+)
 from src.services.heuristic_evaluation_service import HeuristicEvaluationService
 from src.services.fallback_scoring_service import FallbackScoringService
 from src.services.score_validation_service import ScoreValidationService
-from src.services.rate_limiter import RateLimiter
+from src.services.scoring_pipeline_service import ScoringPipelineService
+from src.services.rate_limiter import (
+    RateLimiter,
+    get_rate_limiter as get_shared_rate_limiter,
+)
+from src.utils.deadline import Deadline
+from src.utils.latency import summarize_latencies
+from src.utils.single_flight import get_single_flight
+from src.utils.vitals_history import VitalsHistoryStore, get_vitals_history_store
 
 router = APIRouter(prefix="/website-scoring", tags=["website-scoring"])
 
@@ -46,6 +72,16 @@ def get_lighthouse_service() -> LighthouseService:
     return LighthouseService()
 
 
+def get_lighthouse_batch_scheduler() -> LighthouseBatchScheduler:
+    """Dependency to get the process-wide Lighthouse batch scheduler."""
+    return get_lighthouse_scheduler()
+
+
+def get_vitals_history() -> VitalsHistoryStore:
+    """Dependency to get the process-wide web-vitals history."""
+    return get_vitals_history_store()
+
+
 def get_heuristic_evaluation_service() -> HeuristicEvaluationService:
     """Dependency to get HeuristicEvaluationService instance."""
     return HeuristicEvaluationService()
@@ -61,15 +97,19 @@ def get_score_validation_service() -> ScoreValidationService:
     return ScoreValidationService()
 
 
+def get_scoring_pipeline_service() -> ScoringPipelineService:
+    """Dependency to get ScoringPipelineService instance."""
+    return ScoringPipelineService()
+
+
 def get_rate_limiter() -> RateLimiter:
-    """Dependency to get RateLimiter instance."""
-    return RateLimiter()
+    """Dependency to get the process-wide RateLimiter instance."""
+    return get_shared_rate_limiter()
 
 
 @router.post("/lighthouse", response_model=LighthouseAuditResponse)
 async def run_lighthouse_audit(
     request: LighthouseAuditRequest,
-    background_tasks: BackgroundTasks,
     service: LighthouseService = Depends(get_lighthouse_service),
 ) -> LighthouseAuditResponse:
     """
@@ -77,7 +117,6 @@ async def run_lighthouse_audit(
 
     Args:
         request: Lighthouse audit request with website URL and parameters
-        background_tasks: FastAPI background tasks for async processing
         service: Lighthouse service instance
 
     Returns:
@@ -97,12 +136,13 @@ async def run_lighthouse_audit(
                 status_code=400, detail="Invalid Lighthouse audit request"
             )
 
-        # Execute audit
-        audit_result = service.run_lighthouse_audit(
+        # Execute audit without blocking the event loop
+        audit_result = await service.run_lighthouse_audit_async(
             website_url=str(request.website_url),
             business_id=request.business_id,
             run_id=request.run_id,
             strategy=request.strategy.value,
+            deadline=Deadline.optional(request.deadline_seconds),
         )
 
         # Handle error responses
@@ -187,14 +227,14 @@ async def run_lighthouse_audit(
             },
             core_web_vitals=audit_result.get("core_web_vitals", {}),
             confidence=ConfidenceLevel(audit_result.get("confidence", "low")),
+            audit_summary=audit_result.get("audit_summary"),
+            raw_data_ref=audit_result.get("raw_data_ref"),
+            cache_status=audit_result.get("cache_status"),
+            fallback_used=audit_result.get("fallback_used", False),
+            estimated=audit_result.get("estimated", False),
             raw_data=audit_result.get("raw_data"),
         )
 
-        # Add background task for data persistence (if database is configured)
-        background_tasks.add_task(
-            _persist_audit_results, audit_result, request.business_id, request.run_id
-        )
-
         return response
 
     except HTTPException:
@@ -206,6 +246,169 @@ async def run_lighthouse_audit(
         )
 
 
+@router.post(
+    "/lighthouse/batch", response_model=LighthouseBatchStatus, status_code=202
+)
+async def queue_lighthouse_batch(
+    request: LighthouseBatchRequest,
+    scheduler: LighthouseBatchScheduler = Depends(get_lighthouse_batch_scheduler),
+) -> LighthouseBatchStatus:
+    """
+    Queue Lighthouse audits for a list of websites.
+
+    Audits are dispatched in the background as fast as the PageSpeed Insights
+    per-minute and per-day quotas allow; interactive batches go ahead of
+    queued batch work. Poll ``/lighthouse/batch/{batch_id}`` for progress.
+
+    Args:
+        request: Websites to audit, strategy and priority
+        scheduler: Lighthouse batch scheduler
+
+    Returns:
+        Initial batch status with its batch_id and ETA
+    """
+    status = await scheduler.submit_batch(
+        [(str(item.website_url), item.business_id) for item in request.items],
+        strategy=request.strategy.value,
+        priority=request.priority,
+        run_id=request.run_id or str(uuid.uuid4()),
+    )
+    return LighthouseBatchStatus(**status)
+
+
+@router.get("/lighthouse/batch/{batch_id}", response_model=LighthouseBatchStatus)
+async def get_lighthouse_batch(
+    batch_id: str,
+    include_results: bool = False,
+    scheduler: LighthouseBatchScheduler = Depends(get_lighthouse_batch_scheduler),
+) -> LighthouseBatchStatus:
+    """
+    Get progress, ETA and optionally per-website results of a queued batch.
+
+    Raises:
+        HTTPException: 404 for an unknown batch
+    """
+    status = scheduler.get_batch_status(batch_id, include_results=include_results)
+    if status is None:
+        raise HTTPException(status_code=404, detail=f"Unknown batch: {batch_id}")
+    return LighthouseBatchStatus(**status)
+
+
+@router.get("/lighthouse/scheduler")
+async def get_lighthouse_scheduler_stats(
+    scheduler: LighthouseBatchScheduler = Depends(get_lighthouse_batch_scheduler),
+) -> dict:
+    """
+    Get queue depth, throughput, quota usage and ETA of the Lighthouse scheduler.
+    """
+    return {"timestamp": time.time(), **scheduler.get_stats()}
+
+
+@router.post("/lighthouse/history/compare", response_model=VitalsComparisonResponse)
+def compare_lighthouse_history(
+    request: VitalsComparisonRequest,
+    history: VitalsHistoryStore = Depends(get_vitals_history),
+) -> VitalsComparisonResponse:
+    """
+    Compare recorded scores before and after a change, for many businesses.
+
+    Averages every metric over ``window_days`` on each side of the pivot
+    from recorded audits; PageSpeed Insights is not called. Declared sync so
+    FastAPI runs the SQLite queries in its threadpool, off the event loop.
+
+    Args:
+        request: Businesses, pivot time, window and optional strategy
+        history: Web-vitals history
+
+    Returns:
+        Before/after averages, audit counts and change per business
+    """
+    comparisons = history.compare(
+        request.business_ids,
+        request.pivot_timestamp,
+        request.window_days * 86_400.0,
+        strategy=request.strategy.value if request.strategy else None,
+    )
+    return VitalsComparisonResponse(
+        pivot_timestamp=request.pivot_timestamp,
+        window_days=request.window_days,
+        comparisons=comparisons,
+    )
+
+
+@router.get("/lighthouse/{business_id}/history", response_model=VitalsHistoryResponse)
+def get_lighthouse_history(
+    business_id: str,
+    website_url: Optional[str] = None,
+    strategy: Optional[AuditStrategy] = None,
+    start: Optional[float] = None,
+    end: Optional[float] = None,
+    limit: int = Query(1000, ge=1, le=10_000),
+    history: VitalsHistoryStore = Depends(get_vitals_history),
+) -> VitalsHistoryResponse:
+    """
+    Get recorded Lighthouse scores and Core Web Vitals of a business.
+
+    Args:
+        business_id: Business identifier
+        website_url: Only audits of this URL
+        strategy: Only audits of this strategy
+        start: Earliest Unix time, inclusive
+        end: Latest Unix time, exclusive
+        limit: Most recent audits to return at most
+        history: Web-vitals history
+
+    Returns:
+        Recorded audits, oldest first
+    """
+    points = history.history(
+        business_id,
+        website_url=website_url,
+        strategy=strategy.value if strategy else None,
+        start=start,
+        end=end,
+        limit=limit,
+    )
+    return VitalsHistoryResponse(business_id=business_id, points=points)
+
+
+@router.get("/lighthouse/{business_id}/trend", response_model=VitalsTrendResponse)
+def get_lighthouse_trend(
+    business_id: str,
+    bucket: TrendBucket = TrendBucket.WEEK,
+    website_url: Optional[str] = None,
+    strategy: Optional[AuditStrategy] = None,
+    start: Optional[float] = None,
+    end: Optional[float] = None,
+    history: VitalsHistoryStore = Depends(get_vitals_history),
+) -> VitalsTrendResponse:
+    """
+    Get recorded scores of a business down-sampled to hourly, daily, weekly
+    or monthly averages.
+
+    Args:
+        business_id: Business identifier
+        bucket: Bucket width
+        website_url: Only audits of this URL
+        strategy: Only audits of this strategy
+        start: Earliest Unix time, inclusive
+        end: Latest Unix time, exclusive
+        history: Web-vitals history
+
+    Returns:
+        Per-bucket averages and a trend summary of the overall score
+    """
+    trend = history.trend(
+        business_id,
+        website_url=website_url,
+        strategy=strategy.value if strategy else None,
+        start=start,
+        end=end,
+        bucket=bucket.value,
+    )
+    return VitalsTrendResponse(**trend)
+
+
 @router.post("/heuristics", response_model=HeuristicEvaluationResponse)
 async def run_heuristic_evaluation(
     request: HeuristicEvaluationRequest,
@@ -237,39 +440,21 @@ async def run_heuristic_evaluation(
                 status_code=400, detail="Invalid heuristic evaluation request"
             )
 
-        # Execute evaluation
-        evaluation_result = service.run_heuristic_evaluation(
+        # Execute evaluation without blocking the event loop
+        evaluation_result = await service.run_heuristic_evaluation_async(
             website_url=str(request.website_url),
             business_id=request.business_id,
             run_id=request.run_id,
+            crawl=request.crawl,
         )
 
         # Handle error responses
         if not evaluation_result.get("success", False):
-            HeuristicEvaluationError(
-                success=False,
-                error=evaluation_result.get("error", "Unknown error occurred"),
-                context=evaluation_result.get("context", "evaluation_execution"),
-                website_url=str(request.website_url),
-                business_id=request.business_id,
-                run_id=request.run_id,
-                evaluation_timestamp=time.time(),
-                error_code=evaluation_result.get("error_code"),
-                scores={
-                    "trust_score": 0.0,
-                    "cro_score": 0.0,
-                    "mobile_score": 0.0,
-                    "content_score": 0.0,
-                    "social_score": 0.0,
-                    "overall_heuristic_score": 0.0,
-                    "confidence_level": ConfidenceLevel.LOW,
-                },
-                trust_signals={},
-                cro_elements={},
-                mobile_usability={},
-                content_quality={},
-                social_proof={},
-                confidence=ConfidenceLevel.LOW,
+            _heuristic_error(
+                evaluation_result,
+                str(request.website_url),
+                request.business_id,
+                request.run_id,
             )
 
             # Return error response with appropriate HTTP status
@@ -313,22 +498,11 @@ async def run_heuristic_evaluation(
                 )
 
         # Create successful response
-        response = HeuristicEvaluationResponse(
-            success=True,
-            website_url=str(request.website_url),
-            business_id=request.business_id,
-            run_id=request.run_id,
-            evaluation_timestamp=evaluation_result.get(
-                "evaluation_timestamp", time.time()
-            ),
-            scores=evaluation_result.get("scores"),
-            trust_signals=evaluation_result.get("trust_signals"),
-            cro_elements=evaluation_result.get("cro_elements"),
-            mobile_usability=evaluation_result.get("mobile_usability"),
-            content_quality=evaluation_result.get("content_quality"),
-            social_proof=evaluation_result.get("social_proof"),
-            confidence=ConfidenceLevel(evaluation_result.get("confidence", "low")),
-            raw_data=evaluation_result.get("raw_data"),
+        response = _heuristic_response(
+            evaluation_result,
+            str(request.website_url),
+            request.business_id,
+            request.run_id,
         )
 
         # Add background task for data persistence (if database is configured)
@@ -350,6 +524,139 @@ async def run_heuristic_evaluation(
         )
 
 
+@router.post("/heuristics/batch")
+async def run_heuristic_evaluation_batch(
+    request: HeuristicBatchRequest,
+    background_tasks: BackgroundTasks,
+    service: HeuristicEvaluationService = Depends(get_heuristic_evaluation_service),
+) -> StreamingResponse:
+    """
+    Run heuristic evaluation for many websites, streaming results as NDJSON.
+
+    Each line is a HeuristicEvaluationResponse or HeuristicEvaluationError,
+    written as soon as that website finishes, so lines arrive in completion
+    order rather than request order. The last line is a HeuristicBatchSummary
+    with success counts and latency percentiles.
+
+    Args:
+        request: Websites to evaluate and batch parameters
+        background_tasks: FastAPI background tasks for result persistence
+        service: Heuristic evaluation service instance
+
+    Returns:
+        Streaming ``application/x-ndjson`` response
+    """
+    run_id = request.run_id or str(uuid.uuid4())
+    items = [(item.business_id, str(item.website_url)) for item in request.items]
+
+    async def generate_lines():
+        started = time.perf_counter()
+        latencies = []
+        error_codes: Dict[str, int] = {}
+        succeeded = 0
+
+        try:
+            async for index, result, elapsed in service.evaluate_stream(
+                items,
+                run_id=run_id,
+                max_concurrency=request.max_concurrency,
+                crawl=request.crawl,
+            ):
+                business_id, website_url = items[index]
+                latencies.append(elapsed)
+                if result.get("success", False):
+                    succeeded += 1
+                    line = _heuristic_response(
+                        result, website_url, business_id, run_id
+                    )
+                    background_tasks.add_task(
+                        _persist_heuristic_results, result, business_id, run_id
+                    )
+                else:
+                    error_code = result.get("error_code") or "UNKNOWN_ERROR"
+                    error_codes[error_code] = error_codes.get(error_code, 0) + 1
+                    line = _heuristic_error(result, website_url, business_id, run_id)
+                yield line.model_dump_json() + "\n"
+        except Exception as e:
+            # Headers are already sent; report the failure in-band
+            yield json.dumps(
+                {
+                    "success": False,
+                    "error": f"Batch heuristic evaluation aborted: {str(e)}",
+                    "error_code": "BATCH_ABORTED",
+                    "context": "batch_evaluation",
+                    "run_id": run_id,
+                }
+            ) + "\n"
+
+        summary = HeuristicBatchSummary(
+            run_id=run_id,
+            total=len(items),
+            succeeded=succeeded,
+            failed=len(latencies) - succeeded,
+            elapsed_seconds=time.perf_counter() - started,
+            latency_seconds=summarize_latencies(latencies),
+            error_codes=error_codes,
+        )
+        yield summary.model_dump_json() + "\n"
+
+    return StreamingResponse(generate_lines(), media_type="application/x-ndjson")
+
+
+def _heuristic_response(
+    evaluation_result: dict, website_url: str, business_id: str, run_id: str
+) -> HeuristicEvaluationResponse:
+    """Build the API response for a successful heuristic evaluation."""
+    return HeuristicEvaluationResponse(
+        success=True,
+        website_url=website_url,
+        business_id=business_id,
+        run_id=run_id,
+        evaluation_timestamp=evaluation_result.get(
+            "evaluation_timestamp", time.time()
+        ),
+        scores=evaluation_result.get("scores"),
+        trust_signals=evaluation_result.get("trust_signals"),
+        cro_elements=evaluation_result.get("cro_elements"),
+        mobile_usability=evaluation_result.get("mobile_usability"),
+        content_quality=evaluation_result.get("content_quality"),
+        social_proof=evaluation_result.get("social_proof"),
+        confidence=ConfidenceLevel(evaluation_result.get("confidence", "low")),
+        raw_data=evaluation_result.get("raw_data"),
+    )
+
+
+def _heuristic_error(
+    evaluation_result: dict, website_url: str, business_id: str, run_id: str
+) -> HeuristicEvaluationError:
+    """Build the error model for a failed heuristic evaluation."""
+    return HeuristicEvaluationError(
+        success=False,
+        error=evaluation_result.get("error", "Unknown error occurred"),
+        context=evaluation_result.get("context", "evaluation_execution"),
+        website_url=website_url,
+        business_id=business_id,
+        run_id=run_id,
+        evaluation_timestamp=time.time(),
+        error_code=evaluation_result.get("error_code"),
+        scores={
+            "trust_score": 0.0,
+            "cro_score": 0.0,
+            "mobile_score": 0.0,
+            "content_score": 0.0,
+            "social_score": 0.0,
+            "overall_heuristic_score": 0.0,
+            "confidence_level": ConfidenceLevel.LOW,
+        },
+        trust_signals={},
+        cro_elements={},
+        mobile_usability={},
+        content_quality={},
+        social_proof={},
+        confidence=ConfidenceLevel.LOW,
+    )
+
+
 @router.post("/fallback", response_model=FallbackScoringResponse)
 async def run_fallback_scoring(
     request: FallbackScoringRequest,
@@ -382,7 +689,7 @@ async def run_fallback_scoring(
             )
 
         # Execute fallback scoring
-        fallback_result = service.run_fallback_scoring(
+        fallback_result = await service.run_fallback_scoring_async(
             website_url=str(request.website_url),
             business_id=request.business_id,
             lighthouse_failure_reason=request.lighthouse_failure_reason,
@@ -481,6 +788,7 @@ async def run_fallback_scoring(
             fallback_reason=fallback_result.get("fallback_reason"),
             fallback_quality=fallback_result.get("fallback_quality"),
             retry_attempts=fallback_result.get("retry_attempts", 0),
+            recovered_audit=fallback_result.get("recovered_audit"),
         )
 
         # Add background task for data persistence (if database is configured)
@@ -542,6 +850,18 @@ async def get_fallback_monitoring(
         )
 
 
+@router.get("/metrics/deduplication")
+async def get_deduplication_metrics() -> dict:
+    """
+    Get request coalescing counters for the scoring services.
+
+    Returns:
+        Calls, executions and deduplicated calls per service, and the number
+        of executions currently in flight
+    """
+    return {"timestamp": time.time(), **get_single_flight().get_stats()}
+
+
 @router.get("/lighthouse/{business_id}/summary", response_model=WebsiteScoringSummary)
 async def get_website_scoring_summary(
     business_id: str,
@@ -662,6 +982,84 @@ async def validate_website_scores(
         )
 
 
+@router.post("/score", response_model=WebsiteScoringResponse)
+async def score_website(
+    request: WebsiteScoringRequest,
+    background_tasks: BackgroundTasks,
+    service: ScoringPipelineService = Depends(get_scoring_pipeline_service),
+) -> WebsiteScoringResponse:
+    """
+    Score a website with Lighthouse, heuristics and score validation in one call.
+
+    The Lighthouse audit and heuristic evaluation run concurrently; if the
+    audit fails, the heuristic result is used for fallback scoring.
+
+    Args:
+        request: Website scoring request with website URL and parameters
+        background_tasks: FastAPI background tasks for async processing
+        service: Scoring pipeline service instance
+
+    Returns:
+        Combined scoring response
+
+    Raises:
+        HTTPException: If neither scoring method succeeds
+    """
+    try:
+        # Generate run_id if not provided
+        if not request.run_id:
+            request.run_id = str(uuid.uuid4())
+
+        if not request.business_id or not request.website_url.startswith(
+            ("http://", "https://")
+        ):
+            raise HTTPException(
+                status_code=400, detail="Invalid website scoring request"
+            )
+
+        scoring_result = await service.score_website(
+            website_url=request.website_url,
+            business_id=request.business_id,
+            run_id=request.run_id,
+            strategy=request.strategy.value,
+            deadline=Deadline.optional(request.deadline_seconds),
+        )
+
+        if not scoring_result.get("success", False):
+            status_code = {"TIMEOUT": 408, "RATE_LIMIT_EXCEEDED": 429}.get(
+                scoring_result.get("error_code"), 400
+            )
+            raise HTTPException(
+                status_code=status_code,
+                detail={
+                    "error": scoring_result.get("error", "Scoring failed"),
+                    "error_code": scoring_result.get("error_code"),
+                    "context": scoring_result.get("context", "scoring_pipeline"),
+                    "website_url": request.website_url,
+                    "business_id": request.business_id,
+                    "run_id": request.run_id,
+                },
+            )
+
+        if scoring_result.get("validation_result") is not None:
+            background_tasks.add_task(
+                _persist_validation_results,
+                scoring_result["validation_result"].model_dump(),
+                request.business_id,
+                request.run_id,
+            )
+
+        return WebsiteScoringResponse(**scoring_result)
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Internal server error during website scoring: {str(e)}",
+        )
+
+
 @router.get("/health")
 async def website_scoring_health_check(
     lighthouse_service: LighthouseService = Depends(get_lighthouse_service),
@@ -716,34 +1114,6 @@ async def website_scoring_health_check(
         )
 
 
-async def _persist_audit_results(
-    audit_result: dict, business_id: str, run_id: str
-) -> None:
-    """
-    Background task to persist audit results to database.
-
-    Args:
-        audit_result: Audit result data
-        business_id: Business identifier
-        run_id: Run identifier
-    """
-    try:
-        # This would typically save to database using the models
-        # For now, just log the persistence attempt
-        print(f"Would persist audit results for business {business_id}, run {run_id}")
-
-        # Example of what would be saved:
-        # website_score = WebsiteScore.from_schema_data(audit_result)
-        # audit_result_model = LighthouseAuditResult.from_schema_data(audit_result)
-        # database.session.add(website_score)
-        # database.session.add(audit_result_model)
-        # database.session.commit()
-
-    except Exception as e:
-        # Log error but don't fail the main request
-        print(f"Failed to persist audit results: {str(e)}")
-
-
 async def _persist_heuristic_results(
     evaluation_result: dict, business_id: str, run_id: str
 ) -> None:
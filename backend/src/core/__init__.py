@@ -2,7 +2,13 @@
 Core application logic and configuration
 """
 
-from .config import settings, validate_environment, get_api_config
+from .config import settings, validate_environment, get_api_config, get_data_path
 from .base_service import BaseService
 
-__all__ = ["settings", "validate_environment", "get_api_config", "BaseService"]
+__all__ = [
+    "settings",
+    "validate_environment",
+    "get_api_config",
+    "get_data_path",
+    "BaseService",
+]
@@ -7,31 +7,42 @@ import logging
 from typing import Any, Dict, Optional
 from abc import ABC, abstractmethod
 
+from src.utils.structured_logging import (
+    configure_service_logging,
+    get_log_sampler,
+    get_service_logger,
+)
+
+from .config import get_api_config
+
 
 class BaseService(ABC):
     """Base class for all business logic services."""
 
     def __init__(self, service_name: str):
         self.service_name = service_name
-        self.logger = self._setup_logger()
-
-    def _setup_logger(self) -> logging.Logger:
-        """Set up structured logging for the service."""
-        logger = logging.getLogger(f"{self.__class__.__name__}")
-        logger.setLevel(logging.INFO)
-
-        # Create formatter for basic logging (without custom fields)
-        formatter = logging.Formatter(
-            "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+        config = get_api_config()
+        self.logger = self._setup_logger(config.LOG_LEVEL, config.LOG_FORMAT)
+        self.log_sampler = get_log_sampler(
+            service_name, config.LOG_SAMPLE_RATES.get(service_name, 1.0)
         )
 
-        # Add handler if not already present
-        if not logger.handlers:
-            handler = logging.StreamHandler()
-            handler.setFormatter(formatter)
-            logger.addHandler(handler)
+    def _setup_logger(self, level: str = "INFO", fmt: str = "json") -> logging.Logger:
+        """Get the class's logger; records go through the shared queue handler."""
+        # A no-op once the first service has configured the handler
+        configure_service_logging(level, fmt)
+        return get_service_logger(self.__class__.__name__)
 
-        return logger
+    def _log_fields(
+        self,
+        run_id: Optional[str],
+        business_id: Optional[str],
+        kwargs: Dict[str, Any],
+    ) -> Dict[str, Any]:
+        fields = {"runId": run_id, "businessId": business_id}
+        fields["agentName"] = self.service_name
+        fields.update(kwargs)
+        return {key: value for key, value in fields.items() if value is not None}
 
     def log_operation(
         self,
@@ -40,26 +51,20 @@ class BaseService(ABC):
         business_id: Optional[str] = None,
         **kwargs,
     ):
-        """Log an operation with structured data."""
-        # Create a structured message with the extra information
-        extra_info = []
-        if run_id:
-            extra_info.append(f"runId:{run_id}")
-        if business_id:
-            extra_info.append(f"businessId:{business_id}")
-        extra_info.append(f"agentName:{self.service_name}")
-
-        # Add any additional kwargs
-        for key, value in kwargs.items():
-            if value is not None:
-                extra_info.append(f"{key}:{value}")
-
-        # Create the full message
-        message = f"Operation: {operation}"
-        if extra_info:
-            message += f" | {' | '.join(extra_info)}"
-
-        self.logger.info(message)
+        """
+        Log an operation with structured data.
+
+        Nothing is built unless INFO is enabled and the service's sampler
+        keeps the record, so pass variable details as keyword fields rather
+        than formatting them into ``operation``.
+        """
+        if not self.logger.isEnabledFor(logging.INFO) or not self.log_sampler.keep():
+            return
+        self.logger.info(
+            "Operation: %s",
+            operation,
+            extra={"fields": self._log_fields(run_id, business_id, kwargs)},
+        )
 
     def log_error(
         self,
@@ -69,26 +74,15 @@ class BaseService(ABC):
         business_id: Optional[str] = None,
         **kwargs,
     ):
-        """Log an error with structured data."""
-        # Create a structured message with the extra information
-        extra_info = []
-        if run_id:
-            extra_info.append(f"runId:{run_id}")
-        if business_id:
-            extra_info.append(f"businessId:{business_id}")
-        extra_info.append(f"agentName:{self.service_name}")
-
-        # Add any additional kwargs
-        for key, value in kwargs.items():
-            if value is not None:
-                extra_info.append(f"{key}:{value}")
-
-        # Create the full message
-        message = f"Error in {operation}: {str(error)}"
-        if extra_info:
-            message += f" | {' | '.join(extra_info)}"
-
-        self.logger.error(message)
+        """Log an error with structured data; errors are never sampled."""
+        if not self.logger.isEnabledFor(logging.ERROR):
+            return
+        self.logger.error(
+            "Error in %s: %s",
+            operation,
+            error,
+            extra={"fields": self._log_fields(run_id, business_id, kwargs)},
+        )
 
     @abstractmethod
     def validate_input(self, data: Any) -> bool:
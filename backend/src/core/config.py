@@ -4,7 +4,9 @@ Handles environment variables, API keys, and rate limiting settings.
 """
 
 import os
+import tempfile
 from pathlib import Path
+from typing import Optional
 from pydantic_settings import BaseSettings
 from pydantic import field_validator, ConfigDict
 from dotenv import load_dotenv
@@ -32,10 +34,38 @@ class APIConfig(BaseSettings):
     YELP_FUSION_RATE_LIMIT_PER_DAY: int = 5000
     LIGHTHOUSE_RATE_LIMIT_PER_DAY: int = 25000
     LIGHTHOUSE_RATE_LIMIT_PER_MINUTE: int = 240
+    RATE_LIMITER_ENGINE: str = "sliding_window"  # or "token_bucket", "exact"
+    RATE_LIMITER_STORE: str = "memory"  # "sqlite" or "redis" to share across workers
+    RATE_LIMITER_STORE_PATH: str = ""  # sqlite file; defaults to one under DATA_DIR
+    RATE_LIMITER_REDIS_URL: str = "redis://localhost:6379/0"
+    RATE_LIMITER_KEY_PREFIX: str = "leadgen:ratelimit"
+    RATE_LIMITER_ACQUIRE_TIMEOUT_SECONDS: float = 30.0  # longest wait for capacity
 
     # Heuristic Evaluation Configuration
     HEURISTICS_RATE_LIMIT_PER_MINUTE: int = 60
     HEURISTICS_EVALUATION_TIMEOUT_SECONDS: int = 15
+    HEURISTICS_HTML_PARSER: str = "streaming"  # "streaming" or "bs4" (reference)
+    HEURISTICS_MAX_CONCURRENCY: int = 50
+    HEURISTICS_MAX_PAGE_BYTES: int = 5_000_000  # larger pages are truncated
+    HEURISTICS_MAX_CONNECTIONS: int = 100
+    HEURISTICS_MAX_CONNECTIONS_PER_HOST: int = 4
+    HEURISTICS_KEEPALIVE_EXPIRY_SECONDS: float = 30.0
+    HEURISTICS_DNS_CACHE_TTL_SECONDS: int = 300
+    HEURISTICS_HTTP2_ENABLED: bool = True
+    HEURISTICS_FETCH_CACHE_ENABLED: bool = True
+    HEURISTICS_FETCH_CACHE_DIR: str = ""  # defaults to a directory under DATA_DIR
+    HEURISTICS_FETCH_CACHE_TTL_SECONDS: int = 3600  # revalidate older pages
+    HEURISTICS_FETCH_CACHE_MAX_BYTES: int = 256 * 1024 * 1024
+    HEURISTICS_RESULT_CACHE_ENABLED: bool = True
+    HEURISTICS_RESULT_CACHE_MAX_ENTRIES: int = 10_000  # in-process LRU tier
+    HEURISTICS_RESULT_CACHE_BACKEND: str = "sqlite"  # persistent tier, "" for none
+    HEURISTICS_RESULT_CACHE_PATH: str = ""  # defaults to a file under DATA_DIR
+    HEURISTICS_RESULT_CACHE_MAX_PERSISTED: int = 100_000
+    HEURISTICS_CRAWL_ENABLED: bool = False  # also evaluate linked policy/contact pages
+    HEURISTICS_CRAWL_MAX_PAGES: int = 5  # linked pages besides the landing page
+    HEURISTICS_CRAWL_TIME_BUDGET_SECONDS: float = 10.0
+    HEURISTICS_PROCESS_POOL_WORKERS: int = 0  # 0 scores in threads instead
+    HEURISTICS_PROCESS_POOL_MAX_TASKS_PER_WORKER: int = 500  # then recycle
     FALLBACK_RATE_LIMIT_PER_MINUTE: int = 120
 
     # API Timeout Settings
@@ -44,11 +74,60 @@ class APIConfig(BaseSettings):
     LIGHTHOUSE_CONNECT_TIMEOUT_SECONDS: int = 10
     LIGHTHOUSE_READ_TIMEOUT_SECONDS: int = 25
     LIGHTHOUSE_FALLBACK_TIMEOUT_SECONDS: int = 15
+    LIGHTHOUSE_RECOVERY_PROBE_ENABLED: bool = True  # local timing probe on timeouts
+    LIGHTHOUSE_RECOVERY_PROBE_TIMEOUT_SECONDS: float = 5.0
+    LIGHTHOUSE_RECOVERY_PROBE_MAX_BYTES: int = 2_000_000
+    LIGHTHOUSE_MAX_CONNECTIONS: int = 20  # pooled PageSpeed Insights connections
+    LIGHTHOUSE_BACKEND: str = "psi"  # "local" runs async audits on this host
+    LIGHTHOUSE_LOCAL_COMMAND: str = "lighthouse"  # e.g. "npx lighthouse"
+    LIGHTHOUSE_LOCAL_CHROME_COMMAND: str = "google-chrome"
+    LIGHTHOUSE_LOCAL_POOL_SIZE: int = 4  # concurrent Chrome instances
+    LIGHTHOUSE_LOCAL_RECYCLE_AFTER: int = 50  # audits per Chrome instance
+    LIGHTHOUSE_LOCAL_TIMEOUT_SECONDS: float = 90.0
+    LIGHTHOUSE_RETRY_ATTEMPTS: int = 3
+    LIGHTHOUSE_RETRY_BACKOFF_SECONDS: float = 1.0  # doubled per retry, with jitter
+    LIGHTHOUSE_RETRY_MAX_BACKOFF_SECONDS: float = 10.0
+    LIGHTHOUSE_ADAPTIVE_TIMEOUT_ENABLED: bool = True  # derive from observed latency
+    LIGHTHOUSE_ADAPTIVE_TIMEOUT_PERCENTILE: float = 99.0
+    LIGHTHOUSE_ADAPTIVE_TIMEOUT_MULTIPLIER: float = 1.5  # headroom over the percentile
+    LIGHTHOUSE_ADAPTIVE_TIMEOUT_MIN_SECONDS: float = 5.0  # read timeout is the ceiling
+    LIGHTHOUSE_ADAPTIVE_TIMEOUT_MIN_SAMPLES: int = 20  # per host, then overall
+    LIGHTHOUSE_LATENCY_WINDOW: int = 200  # recent samples kept per host
+    LIGHTHOUSE_INCLUDE_RAW_DATA: bool = False  # return full PSI payloads in results
+    LIGHTHOUSE_PROJECTION_MAX_AUDITS: int = 20  # failing audits/opportunities kept
+    LIGHTHOUSE_PAYLOAD_STORE_ENABLED: bool = False  # keep compressed full payloads
+    LIGHTHOUSE_PAYLOAD_STORE_PATH: str = ""  # defaults to a file under DATA_DIR
+    LIGHTHOUSE_PAYLOAD_STORE_MAX_ENTRIES: int = 50_000
+    LIGHTHOUSE_CACHE_ENABLED: bool = True
+    LIGHTHOUSE_CACHE_TTL_SECONDS: int = 86_400
+    LIGHTHOUSE_CACHE_MOBILE_TTL_SECONDS: int = 0  # 0 uses the default TTL above
+    LIGHTHOUSE_CACHE_DESKTOP_TTL_SECONDS: int = 0
+    LIGHTHOUSE_CACHE_STALE_SECONDS: int = 604_800  # serve stale while refreshing
+    LIGHTHOUSE_CACHE_MAX_ENTRIES: int = 10_000  # in-process tier
+    LIGHTHOUSE_CACHE_BACKEND: str = "sqlite"  # persistent tier; empty for memory only
+    LIGHTHOUSE_CACHE_PATH: str = ""  # defaults to a file under DATA_DIR
+    LIGHTHOUSE_CACHE_MAX_PERSISTED: int = 100_000
+    LIGHTHOUSE_SCHEDULER_BURST: int = 10  # audits dispatched back to back
+    LIGHTHOUSE_SCHEDULER_CONCURRENCY: int = 16  # scheduled audits in flight
+    LIGHTHOUSE_SCHEDULER_QUEUE_PATH: str = ""  # defaults to a file under DATA_DIR
+    LIGHTHOUSE_SCHEDULER_MAX_ATTEMPTS: int = 3  # per job, for rate-limited audits
+    LIGHTHOUSE_QUOTA_TIMEZONE: str = "America/Los_Angeles"  # daily quota resets
+    LIGHTHOUSE_HISTORY_ENABLED: bool = True  # record scores for trend queries
+    LIGHTHOUSE_HISTORY_PATH: str = ""  # defaults to a file under DATA_DIR
+
+    # Local Data Storage
+    DATA_DIR: str = ""  # default home of the *_PATH/*_DIR files; temp dir if empty
 
     # Circuit Breaker Configuration
     CIRCUIT_BREAKER_FAILURE_THRESHOLD: int = 5
     CIRCUIT_BREAKER_RECOVERY_TIMEOUT: int = 60
 
+    # Service Logging Configuration
+    LOG_LEVEL: str = "INFO"
+    LOG_FORMAT: str = "json"  # or "text" for the classic one-line format
+    # Share of INFO records kept per service, e.g. {"RateLimiter": 0.01}
+    LOG_SAMPLE_RATES: dict = {}
+
     @field_validator("GOOGLE_PLACES_API_KEY")
     @classmethod
     def validate_google_places_key(cls, v):
@@ -177,6 +256,17 @@ def validate_environment() -> bool:
         return False
 
 
+def get_data_path(name: str, config: Optional[APIConfig] = None) -> str:
+    """
+    Default path of a persistent cache, queue or history file.
+
+    Files go under DATA_DIR, or the system temp directory when it is unset;
+    the temp directory may be cleared on reboot.
+    """
+    directory = (config or get_api_config()).DATA_DIR or tempfile.gettempdir()
+    return os.path.join(directory, name)
+
+
 def get_google_places_key() -> str:
     """Get Google Places API key for business discovery."""
     return settings.api.GOOGLE_PLACES_API_KEY
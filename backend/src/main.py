@@ -5,10 +5,24 @@ LeadGen Makeover Agent API - Main Application Entry Point
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
+import asyncio
 import logging
 
 from src.core import settings, validate_environment
 from src.middleware.rate_limit_middleware import YelpFusionRateLimitMiddleware
+from src.services.heuristic_evaluation_service import shutdown_evaluation_pool
+from src.services.web_fetcher import get_web_fetcher
+from src.services.pagespeed_client import get_pagespeed_client
+from src.services.lighthouse_scheduler import (
+    close_lighthouse_scheduler,
+    resume_lighthouse_scheduler,
+)
+from src.services.local_lighthouse_runner import close_local_lighthouse_runner
+from src.services.rate_limiter import close_rate_limiter
+from src.utils.background_loop import close_background_loop
+from src.utils.payload_store import close_payload_store
+from src.utils.structured_logging import shutdown_service_logging
+from src.utils.vitals_history import close_vitals_history_store
 from src.api.v1 import (
     authentication,
     business_search,
@@ -20,6 +34,13 @@ from src.api.v1 import (
 )
 
 
+async def _close_pooled_clients() -> None:
+    """Close the shared HTTP clients and browsers of the running event loop."""
+    await get_web_fetcher().aclose()
+    await get_pagespeed_client().aclose()
+    await close_local_lighthouse_runner()
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan manager."""
@@ -32,12 +53,25 @@ async def lifespan(app: FastAPI):
         raise RuntimeError("Environment configuration validation failed")
 
     logging.info("Environment validation successful")
+
+    # Pick up Lighthouse audits queued before a restart
+    resume_lighthouse_scheduler()
+
     logging.info("LeadGen Makeover Agent API started successfully")
 
     yield
 
     # Shutdown
     logging.info("Shutting down LeadGen Makeover Agent API...")
+    await close_lighthouse_scheduler()
+    await _close_pooled_clients()
+    # Pools built by synchronous entry points live on the background loop
+    await asyncio.to_thread(close_background_loop, _close_pooled_clients)
+    shutdown_evaluation_pool()
+    close_payload_store()
+    close_vitals_history_store()
+    close_rate_limiter()
+    shutdown_service_logging()
 
 
 # Create FastAPI application
@@ -10,7 +10,7 @@ from fastapi.responses import JSONResponse
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.types import ASGIApp
 
-from src.services import RateLimiter
+from src.services.rate_limiter import get_rate_limiter
 from src.core.config import get_api_config
 
 
@@ -19,7 +19,7 @@ class YelpFusionRateLimitMiddleware(BaseHTTPMiddleware):
 
     def __init__(self, app: ASGIApp):
         super().__init__(app)
-        self.rate_limiter = RateLimiter()
+        self.rate_limiter = get_rate_limiter()
         self.api_config = get_api_config()
         self.yelp_endpoints = {
             "/api/v1/business-search/yelp": "yelp_fusion",
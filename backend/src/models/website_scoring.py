@@ -429,7 +429,7 @@ class LighthouseAuditResult(Base):
             audit_strategy=data.get("strategy", "desktop"),
             success=str(data.get("success", False)).lower(),
             confidence_level=data.get("confidence", "low"),
-            raw_audit_data=data.get("raw_data"),
+            raw_audit_data=data.get("raw_data") or data.get("audit_summary"),
             error_message=data.get("error"),
             error_code=data.get("error_code"),
             error_context=data.get("context"),
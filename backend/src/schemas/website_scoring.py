@@ -15,6 +15,22 @@ class AuditStrategy(str, Enum):
     MOBILE = "mobile"
 
 
+class AuditPriority(str, Enum):
+    """Dispatch priority of a scheduled Lighthouse audit."""
+
+    INTERACTIVE = "interactive"
+    BATCH = "batch"
+
+
+class TrendBucket(str, Enum):
+    """Width of the buckets a score trend is down-sampled to."""
+
+    HOUR = "hour"
+    DAY = "day"
+    WEEK = "week"
+    MONTH = "month"
+
+
 class ConfidenceLevel(str, Enum):
     """Confidence level for audit results."""
 
@@ -29,13 +45,21 @@ class WebsiteScore(BaseModel):
     performance: float = Field(
         ..., ge=0, le=100, description="Performance score (0-100)"
     )
-    accessibility: float = Field(
-        ..., ge=0, le=100, description="Accessibility score (0-100)"
+    accessibility: Optional[float] = Field(
+        ...,
+        ge=0,
+        le=100,
+        description="Accessibility score (0-100); None when not measured",
+    )
+    best_practices: Optional[float] = Field(
+        ...,
+        ge=0,
+        le=100,
+        description="Best practices score (0-100); None when not measured",
     )
-    best_practices: float = Field(
-        ..., ge=0, le=100, description="Best practices score (0-100)"
+    seo: Optional[float] = Field(
+        ..., ge=0, le=100, description="SEO score (0-100); None when not measured"
     )
-    seo: float = Field(..., ge=0, le=100, description="SEO score (0-100)")
     overall: float = Field(
         ..., ge=0, le=100, description="Overall weighted score (0-100)"
     )
@@ -171,6 +195,13 @@ class HeuristicEvaluationRequest(BaseModel):
     evaluation_parameters: Optional[Dict[str, Any]] = Field(
         None, description="Additional evaluation parameters"
     )
+    crawl: Optional[bool] = Field(
+        None,
+        description=(
+            "Also evaluate linked privacy, terms, about, contact and pricing "
+            "pages; defaults to the server setting"
+        ),
+    )
 
     @validator("website_url")
     def validate_website_url(cls, v):
@@ -235,6 +266,52 @@ class HeuristicEvaluationError(BaseModel):
     )
 
 
+class HeuristicBatchItem(BaseModel):
+    """One website in a batch heuristic evaluation."""
+
+    business_id: str = Field(..., description="Business identifier for tracking")
+    website_url: HttpUrl = Field(..., description="URL of the website to evaluate")
+
+    @validator("website_url")
+    def validate_website_url(cls, v):
+        """Validate website URL format."""
+        if not str(v).startswith(("http://", "https://")):
+            raise ValueError("Website URL must start with http:// or https://")
+        return v
+
+
+class HeuristicBatchRequest(BaseModel):
+    """Request model for batch heuristic evaluation."""
+
+    items: List[HeuristicBatchItem] = Field(
+        ..., min_length=1, max_length=1_000, description="Websites to evaluate"
+    )
+    run_id: Optional[str] = Field(None, description="Run identifier for tracking")
+    max_concurrency: Optional[int] = Field(
+        None, ge=1, description="Maximum evaluations in flight for this batch"
+    )
+    crawl: Optional[bool] = Field(
+        None, description="Also evaluate linked pages; defaults to the server setting"
+    )
+
+
+class HeuristicBatchSummary(BaseModel):
+    """Final NDJSON line of a batch heuristic evaluation."""
+
+    type: str = Field("summary", description="Marks the summary line")
+    run_id: str = Field(..., description="Run identifier")
+    total: int = Field(..., description="Websites in the batch")
+    succeeded: int = Field(..., description="Successful evaluations")
+    failed: int = Field(..., description="Failed evaluations")
+    elapsed_seconds: float = Field(..., description="Wall-clock time for the batch")
+    latency_seconds: Dict[str, float] = Field(
+        ..., description="Per-website latency count, mean, min, max and percentiles"
+    )
+    error_codes: Dict[str, int] = Field(
+        default_factory=dict, description="Failure count per error code"
+    )
+
+
 class CoreWebVitals(BaseModel):
     """Core Web Vitals metrics from Lighthouse audit."""
 
@@ -255,6 +332,41 @@ class CoreWebVitals(BaseModel):
     )
 
 
+class LighthouseAuditFinding(BaseModel):
+    """A failing Lighthouse audit or improvement opportunity."""
+
+    id: str = Field(..., description="Lighthouse audit id")
+    title: Optional[str] = Field(None, description="Audit title")
+    score: float = Field(..., ge=0, le=1, description="Audit score (0-1)")
+    display_value: Optional[str] = Field(None, description="Human-readable result")
+    savings_ms: Optional[float] = Field(
+        None, description="Estimated load time savings in milliseconds"
+    )
+    savings_bytes: Optional[int] = Field(
+        None, description="Estimated transfer size savings in bytes"
+    )
+
+
+class LighthouseAuditSummary(BaseModel):
+    """Compact projection of a full PageSpeed Insights payload."""
+
+    lighthouse_version: Optional[str] = Field(None, description="Lighthouse version")
+    final_url: Optional[str] = Field(None, description="URL after redirects")
+    fetch_time: Optional[str] = Field(None, description="When the page was audited")
+    runtime_error: Optional[str] = Field(
+        None, description="Lighthouse runtime error, if any"
+    )
+    failing_audits: List[LighthouseAuditFinding] = Field(
+        default_factory=list, description="Failing audits, worst first"
+    )
+    opportunities: List[LighthouseAuditFinding] = Field(
+        default_factory=list, description="Opportunities, largest savings first"
+    )
+    estimated_savings_ms: float = Field(
+        0.0, description="Total estimated savings of the listed opportunities"
+    )
+
+
 class LighthouseAuditRequest(BaseModel):
     """Request model for Lighthouse audit."""
 
@@ -267,6 +379,9 @@ class LighthouseAuditRequest(BaseModel):
     audit_parameters: Optional[Dict[str, Any]] = Field(
         None, description="Additional audit parameters"
     )
+    deadline_seconds: Optional[float] = Field(
+        None, gt=0, description="Overall time budget for the audit, retries included"
+    )
 
     @validator("website_url")
     def validate_website_url(cls, v):
@@ -293,8 +408,24 @@ class LighthouseAuditResponse(BaseModel):
     error: Optional[str] = Field(None, description="Error message if audit failed")
     error_code: Optional[str] = Field(None, description="Error code if audit failed")
     context: Optional[str] = Field(None, description="Error context if audit failed")
+    audit_summary: Optional[LighthouseAuditSummary] = Field(
+        None, description="Failing audits and opportunities from the audit"
+    )
+    raw_data_ref: Optional[str] = Field(
+        None, description="Key of the stored compressed raw payload"
+    )
+    cache_status: Optional[str] = Field(
+        None, description="Audit cache outcome: hit, stale, miss or coalesced"
+    )
+    fallback_used: bool = Field(
+        False,
+        description="Whether only a reduced-scope, performance-only audit completed",
+    )
+    estimated: bool = Field(
+        False, description="Whether the performance score is a timing probe estimate"
+    )
     raw_data: Optional[Dict[str, Any]] = Field(
-        None, description="Raw audit data from Lighthouse"
+        None, description="Raw audit data from Lighthouse, when configured"
     )
 
 
@@ -317,6 +448,106 @@ class LighthouseAuditError(BaseModel):
     strategy: str = Field("unknown", description="Unknown strategy due to error")
 
 
+class LighthouseBatchItem(BaseModel):
+    """One website in a scheduled batch of Lighthouse audits."""
+
+    business_id: str = Field(..., description="Business identifier for tracking")
+    website_url: HttpUrl = Field(..., description="URL of the website to audit")
+
+    @validator("website_url")
+    def validate_website_url(cls, v):
+        """Validate website URL format."""
+        if not str(v).startswith(("http://", "https://")):
+            raise ValueError("Website URL must start with http:// or https://")
+        return v
+
+
+class LighthouseBatchRequest(BaseModel):
+    """Request model for queueing a batch of Lighthouse audits."""
+
+    items: List[LighthouseBatchItem] = Field(
+        ..., min_length=1, max_length=50_000, description="Websites to audit"
+    )
+    run_id: Optional[str] = Field(None, description="Run identifier for tracking")
+    strategy: AuditStrategy = Field(
+        AuditStrategy.MOBILE, description="Audit strategy (desktop/mobile)"
+    )
+    priority: AuditPriority = Field(
+        AuditPriority.BATCH, description="Dispatch priority of the batch"
+    )
+
+
+class LighthouseBatchStatus(BaseModel):
+    """Progress of a scheduled batch of Lighthouse audits."""
+
+    batch_id: str = Field(..., description="Batch identifier")
+    total: int = Field(..., description="Audits in the batch")
+    pending: int = Field(..., description="Audits waiting to be dispatched")
+    running: int = Field(..., description="Audits in flight")
+    completed: int = Field(..., description="Successful audits")
+    failed: int = Field(..., description="Failed audits")
+    progress: float = Field(..., ge=0, le=1, description="Fraction finished")
+    eta_seconds: float = Field(..., description="Estimated seconds to finish")
+    throughput_per_minute: float = Field(
+        ..., description="Audits finished per minute recently, across all batches"
+    )
+    results: Optional[List[Dict[str, Any]]] = Field(
+        None, description="Per-website status, score and error"
+    )
+
+
+class VitalsHistoryResponse(BaseModel):
+    """Recorded Lighthouse scores and Core Web Vitals of a business."""
+
+    business_id: str = Field(..., description="Business identifier")
+    points: List[Dict[str, Any]] = Field(
+        default_factory=list,
+        description="Recorded audits, oldest first, with scores and Core Web Vitals",
+    )
+
+
+class VitalsTrendResponse(BaseModel):
+    """Down-sampled trend of recorded Lighthouse scores and Core Web Vitals."""
+
+    business_id: str = Field(..., description="Business identifier")
+    bucket: TrendBucket = Field(..., description="Bucket width")
+    buckets: List[Dict[str, Any]] = Field(
+        default_factory=list,
+        description="Bucket start, audit count and average of each metric",
+    )
+    summary: Dict[str, float] = Field(
+        ..., description="Trend, improvement rate and volatility of overall score"
+    )
+
+
+class VitalsComparisonRequest(BaseModel):
+    """Request model for before/after comparisons of recorded scores."""
+
+    business_ids: List[str] = Field(
+        ..., min_length=1, max_length=10_000, description="Businesses to compare"
+    )
+    pivot_timestamp: float = Field(
+        ..., description="Unix time of the change being evaluated"
+    )
+    window_days: int = Field(
+        30, ge=1, le=365, description="Days averaged on each side of the pivot"
+    )
+    strategy: Optional[AuditStrategy] = Field(
+        None, description="Only audits of this strategy"
+    )
+
+
+class VitalsComparisonResponse(BaseModel):
+    """Average metrics before and after a pivot, per business."""
+
+    pivot_timestamp: float = Field(..., description="Unix time of the change")
+    window_days: int = Field(..., description="Days averaged on each side")
+    comparisons: Dict[str, Dict[str, Any]] = Field(
+        ...,
+        description="Per business: before/after averages, audit counts and change",
+    )
+
+
 class WebsiteScoringSummary(BaseModel):
     """Summary of website scoring results for multiple audits."""
 
@@ -546,6 +777,11 @@ class FallbackScoringResponse(BaseModel):
         ..., description="Quality assessment of fallback results"
     )
     retry_attempts: int = Field(0, ge=0, description="Number of retry attempts made")
+    recovered_audit: Optional[Dict[str, Any]] = Field(
+        None,
+        description="Reduced-scope Lighthouse audit recovered during the retries; "
+        "estimated from a local timing probe when 'estimated' is set",
+    )
     error: Optional[str] = Field(None, description="Error message if fallback failed")
     error_code: Optional[str] = Field(None, description="Error code if fallback failed")
     context: Optional[str] = Field(None, description="Error context if fallback failed")
@@ -716,6 +952,12 @@ class WebsiteScoringRequest(BaseModel):
     business_id: Optional[str] = Field(None, description="Business identifier")
     scoring_method: str = Field("comprehensive", description="Scoring method to use")
     run_id: Optional[str] = Field(None, description="Processing run identifier")
+    strategy: AuditStrategy = Field(
+        AuditStrategy.DESKTOP, description="Lighthouse audit strategy (desktop/mobile)"
+    )
+    deadline_seconds: Optional[float] = Field(
+        None, gt=0, description="Overall time budget for scoring"
+    )
 
 
 class WebsiteScoringResponse(BaseModel):
@@ -757,3 +999,9 @@ class WebsiteScoringResponse(BaseModel):
     raw_data: Optional[Dict[str, Any]] = Field(None, description="Raw scoring data")
     recommendations: List[str] = Field(default_factory=list, description="Recommendations for improvement")
     priority_issues: List[IssuePriority] = Field(default_factory=list, description="High-priority issues to address")
+    validation_result: Optional[ScoreValidationResult] = Field(
+        None, description="Cross-validation of Lighthouse and heuristic scores"
+    )
+    timings: Dict[str, float] = Field(
+        default_factory=dict, description="Duration of each scoring stage in seconds"
+    )
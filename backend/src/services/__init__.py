@@ -4,6 +4,9 @@ Business logic services
 
 from .rate_limiter import RateLimiter
 from .rate_limit_monitor import RateLimitMonitor
+from .web_fetcher import WebFetcher
+from .pagespeed_client import PageSpeedClient
+from .local_lighthouse_runner import LocalLighthouseRunner
 from .google_places_auth_service import GooglePlacesAuthService
 from .yelp_fusion_auth_service import YelpFusionAuthService
 from .google_places_service import GooglePlacesService
@@ -17,9 +20,11 @@ from .review_management_service import ReviewManagementService
 from .business_discovery_service import BusinessDiscoveryService
 from .discover import DiscoveryService
 from .lighthouse_service import LighthouseService
+from .lighthouse_scheduler import LighthouseBatchScheduler
 from .heuristic_evaluation_service import HeuristicEvaluationService
 from .fallback_scoring_service import FallbackScoringService
 from .score_validation_service import ScoreValidationService
+from .scoring_pipeline_service import ScoringPipelineService
 from .website_template_service import WebsiteTemplateService
 from .demo_hosting_service import DemoHostingService
 from .leadgen_ai_agent import LeadGenAIAgent
@@ -28,6 +33,9 @@ from .leadgen_context_manager import LeadGenContextManager
 __all__ = [
     "RateLimiter",
     "RateLimitMonitor",
+    "WebFetcher",
+    "PageSpeedClient",
+    "LocalLighthouseRunner",
     "GooglePlacesAuthService",
     "YelpFusionAuthService",
     "GooglePlacesService",
@@ -41,9 +49,11 @@ __all__ = [
     "BusinessDiscoveryService",
     "DiscoveryService",
     "LighthouseService",
+    "LighthouseBatchScheduler",
     "HeuristicEvaluationService",
     "FallbackScoringService",
     "ScoreValidationService",
+    "ScoringPipelineService",
     "WebsiteTemplateService",
     "DemoHostingService",
     "LeadGenAIAgent",
@@ -17,7 +17,7 @@ from src.services.yelp_fusion_service import YelpFusionService
 from src.services.fallback_scoring_service import FallbackScoringService
 from src.schemas.business_search import BusinessSearchRequest
 from src.schemas.yelp_fusion import YelpBusinessSearchRequest
-from src.services.rate_limiter import RateLimiter
+from src.services.rate_limiter import get_rate_limiter
 
 logger = logging.getLogger(__name__)
 
@@ -34,7 +34,7 @@ class BusinessDiscoveryService(BaseService):
         self.google_places_service = GooglePlacesService()
         self.yelp_fusion_service = YelpFusionService()
         self.fallback_service = FallbackScoringService()
-        self.rate_limiter = RateLimiter()
+        self.rate_limiter = get_rate_limiter()
         self.business_config = get_business_discovery_config()
         
         # Fallback configuration
@@ -364,7 +364,7 @@ class BusinessMatchingService(BaseService):
             return max(0.0, min(1.0, similarity))
 
         except Exception as e:
-            self.logger.warning(f"Error calculating coordinate proximity: {e}")
+            self.logger.warning("Error calculating coordinate proximity: %s", e)
             return 0.0
 
     def _determine_confidence_level(self, score: float) -> ConfidenceLevel:
@@ -232,7 +232,7 @@ class CategoryMapperService(BaseService):
         """
         try:
             self.log_operation(
-                f"Mapping Google categories to Yelp: {google_categories}"
+                "map_google_to_yelp", google_categories=google_categories
             )
 
             if not google_categories:
@@ -265,7 +265,9 @@ class CategoryMapperService(BaseService):
                 if cat not in unique_categories:
                     unique_categories.append(cat)
 
-            self.log_operation(f"Mapped to Yelp categories: {unique_categories}")
+            self.log_operation(
+                "map_google_to_yelp_completed", yelp_categories=unique_categories
+            )
             return unique_categories
 
         except Exception as e:
@@ -283,7 +285,7 @@ class CategoryMapperService(BaseService):
             List of corresponding Google Places category strings
         """
         try:
-            self.log_operation(f"Mapping Yelp categories to Google: {yelp_categories}")
+            self.log_operation("map_yelp_to_google", yelp_categories=yelp_categories)
 
             if not yelp_categories:
                 return []
@@ -313,7 +315,9 @@ class CategoryMapperService(BaseService):
                 if cat not in unique_categories:
                     unique_categories.append(cat)
 
-            self.log_operation(f"Mapped to Google categories: {unique_categories}")
+            self.log_operation(
+                "map_yelp_to_google_completed", google_categories=unique_categories
+            )
             return unique_categories
 
         except Exception as e:
@@ -165,7 +165,7 @@ class ConfidenceScoringService(BaseService):
                 + consistency_confidence * weights["consistency"]
             )
 
-            self.logger.debug(f"Calculated merged confidence: {merged_confidence:.3f}")
+            self.logger.debug("Calculated merged confidence: %.3f", merged_confidence)
             return round(merged_confidence, 3)
 
         except Exception as e:
@@ -3,14 +3,19 @@ Fallback scoring service for when Lighthouse API fails.
 Provides heuristic-only scoring with automatic fallback detection and retry logic.
 """
 
+import asyncio
+import json
 import time
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 from enum import Enum
 
 from src.core.base_service import BaseService
 from src.core.config import get_api_config
-from src.services.rate_limiter import RateLimiter
+from src.services.rate_limiter import Reservation, get_rate_limiter
 from src.services.heuristic_evaluation_service import HeuristicEvaluationService
+from src.services.lighthouse_service import LighthouseService
+from src.utils.background_loop import run_sync
+from src.utils.single_flight import flight_key, get_single_flight
 from src.schemas.website_scoring import (
     FallbackScore,
     FallbackReason,
@@ -40,16 +45,19 @@ class FallbackDecision(str, Enum):
 class FallbackScoringService(BaseService):
     """Service for fallback scoring when Lighthouse fails."""
 
-    def __init__(self):
+    def __init__(self, lighthouse_service: Optional[LighthouseService] = None):
         super().__init__("FallbackScoringService")
         self.api_config = get_api_config()
-        self.rate_limiter = RateLimiter()
+        self.rate_limiter = get_rate_limiter()
         self.heuristic_service = HeuristicEvaluationService()
+        self.lighthouse_service = lighthouse_service or LighthouseService()
+        self.flight = get_single_flight()
 
         # Fallback configuration
         self.max_retry_attempts = 3
         self.retry_delay_base = 1.0
         self.fallback_timeout = 10  # seconds
+        self.quota_wait = self.api_config.RATE_LIMITER_ACQUIRE_TIMEOUT_SECONDS
         self.quality_threshold = 70.0  # minimum quality score for fallback
 
         # Failure pattern recognition
@@ -105,6 +113,48 @@ class FallbackScoringService(BaseService):
         """
         Run fallback scoring when Lighthouse fails.
 
+        Runs ``run_fallback_scoring_async`` on the shared background event
+        loop and blocks the calling thread; async callers await
+        ``run_fallback_scoring_async`` instead.
+
+        Args:
+            website_url: URL of the website to score
+            business_id: Business identifier for tracking
+            lighthouse_failure_reason: Reason why Lighthouse failed
+            run_id: Run identifier for tracking
+            fallback_parameters: Additional fallback parameters
+
+        Returns:
+            Dictionary containing fallback scoring results
+        """
+        return run_sync(
+            self.run_fallback_scoring_async(
+                website_url,
+                business_id,
+                lighthouse_failure_reason,
+                run_id,
+                fallback_parameters,
+            )
+        )
+
+    async def run_fallback_scoring_async(
+        self,
+        website_url: str,
+        business_id: str,
+        lighthouse_failure_reason: str,
+        run_id: Optional[str] = None,
+        fallback_parameters: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Run fallback scoring when Lighthouse fails, without blocking the
+        event loop.
+
+        Concurrent calls for the same URL and failure share one execution.
+        Backoff between Lighthouse recovery attempts yields to the event loop
+        and the heuristic evaluation runs on the shared async fetcher. When
+        the fallback quota is used up it waits for capacity, up to
+        RATE_LIMITER_ACQUIRE_TIMEOUT_SECONDS, rather than failing.
+
         Args:
             website_url: URL of the website to score
             business_id: Business identifier for tracking
@@ -115,7 +165,32 @@ class FallbackScoringService(BaseService):
         Returns:
             Dictionary containing fallback scoring results
         """
+        key = flight_key(
+            "fallback",
+            website_url,
+            failure=lighthouse_failure_reason,
+            parameters=json.dumps(fallback_parameters, sort_keys=True, default=str),
+        )
+        result, shared = await self.flight.do(
+            key,
+            lambda: self._run_fallback_scoring_async(
+                website_url, business_id, lighthouse_failure_reason, run_id
+            ),
+        )
+        if not shared:
+            return result
+        return {**result, "business_id": business_id, "run_id": run_id}
+
+    async def _run_fallback_scoring_async(
+        self,
+        website_url: str,
+        business_id: str,
+        lighthouse_failure_reason: str,
+        run_id: Optional[str],
+    ) -> Dict[str, Any]:
+        """Score one website, without request coalescing."""
         start_time = time.time()
+        reservation = None
 
         try:
             self.log_operation(
@@ -126,24 +201,21 @@ class FallbackScoringService(BaseService):
                 failure_reason=lighthouse_failure_reason,
             )
 
-            # Check rate limiting
-            can_proceed, message = self.rate_limiter.can_make_request(
-                "fallback", run_id
+            reservation = await self.rate_limiter.acquire(
+                "fallback", self.quota_wait, run_id=run_id
             )
-            if not can_proceed:
+            if not reservation.granted:
                 return self._create_error_response(
-                    f"Rate limit exceeded: {message}",
+                    f"Rate limit exceeded: {reservation.reason}",
                     "rate_limit_check",
                     website_url,
                     business_id,
                     run_id,
                 )
 
-            # Analyze failure and determine fallback strategy
             failure_analysis = self._analyze_failure(lighthouse_failure_reason)
-
-            # Execute fallback strategy
             if failure_analysis["decision"] == FallbackDecision.NO_FALLBACK:
+                self.rate_limiter.release(reservation, run_id)
                 return self._create_error_response(
                     f"Fallback not recommended for {failure_analysis['severity']} severity failure",
                     "fallback_strategy",
@@ -152,76 +224,155 @@ class FallbackScoringService(BaseService):
                     run_id,
                 )
 
-            # Execute retry logic if needed
-            retry_attempts = 0
+            retry_attempts, recovered_audit = 0, None
             if failure_analysis["decision"] == FallbackDecision.RETRY_THEN_FALLBACK:
-                retry_attempts = self._execute_retry_logic(
+                retry_attempts, recovered_audit = await self._execute_retry_logic_async(
                     website_url, business_id, run_id, failure_analysis
                 )
 
-            # Run heuristic evaluation for fallback scoring
-            heuristic_result = self._run_heuristic_evaluation(
+            heuristic_result = await self._run_heuristic_evaluation_async(
                 website_url, business_id, run_id
             )
 
-            if not heuristic_result["success"]:
+            return self._fallback_result(
+                website_url,
+                business_id,
+                lighthouse_failure_reason,
+                failure_analysis,
+                heuristic_result,
+                retry_attempts,
+                run_id,
+                start_time,
+                recovered_audit,
+                reservation,
+            )
+
+        except Exception as e:
+            self.rate_limiter.record_request("fallback", False, run_id, reservation)
+            self.log_error(e, "fallback_scoring", run_id, business_id)
+            return self._create_error_response(
+                str(e), "fallback_scoring", website_url, business_id, run_id
+            )
+
+    def score_heuristic_result(
+        self,
+        website_url: str,
+        business_id: str,
+        lighthouse_failure_reason: str,
+        heuristic_result: Dict[str, Any],
+        run_id: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Build fallback scoring from a heuristic evaluation that already ran.
+
+        For callers that evaluated heuristics alongside Lighthouse: the
+        evaluation is not repeated and no Lighthouse retries are attempted.
+
+        Args:
+            website_url: URL of the website to score
+            business_id: Business identifier for tracking
+            lighthouse_failure_reason: Reason why Lighthouse failed
+            heuristic_result: Result of HeuristicEvaluationService evaluation
+            run_id: Run identifier for tracking
+
+        Returns:
+            Dictionary in the same shape as ``run_fallback_scoring``
+        """
+        start_time = time.time()
+        try:
+            failure_analysis = self._analyze_failure(lighthouse_failure_reason)
+            if failure_analysis["decision"] == FallbackDecision.NO_FALLBACK:
                 return self._create_error_response(
-                    f"Heuristic evaluation failed: {heuristic_result.get('error', 'Unknown error')}",
-                    "heuristic_evaluation",
+                    f"Fallback not recommended for {failure_analysis['severity']} severity failure",
+                    "fallback_strategy",
                     website_url,
                     business_id,
                     run_id,
                 )
 
-            # Create fallback score with reduced confidence
-            fallback_score = self._create_fallback_score(
-                heuristic_result, lighthouse_failure_reason, run_id
+            return self._fallback_result(
+                website_url,
+                business_id,
+                lighthouse_failure_reason,
+                failure_analysis,
+                heuristic_result,
+                0,
+                run_id,
+                start_time,
             )
 
-            # Create fallback reason tracking
-            fallback_reason = self._create_fallback_reason(
-                lighthouse_failure_reason, failure_analysis, retry_attempts, True
+        except Exception as e:
+            self.rate_limiter.record_request("fallback", False, run_id)
+            self.log_error(e, "fallback_scoring", run_id, business_id)
+            return self._create_error_response(
+                str(e), "fallback_scoring", website_url, business_id, run_id
             )
 
-            # Assess fallback quality
-            fallback_quality = self._assess_fallback_quality(
-                fallback_score, heuristic_result, failure_analysis
+    def _fallback_result(
+        self,
+        website_url: str,
+        business_id: str,
+        lighthouse_failure_reason: str,
+        failure_analysis: Dict[str, Any],
+        heuristic_result: Dict[str, Any],
+        retry_attempts: int,
+        run_id: Optional[str],
+        start_time: float,
+        recovered_audit: Optional[Dict[str, Any]] = None,
+        reservation: Optional[Reservation] = None,
+    ) -> Dict[str, Any]:
+        """Score, track and assess a fallback from a heuristic evaluation."""
+        if not heuristic_result["success"]:
+            if reservation is not None:
+                self.rate_limiter.release(reservation, run_id)
+            return self._create_error_response(
+                f"Heuristic evaluation failed: {heuristic_result.get('error', 'Unknown error')}",
+                "heuristic_evaluation",
+                website_url,
+                business_id,
+                run_id,
             )
 
-            # Record successful request
-            self.rate_limiter.record_request("fallback", True, run_id)
+        # Create fallback score with reduced confidence
+        fallback_score = self._create_fallback_score(
+            heuristic_result, lighthouse_failure_reason, run_id
+        )
 
-            execution_time = time.time() - start_time
-            self.log_operation(
-                f"Completed fallback scoring in {execution_time:.2f}s",
-                run_id=run_id,
-                business_id=business_id,
-                execution_time=execution_time,
-                fallback_quality=fallback_quality.reliability_score,
-            )
+        # Create fallback reason tracking
+        fallback_reason = self._create_fallback_reason(
+            lighthouse_failure_reason, failure_analysis, retry_attempts, True
+        )
 
-            return {
-                "success": True,
-                "website_url": website_url,
-                "business_id": business_id,
-                "run_id": run_id,
-                "fallback_timestamp": time.time(),
-                "fallback_score": fallback_score,
-                "fallback_reason": fallback_reason,
-                "fallback_quality": fallback_quality,
-                "retry_attempts": retry_attempts,
-                "execution_time": execution_time,
-            }
+        # Assess fallback quality
+        fallback_quality = self._assess_fallback_quality(
+            fallback_score, heuristic_result, failure_analysis
+        )
 
-        except Exception as e:
-            # Record failed request
-            self.rate_limiter.record_request("fallback", False, run_id)
+        # Record successful request
+        self.rate_limiter.record_request("fallback", True, run_id, reservation)
 
-            self.log_error(e, "fallback_scoring", run_id, business_id)
+        execution_time = time.time() - start_time
+        self.log_operation(
+            "Completed fallback scoring",
+            run_id=run_id,
+            business_id=business_id,
+            execution_time=execution_time,
+            fallback_quality=fallback_quality.reliability_score,
+        )
 
-            return self._create_error_response(
-                str(e), "fallback_scoring", website_url, business_id, run_id
-            )
+        return {
+            "success": True,
+            "website_url": website_url,
+            "business_id": business_id,
+            "run_id": run_id,
+            "fallback_timestamp": time.time(),
+            "fallback_score": fallback_score,
+            "fallback_reason": fallback_reason,
+            "fallback_quality": fallback_quality,
+            "retry_attempts": retry_attempts,
+            "recovered_audit": recovered_audit,
+            "execution_time": execution_time,
+        }
 
     def _analyze_failure(self, failure_reason: str) -> Dict[str, Any]:
         """Analyze Lighthouse failure and determine fallback strategy."""
@@ -263,54 +414,44 @@ class FallbackScoringService(BaseService):
         else:
             return "UNKNOWN_ERROR"
 
-    def _execute_retry_logic(
+    async def _execute_retry_logic_async(
         self,
         website_url: str,
         business_id: str,
         run_id: Optional[str],
         failure_analysis: Dict[str, Any],
-    ) -> int:
-        """Execute retry logic for temporary failures."""
+    ) -> Tuple[int, Optional[Dict[str, Any]]]:
+        """
+        Execute retry logic for temporary failures; backoff does not block.
+
+        Returns the number of attempts made and the recovered audit, if any.
+        """
         max_retries = failure_analysis["retry_count"]
         retry_attempts = 0
 
         self.log_operation(
-            f"Executing retry logic for {max_retries} attempts",
+            "Executing retry logic",
             run_id=run_id,
             business_id=business_id,
+            max_retries=max_retries,
             failure_type=failure_analysis["failure_type"],
         )
 
         for attempt in range(max_retries):
             try:
                 retry_attempts += 1
-
-                # Calculate delay with exponential backoff
-                delay = self.retry_delay_base * (2**attempt)
-
-                self.log_operation(
-                    f"Retry attempt {retry_attempts}/{max_retries} with {delay}s delay",
-                    run_id=run_id,
-                    business_id=business_id,
-                    attempt=retry_attempts,
+                await asyncio.sleep(
+                    self._retry_delay(
+                        attempt, retry_attempts, max_retries, business_id, run_id
+                    )
                 )
 
-                # Wait before retry
-                time.sleep(delay)
-
-                # Attempt to recover (this would typically try Lighthouse again)
-                # For now, we'll simulate a recovery attempt
-                recovery_successful = self._attempt_lighthouse_recovery(
+                recovered_audit = await self._attempt_lighthouse_recovery_async(
                     website_url, business_id, run_id
                 )
-
-                if recovery_successful:
-                    self.log_operation(
-                        f"Recovery successful on attempt {retry_attempts}",
-                        run_id=run_id,
-                        business_id=business_id,
-                    )
-                    return retry_attempts
+                if recovered_audit:
+                    self._log_recovery(retry_attempts, business_id, run_id)
+                    return retry_attempts, recovered_audit
 
             except Exception as e:
                 self.log_error(
@@ -319,39 +460,77 @@ class FallbackScoringService(BaseService):
                 continue
 
         self.log_operation(
-            f"All {max_retries} retry attempts failed, proceeding with fallback",
+            "All retry attempts failed, proceeding with fallback",
             run_id=run_id,
             business_id=business_id,
+            max_retries=max_retries,
         )
 
-        return retry_attempts
+        return retry_attempts, None
 
-    def _attempt_lighthouse_recovery(
-        self, website_url: str, business_id: str, run_id: Optional[str]
-    ) -> bool:
-        """Attempt to recover Lighthouse functionality."""
-        try:
-            # This would typically attempt a lightweight Lighthouse check
-            # For now, we'll simulate a recovery attempt that usually fails
-            # In a real implementation, this might try a different Lighthouse endpoint
-            # or check if the service is back online
+    def _retry_delay(
+        self,
+        attempt: int,
+        retry_attempts: int,
+        max_retries: int,
+        business_id: str,
+        run_id: Optional[str],
+    ) -> float:
+        """Exponential backoff before a retry, logged."""
+        delay = self.retry_delay_base * (2**attempt)
+        self.log_operation(
+            "Retrying after backoff",
+            run_id=run_id,
+            business_id=business_id,
+            attempt=retry_attempts,
+            max_retries=max_retries,
+            delay=delay,
+        )
+        return delay
+
+    def _log_recovery(
+        self, retry_attempts: int, business_id: str, run_id: Optional[str]
+    ) -> None:
+        self.log_operation(
+            "Recovery successful",
+            run_id=run_id,
+            business_id=business_id,
+            attempt=retry_attempts,
+        )
 
-            # Simulate recovery attempt (usually fails in fallback scenarios)
-            recovery_successful = False
+    async def _attempt_lighthouse_recovery_async(
+        self, website_url: str, business_id: str, run_id: Optional[str]
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Attempt a reduced-scope Lighthouse audit.
 
-            self.log_operation(
-                f"Lighthouse recovery attempt {'successful' if recovery_successful else 'failed'}",
-                run_id=run_id,
-                business_id=business_id,
+        Returns the audit result when it produced a score (from PageSpeed or
+        the local timing probe), otherwise None.
+        """
+        try:
+            result = await self.lighthouse_service.recover_audit_async(
+                website_url, business_id, run_id
             )
-
-            return recovery_successful
+            return self._recovery_outcome(result, business_id, run_id)
 
         except Exception as e:
             self.log_error(e, "lighthouse_recovery_attempt", run_id, business_id)
-            return False
+            return None
 
-    def _run_heuristic_evaluation(
+    def _recovery_outcome(
+        self, result: Dict[str, Any], business_id: str, run_id: Optional[str]
+    ) -> Optional[Dict[str, Any]]:
+        recovery_successful = bool(result.get("success"))
+        self.log_operation(
+            "Lighthouse recovery attempt finished",
+            run_id=run_id,
+            business_id=business_id,
+            recovered=recovery_successful,
+            estimated=result.get("estimated", False),
+        )
+        return result if recovery_successful else None
+
+    async def _run_heuristic_evaluation_async(
         self, website_url: str, business_id: str, run_id: Optional[str]
     ) -> Dict[str, Any]:
         """Run heuristic evaluation for fallback scoring."""
@@ -362,14 +541,10 @@ class FallbackScoringService(BaseService):
                 business_id=business_id,
                 website_url=website_url,
             )
-
-            # Use the existing heuristic evaluation service
-            result = self.heuristic_service.run_heuristic_evaluation(
+            return await self.heuristic_service.run_heuristic_evaluation_async(
                 website_url, business_id, run_id
             )
 
-            return result
-
         except Exception as e:
             self.log_error(e, "heuristic_evaluation", run_id, business_id)
             return {
@@ -387,6 +562,8 @@ class FallbackScoringService(BaseService):
         """Create fallback score with reduced confidence."""
         try:
             scores = heuristic_result.get("scores", {})
+            if hasattr(scores, "model_dump"):
+                scores = scores.model_dump()
 
             # Create fallback score with reduced confidence
             fallback_score = FallbackScore(
@@ -6,7 +6,7 @@ Handles authentication and connection testing for Google Places API.
 import httpx
 from typing import Dict, Any, Optional
 from src.core import BaseService, get_api_config
-from src.services import RateLimiter
+from src.services.rate_limiter import get_rate_limiter
 
 
 class GooglePlacesAuthService(BaseService):
@@ -15,7 +15,7 @@ class GooglePlacesAuthService(BaseService):
     def __init__(self):
         super().__init__("GooglePlacesAuthService")
         self.api_config = get_api_config()
-        self.rate_limiter = RateLimiter()
+        self.rate_limiter = get_rate_limiter()
         self.base_url = "https://maps.googleapis.com/maps/api/place"
         self.api_key = self.api_config.GOOGLE_PLACES_API_KEY
 
@@ -201,7 +201,7 @@ class GooglePlacesAuthService(BaseService):
 
             if connection_test["success"]:
                 rate_limit_info = self.rate_limiter.get_rate_limit_info("google_places")
-                circuit_breaker = self.rate_limiter._circuit_breakers["google_places"]
+                circuit_breaker = self.rate_limiter.get_circuit_breaker("google_places")
 
                 return {
                     "success": True,
@@ -3,11 +3,12 @@ Google Places business search service.
 Handles business search functionality using Google Places API.
 """
 
+import asyncio
 import httpx
 import re
 from typing import Dict, Any, Optional, List
 from src.core import BaseService, get_api_config
-from src.services import RateLimiter
+from src.services.rate_limiter import Reservation, get_rate_limiter
 from src.schemas import (
     BusinessSearchRequest,
     BusinessData,
@@ -23,10 +24,11 @@ class GooglePlacesService(BaseService):
     def __init__(self):
         super().__init__("GooglePlacesService")
         self.api_config = get_api_config()
-        self.rate_limiter = RateLimiter()
+        self.rate_limiter = get_rate_limiter()
         self.base_url = "https://maps.googleapis.com/maps/api/place"
         self.api_key = self.api_config.GOOGLE_PLACES_API_KEY
         self.max_results_per_request = 20  # Google Places API limit
+        self.quota_wait = self.api_config.RATE_LIMITER_ACQUIRE_TIMEOUT_SECONDS
 
     def validate_input(self, data: Any) -> bool:
         """Validate input data for the service."""
@@ -44,19 +46,52 @@ class GooglePlacesService(BaseService):
         Returns:
             Business search response with results or error details
         """
-        try:
-            self.log_operation(
-                f"Starting business search: '{request.query}' in {request.location}",
-                run_id=request.run_id,
-            )
+        self.log_operation(
+            "Starting business search",
+            run_id=request.run_id,
+            query=request.query,
+            location=request.location,
+        )
+        # Wait for a rate-limit slot rather than failing straight away
+        reservation = self.rate_limiter.acquire_blocking(
+            "google_places", self.quota_wait, run_id=request.run_id
+        )
+        return self._search(request, reservation)
+
+    async def search_businesses_async(
+        self, request: BusinessSearchRequest
+    ) -> BusinessSearchResponse | BusinessSearchError:
+        """
+        Search for businesses without blocking the event loop.
 
-            # Check rate limiting
-            can_request, reason = self.rate_limiter.can_make_request(
-                "google_places", request.run_id
-            )
-            if not can_request:
+        Same behaviour and result as ``search_businesses``, but the wait for
+        quota is awaited and the HTTP request runs in a worker thread.
+
+        Args:
+            request: Business search request with query, location, and filters
+
+        Returns:
+            Business search response with results or error details
+        """
+        self.log_operation(
+            "Starting business search",
+            run_id=request.run_id,
+            query=request.query,
+            location=request.location,
+        )
+        reservation = await self.rate_limiter.acquire(
+            "google_places", self.quota_wait, run_id=request.run_id
+        )
+        return await asyncio.to_thread(self._search, request, reservation)
+
+    def _search(
+        self, request: BusinessSearchRequest, reservation: Reservation
+    ) -> BusinessSearchResponse | BusinessSearchError:
+        """Run a search once the rate limiter has decided on ``reservation``."""
+        try:
+            if not reservation.granted:
                 return BusinessSearchError(
-                    error=f"Rate limit exceeded: {reason}",
+                    error=f"Rate limit exceeded: {reservation.reason}",
                     context="rate_limit_check",
                     query=request.query,
                     location=request.location,
@@ -68,6 +103,7 @@ class GooglePlacesService(BaseService):
                 request.location, request.location_type
             )
             if not location_info["valid"]:
+                self.rate_limiter.release(reservation, request.run_id)
                 return BusinessSearchError(
                     error=f"Invalid location: {location_info['error']}",
                     context="location_validation",
@@ -80,7 +116,9 @@ class GooglePlacesService(BaseService):
             search_params = self._build_search_params(request, location_info)
 
             # Execute search
-            search_result = self._execute_search(search_params, request.run_id)
+            search_result = self._execute_search(
+                search_params, request.run_id, reservation
+            )
             if not search_result["success"]:
                 return BusinessSearchError(
                     error=search_result["error"],
@@ -115,13 +153,16 @@ class GooglePlacesService(BaseService):
             )
 
             self.log_operation(
-                f"Business search completed successfully: {len(businesses)} results found",
+                "Business search completed",
                 run_id=request.run_id,
+                results=len(businesses),
             )
 
             return response
 
         except Exception as e:
+            # A slot claimed for a request that was never sent
+            self.rate_limiter.release(reservation, request.run_id)
             self.log_error(e, "business_search", request.run_id)
             return BusinessSearchError(
                 error=f"Unexpected error during business search: {str(e)}",
@@ -216,7 +257,10 @@ class GooglePlacesService(BaseService):
         return params
 
     def _execute_search(
-        self, search_params: Dict[str, Any], run_id: Optional[str]
+        self,
+        search_params: Dict[str, Any],
+        run_id: Optional[str],
+        reservation: Optional[Reservation] = None,
     ) -> Dict[str, Any]:
         """
         Execute the actual API search request.
@@ -224,6 +268,7 @@ class GooglePlacesService(BaseService):
         Args:
             search_params: Search parameters for the API
             run_id: Optional run identifier for logging
+            reservation: Slot claimed for this request by ``acquire_blocking``
 
         Returns:
             Dictionary with search results or error information
@@ -236,7 +281,7 @@ class GooglePlacesService(BaseService):
 
                 # Record the request for rate limiting
                 self.rate_limiter.record_request(
-                    "google_places", response.status_code == 200, run_id
+                    "google_places", response.status_code == 200, run_id, reservation
                 )
 
                 if response.status_code == 200:
@@ -343,8 +388,10 @@ class GooglePlacesService(BaseService):
                     continue
 
             self.log_operation(
-                f"Processed {len(businesses)} business results from {len(raw_results)} raw results",
+                "Processed business results",
                 run_id=run_id,
+                results=len(businesses),
+                raw_results=len(raw_results),
             )
 
             return businesses
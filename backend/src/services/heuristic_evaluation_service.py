@@ -3,14 +3,32 @@ Heuristic evaluation service for website analysis.
 Analyzes trust signals, CRO elements, mobile usability, content quality, and social proof.
 """
 
+import asyncio
+import hashlib
 import time
-import re
+import weakref
 import requests
-from typing import Dict, Any, Optional, Tuple
-from bs4 import BeautifulSoup
-from src.core.base_service import BaseService
-from src.core.config import get_api_config
-from src.services.rate_limiter import RateLimiter
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Dict, Any, AsyncIterator, List, Optional, Sequence, Tuple
+from src.core.config import get_api_config, get_data_path
+from src.services.heuristic_evaluator import HeuristicEvaluator
+from src.services.rate_limiter import (
+    Reservation,
+    RequestPriority,
+    get_rate_limiter,
+)
+from src.services.web_fetcher import FetchResult, get_web_fetcher
+from src.utils.html_stream import STREAM_CHUNK_SIZE, HTMLStreamReader, NotHTMLError
+from src.utils.http_cache import get_http_cache
+from src.utils.page_features import PageFeatures
+from src.utils.result_cache import (
+    MemoryCacheBackend,
+    TieredCache,
+    create_cache_backend,
+)
+from src.utils.single_flight import flight_key, get_single_flight
+from src.utils.site_crawl import CrawlLink, discover_crawl_links
 from src.schemas.website_scoring import (
     HeuristicScore,
     TrustSignals,
@@ -18,18 +36,176 @@ from src.schemas.website_scoring import (
     MobileUsability,
     ContentQuality,
     SocialProof,
-    ConfidenceLevel,
 )
 
 
-class HeuristicEvaluationService(BaseService):
+# Process-wide cap on concurrent async evaluations, one semaphore per event loop
+_EVALUATION_SLOTS: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+
+def _evaluation_slots(limit: int) -> asyncio.Semaphore:
+    loop = asyncio.get_running_loop()
+    slots = _EVALUATION_SLOTS.get(loop)
+    if slots is None:
+        slots = asyncio.Semaphore(limit)
+        _EVALUATION_SLOTS[loop] = slots
+    return slots
+
+
+# Categories merged across crawled pages; mobile usability and content
+# quality describe the landing page itself
+SITE_WIDE_CATEGORIES = ("trust_signals", "cro_elements", "social_proof")
+
+# Signals that only the landing page can establish
+LANDING_ONLY_SIGNALS = frozenset(["has_https", "has_ssl_certificate"])
+
+# Signal evidenced by reaching a linked page of each crawl kind. A pricing
+# page is not evidence of a pricing table; its own analysis has to find one,
+# and reaching it is reported in ``raw_data["crawled_pages"]``.
+CRAWL_KIND_SIGNALS = {
+    "privacy": ("trust_signals", "has_privacy_policy"),
+    "terms": ("trust_signals", "has_terms_of_service"),
+    "about": ("trust_signals", "has_about_page"),
+    "contact": ("trust_signals", "has_contact_info"),
+}
+
+# Process-wide evaluation result cache, shared by every service instance
+_result_cache: Optional[TieredCache] = None
+
+
+def _shared_result_cache(api_config) -> TieredCache:
+    global _result_cache
+    if _result_cache is None:
+        persistent = None
+        backend = api_config.HEURISTICS_RESULT_CACHE_BACKEND
+        if backend:
+            path = api_config.HEURISTICS_RESULT_CACHE_PATH or get_data_path(
+                "leadgen_heuristic_results.sqlite3", api_config
+            )
+            persistent = create_cache_backend(
+                backend,
+                path=path,
+                max_entries=api_config.HEURISTICS_RESULT_CACHE_MAX_PERSISTED,
+            )
+        _result_cache = TieredCache(
+            MemoryCacheBackend(api_config.HEURISTICS_RESULT_CACHE_MAX_ENTRIES),
+            persistent,
+        )
+    return _result_cache
+
+
+# Process-wide pool for CPU-bound parsing and scoring, created on first use
+_evaluation_pool: Optional[ProcessPoolExecutor] = None
+# Evaluator built once in each pool worker process
+_worker_evaluator: Optional[HeuristicEvaluator] = None
+
+# Models of an evaluation, in the order they are packed for transfer
+_EVALUATION_MODELS = {
+    "trust_signals": TrustSignals,
+    "cro_elements": CROElements,
+    "mobile_usability": MobileUsability,
+    "content_quality": ContentQuality,
+    "social_proof": SocialProof,
+}
+
+
+def _shared_evaluation_pool(api_config) -> Optional[ProcessPoolExecutor]:
+    global _evaluation_pool
+    workers = api_config.HEURISTICS_PROCESS_POOL_WORKERS
+    if not workers:
+        return None
+    if _evaluation_pool is None:
+        # Recycling workers after N tasks bounds parser memory growth
+        _evaluation_pool = ProcessPoolExecutor(
+            max_workers=workers,
+            max_tasks_per_child=(
+                api_config.HEURISTICS_PROCESS_POOL_MAX_TASKS_PER_WORKER or None
+            ),
+            initializer=_init_evaluation_worker,
+            initargs=(api_config.HEURISTICS_HTML_PARSER,),
+        )
+    return _evaluation_pool
+
+
+def _discard_evaluation_pool(pool: ProcessPoolExecutor) -> None:
+    global _evaluation_pool
+    if _evaluation_pool is pool:
+        _evaluation_pool = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def shutdown_evaluation_pool() -> None:
+    """Stop the scoring worker processes, if any were started."""
+    global _evaluation_pool
+    if _evaluation_pool is not None:
+        _evaluation_pool.shutdown(wait=True, cancel_futures=True)
+        _evaluation_pool = None
+
+
+def _init_evaluation_worker(html_parser: Optional[str] = None) -> None:
+    # Only the parser and patterns; no fetcher, caches, rate limiter or pool
+    global _worker_evaluator
+    _worker_evaluator = HeuristicEvaluator(html_parser)
+
+
+def _evaluate_in_worker(website_url: str, html_content: str) -> Tuple:
+    """Parse and score a page in a pool worker; returns a packed evaluation."""
+    return _pack_evaluation(_worker_evaluator.evaluate(website_url, html_content))
+
+
+def _pack_evaluation(evaluation: Dict[str, Any]) -> Tuple:
+    """
+    Compact form of an evaluation for transfer between processes.
+
+    Each signal model becomes a bit mask in field order and the scores a
+    tuple of values, around a tenth of the size of the pickled dictionaries.
+    """
+    masks = tuple(
+        sum(
+            1 << index
+            for index, name in enumerate(model.model_fields)
+            if evaluation[category][name]
+        )
+        for category, model in _EVALUATION_MODELS.items()
+    )
+    scores = tuple(evaluation["scores"][name] for name in HeuristicScore.model_fields)
+    return masks, scores
+
+
+def _unpack_evaluation(packed: Tuple) -> Dict[str, Any]:
+    """Rebuild an evaluation dictionary from ``_pack_evaluation`` output."""
+    masks, scores = packed
+    evaluation: Dict[str, Any] = {
+        "scores": dict(zip(HeuristicScore.model_fields, scores))
+    }
+    for mask, (category, model) in zip(masks, _EVALUATION_MODELS.items()):
+        evaluation[category] = {
+            name: bool(mask >> index & 1)
+            for index, name in enumerate(model.model_fields)
+        }
+    return evaluation
+
+
+class HeuristicEvaluationService(HeuristicEvaluator):
     """Service for heuristic evaluation of websites."""
 
     def __init__(self):
-        super().__init__("HeuristicEvaluationService")
         self.api_config = get_api_config()
-        self.rate_limiter = RateLimiter()
+        super().__init__(
+            self.api_config.HEURISTICS_HTML_PARSER, "HeuristicEvaluationService"
+        )
+        self.rate_limiter = get_rate_limiter()
         self.timeout = self.api_config.HEURISTICS_EVALUATION_TIMEOUT_SECONDS
+        self.web_fetcher = get_web_fetcher()
+        self.max_concurrency = self.api_config.HEURISTICS_MAX_CONCURRENCY
+        self.quota_wait = self.api_config.RATE_LIMITER_ACQUIRE_TIMEOUT_SECONDS
+        self.max_page_bytes = self.api_config.HEURISTICS_MAX_PAGE_BYTES
+        self.crawl_enabled = self.api_config.HEURISTICS_CRAWL_ENABLED
+        self.crawl_max_pages = self.api_config.HEURISTICS_CRAWL_MAX_PAGES
+        self.crawl_time_budget = self.api_config.HEURISTICS_CRAWL_TIME_BUDGET_SECONDS
+        self.fetch_cache = (
+            get_http_cache() if self.api_config.HEURISTICS_FETCH_CACHE_ENABLED else None
+        )
 
         # User agent rotation for reliable scraping
         self.user_agents = [
@@ -40,114 +216,13 @@ class HeuristicEvaluationService(BaseService):
             "Mozilla/5.0 (Macintosh; Intel Mac OS X 10.15; rv:89.0) Gecko/20100101 Firefox/89.0",
         ]
 
-        # Trust signal patterns
-        self.trust_patterns = {
-            "privacy_policy": [
-                r"privacy\s*policy",
-                r"privacy\s*notice",
-                r"privacy\s*statement",
-                r"data\s*protection",
-                r"gdpr",
-                r"ccpa",
-                r"\bprivacy\b",
-            ],
-            "terms_of_service": [
-                r"terms\s*of\s*service",
-                r"terms\s*and\s*conditions",
-                r"user\s*agreement",
-                r"legal\s*terms",
-                r"conditions\s*of\s*use",
-            ],
-            "about_page": [
-                r"about\s*us",
-                r"about\s*company",
-                r"company\s*information",
-                r"our\s*story",
-                r"who\s*we\s*are",
-            ],
-            "contact_info": [
-                r"contact\s*us",
-                r"get\s*in\s*touch",
-                r"contact\s*information",
-                r"phone",
-                r"email",
-                r"address",
-                r"\bcontact\b",
-            ],
-        }
-
-        # CRO element patterns
-        self.cro_patterns = {
-            "cta_buttons": [
-                r"get\s*started",
-                r"start\s*now",
-                r"get\s*quote",
-                r"request\s*demo",
-                r"book\s*now",
-                r"order\s*now",
-                r"buy\s*now",
-                r"sign\s*up",
-                r"free\s*trial",
-                r"learn\s*more",
-                r"contact\s*sales",
-            ],
-            "pricing_tables": [
-                r"pricing",
-                r"plans",
-                r"packages",
-                r"cost",
-                r"price",
-                r"monthly",
-                r"annually",
-                r"yearly",
-                r"per\s*month",
-                r"\$\d+",
-            ],
-            "testimonials": [
-                r"testimonial",
-                r"review",
-                r"customer\s*story",
-                r"client\s*feedback",
-                r"what\s*customers\s*say",
-                r"customer\s*experience",
-            ],
-            "urgency_elements": [
-                r"limited\s*time",
-                r"offer\s*expires",
-                r"act\s*now",
-                r"while\s*supplies\s*last",
-                r"only\s*\d+\s*left",
-            ],
-        }
-
-        # Social proof patterns
-        self.social_patterns = {
-            "testimonials": [
-                r"testimonial",
-                r"review",
-                r"customer\s*story",
-                r"client\s*feedback",
-                r"what\s*customers\s*say",
-                r"customer\s*experience",
-            ],
-            "case_studies": [
-                r"case\s*study",
-                r"success\s*story",
-                r"customer\s*success",
-                r"results",
-                r"outcomes",
-                r"before\s*and\s*after",
-            ],
-            "awards_certifications": [
-                r"award",
-                r"certification",
-                r"accreditation",
-                r"badge",
-                r"recognition",
-                r"honor",
-                r"achievement",
-            ],
-        }
+        self.result_cache = (
+            _shared_result_cache(self.api_config)
+            if self.api_config.HEURISTICS_RESULT_CACHE_ENABLED
+            else None
+        )
+        self.evaluation_pool = _shared_evaluation_pool(self.api_config)
+        self.flight = get_single_flight()
 
     def validate_input(self, data: Any) -> bool:
         """Validate input data for the service."""
@@ -163,6 +238,8 @@ class HeuristicEvaluationService(BaseService):
         """
         Run comprehensive heuristic evaluation of a website.
 
+        Concurrent evaluations of the same URL share one execution.
+
         Args:
             website_url: URL of the website to evaluate
             business_id: Business identifier for tracking
@@ -171,6 +248,16 @@ class HeuristicEvaluationService(BaseService):
         Returns:
             Dictionary containing evaluation results and scores
         """
+        result, shared = self.flight.do_sync(
+            flight_key("heuristics", website_url, crawl=False),
+            lambda: self._run_heuristic_evaluation(website_url, business_id, run_id),
+        )
+        return self._for_caller(result, shared, business_id, run_id)
+
+    def _run_heuristic_evaluation(
+        self, website_url: str, business_id: str, run_id: Optional[str]
+    ) -> Dict[str, Any]:
+        """Evaluate a website synchronously, without request coalescing."""
         start_time = time.time()
 
         try:
@@ -182,1176 +269,671 @@ class HeuristicEvaluationService(BaseService):
             )
 
             # Check rate limiting
-            can_proceed, message = self.rate_limiter.can_make_request(
-                "heuristics", run_id
-            )
-            if not can_proceed:
-                self.log_operation(
-                    f"Rate limit exceeded: {message}",
-                    run_id=run_id,
-                    business_id=business_id,
-                )
-                return {
-                    "success": False,
-                    "error": f"Rate limit exceeded: {message}",
-                    "error_code": "RATE_LIMIT_EXCEEDED",
-                    "context": "rate_limit_check",
-                    "run_id": run_id,
-                    "business_id": business_id,
-                }
-
-            # Fetch and parse the website
-            html_content, soup = self._fetch_website(website_url)
-            if not html_content:
-                return {
-                    "success": False,
-                    "error": "Failed to fetch website content",
-                    "error_code": "FETCH_FAILED",
-                    "context": "website_fetching",
-                    "run_id": run_id,
-                    "business_id": business_id,
-                }
-
-            # Evaluate all heuristic categories
-            trust_signals = self._evaluate_trust_signals(website_url, soup)
-            cro_elements = self._evaluate_cro_elements(soup)
-            mobile_usability = self._evaluate_mobile_usability(soup)
-            content_quality = self._evaluate_content_quality(soup)
-            social_proof = self._evaluate_social_proof(soup)
-
-            # Calculate scores
-            scores = self._calculate_heuristic_scores(
-                trust_signals,
-                cro_elements,
-                mobile_usability,
-                content_quality,
-                social_proof,
-            )
-
-            # Record successful request
-            self.rate_limiter.record_request("heuristics", True, run_id)
-
-            evaluation_time = time.time() - start_time
-            self.log_operation(
-                f"Completed heuristic evaluation in {evaluation_time:.2f}s",
-                run_id=run_id,
-                business_id=business_id,
-                evaluation_time=evaluation_time,
-            )
-
-            return {
-                "success": True,
-                "website_url": website_url,
-                "business_id": business_id,
-                "run_id": run_id,
-                "evaluation_timestamp": time.time(),
-                "scores": scores,
-                "trust_signals": trust_signals.model_dump(),
-                "cro_elements": cro_elements.model_dump(),
-                "mobile_usability": mobile_usability.model_dump(),
-                "content_quality": content_quality.model_dump(),
-                "social_proof": social_proof.model_dump(),
-                "confidence": scores.confidence_level.value,
-                "raw_data": {
-                    "html_length": len(html_content),
-                    "evaluation_time": evaluation_time,
-                },
-            }
-
-        except Exception as e:
-            # Record failed request
-            self.rate_limiter.record_request("heuristics", False, run_id)
-
-            self.log_error(e, "heuristic_evaluation", run_id, business_id)
-
-            return {
-                "success": False,
-                "error": str(e),
-                "error_code": "EVALUATION_FAILED",
-                "context": "heuristic_evaluation",
-                "run_id": run_id,
-                "business_id": business_id,
-            }
-
-    def _fetch_website(
-        self, website_url: str
-    ) -> Tuple[Optional[str], Optional[BeautifulSoup]]:
-        """Fetch website content and parse HTML."""
-        try:
-            # Select a user agent
-            user_agent = self.user_agents[hash(website_url) % len(self.user_agents)]
-
-            headers = {
-                "User-Agent": user_agent,
-                "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
-                "Accept-Language": "en-US,en;q=0.5",
-                "Accept-Encoding": "gzip, deflate",
-                "Connection": "keep-alive",
-                "Upgrade-Insecure-Requests": "1",
-            }
-
-            response = requests.get(
-                website_url, headers=headers, timeout=self.timeout, allow_redirects=True
-            )
-            response.raise_for_status()
-
-            # Parse HTML content
-            soup = BeautifulSoup(response.content, "html.parser")
-            return response.text, soup
-
-        except requests.exceptions.Timeout:
-            self.log_error(Exception("Website fetch timeout"), "website_fetching")
-            return None, None
-        except requests.exceptions.RequestException as e:
-            self.log_error(e, "website_fetching")
-            return None, None
-        except Exception as e:
-            self.log_error(e, "website_fetching")
-            return None, None
-
-    def _evaluate_trust_signals(
-        self, website_url: str, soup: BeautifulSoup
-    ) -> TrustSignals:
-        """Evaluate trust signals on the website."""
-        try:
-            # Check HTTPS
-            has_https = website_url.startswith("https://")
-
-            # Check SSL certificate (basic check)
-            has_ssl_certificate = has_https
-
-            # Check for privacy policy
-            has_privacy_policy = self._check_text_patterns(
-                soup, self.trust_patterns["privacy_policy"]
-            )
-
-            # Check for terms of service
-            has_terms_of_service = self._check_text_patterns(
-                soup, self.trust_patterns["terms_of_service"]
-            )
-
-            # Check for about page
-            has_about_page = self._check_text_patterns(
-                soup, self.trust_patterns["about_page"]
-            )
-
-            # Check for contact information
-            has_contact_info = self._check_text_patterns(
-                soup, self.trust_patterns["contact_info"]
-            )
-
-            # Check for business address
-            has_business_address = self._check_address_elements(soup)
-
-            # Check for phone number
-            has_phone_number = self._check_phone_elements(soup)
-
-            # Check for email
-            has_email = self._check_email_elements(soup)
-
-            return TrustSignals(
-                has_https=has_https,
-                has_privacy_policy=has_privacy_policy,
-                has_contact_info=has_contact_info,
-                has_about_page=has_about_page,
-                has_terms_of_service=has_terms_of_service,
-                has_ssl_certificate=has_ssl_certificate,
-                has_business_address=has_business_address,
-                has_phone_number=has_phone_number,
-                has_email=has_email,
-            )
-
-        except Exception as e:
-            self.log_error(e, "trust_signals_evaluation")
-            return TrustSignals()
-
-    def _evaluate_cro_elements(self, soup: BeautifulSoup) -> CROElements:
-        """Evaluate conversion rate optimization elements."""
-        try:
-            # Check for CTA buttons
-            has_cta_buttons = self._check_cta_elements(soup)
-
-            # Check for contact forms
-            has_contact_forms = self._check_contact_forms(soup)
-
-            # Check for pricing tables
-            has_pricing_tables = self._check_text_patterns(
-                soup, self.cro_patterns["pricing_tables"]
-            )
-
-            # Check for testimonials
-            has_testimonials = self._check_text_patterns(
-                soup, self.cro_patterns["testimonials"]
-            )
-
-            # Check for reviews
-            has_reviews = self._check_review_elements(soup)
-
-            # Check for social proof
-            has_social_proof = has_testimonials or has_reviews
-
-            # Check for urgency elements
-            has_urgency_elements = self._check_text_patterns(
-                soup, self.cro_patterns["urgency_elements"]
-            )
-
-            # Check for trust badges
-            has_trust_badges = self._check_trust_badges(soup)
-
-            return CROElements(
-                has_cta_buttons=has_cta_buttons,
-                has_contact_forms=has_contact_forms,
-                has_pricing_tables=has_pricing_tables,
-                has_testimonials=has_testimonials,
-                has_reviews=has_reviews,
-                has_social_proof=has_social_proof,
-                has_urgency_elements=has_urgency_elements,
-                has_trust_badges=has_trust_badges,
-            )
-
-        except Exception as e:
-            self.log_error(e, "cro_elements_evaluation")
-            return CROElements()
+            rate_limit_error = self._check_rate_limit(run_id, business_id)
+            if rate_limit_error:
+                return rate_limit_error
 
-    def _evaluate_mobile_usability(self, soup: BeautifulSoup) -> MobileUsability:
-        """Evaluate mobile usability heuristics."""
-        try:
-            # Check for viewport meta tag
-            has_viewport_meta = self._check_viewport_meta(soup)
-
-            # Check for touch targets
-            has_touch_targets = self._check_touch_targets(soup)
-
-            # Check for responsive design
-            has_responsive_design = self._check_responsive_design(soup)
-
-            # Check for mobile navigation
-            has_mobile_navigation = self._check_mobile_navigation(soup)
-
-            # Check for readable fonts
-            has_readable_fonts = self._check_readable_fonts(soup)
-
-            # Check for adequate spacing
-            has_adequate_spacing = self._check_adequate_spacing(soup)
+            # Fetch the website; it is only parsed if no cached result matches
+            html_content = self._download_page(website_url)
+            if not html_content:
+                return self._fetch_failed_result(run_id, business_id)
 
-            return MobileUsability(
-                has_viewport_meta=has_viewport_meta,
-                has_touch_targets=has_touch_targets,
-                has_responsive_design=has_responsive_design,
-                has_mobile_navigation=has_mobile_navigation,
-                has_readable_fonts=has_readable_fonts,
-                has_adequate_spacing=has_adequate_spacing,
+            return self._evaluate_page(
+                website_url, business_id, run_id, html_content, start_time
             )
 
         except Exception as e:
-            self.log_error(e, "mobile_usability_evaluation")
-            return MobileUsability()
-
-    def _evaluate_content_quality(self, soup: BeautifulSoup) -> ContentQuality:
-        """Evaluate content quality and structure."""
-        try:
-            # Check for proper heading structure
-            has_proper_headings = self._check_heading_structure(soup)
-
-            # Check for alt text on images
-            has_alt_text = self._check_alt_text(soup)
+            return self._evaluation_failed_result(e, run_id, business_id)
 
-            # Check for meta description
-            has_meta_description = self._check_meta_description(soup)
-
-            # Check for meta keywords
-            has_meta_keywords = self._check_meta_keywords(soup)
-
-            # Check for structured data
-            has_structured_data = self._check_structured_data(soup)
-
-            # Check for internal links
-            has_internal_links = self._check_internal_links(soup)
-
-            # Check for external links
-            has_external_links = self._check_external_links(soup)
+    async def run_heuristic_evaluation_async(
+        self,
+        website_url: str,
+        business_id: str,
+        run_id: Optional[str] = None,
+        crawl: Optional[bool] = None,
+        priority: RequestPriority = RequestPriority.NORMAL,
+    ) -> Dict[str, Any]:
+        """
+        Run heuristic evaluation without blocking the event loop.
+
+        Concurrent evaluations of the same URL and crawl mode share one
+        execution and its result. When the heuristics rate limit is used up
+        the evaluation queues for capacity, for up to
+        RATE_LIMITER_ACQUIRE_TIMEOUT_SECONDS, instead of failing at once;
+        BATCH priority evaluations wait until capacity frees up.
+
+        The page is fetched through the shared pooled WebFetcher and parsed
+        and scored in a worker thread, or in a worker process when
+        HEURISTICS_PROCESS_POOL_WORKERS is set. At most
+        HEURISTICS_MAX_CONCURRENCY evaluations run at once per process;
+        further calls wait for a slot.
+
+        In crawl mode the same-origin privacy, terms, about, contact and
+        pricing pages linked from the landing page are fetched concurrently,
+        within HEURISTICS_CRAWL_MAX_PAGES and HEURISTICS_CRAWL_TIME_BUDGET_SECONDS,
+        and their evidence is merged into the trust, CRO and social proof
+        signals.
 
-            # Check for blog content
-            has_blog_content = self._check_blog_content(soup)
+        Args:
+            website_url: URL of the website to evaluate
+            business_id: Business identifier for tracking
+            run_id: Run identifier for tracking
+            crawl: Also evaluate linked pages; defaults to HEURISTICS_CRAWL_ENABLED
+            priority: Queue class while waiting for rate limit capacity
 
-            return ContentQuality(
-                has_proper_headings=has_proper_headings,
-                has_alt_text=has_alt_text,
-                has_meta_description=has_meta_description,
-                has_meta_keywords=has_meta_keywords,
-                has_structured_data=has_structured_data,
-                has_internal_links=has_internal_links,
-                has_external_links=has_external_links,
-                has_blog_content=has_blog_content,
-            )
+        Returns:
+            Dictionary containing evaluation results and scores, in the same
+            shape as run_heuristic_evaluation
+        """
+        crawl = self.crawl_enabled if crawl is None else crawl
+        result, shared = await self.flight.do(
+            flight_key("heuristics", website_url, crawl=crawl),
+            lambda: self._run_heuristic_evaluation_async(
+                website_url, business_id, run_id, crawl, priority
+            ),
+        )
+        return self._for_caller(result, shared, business_id, run_id)
+
+    @staticmethod
+    def _for_caller(
+        result: Dict[str, Any],
+        shared: bool,
+        business_id: str,
+        run_id: Optional[str],
+    ) -> Dict[str, Any]:
+        """Attribute a result that may have been shared with other callers."""
+        if not shared:
+            return result
+        return {**result, "business_id": business_id, "run_id": run_id}
 
-        except Exception as e:
-            self.log_error(e, "content_quality_evaluation")
-            return ContentQuality()
+    async def _run_heuristic_evaluation_async(
+        self,
+        website_url: str,
+        business_id: str,
+        run_id: Optional[str],
+        crawl: bool,
+        priority: RequestPriority = RequestPriority.NORMAL,
+    ) -> Dict[str, Any]:
+        """Evaluate a website asynchronously, without request coalescing."""
+        # Wait for quota before taking an evaluation slot, so queued
+        # evaluations do not hold slots
+        reservation = await self._acquire(run_id, priority)
+        if not reservation.granted:
+            return self._rate_limited_result(reservation.reason, run_id, business_id)
 
-    def _evaluate_social_proof(self, soup: BeautifulSoup) -> SocialProof:
-        """Evaluate social proof elements."""
-        try:
-            # Check for social media links
-            has_social_media_links = self._check_social_media_links(soup)
+        async with _evaluation_slots(self.max_concurrency):
+            start_time = time.time()
 
-            # Check for customer reviews
-            has_customer_reviews = self._check_review_elements(soup)
+            try:
+                self.log_operation(
+                    "Starting heuristic evaluation",
+                    run_id=run_id,
+                    business_id=business_id,
+                    website_url=website_url,
+                    crawl=crawl,
+                )
 
-            # Check for testimonials
-            has_testimonials = self._check_text_patterns(
-                soup, self.social_patterns["testimonials"]
-            )
+                page = await self._fetch_page_async(website_url)
+                if page is None or not page.text:
+                    # Unreachable sites do not count against the limit
+                    self.rate_limiter.release(reservation, run_id)
+                    return self._fetch_failed_result(run_id, business_id)
+
+                if crawl:
+                    return await self._evaluate_site_async(
+                        website_url,
+                        business_id,
+                        run_id,
+                        page,
+                        start_time,
+                        reservation,
+                    )
+
+                # Parsing and scoring are CPU bound; keep them off the event loop
+                evaluation, result_cached = await self._page_evaluation_async(
+                    website_url, page.text
+                )
+                return self._evaluation_result(
+                    website_url,
+                    business_id,
+                    run_id,
+                    evaluation,
+                    start_time,
+                    {"html_length": len(page.text), "result_cached": result_cached},
+                    reservation,
+                )
 
-            # Check for case studies
-            has_case_studies = self._check_text_patterns(
-                soup, self.social_patterns["case_studies"]
-            )
+            except Exception as e:
+                return self._evaluation_failed_result(
+                    e, run_id, business_id, reservation
+                )
 
-            # Check for awards and certifications
-            has_awards_certifications = self._check_text_patterns(
-                soup, self.social_patterns["awards_certifications"]
-            )
+    async def evaluate_many(
+        self,
+        urls: Sequence[str],
+        business_ids: Optional[Sequence[str]] = None,
+        run_id: Optional[str] = None,
+        max_concurrency: Optional[int] = None,
+        crawl: Optional[bool] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Evaluate many websites concurrently.
 
-            # Check for partner logos
-            has_partner_logos = self._check_partner_logos(soup)
+        Args:
+            urls: Website URLs to evaluate
+            business_ids: Business identifier per URL (defaults to the URL)
+            run_id: Run identifier for tracking
+            max_concurrency: Optional cap for this batch, below the
+                process-wide HEURISTICS_MAX_CONCURRENCY
+            crawl: Also evaluate linked pages; defaults to HEURISTICS_CRAWL_ENABLED
 
-            # Check for user-generated content
-            has_user_generated_content = self._check_user_generated_content(soup)
+        Returns:
+            One evaluation result per URL, in input order; failures are
+            returned as error dictionaries rather than raised
+        """
+        if business_ids is None:
+            business_ids = list(urls)
+        if len(business_ids) != len(urls):
+            raise ValueError("business_ids must have one entry per URL")
+
+        results: List[Dict[str, Any]] = [{}] * len(urls)
+        async for index, result, _ in self.evaluate_stream(
+            list(zip(business_ids, urls)),
+            run_id=run_id,
+            max_concurrency=max_concurrency,
+            crawl=crawl,
+        ):
+            results[index] = result
+        return results
+
+    async def evaluate_stream(
+        self,
+        items: Sequence[Tuple[str, str]],
+        run_id: Optional[str] = None,
+        max_concurrency: Optional[int] = None,
+        crawl: Optional[bool] = None,
+    ) -> AsyncIterator[Tuple[int, Dict[str, Any], float]]:
+        """
+        Evaluate many websites concurrently, yielding results as they finish.
 
-            return SocialProof(
-                has_social_media_links=has_social_media_links,
-                has_customer_reviews=has_customer_reviews,
-                has_testimonials=has_testimonials,
-                has_case_studies=has_case_studies,
-                has_awards_certifications=has_awards_certifications,
-                has_partner_logos=has_partner_logos,
-                has_user_generated_content=has_user_generated_content,
-            )
+        At most ``max_concurrency`` items, by default HEURISTICS_MAX_CONCURRENCY,
+        are started at a time. Items wait for heuristics rate limit capacity
+        at BATCH priority rather than failing, so a large batch is paced by
+        the limit instead of returning RATE_LIMIT_EXCEEDED results.
 
-        except Exception as e:
-            self.log_error(e, "social_proof_evaluation")
-            return SocialProof()
+        Args:
+            items: ``(business_id, website_url)`` pairs
+            run_id: Run identifier for tracking
+            max_concurrency: Optional cap for this batch, below the
+                process-wide HEURISTICS_MAX_CONCURRENCY
+            crawl: Also evaluate linked pages; defaults to HEURISTICS_CRAWL_ENABLED
 
-    def _check_text_patterns(self, soup: BeautifulSoup, patterns: list) -> bool:
-        """Check if any text patterns are found in the HTML."""
-        try:
-            # Check text content
-            text_content = soup.get_text().lower()
-            if any(
-                re.search(pattern, text_content, re.IGNORECASE) for pattern in patterns
-            ):
-                return True
-
-            # Check link text and href attributes
-            links = soup.find_all("a", href=True)
-            for link in links:
-                link_text = link.get_text().lower()
-                href = link.get("href", "").lower()
-
-                # Check if link text or href contains any of the patterns
-                if any(
-                    re.search(pattern, link_text, re.IGNORECASE) for pattern in patterns
-                ):
-                    return True
-                if any(re.search(pattern, href, re.IGNORECASE) for pattern in patterns):
-                    return True
-
-            # Check HTML attributes (class, id, etc.)
-            for tag in soup.find_all():
-                for attr_name, attr_value in tag.attrs.items():
-                    if isinstance(attr_value, str):
-                        if any(
-                            re.search(pattern, attr_value.lower(), re.IGNORECASE)
-                            for pattern in patterns
-                        ):
-                            return True
-                    elif isinstance(attr_value, list):
-                        for value in attr_value:
-                            if isinstance(value, str):
-                                if any(
-                                    re.search(pattern, value.lower(), re.IGNORECASE)
-                                    for pattern in patterns
-                                ):
-                                    return True
+        Yields:
+            ``(index, result, elapsed_seconds)`` in completion order, where
+            ``index`` is the position of the item in ``items``
+        """
+        if not items:
+            return
+        pending = iter(enumerate(items))
+        finished: asyncio.Queue = asyncio.Queue()
+
+        async def evaluate_next() -> None:
+            # Workers share one iterator, so each item is taken exactly once
+            for index, (business_id, url) in pending:
+                started = time.monotonic()
+                try:
+                    result = await self.run_heuristic_evaluation_async(
+                        url,
+                        business_id,
+                        run_id,
+                        crawl=crawl,
+                        priority=RequestPriority.BATCH,
+                    )
+                except Exception as e:
+                    finished.put_nowait(e)
+                    return
+                finished.put_nowait((index, result, time.monotonic() - started))
+
+        workers = min(max_concurrency or self.max_concurrency, len(items))
+        self.log_operation(
+            "Streaming website evaluations",
+            run_id=run_id,
+            websites=len(items),
+            max_concurrency=workers,
+        )
+        tasks = [asyncio.create_task(evaluate_next()) for _ in range(workers)]
+        try:
+            for _ in range(len(items)):
+                entry = await finished.get()
+                if isinstance(entry, Exception):
+                    raise entry
+                yield entry
+        finally:
+            # The consumer may stop early, e.g. when a client disconnects
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _acquire(
+        self, run_id: Optional[str], priority: RequestPriority
+    ) -> Reservation:
+        """
+        Wait for heuristics rate limit capacity. Batch items wait until it
+        frees up; other evaluations for at most ``quota_wait`` seconds.
+        """
+        timeout = None if priority == RequestPriority.BATCH else self.quota_wait
+        return await self.rate_limiter.acquire("heuristics", timeout, priority, run_id)
+
+    def _check_rate_limit(
+        self, run_id: Optional[str], business_id: str
+    ) -> Optional[Dict[str, Any]]:
+        """Return an error result if the heuristics rate limit is exhausted."""
+        can_proceed, message = self.rate_limiter.can_make_request(
+            "heuristics", run_id
+        )
+        if can_proceed:
+            return None
+        return self._rate_limited_result(message, run_id, business_id)
 
-            return False
-        except Exception:
-            return False
+    def _rate_limited_result(
+        self, message: str, run_id: Optional[str], business_id: str
+    ) -> Dict[str, Any]:
+        self.log_operation(
+            "Rate limit exceeded",
+            run_id=run_id,
+            business_id=business_id,
+            reason=message,
+        )
+        return {
+            "success": False,
+            "error": f"Rate limit exceeded: {message}",
+            "error_code": "RATE_LIMIT_EXCEEDED",
+            "context": "rate_limit_check",
+            "run_id": run_id,
+            "business_id": business_id,
+        }
 
-    def _check_address_elements(self, soup: BeautifulSoup) -> bool:
-        """Check for business address elements."""
-        try:
-            # Look for address-related text
-            address_patterns = [
-                r"\d+\s+[a-zA-Z\s]+(?:street|st|avenue|ave|road|rd|lane|ln|drive|dr)",
-                r"[a-zA-Z\s]+,\s*[A-Z]{2}\s*\d{5}",
-                r"p\.?o\.?\s*box\s*\d+",
-            ]
-
-            text_content = soup.get_text()
-            return any(
-                re.search(pattern, text_content, re.IGNORECASE)
-                for pattern in address_patterns
-            )
-        except Exception:
-            return False
+    def _fetch_failed_result(
+        self, run_id: Optional[str], business_id: str
+    ) -> Dict[str, Any]:
+        return {
+            "success": False,
+            "error": "Failed to fetch website content",
+            "error_code": "FETCH_FAILED",
+            "context": "website_fetching",
+            "run_id": run_id,
+            "business_id": business_id,
+        }
 
-    def _check_phone_elements(self, soup: BeautifulSoup) -> bool:
-        """Check for phone number elements."""
-        try:
-            # Look for phone number patterns
-            phone_patterns = [
-                r"\(\d{3}\)\s*\d{3}-\d{4}",
-                r"\d{3}-\d{3}-\d{4}",
-                r"\d{3}\.\d{3}\.\d{4}",
-                r"\+1\s*\d{3}\s*\d{3}\s*\d{4}",
-            ]
-
-            text_content = soup.get_text()
-            return any(re.search(pattern, text_content) for pattern in phone_patterns)
-        except Exception:
-            return False
+    def _evaluation_failed_result(
+        self,
+        error: Exception,
+        run_id: Optional[str],
+        business_id: str,
+        reservation: Optional[Reservation] = None,
+    ) -> Dict[str, Any]:
+        # Record failed request
+        self.rate_limiter.record_request("heuristics", False, run_id, reservation)
+
+        self.log_error(error, "heuristic_evaluation", run_id, business_id)
+
+        return {
+            "success": False,
+            "error": str(error),
+            "error_code": "EVALUATION_FAILED",
+            "context": "heuristic_evaluation",
+            "run_id": run_id,
+            "business_id": business_id,
+        }
 
-    def _check_email_elements(self, soup: BeautifulSoup) -> bool:
-        """Check for email address elements."""
-        try:
-            # Look for email patterns
-            email_pattern = r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b"
-            text_content = soup.get_text()
-            return bool(re.search(email_pattern, text_content))
-        except Exception:
-            return False
+    def _evaluate_page(
+        self,
+        website_url: str,
+        business_id: str,
+        run_id: Optional[str],
+        html_content: str,
+        start_time: float,
+    ) -> Dict[str, Any]:
+        """Score a page and build the evaluation result."""
+        evaluation, result_cached = self._page_evaluation(website_url, html_content)
+        return self._evaluation_result(
+            website_url,
+            business_id,
+            run_id,
+            evaluation,
+            start_time,
+            {"html_length": len(html_content), "result_cached": result_cached},
+        )
 
-    def _check_cta_elements(self, soup: BeautifulSoup) -> bool:
-        """Check for call-to-action buttons."""
-        try:
-            # Look for CTA buttons and links
-            cta_elements = soup.find_all(
-                ["button", "a", "input"],
-                string=re.compile(
-                    "|".join(self.cro_patterns["cta_buttons"]), re.IGNORECASE
-                ),
-            )
+    def _page_evaluation(
+        self,
+        website_url: str,
+        html_content: str,
+        features: Optional[PageFeatures] = None,
+    ) -> Tuple[Dict[str, Any], bool]:
+        """Evaluate one page, reusing the cached result for identical content."""
+        # Identical content under the same ruleset scores identically; skip
+        # parsing and evaluation when it has been seen before
+        cache_key = self._result_cache_key(website_url, html_content)
+        evaluation = self.result_cache.get(cache_key) if self.result_cache else None
+        if evaluation is not None:
+            return evaluation, True
+
+        if features is None:
+            features = self.page_parser.parse(html_content)
+        evaluation = self._evaluate_features(website_url, features)
+        if self.result_cache is not None:
+            self.result_cache.set(cache_key, evaluation)
+        return evaluation, False
+
+    async def _page_evaluation_async(
+        self,
+        website_url: str,
+        html_content: str,
+        features: Optional[PageFeatures] = None,
+    ) -> Tuple[Dict[str, Any], bool]:
+        """
+        Evaluate one page off the event loop.
 
-            # Also check for buttons with CTA-like classes
-            cta_buttons = soup.find_all(
-                "button",
-                class_=re.compile(r"cta|call-to-action|primary|action", re.IGNORECASE),
+        With a process pool configured, cache misses are parsed and scored in
+        a worker process so scoring is not serialized on the GIL; otherwise,
+        or for pages already parsed here, a worker thread is used.
+        """
+        pool = self.evaluation_pool
+        if pool is None or features is not None:
+            return await asyncio.to_thread(
+                self._page_evaluation, website_url, html_content, features
             )
 
-            return len(cta_elements) > 0 or len(cta_buttons) > 0
-        except Exception:
-            return False
-
-    def _check_contact_forms(self, soup: BeautifulSoup) -> bool:
-        """Check for contact forms."""
-        try:
-            # Look for form elements
-            forms = soup.find_all("form")
-
-            # Check if any form has contact-related fields
-            for form in forms:
-                # Check form action attribute
-                form_action = form.get("action", "").lower()
-                if any(
-                    keyword in form_action
-                    for keyword in ["contact", "message", "inquiry", "request"]
-                ):
-                    return True
-
-                # Check form text content
-                form_text = form.get_text().lower()
-                if any(
-                    keyword in form_text
-                    for keyword in ["contact", "message", "inquiry", "request"]
-                ):
-                    return True
-
-                # Check for common contact form fields
-                inputs = form.find_all("input")
-                for input_elem in inputs:
-                    input_type = input_elem.get("type", "").lower()
-                    input_name = input_elem.get("name", "").lower()
-                    if input_type in ["email", "text"] and any(
-                        keyword in input_name
-                        for keyword in ["name", "email", "message"]
-                    ):
-                        return True
-
-            return False
-        except Exception:
-            return False
-
-    def _check_review_elements(self, soup: BeautifulSoup) -> bool:
-        """Check for review elements."""
-        try:
-            # Look for review-related elements
-            review_patterns = [
-                r"review",
-                r"rating",
-                r"star",
-                r"feedback",
-                r"opinion",
-                r"\d+\s*out\s*of\s*\d+",
-                r"\d+\s*stars?",
-            ]
-
-            # Check text content
-            text_content = soup.get_text().lower()
-            if any(
-                re.search(pattern, text_content, re.IGNORECASE)
-                for pattern in review_patterns
-            ):
-                return True
-
-            # Check HTML attributes (class, id, etc.)
-            for tag in soup.find_all():
-                for attr_name, attr_value in tag.attrs.items():
-                    if isinstance(attr_value, str):
-                        if any(
-                            re.search(pattern, attr_value.lower(), re.IGNORECASE)
-                            for pattern in review_patterns
-                        ):
-                            return True
-                    elif isinstance(attr_value, list):
-                        for value in attr_value:
-                            if isinstance(value, str):
-                                if any(
-                                    re.search(pattern, value.lower(), re.IGNORECASE)
-                                    for pattern in review_patterns
-                                ):
-                                    return True
-
-            return False
-        except Exception:
-            return False
+        cache_key = await asyncio.to_thread(
+            self._result_cache_key, website_url, html_content
+        )
+        if self.result_cache is not None:
+            evaluation = await asyncio.to_thread(self.result_cache.get, cache_key)
+            if evaluation is not None:
+                return evaluation, True
 
-    def _check_trust_badges(self, soup: BeautifulSoup) -> bool:
-        """Check for trust badges and certifications."""
+        loop = asyncio.get_running_loop()
         try:
-            # Look for trust-related images and text
-            trust_patterns = [
-                r"trust\s*badge",
-                r"certified",
-                r"verified",
-                r"secure",
-                r"bbb",
-                r"better\s*business\s*bureau",
-                r"guarantee",
-            ]
-
-            text_content = soup.get_text().lower()
-            return any(
-                re.search(pattern, text_content, re.IGNORECASE)
-                for pattern in trust_patterns
+            packed = await loop.run_in_executor(
+                pool, _evaluate_in_worker, website_url, html_content
             )
-        except Exception:
-            return False
-
-    def _check_viewport_meta(self, soup: BeautifulSoup) -> bool:
-        """Check for viewport meta tag."""
-        try:
-            viewport_meta = soup.find("meta", attrs={"name": "viewport"})
-            return viewport_meta is not None
-        except Exception:
-            return False
-
-    def _check_touch_targets(self, soup: BeautifulSoup) -> bool:
-        """Check for adequate touch target sizes."""
-        try:
-            # Look for buttons and links that might be touch targets
-            touch_elements = soup.find_all(["button", "a", "input"])
-
-            # This is a simplified check - in a real implementation, you'd analyze CSS
-            # For now, we'll assume the presence of mobile-friendly elements suggests good touch targets
-            return len(touch_elements) > 0
-        except Exception:
-            return False
-
-    def _check_responsive_design(self, soup: BeautifulSoup) -> bool:
-        """Check for responsive design indicators."""
-        try:
-            # Look for responsive design indicators
-            responsive_indicators = [
-                soup.find("meta", attrs={"name": "viewport"}),
-                soup.find(
-                    "link",
-                    attrs={"media": re.compile(r"max-width|min-width", re.IGNORECASE)},
-                ),
-                soup.find("style", string=re.compile(r"@media", re.IGNORECASE)),
-            ]
-
-            return any(indicator is not None for indicator in responsive_indicators)
-        except Exception:
-            return False
-
-    def _check_mobile_navigation(self, soup: BeautifulSoup) -> bool:
-        """Check for mobile navigation elements."""
-        try:
-            # Look for mobile navigation indicators
-            mobile_nav_patterns = [
-                r"mobile\s*nav",
-                r"hamburger",
-                r"menu\s*toggle",
-                r"mobile\s*menu",
-                r"responsive\s*nav",
-            ]
-
-            text_content = soup.get_text().lower()
-            return any(
-                re.search(pattern, text_content, re.IGNORECASE)
-                for pattern in mobile_nav_patterns
+        except BrokenProcessPool as e:
+            # A worker died; rebuild the pool next time and score here instead
+            self.log_error(e, "process_pool_evaluation")
+            _discard_evaluation_pool(pool)
+            return await asyncio.to_thread(
+                self._page_evaluation, website_url, html_content
             )
-        except Exception:
-            return False
 
-    def _check_readable_fonts(self, soup: BeautifulSoup) -> bool:
-        """Check for readable font sizes."""
-        try:
-            # This is a simplified check - in a real implementation, you'd analyze CSS
-            # For now, we'll assume the presence of text content suggests readable fonts
-            text_content = soup.get_text()
-            return (
-                len(text_content.strip()) > 100
-            )  # Assume readable if there's substantial text
-        except Exception:
-            return False
+        evaluation = _unpack_evaluation(packed)
+        if self.result_cache is not None:
+            await asyncio.to_thread(self.result_cache.set, cache_key, evaluation)
+        return evaluation, False
 
-    def _check_adequate_spacing(self, soup: BeautifulSoup) -> bool:
-        """Check for adequate spacing between elements."""
-        try:
-            # This is a simplified check - in a real implementation, you'd analyze CSS
-            # For now, we'll assume the presence of structured content suggests good spacing
-            paragraphs = soup.find_all("p")
-            divs = soup.find_all("div")
-            return len(paragraphs) > 0 or len(divs) > 0
-        except Exception:
-            return False
-
-    def _check_heading_structure(self, soup: BeautifulSoup) -> bool:
-        """Check for proper heading structure."""
-        try:
-            headings = soup.find_all(["h1", "h2", "h3", "h4", "h5", "h6"])
-
-            if len(headings) == 0:
-                return False
+    def _merge_site_evidence(
+        self,
+        landing: Dict[str, Any],
+        linked: List[Tuple[CrawlLink, Dict[str, Any]]],
+    ) -> Dict[str, Any]:
+        """Combine landing page signals with evidence from crawled pages."""
+        merged = {
+            category: dict(signals)
+            for category, signals in landing.items()
+            if category != "scores"
+        }
+        for link, evaluation in linked:
+            for category in SITE_WIDE_CATEGORIES:
+                for signal, present in evaluation[category].items():
+                    if present and signal not in LANDING_ONLY_SIGNALS:
+                        merged[category][signal] = True
+
+            # A reachable page of a known kind is direct evidence of its signal
+            if link.kind in CRAWL_KIND_SIGNALS:
+                category, signal = CRAWL_KIND_SIGNALS[link.kind]
+                merged[category][signal] = True
+
+        scores = self._calculate_heuristic_scores(
+            TrustSignals.model_validate(merged["trust_signals"]),
+            CROElements.model_validate(merged["cro_elements"]),
+            MobileUsability.model_validate(merged["mobile_usability"]),
+            ContentQuality.model_validate(merged["content_quality"]),
+            SocialProof.model_validate(merged["social_proof"]),
+        )
+        merged["scores"] = scores.model_dump(mode="json")
+        return merged
 
-            # Check if there's at least one H1
-            h1_count = len(soup.find_all("h1"))
+    def _evaluation_result(
+        self,
+        website_url: str,
+        business_id: str,
+        run_id: Optional[str],
+        evaluation: Dict[str, Any],
+        start_time: float,
+        raw_data: Dict[str, Any],
+        reservation: Optional[Reservation] = None,
+    ) -> Dict[str, Any]:
+        """Build the success response from an evaluation."""
+        scores = HeuristicScore.model_validate(evaluation["scores"])
+        trust_signals = TrustSignals.model_validate(evaluation["trust_signals"])
+        cro_elements = CROElements.model_validate(evaluation["cro_elements"])
+        mobile_usability = MobileUsability.model_validate(
+            evaluation["mobile_usability"]
+        )
+        content_quality = ContentQuality.model_validate(evaluation["content_quality"])
+        social_proof = SocialProof.model_validate(evaluation["social_proof"])
+
+        # Record successful request
+        self.rate_limiter.record_request("heuristics", True, run_id, reservation)
+
+        evaluation_time = time.time() - start_time
+        self.log_operation(
+            "Completed heuristic evaluation",
+            run_id=run_id,
+            business_id=business_id,
+            evaluation_time=evaluation_time,
+            result_cached=raw_data.get("result_cached"),
+        )
 
-            # Check for logical heading hierarchy
-            [int(h.name[1]) for h in headings]
+        return {
+            "success": True,
+            "website_url": website_url,
+            "business_id": business_id,
+            "run_id": run_id,
+            "evaluation_timestamp": time.time(),
+            "scores": scores,
+            "trust_signals": trust_signals.model_dump(),
+            "cro_elements": cro_elements.model_dump(),
+            "mobile_usability": mobile_usability.model_dump(),
+            "content_quality": content_quality.model_dump(),
+            "social_proof": social_proof.model_dump(),
+            "confidence": scores.confidence_level.value,
+            "raw_data": {"evaluation_time": evaluation_time, **raw_data},
+        }
 
-            return h1_count > 0 and len(headings) >= 2
-        except Exception:
-            return False
+    def _result_cache_key(self, website_url: str, html_content: str) -> str:
+        """Cache key for a page: ruleset version, URL scheme and content hash."""
+        content_hash = hashlib.sha256(html_content.encode("utf-8")).hexdigest()
+        # The HTTPS trust signal is the only input taken from the URL
+        scheme = "https" if website_url.startswith("https://") else "http"
+        return f"{self.ruleset_version}:{scheme}:{content_hash}"
+
+    def _request_headers(self, website_url: str) -> Dict[str, str]:
+        """Browser-like request headers with a per-site user agent."""
+        # Select a user agent
+        user_agent = self.user_agents[hash(website_url) % len(self.user_agents)]
+
+        return {
+            "User-Agent": user_agent,
+            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
+            "Accept-Language": "en-US,en;q=0.5",
+            "Upgrade-Insecure-Requests": "1",
+        }
 
-    def _check_alt_text(self, soup: BeautifulSoup) -> bool:
-        """Check for alt text on images."""
+    def _download_page(self, website_url: str) -> Optional[str]:
+        """Download a page under the byte budget, decoded to text."""
         try:
-            images = soup.find_all("img")
-            if len(images) == 0:
-                return True  # No images means no alt text needed
-
-            images_with_alt = [
-                img for img in images if img.get("alt") and img.get("alt").strip()
-            ]
-            return len(images_with_alt) > 0
-        except Exception:
-            return False
+            cached = self.fetch_cache.get(website_url) if self.fetch_cache else None
+            if cached is not None and self.fetch_cache.is_fresh(cached):
+                return cached.text
 
-    def _check_meta_description(self, soup: BeautifulSoup) -> bool:
-        """Check for meta description."""
-        try:
-            meta_desc = soup.find("meta", attrs={"name": "description"})
-            return meta_desc is not None and meta_desc.get("content", "").strip() != ""
-        except Exception:
-            return False
+            headers = {
+                **self._request_headers(website_url),
+                "Accept-Encoding": "gzip, deflate",
+                "Connection": "keep-alive",
+            }
+            if cached is not None:
+                # Pay a 304 instead of a full download when the page is unchanged
+                headers.update(cached.conditional_headers())
 
-    def _check_meta_keywords(self, soup: BeautifulSoup) -> bool:
-        """Check for meta keywords."""
-        try:
-            meta_keywords = soup.find("meta", attrs={"name": "keywords"})
-            return (
-                meta_keywords is not None
-                and meta_keywords.get("content", "").strip() != ""
+            response = requests.get(
+                website_url,
+                headers=headers,
+                timeout=self.timeout,
+                allow_redirects=True,
+                stream=True,
             )
-        except Exception:
-            return False
+            try:
+                if cached is not None and response.status_code == 304:
+                    return self.fetch_cache.revalidate(cached, response.headers).text
 
-    def _check_structured_data(self, soup: BeautifulSoup) -> bool:
-        """Check for structured data markup."""
-        try:
-            # Look for JSON-LD structured data
-            json_ld_scripts = soup.find_all("script", type="application/ld+json")
+                response.raise_for_status()
 
-            # Look for microdata attributes
-            microdata_elements = soup.find_all(attrs={"itemtype": True})
+                # Decode while downloading; stop at the budget or on non-HTML
+                reader = HTMLStreamReader(
+                    response.headers.get("Content-Type"), self.max_page_bytes
+                )
+                for chunk in response.iter_content(chunk_size=STREAM_CHUNK_SIZE):
+                    if not reader.feed(chunk):
+                        break
+                html_content = reader.finish()
+            finally:
+                response.close()
+
+            self._log_truncation(website_url, reader.truncated, reader.bytes_read)
+            if self.fetch_cache is not None:
+                self.fetch_cache.put(
+                    website_url,
+                    html_content,
+                    response.headers,
+                    final_url=response.url,
+                    encoding=reader.encoding,
+                    truncated=reader.truncated,
+                )
 
-            # Look for RDFa attributes
-            rdfa_elements = soup.find_all(attrs={"property": True})
+            return html_content
 
-            return (
-                len(json_ld_scripts) > 0
-                or len(microdata_elements) > 0
-                or len(rdfa_elements) > 0
+        except NotHTMLError as e:
+            self.log_operation(
+                "Skipping non-HTML response", website_url=website_url, reason=e
             )
-        except Exception:
-            return False
-
-    def _check_internal_links(self, soup: BeautifulSoup) -> bool:
-        """Check for internal linking structure."""
-        try:
-            links = soup.find_all("a", href=True)
-            internal_links = [
-                link
-                for link in links
-                if link["href"].startswith("#") or not link["href"].startswith("http")
-            ]
-            return len(internal_links) > 0
-        except Exception:
-            return False
-
-    def _check_external_links(self, soup: BeautifulSoup) -> bool:
-        """Check for external links."""
-        try:
-            links = soup.find_all("a", href=True)
-            external_links = [
-                link
-                for link in links
-                if link["href"].startswith("http")
-                and not link["href"].startswith("http://localhost")
-            ]
-            return len(external_links) > 0
-        except Exception:
-            return False
+            return None
+        except requests.exceptions.Timeout:
+            self.log_error(Exception("Website fetch timeout"), "website_fetching")
+            return None
+        except requests.exceptions.RequestException as e:
+            self.log_error(e, "website_fetching")
+            return None
+        except Exception as e:
+            self.log_error(e, "website_fetching")
+            return None
 
-    def _check_blog_content(self, soup: BeautifulSoup) -> bool:
-        """Check for blog or content section."""
+    async def _fetch_page_async(self, website_url: str) -> Optional[FetchResult]:
+        """Stream a page over the shared pool; None if it could not be fetched."""
         try:
-            # Look for blog-related indicators
-            blog_patterns = [
-                r"blog",
-                r"article",
-                r"post",
-                r"news",
-                r"updates",
-                r"latest",
-                r"recent",
-                r"archive",
-            ]
-
-            text_content = soup.get_text().lower()
-            return any(
-                re.search(pattern, text_content, re.IGNORECASE)
-                for pattern in blog_patterns
+            result = await self.web_fetcher.fetch_html(
+                website_url,
+                headers=self._request_headers(website_url),
+                max_bytes=self.max_page_bytes,
+                cache=self.fetch_cache,
             )
-        except Exception:
-            return False
-
-    def _check_social_media_links(self, soup: BeautifulSoup) -> bool:
-        """Check for social media links."""
-        try:
-            # Look for social media platforms
-            social_platforms = [
-                "facebook",
-                "twitter",
-                "instagram",
-                "linkedin",
-                "youtube",
-                "tiktok",
-                "snapchat",
-                "pinterest",
-                "reddit",
-            ]
-
-            links = soup.find_all("a", href=True)
-            social_links = [
-                link
-                for link in links
-                if any(
-                    platform in link["href"].lower() for platform in social_platforms
-                )
-            ]
-
-            return len(social_links) > 0
-        except Exception:
-            return False
-
-    def _check_partner_logos(self, soup: BeautifulSoup) -> bool:
-        """Check for partner or client logos."""
-        try:
-            # Look for partner-related text
-            partner_patterns = [
-                r"partners?",
-                r"clients?",
-                r"customers?",
-                r"logos?",
-                r"who\s*trusts\s*us",
-                r"our\s*clients",
-            ]
-
-            # Check text content
-            text_content = soup.get_text().lower()
-            if any(
-                re.search(pattern, text_content, re.IGNORECASE)
-                for pattern in partner_patterns
-            ):
-                return True
-
-            # Check HTML attributes (class, id, alt, etc.)
-            for tag in soup.find_all():
-                for attr_name, attr_value in tag.attrs.items():
-                    if isinstance(attr_value, str):
-                        if any(
-                            re.search(pattern, attr_value.lower(), re.IGNORECASE)
-                            for pattern in partner_patterns
-                        ):
-                            return True
-                    elif isinstance(attr_value, list):
-                        for value in attr_value:
-                            if isinstance(value, str):
-                                if any(
-                                    re.search(pattern, value.lower(), re.IGNORECASE)
-                                    for pattern in partner_patterns
-                                ):
-                                    return True
+            if not result.success:
+                return None
 
-            return False
-        except Exception:
-            return False
+            self._log_truncation(website_url, result.truncated, result.bytes_read)
+            return result
 
-    def _check_user_generated_content(self, soup: BeautifulSoup) -> bool:
-        """Check for user-generated content."""
-        try:
-            # Look for user-generated content indicators
-            ugc_patterns = [
-                r"user\s*reviews",
-                r"customer\s*photos",
-                r"guest\s*posts",
-                r"community",
-                r"forum",
-                r"comments",
-            ]
-
-            text_content = soup.get_text().lower()
-            return any(
-                re.search(pattern, text_content, re.IGNORECASE)
-                for pattern in ugc_patterns
-            )
-        except Exception:
-            return False
+        except Exception as e:
+            self.log_error(e, "website_fetching")
+            return None
 
-    def _calculate_heuristic_scores(
+    async def _evaluate_site_async(
         self,
-        trust_signals: TrustSignals,
-        cro_elements: CROElements,
-        mobile_usability: MobileUsability,
-        content_quality: ContentQuality,
-        social_proof: SocialProof,
-    ) -> HeuristicScore:
-        """Calculate heuristic scores based on detected elements."""
-        try:
-            # Trust score (weighted by importance)
-            trust_score = self._calculate_trust_score(trust_signals)
-
-            # CRO score
-            cro_score = self._calculate_cro_score(cro_elements)
-
-            # Mobile usability score
-            mobile_score = self._calculate_mobile_score(mobile_usability)
-
-            # Content quality score
-            content_score = self._calculate_content_score(content_quality)
-
-            # Social proof score
-            social_score = self._calculate_social_score(social_proof)
+        website_url: str,
+        business_id: str,
+        run_id: Optional[str],
+        page: FetchResult,
+        start_time: float,
+        reservation: Optional[Reservation] = None,
+    ) -> Dict[str, Any]:
+        """Crawl pages linked from the landing page and score them together."""
+        features = await asyncio.to_thread(self.page_parser.parse, page.text)
+        links = discover_crawl_links(
+            page.final_url or website_url, features.anchors, self.crawl_max_pages
+        )
+        linked_pages = await self._crawl_pages(links)
+
+        (evaluation, result_cached), *linked = await asyncio.gather(
+            self._page_evaluation_async(website_url, page.text, features),
+            *(
+                self._page_evaluation_async(link.url, text)
+                for link, text in linked_pages
+            ),
+        )
+        merged = self._merge_site_evidence(
+            evaluation,
+            [
+                (link, linked_evaluation)
+                for (link, _), (linked_evaluation, _) in zip(linked_pages, linked)
+            ],
+        )
+        return self._evaluation_result(
+            website_url,
+            business_id,
+            run_id,
+            merged,
+            start_time,
+            {
+                "html_length": len(page.text),
+                "result_cached": result_cached,
+                "crawled_pages": [
+                    {"url": link.url, "kind": link.kind, "html_length": len(text)}
+                    for link, text in linked_pages
+                ],
+            },
+            reservation,
+        )
 
-            # Overall heuristic score (weighted average)
-            overall_score = self._calculate_overall_score(
-                trust_score, cro_score, mobile_score, content_score, social_score
-            )
+    async def _crawl_pages(
+        self, links: List[CrawlLink]
+    ) -> List[Tuple[CrawlLink, str]]:
+        """Fetch linked pages concurrently within the crawl time budget."""
+        if not links:
+            return []
 
-            # Determine confidence level
-            confidence_level = self._determine_confidence_level(
-                trust_signals,
-                cro_elements,
-                mobile_usability,
-                content_quality,
-                social_proof,
+        tasks = [
+            asyncio.create_task(self._fetch_page_async(link.url)) for link in links
+        ]
+        done, pending = await asyncio.wait(tasks, timeout=self.crawl_time_budget)
+        if pending:
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+            self.log_operation(
+                "Crawl time budget exhausted", skipped_pages=len(pending)
             )
 
-            return HeuristicScore(
-                trust_score=trust_score,
-                cro_score=cro_score,
-                mobile_score=mobile_score,
-                content_score=content_score,
-                social_score=social_score,
-                overall_heuristic_score=overall_score,
-                confidence_level=confidence_level,
-            )
+        pages = []
+        for link, task in zip(links, tasks):
+            if task in done and task.result() is not None and task.result().text:
+                pages.append((link, task.result().text))
+        return pages
 
-        except Exception as e:
-            self.log_error(e, "score_calculation")
-            # Return default scores on error
-            return HeuristicScore(
-                trust_score=0.0,
-                cro_score=0.0,
-                mobile_score=0.0,
-                content_score=0.0,
-                social_score=0.0,
-                overall_heuristic_score=0.0,
-                confidence_level=ConfidenceLevel.LOW,
+    def _log_truncation(self, website_url: str, truncated: bool, bytes_read: int):
+        """Note pages cut off at the byte budget; they are scored on the prefix."""
+        if truncated:
+            self.log_operation(
+                "Page truncated at byte budget",
+                website_url=website_url,
+                bytes_read=bytes_read,
             )
-
-    def _calculate_trust_score(self, trust_signals: TrustSignals) -> float:
-        """Calculate trust score (0-100)."""
-        score = 0.0
-        total_weight = 0.0
-
-        # HTTPS is critical
-        if trust_signals.has_https:
-            score += 25.0
-        total_weight += 25.0
-
-        # Privacy and terms are important
-        if trust_signals.has_privacy_policy:
-            score += 15.0
-        if trust_signals.has_terms_of_service:
-            score += 10.0
-        total_weight += 25.0
-
-        # Contact information
-        if trust_signals.has_contact_info:
-            score += 15.0
-        if trust_signals.has_business_address:
-            score += 10.0
-        if trust_signals.has_phone_number:
-            score += 10.0
-        if trust_signals.has_email:
-            score += 10.0
-        total_weight += 45.0
-
-        # About page
-        if trust_signals.has_about_page:
-            score += 5.0
-        total_weight += 5.0
-
-        return min(100.0, (score / total_weight) * 100) if total_weight > 0 else 0.0
-
-    def _calculate_cro_score(self, cro_elements: CROElements) -> float:
-        """Calculate CRO score (0-100)."""
-        score = 0.0
-        total_weight = 0.0
-
-        # CTA buttons are critical
-        if cro_elements.has_cta_buttons:
-            score += 30.0
-        total_weight += 30.0
-
-        # Contact forms
-        if cro_elements.has_contact_forms:
-            score += 25.0
-        total_weight += 25.0
-
-        # Social proof elements
-        if cro_elements.has_testimonials:
-            score += 15.0
-        if cro_elements.has_reviews:
-            score += 15.0
-        if cro_elements.has_social_proof:
-            score += 10.0
-        total_weight += 40.0
-
-        # Additional elements
-        if cro_elements.has_pricing_tables:
-            score += 5.0
-        total_weight += 5.0
-
-        return min(100.0, (score / total_weight) * 100) if total_weight > 0 else 0.0
-
-    def _calculate_mobile_score(self, mobile_usability: MobileUsability) -> float:
-        """Calculate mobile usability score (0-100)."""
-        score = 0.0
-        total_weight = 0.0
-
-        # Viewport meta is critical
-        if mobile_usability.has_viewport_meta:
-            score += 30.0
-        total_weight += 30.0
-
-        # Responsive design
-        if mobile_usability.has_responsive_design:
-            score += 25.0
-        total_weight += 25.0
-
-        # Touch targets
-        if mobile_usability.has_touch_targets:
-            score += 20.0
-        total_weight += 20.0
-
-        # Mobile navigation
-        if mobile_usability.has_mobile_navigation:
-            score += 15.0
-        total_weight += 15.0
-
-        # Readability
-        if mobile_usability.has_readable_fonts:
-            score += 5.0
-        if mobile_usability.has_adequate_spacing:
-            score += 5.0
-        total_weight += 10.0
-
-        return min(100.0, (score / total_weight) * 100) if total_weight > 0 else 0.0
-
-    def _calculate_content_score(self, content_quality: ContentQuality) -> float:
-        """Calculate content quality score (0-100)."""
-        score = 0.0
-        total_weight = 0.0
-
-        # Heading structure is important
-        if content_quality.has_proper_headings:
-            score += 20.0
-        total_weight += 20.0
-
-        # Meta tags
-        if content_quality.has_meta_description:
-            score += 20.0
-        if content_quality.has_meta_keywords:
-            score += 10.0
-        total_weight += 30.0
-
-        # Alt text for images
-        if content_quality.has_alt_text:
-            score += 15.0
-        total_weight += 15.0
-
-        # Structured data
-        if content_quality.has_structured_data:
-            score += 15.0
-        total_weight += 15.0
-
-        # Links
-        if content_quality.has_internal_links:
-            score += 10.0
-        if content_quality.has_external_links:
-            score += 5.0
-        total_weight += 15.0
-
-        # Blog content
-        if content_quality.has_blog_content:
-            score += 5.0
-        total_weight += 5.0
-
-        return min(100.0, (score / total_weight) * 100) if total_weight > 0 else 0.0
-
-    def _calculate_social_score(self, social_proof: SocialProof) -> float:
-        """Calculate social proof score (0-100)."""
-        score = 0.0
-        total_weight = 0.0
-
-        # Customer reviews are most important
-        if social_proof.has_customer_reviews:
-            score += 30.0
-        total_weight += 30.0
-
-        # Testimonials
-        if social_proof.has_testimonials:
-            score += 25.0
-        total_weight += 25.0
-
-        # Social media presence
-        if social_proof.has_social_media_links:
-            score += 20.0
-        total_weight += 20.0
-
-        # Case studies and awards
-        if social_proof.has_case_studies:
-            score += 15.0
-        if social_proof.has_awards_certifications:
-            score += 10.0
-        total_weight += 25.0
-
-        return min(100.0, (score / total_weight) * 100) if total_weight > 0 else 0.0
-
-    def _calculate_overall_score(
-        self,
-        trust_score: float,
-        cro_score: float,
-        mobile_score: float,
-        content_score: float,
-        social_score: float,
-    ) -> float:
-        """Calculate overall heuristic score with business impact weighting."""
-        # Weight scores by business impact
-        weights = {
-            "trust": 0.30,  # Trust is critical for conversions
-            "cro": 0.25,  # CRO directly impacts revenue
-            "mobile": 0.20,  # Mobile usability is important
-            "content": 0.15,  # Content quality supports other areas
-            "social": 0.10,  # Social proof enhances trust
-        }
-
-        overall_score = (
-            trust_score * weights["trust"]
-            + cro_score * weights["cro"]
-            + mobile_score * weights["mobile"]
-            + content_score * weights["content"]
-            + social_score * weights["social"]
-        )
-
-        return round(overall_score, 2)
-
-    def _determine_confidence_level(
-        self,
-        trust_signals: TrustSignals,
-        cro_elements: CROElements,
-        mobile_usability: MobileUsability,
-        content_quality: ContentQuality,
-        social_proof: SocialProof,
-    ) -> ConfidenceLevel:
-        """Determine confidence level based on data availability and quality."""
-        # Count detected elements
-        total_elements = 0
-        detected_elements = 0
-
-        # Trust signals
-        for field in TrustSignals.model_fields:
-            total_elements += 1
-            if getattr(trust_signals, field):
-                detected_elements += 1
-
-        # CRO elements
-        for field in CROElements.model_fields:
-            total_elements += 1
-            if getattr(cro_elements, field):
-                detected_elements += 1
-
-        # Mobile usability
-        for field in MobileUsability.model_fields:
-            total_elements += 1
-            if getattr(mobile_usability, field):
-                detected_elements += 1
-
-        # Content quality
-        for field in ContentQuality.model_fields:
-            total_elements += 1
-            if getattr(content_quality, field):
-                detected_elements += 1
-
-        # Social proof
-        for field in SocialProof.model_fields:
-            total_elements += 1
-            if getattr(social_proof, field):
-                detected_elements += 1
-
-        # Calculate confidence based on detection rate
-        detection_rate = detected_elements / total_elements if total_elements > 0 else 0
-
-        if detection_rate >= 0.7:
-            return ConfidenceLevel.HIGH
-        elif detection_rate >= 0.4:
-            return ConfidenceLevel.MEDIUM
-        else:
-            return ConfidenceLevel.LOW
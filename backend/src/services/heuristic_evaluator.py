@@ -0,0 +1,1142 @@
+"""
+Heuristic evaluator for parsed web pages.
+Scores trust signals, CRO elements, mobile usability, content quality and social proof without any network or cache access.
+"""
+
+import hashlib
+import json
+import re
+from typing import Any, Dict, Optional, Set
+
+from src.core.base_service import BaseService
+from src.core.config import get_api_config
+from src.utils.html_parsers import get_page_parser
+from src.utils.page_features import PageFeatures
+from src.utils.pattern_engine import build_pattern_engine
+from src.schemas.website_scoring import (
+    HeuristicScore,
+    TrustSignals,
+    CROElements,
+    MobileUsability,
+    ContentQuality,
+    SocialProof,
+    ConfidenceLevel,
+)
+
+# Bump when evaluator or scoring logic changes so cached results are not
+# reused; edits to the signal patterns are picked up by the ruleset hash
+HEURISTIC_RULESET_REVISION = 1
+
+
+class HeuristicEvaluator(BaseService):
+    """
+    Pure heuristic evaluation of a page: parsing, pattern matching and scoring.
+
+    Holds only the HTML parser and the compiled signal patterns, so it is
+    cheap to build in a worker process. HeuristicEvaluationService adds
+    fetching, caching and rate limiting on top.
+    """
+
+    def __init__(
+        self,
+        html_parser: Optional[str] = None,
+        service_name: str = "HeuristicEvaluator",
+    ):
+        super().__init__(service_name)
+        self.page_parser = get_page_parser(
+            html_parser or get_api_config().HEURISTICS_HTML_PARSER
+        )
+
+        # Trust signal patterns
+        self.trust_patterns = {
+            "privacy_policy": [
+                r"privacy\s*policy",
+                r"privacy\s*notice",
+                r"privacy\s*statement",
+                r"data\s*protection",
+                r"gdpr",
+                r"ccpa",
+                r"\bprivacy\b",
+            ],
+            "terms_of_service": [
+                r"terms\s*of\s*service",
+                r"terms\s*and\s*conditions",
+                r"user\s*agreement",
+                r"legal\s*terms",
+                r"conditions\s*of\s*use",
+            ],
+            "about_page": [
+                r"about\s*us",
+                r"about\s*company",
+                r"company\s*information",
+                r"our\s*story",
+                r"who\s*we\s*are",
+            ],
+            "contact_info": [
+                r"contact\s*us",
+                r"get\s*in\s*touch",
+                r"contact\s*information",
+                r"phone",
+                r"email",
+                r"address",
+                r"\bcontact\b",
+            ],
+        }
+
+        # CRO element patterns
+        self.cro_patterns = {
+            "cta_buttons": [
+                r"get\s*started",
+                r"start\s*now",
+                r"get\s*quote",
+                r"request\s*demo",
+                r"book\s*now",
+                r"order\s*now",
+                r"buy\s*now",
+                r"sign\s*up",
+                r"free\s*trial",
+                r"learn\s*more",
+                r"contact\s*sales",
+            ],
+            "pricing_tables": [
+                r"pricing",
+                r"plans",
+                r"packages",
+                r"cost",
+                r"price",
+                r"monthly",
+                r"annually",
+                r"yearly",
+                r"per\s*month",
+                r"\$\d+",
+            ],
+            "testimonials": [
+                r"testimonial",
+                r"review",
+                r"customer\s*story",
+                r"client\s*feedback",
+                r"what\s*customers\s*say",
+                r"customer\s*experience",
+            ],
+            "urgency_elements": [
+                r"limited\s*time",
+                r"offer\s*expires",
+                r"act\s*now",
+                r"while\s*supplies\s*last",
+                r"only\s*\d+\s*left",
+            ],
+        }
+
+        # Social proof patterns
+        self.social_patterns = {
+            "testimonials": [
+                r"testimonial",
+                r"review",
+                r"customer\s*story",
+                r"client\s*feedback",
+                r"what\s*customers\s*say",
+                r"customer\s*experience",
+            ],
+            "case_studies": [
+                r"case\s*study",
+                r"success\s*story",
+                r"customer\s*success",
+                r"results",
+                r"outcomes",
+                r"before\s*and\s*after",
+            ],
+            "awards_certifications": [
+                r"award",
+                r"certification",
+                r"accreditation",
+                r"badge",
+                r"recognition",
+                r"honor",
+                r"achievement",
+            ],
+        }
+
+        # Page elements searched for in text and attribute values
+        self.element_patterns = {
+            "reviews": [
+                r"review",
+                r"rating",
+                r"star",
+                r"feedback",
+                r"opinion",
+                r"\d+\s*out\s*of\s*\d+",
+                r"\d+\s*stars?",
+            ],
+            "partner_logos": [
+                r"partners?",
+                r"clients?",
+                r"customers?",
+                r"logos?",
+                r"who\s*trusts\s*us",
+                r"our\s*clients",
+            ],
+        }
+
+        # Single compiled matcher for every trust/CRO/social/element pattern group
+        self.pattern_engine = build_pattern_engine(
+            {
+                "trust": self.trust_patterns,
+                "cro": self.cro_patterns,
+                "social": self.social_patterns,
+                "elements": self.element_patterns,
+            }
+        )
+
+        # Cached results are keyed on the ruleset, so pattern edits invalidate them
+        self.ruleset_version = self._ruleset_version()
+
+    def validate_input(self, data: Any) -> bool:
+        """Validate that data is HTML content."""
+        return isinstance(data, str)
+
+    def evaluate(self, website_url: str, html_content: str) -> Dict[str, Any]:
+        """Parse and score one page; the result is JSON-serializable."""
+        features = self.page_parser.parse(html_content)
+        return self._evaluate_features(website_url, features)
+
+    def _evaluate_features(
+        self, website_url: str, features: PageFeatures
+    ) -> Dict[str, Any]:
+        """Run every heuristic category over an indexed page, JSON-serializable."""
+        # Match every pattern group in a single pass over the page
+        signal_hits = self._match_signal_patterns(features)
+
+        # Evaluate all heuristic categories
+        trust_signals = self._evaluate_trust_signals(website_url, features, signal_hits)
+        cro_elements = self._evaluate_cro_elements(features, signal_hits)
+        mobile_usability = self._evaluate_mobile_usability(features)
+        content_quality = self._evaluate_content_quality(features)
+        social_proof = self._evaluate_social_proof(features, signal_hits)
+
+        # Calculate scores
+        scores = self._calculate_heuristic_scores(
+            trust_signals,
+            cro_elements,
+            mobile_usability,
+            content_quality,
+            social_proof,
+        )
+
+        return {
+            "scores": scores.model_dump(mode="json"),
+            "trust_signals": trust_signals.model_dump(mode="json"),
+            "cro_elements": cro_elements.model_dump(mode="json"),
+            "mobile_usability": mobile_usability.model_dump(mode="json"),
+            "content_quality": content_quality.model_dump(mode="json"),
+            "social_proof": social_proof.model_dump(mode="json"),
+        }
+
+    def _ruleset_version(self) -> str:
+        """Hash of the evaluator revision and every signal pattern."""
+        ruleset = {
+            "revision": HEURISTIC_RULESET_REVISION,
+            "trust": self.trust_patterns,
+            "cro": self.cro_patterns,
+            "social": self.social_patterns,
+            "elements": self.element_patterns,
+        }
+        encoded = json.dumps(ruleset, sort_keys=True).encode("utf-8")
+        return hashlib.sha256(encoded).hexdigest()[:16]
+
+    def _evaluate_trust_signals(
+        self,
+        website_url: str,
+        features: PageFeatures,
+        signal_hits: Optional[Set[str]] = None,
+    ) -> TrustSignals:
+        """Evaluate trust signals on the website."""
+        try:
+            if signal_hits is None:
+                signal_hits = self._match_signal_patterns(features)
+
+            # Check HTTPS
+            has_https = website_url.startswith("https://")
+
+            # Check SSL certificate (basic check)
+            has_ssl_certificate = has_https
+
+            # Check for privacy policy
+            has_privacy_policy = "trust.privacy_policy" in signal_hits
+
+            # Check for terms of service
+            has_terms_of_service = "trust.terms_of_service" in signal_hits
+
+            # Check for about page
+            has_about_page = "trust.about_page" in signal_hits
+
+            # Check for contact information
+            has_contact_info = "trust.contact_info" in signal_hits
+
+            # Check for business address
+            has_business_address = self._check_address_elements(features)
+
+            # Check for phone number
+            has_phone_number = self._check_phone_elements(features)
+
+            # Check for email
+            has_email = self._check_email_elements(features)
+
+            return TrustSignals(
+                has_https=has_https,
+                has_privacy_policy=has_privacy_policy,
+                has_contact_info=has_contact_info,
+                has_about_page=has_about_page,
+                has_terms_of_service=has_terms_of_service,
+                has_ssl_certificate=has_ssl_certificate,
+                has_business_address=has_business_address,
+                has_phone_number=has_phone_number,
+                has_email=has_email,
+            )
+
+        except Exception as e:
+            self.log_error(e, "trust_signals_evaluation")
+            return TrustSignals()
+
+    def _evaluate_cro_elements(
+        self, features: PageFeatures, signal_hits: Optional[Set[str]] = None
+    ) -> CROElements:
+        """Evaluate conversion rate optimization elements."""
+        try:
+            if signal_hits is None:
+                signal_hits = self._match_signal_patterns(features)
+
+            # Check for CTA buttons
+            has_cta_buttons = self._check_cta_elements(features)
+
+            # Check for contact forms
+            has_contact_forms = self._check_contact_forms(features)
+
+            # Check for pricing tables
+            has_pricing_tables = "cro.pricing_tables" in signal_hits
+
+            # Check for testimonials
+            has_testimonials = "cro.testimonials" in signal_hits
+
+            # Check for reviews
+            has_reviews = self._check_review_elements(features, signal_hits)
+
+            # Check for social proof
+            has_social_proof = has_testimonials or has_reviews
+
+            # Check for urgency elements
+            has_urgency_elements = "cro.urgency_elements" in signal_hits
+
+            # Check for trust badges
+            has_trust_badges = self._check_trust_badges(features)
+
+            return CROElements(
+                has_cta_buttons=has_cta_buttons,
+                has_contact_forms=has_contact_forms,
+                has_pricing_tables=has_pricing_tables,
+                has_testimonials=has_testimonials,
+                has_reviews=has_reviews,
+                has_social_proof=has_social_proof,
+                has_urgency_elements=has_urgency_elements,
+                has_trust_badges=has_trust_badges,
+            )
+
+        except Exception as e:
+            self.log_error(e, "cro_elements_evaluation")
+            return CROElements()
+
+    def _evaluate_mobile_usability(self, features: PageFeatures) -> MobileUsability:
+        """Evaluate mobile usability heuristics."""
+        try:
+            # Check for viewport meta tag
+            has_viewport_meta = self._check_viewport_meta(features)
+
+            # Check for touch targets
+            has_touch_targets = self._check_touch_targets(features)
+
+            # Check for responsive design
+            has_responsive_design = self._check_responsive_design(features)
+
+            # Check for mobile navigation
+            has_mobile_navigation = self._check_mobile_navigation(features)
+
+            # Check for readable fonts
+            has_readable_fonts = self._check_readable_fonts(features)
+
+            # Check for adequate spacing
+            has_adequate_spacing = self._check_adequate_spacing(features)
+
+            return MobileUsability(
+                has_viewport_meta=has_viewport_meta,
+                has_touch_targets=has_touch_targets,
+                has_responsive_design=has_responsive_design,
+                has_mobile_navigation=has_mobile_navigation,
+                has_readable_fonts=has_readable_fonts,
+                has_adequate_spacing=has_adequate_spacing,
+            )
+
+        except Exception as e:
+            self.log_error(e, "mobile_usability_evaluation")
+            return MobileUsability()
+
+    def _evaluate_content_quality(self, features: PageFeatures) -> ContentQuality:
+        """Evaluate content quality and structure."""
+        try:
+            # Check for proper heading structure
+            has_proper_headings = self._check_heading_structure(features)
+
+            # Check for alt text on images
+            has_alt_text = self._check_alt_text(features)
+
+            # Check for meta description
+            has_meta_description = self._check_meta_description(features)
+
+            # Check for meta keywords
+            has_meta_keywords = self._check_meta_keywords(features)
+
+            # Check for structured data
+            has_structured_data = self._check_structured_data(features)
+
+            # Check for internal links
+            has_internal_links = self._check_internal_links(features)
+
+            # Check for external links
+            has_external_links = self._check_external_links(features)
+
+            # Check for blog content
+            has_blog_content = self._check_blog_content(features)
+
+            return ContentQuality(
+                has_proper_headings=has_proper_headings,
+                has_alt_text=has_alt_text,
+                has_meta_description=has_meta_description,
+                has_meta_keywords=has_meta_keywords,
+                has_structured_data=has_structured_data,
+                has_internal_links=has_internal_links,
+                has_external_links=has_external_links,
+                has_blog_content=has_blog_content,
+            )
+
+        except Exception as e:
+            self.log_error(e, "content_quality_evaluation")
+            return ContentQuality()
+
+    def _evaluate_social_proof(
+        self, features: PageFeatures, signal_hits: Optional[Set[str]] = None
+    ) -> SocialProof:
+        """Evaluate social proof elements."""
+        try:
+            if signal_hits is None:
+                signal_hits = self._match_signal_patterns(features)
+
+            # Check for social media links
+            has_social_media_links = self._check_social_media_links(features)
+
+            # Check for customer reviews
+            has_customer_reviews = self._check_review_elements(features, signal_hits)
+
+            # Check for testimonials
+            has_testimonials = "social.testimonials" in signal_hits
+
+            # Check for case studies
+            has_case_studies = "social.case_studies" in signal_hits
+
+            # Check for awards and certifications
+            has_awards_certifications = "social.awards_certifications" in signal_hits
+
+            # Check for partner logos
+            has_partner_logos = self._check_partner_logos(features, signal_hits)
+
+            # Check for user-generated content
+            has_user_generated_content = self._check_user_generated_content(features)
+
+            return SocialProof(
+                has_social_media_links=has_social_media_links,
+                has_customer_reviews=has_customer_reviews,
+                has_testimonials=has_testimonials,
+                has_case_studies=has_case_studies,
+                has_awards_certifications=has_awards_certifications,
+                has_partner_logos=has_partner_logos,
+                has_user_generated_content=has_user_generated_content,
+            )
+
+        except Exception as e:
+            self.log_error(e, "social_proof_evaluation")
+            return SocialProof()
+
+    def _match_signal_patterns(self, features: PageFeatures) -> Set[str]:
+        """
+        Match all trust, CRO and social patterns against the page in one pass.
+
+        Scans the visible text, link text and every attribute value (class, id,
+        href, alt, ...) and returns the namespaced signals that were hit, e.g.
+        ``{"trust.privacy_policy", "cro.pricing_tables"}``.
+        """
+        try:
+            return self.pattern_engine.scan(
+                features.text,
+                *(anchor.text for anchor in features.anchors),
+                *features.attribute_values,
+            )
+        except Exception:
+            return set()
+
+    def _check_address_elements(self, features: PageFeatures) -> bool:
+        """Check for business address elements."""
+        try:
+            # Look for address-related text
+            address_patterns = [
+                r"\d+\s+[a-zA-Z\s]+(?:street|st|avenue|ave|road|rd|lane|ln|drive|dr)",
+                r"[a-zA-Z\s]+,\s*[A-Z]{2}\s*\d{5}",
+                r"p\.?o\.?\s*box\s*\d+",
+            ]
+
+            return any(
+                re.search(pattern, features.text, re.IGNORECASE)
+                for pattern in address_patterns
+            )
+        except Exception:
+            return False
+
+    def _check_phone_elements(self, features: PageFeatures) -> bool:
+        """Check for phone number elements."""
+        try:
+            # Look for phone number patterns
+            phone_patterns = [
+                r"\(\d{3}\)\s*\d{3}-\d{4}",
+                r"\d{3}-\d{3}-\d{4}",
+                r"\d{3}\.\d{3}\.\d{4}",
+                r"\+1\s*\d{3}\s*\d{3}\s*\d{4}",
+            ]
+
+            return any(re.search(pattern, features.text) for pattern in phone_patterns)
+        except Exception:
+            return False
+
+    def _check_email_elements(self, features: PageFeatures) -> bool:
+        """Check for email address elements."""
+        try:
+            # Look for email patterns
+            email_pattern = r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b"
+            return bool(re.search(email_pattern, features.text))
+        except Exception:
+            return False
+
+    def _check_cta_elements(self, features: PageFeatures) -> bool:
+        """Check for call-to-action buttons."""
+        try:
+            # Look for CTA buttons and links
+            cta_text = re.compile(
+                "|".join(self.cro_patterns["cta_buttons"]), re.IGNORECASE
+            )
+            # Also check for buttons with CTA-like classes
+            cta_class = re.compile(
+                r"cta|call-to-action|primary|action", re.IGNORECASE
+            )
+
+            for control in features.controls:
+                if control.string is not None and cta_text.search(control.string):
+                    return True
+                if control.name == "button" and any(
+                    cta_class.search(css_class) for css_class in control.classes
+                ):
+                    return True
+
+            return False
+        except Exception:
+            return False
+
+    def _check_contact_forms(self, features: PageFeatures) -> bool:
+        """Check for contact forms."""
+        try:
+            # Check if any form has contact-related fields
+            for form in features.forms:
+                # Check form action attribute
+                form_action = form.action.lower()
+                if any(
+                    keyword in form_action
+                    for keyword in ["contact", "message", "inquiry", "request"]
+                ):
+                    return True
+
+                # Check form text content
+                if any(
+                    keyword in form.text
+                    for keyword in ["contact", "message", "inquiry", "request"]
+                ):
+                    return True
+
+                # Check for common contact form fields
+                for input_elem in form.inputs:
+                    input_type = input_elem.type.lower()
+                    input_name = input_elem.name.lower()
+                    if input_type in ["email", "text"] and any(
+                        keyword in input_name
+                        for keyword in ["name", "email", "message"]
+                    ):
+                        return True
+
+            return False
+        except Exception:
+            return False
+
+    def _check_review_elements(
+        self, features: PageFeatures, signal_hits: Optional[Set[str]] = None
+    ) -> bool:
+        """Check for review elements in text and attributes (class, id, etc.)."""
+        if signal_hits is None:
+            signal_hits = self._match_signal_patterns(features)
+        return "elements.reviews" in signal_hits
+
+    def _check_trust_badges(self, features: PageFeatures) -> bool:
+        """Check for trust badges and certifications."""
+        try:
+            # Look for trust-related images and text
+            trust_patterns = [
+                r"trust\s*badge",
+                r"certified",
+                r"verified",
+                r"secure",
+                r"bbb",
+                r"better\s*business\s*bureau",
+                r"guarantee",
+            ]
+
+            return any(
+                re.search(pattern, features.text, re.IGNORECASE)
+                for pattern in trust_patterns
+            )
+        except Exception:
+            return False
+
+    def _check_viewport_meta(self, features: PageFeatures) -> bool:
+        """Check for viewport meta tag."""
+        try:
+            return features.find_meta("viewport") is not None
+        except Exception:
+            return False
+
+    def _check_touch_targets(self, features: PageFeatures) -> bool:
+        """Check for adequate touch target sizes."""
+        try:
+            # Look for buttons and links that might be touch targets
+            # This is a simplified check - in a real implementation, you'd analyze CSS
+            # For now, we'll assume the presence of mobile-friendly elements suggests good touch targets
+            return len(features.controls) > 0
+        except Exception:
+            return False
+
+    def _check_responsive_design(self, features: PageFeatures) -> bool:
+        """Check for responsive design indicators."""
+        try:
+            # Look for responsive design indicators
+            media_query = re.compile(r"max-width|min-width", re.IGNORECASE)
+            media_rule = re.compile(r"@media", re.IGNORECASE)
+
+            return (
+                features.find_meta("viewport") is not None
+                or any(media_query.search(media) for media in features.link_media)
+                or any(media_rule.search(style) for style in features.style_texts)
+            )
+        except Exception:
+            return False
+
+    def _check_mobile_navigation(self, features: PageFeatures) -> bool:
+        """Check for mobile navigation elements."""
+        try:
+            # Look for mobile navigation indicators
+            mobile_nav_patterns = [
+                r"mobile\s*nav",
+                r"hamburger",
+                r"menu\s*toggle",
+                r"mobile\s*menu",
+                r"responsive\s*nav",
+            ]
+
+            return any(
+                re.search(pattern, features.text, re.IGNORECASE)
+                for pattern in mobile_nav_patterns
+            )
+        except Exception:
+            return False
+
+    def _check_readable_fonts(self, features: PageFeatures) -> bool:
+        """Check for readable font sizes."""
+        try:
+            # This is a simplified check - in a real implementation, you'd analyze CSS
+            # For now, we'll assume the presence of text content suggests readable fonts
+            return (
+                len(features.text.strip()) > 100
+            )  # Assume readable if there's substantial text
+        except Exception:
+            return False
+
+    def _check_adequate_spacing(self, features: PageFeatures) -> bool:
+        """Check for adequate spacing between elements."""
+        try:
+            # This is a simplified check - in a real implementation, you'd analyze CSS
+            # For now, we'll assume the presence of structured content suggests good spacing
+            return features.count("p", "div") > 0
+        except Exception:
+            return False
+
+    def _check_heading_structure(self, features: PageFeatures) -> bool:
+        """Check for proper heading structure."""
+        try:
+            headings = features.headings
+
+            if len(headings) == 0:
+                return False
+
+            # Check if there's at least one H1
+            h1_count = headings.count("h1")
+
+            return h1_count > 0 and len(headings) >= 2
+        except Exception:
+            return False
+
+    def _check_alt_text(self, features: PageFeatures) -> bool:
+        """Check for alt text on images."""
+        try:
+            images = features.image_alts
+            if len(images) == 0:
+                return True  # No images means no alt text needed
+
+            images_with_alt = [alt for alt in images if alt and alt.strip()]
+            return len(images_with_alt) > 0
+        except Exception:
+            return False
+
+    def _check_meta_description(self, features: PageFeatures) -> bool:
+        """Check for meta description."""
+        try:
+            meta_desc = features.find_meta("description")
+            return meta_desc is not None and meta_desc.get("content", "").strip() != ""
+        except Exception:
+            return False
+
+    def _check_meta_keywords(self, features: PageFeatures) -> bool:
+        """Check for meta keywords."""
+        try:
+            meta_keywords = features.find_meta("keywords")
+            return (
+                meta_keywords is not None
+                and meta_keywords.get("content", "").strip() != ""
+            )
+        except Exception:
+            return False
+
+    def _check_structured_data(self, features: PageFeatures) -> bool:
+        """Check for structured data markup."""
+        try:
+            # Look for JSON-LD structured data
+            has_json_ld = "application/ld+json" in features.script_types
+
+            # Look for microdata and RDFa attributes
+            return (
+                has_json_ld
+                or "itemtype" in features.attribute_names
+                or "property" in features.attribute_names
+            )
+        except Exception:
+            return False
+
+    def _check_internal_links(self, features: PageFeatures) -> bool:
+        """Check for internal linking structure."""
+        try:
+            return any(anchor.is_internal for anchor in features.anchors)
+        except Exception:
+            return False
+
+    def _check_external_links(self, features: PageFeatures) -> bool:
+        """Check for external links."""
+        try:
+            return any(anchor.is_external for anchor in features.anchors)
+        except Exception:
+            return False
+
+    def _check_blog_content(self, features: PageFeatures) -> bool:
+        """Check for blog or content section."""
+        try:
+            # Look for blog-related indicators
+            blog_patterns = [
+                r"blog",
+                r"article",
+                r"post",
+                r"news",
+                r"updates",
+                r"latest",
+                r"recent",
+                r"archive",
+            ]
+
+            return any(
+                re.search(pattern, features.text, re.IGNORECASE)
+                for pattern in blog_patterns
+            )
+        except Exception:
+            return False
+
+    def _check_social_media_links(self, features: PageFeatures) -> bool:
+        """Check for social media links."""
+        try:
+            # Look for social media platforms
+            social_platforms = [
+                "facebook",
+                "twitter",
+                "instagram",
+                "linkedin",
+                "youtube",
+                "tiktok",
+                "snapchat",
+                "pinterest",
+                "reddit",
+            ]
+
+            return any(
+                platform in anchor.href.lower()
+                for anchor in features.anchors
+                for platform in social_platforms
+            )
+        except Exception:
+            return False
+
+    def _check_partner_logos(
+        self, features: PageFeatures, signal_hits: Optional[Set[str]] = None
+    ) -> bool:
+        """Check for partner or client logos in text and attributes (alt, etc.)."""
+        if signal_hits is None:
+            signal_hits = self._match_signal_patterns(features)
+        return "elements.partner_logos" in signal_hits
+
+    def _check_user_generated_content(self, features: PageFeatures) -> bool:
+        """Check for user-generated content."""
+        try:
+            # Look for user-generated content indicators
+            ugc_patterns = [
+                r"user\s*reviews",
+                r"customer\s*photos",
+                r"guest\s*posts",
+                r"community",
+                r"forum",
+                r"comments",
+            ]
+
+            return any(
+                re.search(pattern, features.text, re.IGNORECASE)
+                for pattern in ugc_patterns
+            )
+        except Exception:
+            return False
+
+    def _calculate_heuristic_scores(
+        self,
+        trust_signals: TrustSignals,
+        cro_elements: CROElements,
+        mobile_usability: MobileUsability,
+        content_quality: ContentQuality,
+        social_proof: SocialProof,
+    ) -> HeuristicScore:
+        """Calculate heuristic scores based on detected elements."""
+        try:
+            # Trust score (weighted by importance)
+            trust_score = self._calculate_trust_score(trust_signals)
+
+            # CRO score
+            cro_score = self._calculate_cro_score(cro_elements)
+
+            # Mobile usability score
+            mobile_score = self._calculate_mobile_score(mobile_usability)
+
+            # Content quality score
+            content_score = self._calculate_content_score(content_quality)
+
+            # Social proof score
+            social_score = self._calculate_social_score(social_proof)
+
+            # Overall heuristic score (weighted average)
+            overall_score = self._calculate_overall_score(
+                trust_score, cro_score, mobile_score, content_score, social_score
+            )
+
+            # Determine confidence level
+            confidence_level = self._determine_confidence_level(
+                trust_signals,
+                cro_elements,
+                mobile_usability,
+                content_quality,
+                social_proof,
+            )
+
+            return HeuristicScore(
+                trust_score=trust_score,
+                cro_score=cro_score,
+                mobile_score=mobile_score,
+                content_score=content_score,
+                social_score=social_score,
+                overall_heuristic_score=overall_score,
+                confidence_level=confidence_level,
+            )
+
+        except Exception as e:
+            self.log_error(e, "score_calculation")
+            # Return default scores on error
+            return HeuristicScore(
+                trust_score=0.0,
+                cro_score=0.0,
+                mobile_score=0.0,
+                content_score=0.0,
+                social_score=0.0,
+                overall_heuristic_score=0.0,
+                confidence_level=ConfidenceLevel.LOW,
+            )
+
+    def _calculate_trust_score(self, trust_signals: TrustSignals) -> float:
+        """Calculate trust score (0-100)."""
+        score = 0.0
+        total_weight = 0.0
+
+        # HTTPS is critical
+        if trust_signals.has_https:
+            score += 25.0
+        total_weight += 25.0
+
+        # Privacy and terms are important
+        if trust_signals.has_privacy_policy:
+            score += 15.0
+        if trust_signals.has_terms_of_service:
+            score += 10.0
+        total_weight += 25.0
+
+        # Contact information
+        if trust_signals.has_contact_info:
+            score += 15.0
+        if trust_signals.has_business_address:
+            score += 10.0
+        if trust_signals.has_phone_number:
+            score += 10.0
+        if trust_signals.has_email:
+            score += 10.0
+        total_weight += 45.0
+
+        # About page
+        if trust_signals.has_about_page:
+            score += 5.0
+        total_weight += 5.0
+
+        return min(100.0, (score / total_weight) * 100) if total_weight > 0 else 0.0
+
+    def _calculate_cro_score(self, cro_elements: CROElements) -> float:
+        """Calculate CRO score (0-100)."""
+        score = 0.0
+        total_weight = 0.0
+
+        # CTA buttons are critical
+        if cro_elements.has_cta_buttons:
+            score += 30.0
+        total_weight += 30.0
+
+        # Contact forms
+        if cro_elements.has_contact_forms:
+            score += 25.0
+        total_weight += 25.0
+
+        # Social proof elements
+        if cro_elements.has_testimonials:
+            score += 15.0
+        if cro_elements.has_reviews:
+            score += 15.0
+        if cro_elements.has_social_proof:
+            score += 10.0
+        total_weight += 40.0
+
+        # Additional elements
+        if cro_elements.has_pricing_tables:
+            score += 5.0
+        total_weight += 5.0
+
+        return min(100.0, (score / total_weight) * 100) if total_weight > 0 else 0.0
+
+    def _calculate_mobile_score(self, mobile_usability: MobileUsability) -> float:
+        """Calculate mobile usability score (0-100)."""
+        score = 0.0
+        total_weight = 0.0
+
+        # Viewport meta is critical
+        if mobile_usability.has_viewport_meta:
+            score += 30.0
+        total_weight += 30.0
+
+        # Responsive design
+        if mobile_usability.has_responsive_design:
+            score += 25.0
+        total_weight += 25.0
+
+        # Touch targets
+        if mobile_usability.has_touch_targets:
+            score += 20.0
+        total_weight += 20.0
+
+        # Mobile navigation
+        if mobile_usability.has_mobile_navigation:
+            score += 15.0
+        total_weight += 15.0
+
+        # Readability
+        if mobile_usability.has_readable_fonts:
+            score += 5.0
+        if mobile_usability.has_adequate_spacing:
+            score += 5.0
+        total_weight += 10.0
+
+        return min(100.0, (score / total_weight) * 100) if total_weight > 0 else 0.0
+
+    def _calculate_content_score(self, content_quality: ContentQuality) -> float:
+        """Calculate content quality score (0-100)."""
+        score = 0.0
+        total_weight = 0.0
+
+        # Heading structure is important
+        if content_quality.has_proper_headings:
+            score += 20.0
+        total_weight += 20.0
+
+        # Meta tags
+        if content_quality.has_meta_description:
+            score += 20.0
+        if content_quality.has_meta_keywords:
+            score += 10.0
+        total_weight += 30.0
+
+        # Alt text for images
+        if content_quality.has_alt_text:
+            score += 15.0
+        total_weight += 15.0
+
+        # Structured data
+        if content_quality.has_structured_data:
+            score += 15.0
+        total_weight += 15.0
+
+        # Links
+        if content_quality.has_internal_links:
+            score += 10.0
+        if content_quality.has_external_links:
+            score += 5.0
+        total_weight += 15.0
+
+        # Blog content
+        if content_quality.has_blog_content:
+            score += 5.0
+        total_weight += 5.0
+
+        return min(100.0, (score / total_weight) * 100) if total_weight > 0 else 0.0
+
+    def _calculate_social_score(self, social_proof: SocialProof) -> float:
+        """Calculate social proof score (0-100)."""
+        score = 0.0
+        total_weight = 0.0
+
+        # Customer reviews are most important
+        if social_proof.has_customer_reviews:
+            score += 30.0
+        total_weight += 30.0
+
+        # Testimonials
+        if social_proof.has_testimonials:
+            score += 25.0
+        total_weight += 25.0
+
+        # Social media presence
+        if social_proof.has_social_media_links:
+            score += 20.0
+        total_weight += 20.0
+
+        # Case studies and awards
+        if social_proof.has_case_studies:
+            score += 15.0
+        if social_proof.has_awards_certifications:
+            score += 10.0
+        total_weight += 25.0
+
+        return min(100.0, (score / total_weight) * 100) if total_weight > 0 else 0.0
+
+    def _calculate_overall_score(
+        self,
+        trust_score: float,
+        cro_score: float,
+        mobile_score: float,
+        content_score: float,
+        social_score: float,
+    ) -> float:
+        """Calculate overall heuristic score with business impact weighting."""
+        # Weight scores by business impact
+        weights = {
+            "trust": 0.30,  # Trust is critical for conversions
+            "cro": 0.25,  # CRO directly impacts revenue
+            "mobile": 0.20,  # Mobile usability is important
+            "content": 0.15,  # Content quality supports other areas
+            "social": 0.10,  # Social proof enhances trust
+        }
+
+        overall_score = (
+            trust_score * weights["trust"]
+            + cro_score * weights["cro"]
+            + mobile_score * weights["mobile"]
+            + content_score * weights["content"]
+            + social_score * weights["social"]
+        )
+
+        return round(overall_score, 2)
+
+    def _determine_confidence_level(
+        self,
+        trust_signals: TrustSignals,
+        cro_elements: CROElements,
+        mobile_usability: MobileUsability,
+        content_quality: ContentQuality,
+        social_proof: SocialProof,
+    ) -> ConfidenceLevel:
+        """Determine confidence level based on data availability and quality."""
+        # Count detected elements
+        total_elements = 0
+        detected_elements = 0
+
+        # Trust signals
+        for field in TrustSignals.model_fields:
+            total_elements += 1
+            if getattr(trust_signals, field):
+                detected_elements += 1
+
+        # CRO elements
+        for field in CROElements.model_fields:
+            total_elements += 1
+            if getattr(cro_elements, field):
+                detected_elements += 1
+
+        # Mobile usability
+        for field in MobileUsability.model_fields:
+            total_elements += 1
+            if getattr(mobile_usability, field):
+                detected_elements += 1
+
+        # Content quality
+        for field in ContentQuality.model_fields:
+            total_elements += 1
+            if getattr(content_quality, field):
+                detected_elements += 1
+
+        # Social proof
+        for field in SocialProof.model_fields:
+            total_elements += 1
+            if getattr(social_proof, field):
+                detected_elements += 1
+
+        # Calculate confidence based on detection rate
+        detection_rate = detected_elements / total_elements if total_elements > 0 else 0
+
+        if detection_rate >= 0.7:
+            return ConfidenceLevel.HIGH
+        elif detection_rate >= 0.4:
+            return ConfidenceLevel.MEDIUM
+        else:
+            return ConfidenceLevel.LOW
@@ -518,7 +518,7 @@ What would you like me to help you with?
     ) -> Dict[str, Any]:
         """Helper method to search Google Places."""
         try:
-            return self.google_places_service.search_businesses(request)
+            return await self.google_places_service.search_businesses_async(request)
         except Exception as e:
             logger.error(f"❌ Google Places search failed: {e}")
             return {"error": "Google Places search failed", "details": str(e)}
@@ -0,0 +1,425 @@
+"""
+Queued Lighthouse audit scheduler.
+Dispatches audits at the highest rate the PageSpeed Insights per-minute and per-day quotas sustain, interactive requests first.
+"""
+
+import asyncio
+import time
+from collections import deque
+from typing import Any, Deque, Dict, Iterable, List, Optional, Set, Tuple
+
+from src.core.base_service import BaseService
+from src.core.config import get_api_config, get_data_path
+from src.schemas.website_scoring import AuditPriority
+from src.services.lighthouse_service import LighthouseService
+from src.services.rate_limiter import RequestPriority
+from src.utils.audit_queue import DONE, FAILED, PENDING, RUNNING, AuditJob, AuditQueue
+from src.utils.token_bucket import DailyQuota, TokenBucket
+
+# Dispatch order; lower ranks go first
+PRIORITY_RANK = {AuditPriority.INTERACTIVE: 0, AuditPriority.BATCH: 1}
+# Rate-limiter queue class for each rank, so batches never delay interactive audits
+LIMITER_PRIORITY = {0: RequestPriority.INTERACTIVE, 1: RequestPriority.BATCH}
+
+# Window over which throughput and audit duration are averaged
+THROUGHPUT_WINDOW_SECONDS = 300.0
+
+# Pause after PageSpeed itself reports the quota exhausted
+RATE_LIMIT_BACKOFF_SECONDS = 30.0
+
+DAILY_QUOTA_STATE_KEY = "daily_quota"
+
+
+class LighthouseBatchScheduler(BaseService):
+    """
+    Priority queue in front of LighthouseService.
+
+    A single dispatcher takes the next job only once both the per-minute
+    token bucket and the daily quota allow another request, so callers no
+    longer see 429s or need to throttle themselves. Interactive audits are
+    dispatched before any queued batch work. Jobs and daily quota usage are
+    persisted; after a restart, jobs that were in flight are queued again.
+    With the local Lighthouse backend the quotas do not apply and dispatch
+    is bounded by the browser pool alone.
+    """
+
+    def __init__(
+        self,
+        lighthouse_service: Optional[LighthouseService] = None,
+        queue: Optional[AuditQueue] = None,
+        minute_bucket: Optional[TokenBucket] = None,
+        daily_quota: Optional[DailyQuota] = None,
+        concurrency: Optional[int] = None,
+    ):
+        super().__init__("LighthouseBatchScheduler")
+        self.api_config = get_api_config()
+        self.lighthouse_service = lighthouse_service or LighthouseService()
+        self.queue = queue or AuditQueue()
+        self.minute_bucket = minute_bucket or TokenBucket.for_window(
+            self.api_config.LIGHTHOUSE_RATE_LIMIT_PER_MINUTE,
+            60.0,
+            self.api_config.LIGHTHOUSE_SCHEDULER_BURST,
+        )
+        if daily_quota is None:
+            day, used = self.queue.get_state(DAILY_QUOTA_STATE_KEY) or (None, 0)
+            daily_quota = DailyQuota(
+                self.api_config.LIGHTHOUSE_RATE_LIMIT_PER_DAY,
+                self.api_config.LIGHTHOUSE_QUOTA_TIMEZONE,
+                used=used,
+                day=day,
+            )
+        self.daily_quota = daily_quota
+        # Local audits are bounded by the browser pool, not PageSpeed quotas
+        self.quota_limited = self.api_config.LIGHTHOUSE_BACKEND != "local"
+        self.concurrency = concurrency or (
+            self.api_config.LIGHTHOUSE_SCHEDULER_CONCURRENCY
+            if self.quota_limited
+            else self.api_config.LIGHTHOUSE_LOCAL_POOL_SIZE
+        )
+        self.max_attempts = self.api_config.LIGHTHOUSE_SCHEDULER_MAX_ATTEMPTS
+
+        self.dispatched = 0
+        self.requeued = 0
+        self._completions: Deque[Tuple[float, float]] = deque()
+        self._waiters: Dict[int, asyncio.Future] = {}
+        self._tasks: Set[asyncio.Task] = set()
+        self._dispatcher: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._paused_until = 0.0
+        self._resumed = False
+
+    def validate_input(self, data: Any) -> bool:
+        """Validate input data for the service."""
+        if not isinstance(data, dict):
+            return False
+        return bool(data.get("items"))
+
+    @property
+    def running(self) -> bool:
+        return self._dispatcher is not None and not self._dispatcher.done()
+
+    def start(self) -> None:
+        """
+        Start dispatching on the running event loop; a no-op when running.
+
+        Jobs left running by a previous process, or by a dispatcher on an
+        event loop that is gone, are queued again.
+        """
+        loop = asyncio.get_running_loop()
+        if self.running and self._loop is loop:
+            return
+        if not self._resumed or self._loop is not loop:
+            requeued = self.queue.requeue_running()
+            self._resumed = True
+            if requeued:
+                self.log_operation("Resuming interrupted audits", audits=requeued)
+        self._loop = loop
+        self._tasks = set()
+        self._wakeup = asyncio.Event()
+        self._slots = asyncio.Semaphore(self.concurrency)
+        self._dispatcher = asyncio.create_task(self._dispatch_loop())
+
+    async def stop(self) -> None:
+        """Stop dispatching; audits in flight are cancelled and resume later."""
+        tasks = [task for task in (self._dispatcher, *self._tasks) if task]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        for waiter in self._waiters.values():
+            waiter.cancel()
+        self._dispatcher = None
+        self._tasks.clear()
+        self.queue.requeue_running()
+
+    async def submit_batch(
+        self,
+        items: Iterable[Tuple[str, str]],
+        strategy: str = "mobile",
+        priority: AuditPriority = AuditPriority.BATCH,
+        run_id: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Queue audits and return without waiting for them.
+
+        The queue is SQLite-backed, so it is written in a worker thread.
+
+        Args:
+            items: ``(website_url, business_id)`` pairs
+            strategy: Audit strategy ('desktop' or 'mobile')
+            priority: Dispatch priority of the batch
+            run_id: Run identifier for tracking
+
+        Returns:
+            Batch status as from ``get_batch_status``, including its ``batch_id``
+        """
+        batch_id, job_ids = await asyncio.to_thread(
+            self.queue.push, list(items), strategy, PRIORITY_RANK[priority], run_id
+        )
+        self.log_operation(
+            "Queued Lighthouse audits",
+            run_id=run_id,
+            audits=len(job_ids),
+            batch_id=batch_id,
+            priority=priority.value,
+        )
+        self.start()
+        self._wakeup.set()
+        return await asyncio.to_thread(self.get_batch_status, batch_id)
+
+    async def audit(
+        self,
+        website_url: str,
+        business_id: str,
+        run_id: Optional[str] = None,
+        strategy: str = "mobile",
+        priority: AuditPriority = AuditPriority.INTERACTIVE,
+    ) -> Dict[str, Any]:
+        """
+        Queue one audit and wait for its result.
+
+        Returns:
+            The LighthouseService audit result
+        """
+        _, (job_id,) = self.queue.push(
+            [(website_url, business_id)], strategy, PRIORITY_RANK[priority], run_id
+        )
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters[job_id] = waiter
+        self.start()
+        self._wakeup.set()
+        try:
+            return await waiter
+        finally:
+            self._waiters.pop(job_id, None)
+
+    def get_batch_status(
+        self, batch_id: str, include_results: bool = False
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Progress, ETA and optionally per-URL results of a batch.
+
+        Returns:
+            Status dictionary, or None for an unknown batch
+        """
+        jobs = self.queue.batch_jobs(batch_id)
+        if not jobs:
+            return None
+
+        counts = {PENDING: 0, RUNNING: 0, DONE: 0, FAILED: 0}
+        for job in jobs:
+            counts[job.status] += 1
+        pending = [job for job in jobs if job.status == PENDING]
+        if pending:
+            last = pending[-1]
+            ahead = self.queue.pending_ahead(last.priority, last.id) + 1
+            eta = self._eta_seconds(ahead)
+        else:
+            eta = self._eta_seconds(0) if counts[RUNNING] else 0.0
+
+        status = {
+            "batch_id": batch_id,
+            "total": len(jobs),
+            "pending": counts[PENDING],
+            "running": counts[RUNNING],
+            "completed": counts[DONE],
+            "failed": counts[FAILED],
+            "progress": round((counts[DONE] + counts[FAILED]) / len(jobs), 4),
+            "eta_seconds": round(eta, 1),
+            "throughput_per_minute": self._throughput_per_minute(),
+        }
+        if include_results:
+            status["results"] = [self._job_summary(job) for job in jobs]
+        return status
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Queue depth, dispatch rates, quota usage and ETA of the whole queue."""
+        counts = self.queue.counts()
+        day, used = self.daily_quota.snapshot()
+        return {
+            "running": self.running,
+            "queue": counts,
+            "in_flight": len(self._tasks),
+            "dispatched": self.dispatched,
+            "requeued": self.requeued,
+            "sustainable_rate_per_minute": round(self.minute_bucket.rate * 60, 2),
+            "throughput_per_minute": self._throughput_per_minute(),
+            "average_audit_seconds": round(self._average_duration(), 3),
+            "eta_seconds": round(self._eta_seconds(counts[PENDING]), 1),
+            "daily_quota": {
+                "day": day,
+                "limit": self.daily_quota.limit,
+                "used": used,
+                "remaining": self.daily_quota.remaining,
+                "resets_in_seconds": round(self.daily_quota.seconds_until_reset()),
+            },
+        }
+
+    async def _dispatch_loop(self) -> None:
+        while True:
+            wait = self._paused_until - time.monotonic()
+            if self.quota_limited:
+                wait = max(
+                    wait, self.minute_bucket.wait_time(), self.daily_quota.wait_time()
+                )
+            if wait > 0:
+                await asyncio.sleep(wait)
+                continue
+
+            await self._slots.acquire()
+            # Cleared before looking, so a submission in between is not missed
+            self._wakeup.clear()
+            job = self.queue.pop()
+            if job is None:
+                self._slots.release()
+                await self._wakeup.wait()
+                continue
+
+            if self.quota_limited:
+                acquired = (
+                    self.minute_bucket.try_acquire()
+                    and self.daily_quota.try_acquire()
+                )
+                if not acquired:
+                    self.queue.requeue(job.id)
+                    self._slots.release()
+                    continue
+                self.queue.set_state(
+                    DAILY_QUOTA_STATE_KEY, self.daily_quota.snapshot()
+                )
+
+            self.dispatched += 1
+            task = asyncio.create_task(self._run_job(job))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _run_job(self, job: AuditJob) -> None:
+        started = time.monotonic()
+        try:
+            result = await self.lighthouse_service.run_lighthouse_audit_async(
+                job.url,
+                job.business_id,
+                job.run_id,
+                job.strategy,
+                priority=LIMITER_PRIORITY.get(job.priority, RequestPriority.NORMAL),
+            )
+        except Exception as e:
+            self.log_error(e, "scheduled_audit", job.run_id, job.business_id)
+            result = {
+                "success": False,
+                "error": str(e),
+                "context": "scheduled_audit",
+            }
+        finally:
+            self._slots.release()
+
+        if (
+            result.get("error_code") == "RATE_LIMIT_EXCEEDED"
+            and job.attempts < self.max_attempts
+        ):
+            # The quota is shared with other clients of the API key
+            self._paused_until = time.monotonic() + RATE_LIMIT_BACKOFF_SECONDS
+            self.requeued += 1
+            self.queue.requeue(job.id)
+            self._wakeup.set()
+            return
+
+        self.queue.complete(job.id, result)
+        self._completions.append((time.monotonic(), time.monotonic() - started))
+        waiter = self._waiters.get(job.id)
+        if waiter is not None and not waiter.done():
+            waiter.set_result(result)
+
+    def _recent_completions(self) -> List[Tuple[float, float]]:
+        cutoff = time.monotonic() - THROUGHPUT_WINDOW_SECONDS
+        while self._completions and self._completions[0][0] < cutoff:
+            self._completions.popleft()
+        return list(self._completions)
+
+    def _throughput_per_minute(self) -> float:
+        """Audits completed per minute over the recent window."""
+        recent = self._recent_completions()
+        if len(recent) < 2:
+            return float(len(recent))
+        span = max(recent[-1][0] - recent[0][0], 1.0)
+        return round((len(recent) - 1) / span * 60, 2)
+
+    def _average_duration(self) -> float:
+        recent = self._recent_completions()
+        if not recent:
+            return 0.0
+        return sum(duration for _, duration in recent) / len(recent)
+
+    def _eta_seconds(self, jobs: int) -> float:
+        """
+        Estimated seconds until ``jobs`` more audits have been dispatched and
+        finished: the slower of what the quotas and the concurrency allow,
+        plus one audit's duration.
+        """
+        duration = self._average_duration()
+        if jobs <= 0:
+            return duration
+        quota_time = 0.0
+        if self.quota_limited:
+            quota_time = max(
+                self.minute_bucket.time_for(jobs), self._daily_time(jobs)
+            )
+        concurrency_time = jobs * duration / self.concurrency
+        return max(quota_time, concurrency_time) + duration
+
+    def _daily_time(self, jobs: int) -> float:
+        remaining = self.daily_quota.remaining
+        if jobs <= remaining:
+            return 0.0
+        extra_days = (jobs - remaining - 1) // self.daily_quota.limit
+        return self.daily_quota.seconds_until_reset() + extra_days * 86_400.0
+
+    @staticmethod
+    def _job_summary(job: AuditJob) -> Dict[str, Any]:
+        summary = {
+            "job_id": job.id,
+            "website_url": job.url,
+            "business_id": job.business_id,
+            "status": job.status,
+            "attempts": job.attempts,
+            "overall_score": None,
+            "error": job.error,
+        }
+        if job.result:
+            summary["overall_score"] = job.result.get("overall_score")
+            summary["scores"] = job.result.get("scores")
+            summary["error_code"] = job.result.get("error_code")
+        return summary
+
+
+_shared_scheduler: Optional[LighthouseBatchScheduler] = None
+
+
+def get_lighthouse_scheduler() -> LighthouseBatchScheduler:
+    """Get the process-wide scheduler with its queue persisted to disk."""
+    global _shared_scheduler
+    if _shared_scheduler is None:
+        config = get_api_config()
+        path = config.LIGHTHOUSE_SCHEDULER_QUEUE_PATH or get_data_path(
+            "leadgen_lighthouse_queue.sqlite3", config
+        )
+        _shared_scheduler = LighthouseBatchScheduler(queue=AuditQueue(path))
+    return _shared_scheduler
+
+
+def resume_lighthouse_scheduler() -> None:
+    """Start the process-wide scheduler when its persisted queue has work left."""
+    scheduler = get_lighthouse_scheduler()
+    counts = scheduler.queue.counts()
+    if counts[PENDING] or counts[RUNNING]:
+        scheduler.start()
+
+
+async def close_lighthouse_scheduler() -> None:
+    """Stop the process-wide scheduler, if it was created, and close its queue."""
+    global _shared_scheduler
+    if _shared_scheduler is not None:
+        await _shared_scheduler.stop()
+        _shared_scheduler.queue.close()
+        _shared_scheduler = None
@@ -3,35 +3,114 @@ Lighthouse API integration service for website performance auditing.
 Handles website audits using Google PageSpeed Insights API with timeout and retry logic.
 """
 
+import asyncio
+import hashlib
 import time
-from typing import Dict, Any, Optional
-from urllib.parse import urlencode
-import requests
-from tenacity import (
-    retry,
-    stop_after_attempt,
-    wait_exponential,
-    retry_if_exception_type,
-)
-
-from src.core import BaseService, get_api_config
-from src.services import RateLimiter
+import uuid
+from typing import Dict, Any, Optional, Sequence
+
+from src.core import BaseService, get_api_config, get_data_path
+from src.services.rate_limiter import Reservation, RequestPriority, get_rate_limiter
+from src.services.local_lighthouse_runner import get_local_lighthouse_runner
+from src.services.pagespeed_client import PageSpeedClient, get_pagespeed_client
+from src.services.web_fetcher import WebFetcher, get_web_fetcher
+from src.utils.audit_cache import AuditResultCache, audit_cache_key
+from src.utils.background_loop import run_sync
+from src.utils.deadline import Deadline
+from src.utils.lighthouse_projection import project_audit_result
+from src.utils.payload_store import PayloadStore, get_payload_store
+from src.utils.vitals_history import VitalsHistoryStore, get_vitals_history_store
+from src.utils.result_cache import MemoryCacheBackend, TieredCache, create_cache_backend
+from src.utils.single_flight import flight_key, get_single_flight
 from src.utils.score_calculation import calculate_overall_score
+from src.utils.timing_probe import summarize_probe
+
+# Lighthouse categories requested by a full audit
+AUDIT_CATEGORIES = ("performance", "accessibility", "best-practices", "seo")
+
+# Recovery audits after a timeout are performance-only and mobile-only
+RECOVERY_STRATEGY = "mobile"
+
+# Process-wide audit result cache, created on first use
+_audit_cache: Optional[AuditResultCache] = None
+
+
+def _shared_audit_cache(api_config) -> AuditResultCache:
+    global _audit_cache
+    if _audit_cache is None:
+        persistent = None
+        backend = api_config.LIGHTHOUSE_CACHE_BACKEND
+        if backend:
+            path = api_config.LIGHTHOUSE_CACHE_PATH or get_data_path(
+                "leadgen_lighthouse_results.sqlite3", api_config
+            )
+            persistent = create_cache_backend(
+                backend,
+                path=path,
+                table="audits",
+                max_entries=api_config.LIGHTHOUSE_CACHE_MAX_PERSISTED,
+            )
+        _audit_cache = AuditResultCache(
+            TieredCache(
+                MemoryCacheBackend(api_config.LIGHTHOUSE_CACHE_MAX_ENTRIES), persistent
+            ),
+            ttl_seconds=api_config.LIGHTHOUSE_CACHE_TTL_SECONDS,
+            stale_seconds=api_config.LIGHTHOUSE_CACHE_STALE_SECONDS,
+            strategy_ttls={
+                "mobile": api_config.LIGHTHOUSE_CACHE_MOBILE_TTL_SECONDS,
+                "desktop": api_config.LIGHTHOUSE_CACHE_DESKTOP_TTL_SECONDS,
+            },
+            flight=get_single_flight(),
+            namespace="lighthouse",
+        )
+    return _audit_cache
 
 
 class LighthouseService(BaseService):
     """Lighthouse API integration service for website performance auditing."""
 
-    def __init__(self):
+    def __init__(
+        self,
+        psi_client: Optional[PageSpeedClient] = None,
+        payload_store: Optional[PayloadStore] = None,
+        web_fetcher: Optional[WebFetcher] = None,
+        history_store: Optional[VitalsHistoryStore] = None,
+    ):
         super().__init__("LighthouseService")
         self.api_config = get_api_config()
-        self.rate_limiter = RateLimiter()
-        self.base_url = "https://www.googleapis.com/pagespeedonline/v5/runPagespeed"
+        self.rate_limiter = get_rate_limiter()
         self.api_key = self.api_config.LIGHTHOUSE_API_KEY
         self.timeout = self.api_config.LIGHTHOUSE_AUDIT_TIMEOUT_SECONDS
-        self.connect_timeout = self.api_config.LIGHTHOUSE_CONNECT_TIMEOUT_SECONDS
-        self.read_timeout = self.api_config.LIGHTHOUSE_READ_TIMEOUT_SECONDS
         self.fallback_timeout = self.api_config.LIGHTHOUSE_FALLBACK_TIMEOUT_SECONDS
+        self.probe_enabled = self.api_config.LIGHTHOUSE_RECOVERY_PROBE_ENABLED
+        self.probe_timeout = self.api_config.LIGHTHOUSE_RECOVERY_PROBE_TIMEOUT_SECONDS
+        self.probe_max_bytes = self.api_config.LIGHTHOUSE_RECOVERY_PROBE_MAX_BYTES
+        self.quota_wait = self.api_config.RATE_LIMITER_ACQUIRE_TIMEOUT_SECONDS
+        self.web_fetcher = web_fetcher or get_web_fetcher()
+        # Both expose run_pagespeed with the same parameters and result shape
+        self.local_backend = self.api_config.LIGHTHOUSE_BACKEND == "local"
+        self.psi_client = psi_client or (
+            get_local_lighthouse_runner()
+            if self.local_backend
+            else get_pagespeed_client()
+        )
+        self.include_raw_data = self.api_config.LIGHTHOUSE_INCLUDE_RAW_DATA
+        self.projection_max_audits = self.api_config.LIGHTHOUSE_PROJECTION_MAX_AUDITS
+        self.payload_store = payload_store
+        if (
+            self.payload_store is None
+            and self.api_config.LIGHTHOUSE_PAYLOAD_STORE_ENABLED
+        ):
+            self.payload_store = get_payload_store()
+        self.history_store = history_store
+        if self.history_store is None and self.api_config.LIGHTHOUSE_HISTORY_ENABLED:
+            self.history_store = get_vitals_history_store()
+        self.flight = get_single_flight()
+        self.audit_cache = (
+            _shared_audit_cache(self.api_config)
+            if self.api_config.LIGHTHOUSE_CACHE_ENABLED
+            else None
+        )
 
     def validate_input(self, data: Any) -> bool:
         """Validate input data for the service."""
@@ -48,7 +127,12 @@ class LighthouseService(BaseService):
         strategy: str = "desktop",
     ) -> Dict[str, Any]:
         """
-        Run a Lighthouse audit for a website using Google PageSpeed Insights API.
+        Run a Lighthouse audit for a website from synchronous code.
+
+        Runs ``run_lighthouse_audit_async`` on the shared background event
+        loop, so both entry points share the pooled PageSpeedClient and its
+        retry policy. Blocks the calling thread; async callers await
+        ``run_lighthouse_audit_async`` instead.
 
         Args:
             website_url: URL of the website to audit
@@ -59,28 +143,104 @@ class LighthouseService(BaseService):
         Returns:
             Dictionary containing audit results or error information
         """
+        return run_sync(
+            self.run_lighthouse_audit_async(
+                website_url, business_id, run_id, strategy
+            )
+        )
+
+    async def run_lighthouse_audit_async(
+        self,
+        website_url: str,
+        business_id: str,
+        run_id: Optional[str] = None,
+        strategy: str = "desktop",
+        deadline: Optional[Deadline] = None,
+        priority: RequestPriority = RequestPriority.NORMAL,
+    ) -> Dict[str, Any]:
+        """
+        Run a Lighthouse audit without blocking the event loop.
+
+        The request goes through the pooled PageSpeedClient, whose retries
+        back off with ``asyncio.sleep``. When the PageSpeed quota is used up the audit
+        queues for it, for up to RATE_LIMITER_ACQUIRE_TIMEOUT_SECONDS or the
+        deadline, instead of failing at once.
+
+        With LIGHTHOUSE_CACHE_ENABLED, results are cached per normalized URL,
+        strategy and category set. Fresh results are served without calling
+        the API, stale ones are served while a background audit refreshes
+        them, and concurrent misses for one key share a single audit.
+        ``cache_status`` on the result reports which happened. Without the
+        cache, concurrent audits of one URL and strategy are still coalesced.
+
+        Args:
+            website_url: URL of the website to audit
+            business_id: Business identifier for logging and tracking
+            run_id: Run identifier for logging and tracking
+            strategy: Audit strategy ('desktop' or 'mobile')
+            deadline: Overall deadline; retries and the fallback audit only
+                get the time left. A coalesced audit keeps the deadline of
+                the caller that started it.
+            priority: Queue class while waiting for PageSpeed quota
+
+        Returns:
+            Dictionary containing audit results or error information
+        """
+        if not self._validate_url(website_url):
+            return await self._run_lighthouse_audit_async(
+                website_url, business_id, run_id, strategy, deadline, priority
+            )
+        if self.audit_cache is None:
+            result, shared = await self.flight.do(
+                flight_key("lighthouse", website_url, strategy=strategy),
+                lambda: self._run_lighthouse_audit_async(
+                    website_url, business_id, run_id, strategy, deadline, priority
+                ),
+            )
+            return self._for_caller(result, shared, business_id, run_id)
+
+        result, status, age = await self.audit_cache.get_or_run(
+            audit_cache_key(website_url, strategy, AUDIT_CATEGORIES),
+            strategy,
+            lambda: self._run_lighthouse_audit_async(
+                website_url, business_id, run_id, strategy, deadline, priority
+            ),
+            self._is_cacheable,
+        )
+        return self._with_cache_status(result, status, age, business_id, run_id)
+
+    async def _run_lighthouse_audit_async(
+        self,
+        website_url: str,
+        business_id: str,
+        run_id: Optional[str],
+        strategy: str,
+        deadline: Optional[Deadline] = None,
+        priority: RequestPriority = RequestPriority.NORMAL,
+    ) -> Dict[str, Any]:
+        """Run an audit against the API, bypassing the cache."""
+        reservation = None
         try:
             self.log_operation(
-                f"Starting Lighthouse audit for {website_url} using {strategy} strategy",
+                "Starting Lighthouse audit",
                 run_id=run_id,
                 business_id=business_id,
+                website_url=website_url,
+                strategy=strategy,
             )
 
-            # Check rate limiting
-            can_request, reason = self.rate_limiter.can_make_request(
-                "lighthouse", run_id
-            )
-            if not can_request:
+            reservation = await self._acquire(run_id, deadline, priority)
+            if not reservation.granted:
                 return self._create_error_response(
-                    f"Rate limit exceeded: {reason}",
+                    f"Rate limit exceeded: {reservation.reason}",
                     "rate_limit_check",
                     website_url,
                     business_id,
                     run_id,
                 )
 
-            # Validate URL format
             if not self._validate_url(website_url):
+                self.rate_limiter.release(reservation, run_id)
                 return self._create_error_response(
                     "Invalid website URL format",
                     "url_validation",
@@ -89,75 +249,241 @@ class LighthouseService(BaseService):
                     run_id,
                 )
 
-            # Build API request parameters
-            params = self._build_audit_params(website_url, strategy)
-
-            # Execute audit with timeout and retry logic
-            audit_result = self._execute_audit_with_retry(params, run_id, business_id)
-
-            # Record the request in rate limiter
-            self.rate_limiter.record_request(
-                "lighthouse", audit_result["success"], run_id
+            audit_result = await self.psi_client.run_pagespeed(
+                self._build_audit_params(website_url, strategy),
+                run_id=run_id,
+                business_id=business_id,
+                deadline=deadline,
             )
+            self._record_request(audit_result["success"], run_id, reservation)
 
-            # If primary audit fails, attempt fallback audit
             if (
                 not audit_result["success"]
                 and audit_result.get("error_code") == "TIMEOUT"
             ):
                 self.log_operation(
-                    f"Primary audit failed with timeout, attempting fallback audit for {website_url}",
+                    "Primary audit failed with timeout, attempting fallback audit",
                     run_id=run_id,
                     business_id=business_id,
+                    website_url=website_url,
                     context="fallback_attempt",
                 )
-
-                # Attempt fallback audit with reduced scope
-                fallback_result = self._execute_fallback_audit(
-                    website_url, business_id, run_id, strategy
+                return await self.recover_audit_async(
+                    website_url, business_id, run_id, deadline
                 )
 
-                if fallback_result["success"]:
-                    self.log_operation(
-                        f"Fallback audit successful for {website_url}",
-                        run_id=run_id,
-                        business_id=business_id,
-                        context="fallback_success",
-                    )
-                    return fallback_result
-                else:
-                    self.log_operation(
-                        f"Fallback audit also failed for {website_url}",
-                        run_id=run_id,
-                        business_id=business_id,
-                        context="fallback_failure",
-                    )
-                    # Return fallback result instead of original audit result
-                    return fallback_result
-
             if not audit_result["success"]:
                 return audit_result
 
-            # Process and normalize audit results
             processed_results = self._process_audit_results(
                 audit_result["data"], website_url, business_id, run_id
             )
 
             self.log_operation(
-                f"Successfully completed Lighthouse audit for {website_url}",
+                "Successfully completed Lighthouse audit",
                 run_id=run_id,
                 business_id=business_id,
+                website_url=website_url,
                 scores=processed_results.get("scores", {}),
             )
 
             return processed_results
 
         except Exception as e:
+            if reservation is not None:
+                # No-op once the request was recorded
+                self.rate_limiter.release(reservation, run_id)
             self.log_error(e, "lighthouse_audit_execution", run_id, business_id)
             return self._create_error_response(
                 str(e), "audit_execution", website_url, business_id, run_id
             )
 
+    async def audit(
+        self,
+        website_url: str,
+        business_id: str,
+        run_id: Optional[str] = None,
+        strategies: Sequence[str] = ("mobile", "desktop"),
+        deadline: Optional[Deadline] = None,
+    ) -> Dict[str, Any]:
+        """
+        Audit a website under several strategies concurrently.
+
+        Args:
+            website_url: URL of the website to audit
+            business_id: Business identifier for logging and tracking
+            run_id: Run identifier for logging and tracking
+            strategies: Form factors to audit, e.g. ``("mobile", "desktop")``
+            deadline: Overall deadline shared by every strategy
+
+        Returns:
+            Dictionary with one audit result per strategy under ``audits``;
+            ``success`` is true when at least one strategy succeeded and
+            ``failed_strategies`` lists the rest
+        """
+        strategies = list(dict.fromkeys(strategies))
+        results = await asyncio.gather(
+            *(
+                self.run_lighthouse_audit_async(
+                    website_url, business_id, run_id, strategy, deadline
+                )
+                for strategy in strategies
+            )
+        )
+        audits = dict(zip(strategies, results))
+        failed = [
+            strategy for strategy, result in audits.items() if not result["success"]
+        ]
+
+        return {
+            "success": len(failed) < len(strategies),
+            "website_url": website_url,
+            "business_id": business_id,
+            "run_id": run_id,
+            "audit_timestamp": time.time(),
+            "strategies": strategies,
+            "failed_strategies": failed,
+            "audits": audits,
+        }
+
+    def recover_audit(
+        self, website_url: str, business_id: str, run_id: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Reduced-scope audit from synchronous code.
+
+        Runs ``recover_audit_async`` on the shared background event loop and
+        blocks the calling thread until it finishes.
+        """
+        return run_sync(self.recover_audit_async(website_url, business_id, run_id))
+
+    async def recover_audit_async(
+        self,
+        website_url: str,
+        business_id: str,
+        run_id: Optional[str] = None,
+        deadline: Optional[Deadline] = None,
+    ) -> Dict[str, Any]:
+        """
+        Reduced-scope audit for a website whose full audit timed out.
+
+        Makes a single performance-only, mobile-only PageSpeed request and,
+        alongside it, a local timing probe of the page (time to first byte,
+        document size and request count). The PageSpeed score is preferred;
+        when that request fails too, the probe's estimate is returned with
+        low confidence and ``estimated`` set. Concurrent recoveries of one URL,
+        e.g. its mobile and desktop audits, share one execution.
+
+        Args:
+            website_url: URL of the website to audit
+            business_id: Business identifier for logging and tracking
+            run_id: Run identifier for logging and tracking
+            deadline: Overall deadline; both requests are cut short at it
+
+        Returns:
+            Fallback audit result, or an error with error_code FALLBACK_FAILED
+        """
+        result, shared = await self.flight.do(
+            flight_key("lighthouse_recovery", website_url),
+            lambda: self._recover_audit_async(
+                website_url, business_id, run_id, deadline
+            ),
+        )
+        return self._for_caller(result, shared, business_id, run_id)
+
+    async def _recover_audit_async(
+        self,
+        website_url: str,
+        business_id: str,
+        run_id: Optional[str],
+        deadline: Optional[Deadline],
+    ) -> Dict[str, Any]:
+        probe_task = None
+        if self.probe_enabled:
+            probe_task = asyncio.create_task(
+                self._run_timing_probe_async(
+                    website_url, business_id, run_id, deadline
+                )
+            )
+        try:
+            # The probe needs no PageSpeed quota, so it still runs when limited
+            reservation = await self._acquire(run_id, deadline)
+            if reservation.granted:
+                result = await self._execute_fallback_audit_async(
+                    website_url, business_id, run_id, deadline
+                )
+                self._record_request(result["success"], run_id, reservation)
+            else:
+                reason = reservation.reason
+                result = self._fallback_failure(f"Rate limit exceeded: {reason}")
+            if result["success"] or probe_task is None:
+                return result
+            probe = await probe_task
+        finally:
+            if probe_task is not None:
+                probe_task.cancel()
+        return self._probe_result(probe, result, business_id, run_id)
+
+    async def _acquire(
+        self,
+        run_id: Optional[str],
+        deadline: Optional[Deadline],
+        priority: RequestPriority = RequestPriority.NORMAL,
+    ) -> Reservation:
+        """
+        Wait for PageSpeed quota for an async audit, at most ``quota_wait``
+        seconds or until the deadline; local audits use no quota.
+        """
+        if self.local_backend:
+            return Reservation("lighthouse", True, "Local Lighthouse backend")
+        timeout = self.quota_wait
+        if deadline is not None:
+            timeout = deadline.clamp(timeout)
+        return await self.rate_limiter.acquire("lighthouse", timeout, priority, run_id)
+
+    def _record_request(
+        self,
+        success: bool,
+        run_id: Optional[str],
+        reservation: Optional[Reservation] = None,
+    ) -> None:
+        if not self.local_backend:
+            self.rate_limiter.record_request("lighthouse", success, run_id, reservation)
+
+    @staticmethod
+    def _is_cacheable(result: Dict[str, Any]) -> bool:
+        """Only complete audits are cached; fallback results are partial."""
+        return bool(result.get("success")) and not result.get("fallback_used")
+
+    @staticmethod
+    def _for_caller(
+        result: Dict[str, Any],
+        shared: bool,
+        business_id: str,
+        run_id: Optional[str],
+    ) -> Dict[str, Any]:
+        """Attribute a result that may have been shared with other callers."""
+        if not shared:
+            return result
+        return {**result, "business_id": business_id, "run_id": run_id}
+
+    @staticmethod
+    def _with_cache_status(
+        result: Dict[str, Any],
+        status: str,
+        age: float,
+        business_id: str,
+        run_id: Optional[str],
+    ) -> Dict[str, Any]:
+        """Copy of a possibly shared result, attributed to the current caller."""
+        return {
+            **result,
+            "business_id": business_id,
+            "run_id": run_id,
+            "cache_status": status,
+            "cache_age_seconds": round(age, 3),
+        }
+
     def _validate_url(self, url: str) -> bool:
         """Validate URL format."""
         try:
@@ -174,72 +500,10 @@ class LighthouseService(BaseService):
             "url": website_url,
             "key": self.api_key,
             "strategy": strategy,
-            "category": "performance,accessibility,best-practices,seo",
+            "category": ",".join(AUDIT_CATEGORIES),
             "prettyPrint": "false",
         }
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=4, max=10),
-        retry=retry_if_exception_type((requests.RequestException, requests.Timeout)),
-    )
-    def _execute_audit_with_retry(
-        self, params: Dict[str, str], run_id: Optional[str], business_id: str
-    ) -> Dict[str, Any]:
-        """Execute audit with retry logic and timeout handling."""
-        try:
-            # Build full URL with parameters
-            full_url = f"{self.base_url}?{urlencode(params)}"
-
-            self.log_operation(
-                "Executing Lighthouse audit request",
-                run_id=run_id,
-                business_id=business_id,
-                url=params.get("url"),
-            )
-
-            # Make request with enhanced timeout handling
-            timeout_tuple = (self.connect_timeout, self.read_timeout)
-            response = requests.get(
-                full_url,
-                timeout=timeout_tuple,
-                headers={"User-Agent": "LeadGen-Makeover-Agent/1.0"},
-            )
-
-            response.raise_for_status()
-
-            # Parse response
-            audit_data = response.json()
-
-            return {
-                "success": True,
-                "data": audit_data,
-                "status_code": response.status_code,
-            }
-
-        except requests.Timeout:
-            self.log_error(
-                Exception("Lighthouse audit request timed out"),
-                "audit_timeout",
-                run_id,
-                business_id,
-            )
-            return {
-                "success": False,
-                "error": "Audit request timed out",
-                "error_code": "TIMEOUT",
-                "context": "audit_execution",
-            }
-
-        except requests.RequestException as e:
-            self.log_error(e, "audit_request_failed", run_id, business_id)
-            return {
-                "success": False,
-                "error": f"Audit request failed: {str(e)}",
-                "error_code": "REQUEST_FAILED",
-                "context": "audit_execution",
-            }
-
     def _process_audit_results(
         self,
         audit_data: Dict[str, Any],
@@ -268,7 +532,7 @@ class LighthouseService(BaseService):
             # Determine confidence level
             confidence = self._determine_confidence(audit_data)
 
-            return {
+            result = {
                 "success": True,
                 "website_url": website_url,
                 "business_id": business_id,
@@ -281,8 +545,11 @@ class LighthouseService(BaseService):
                 "overall_score": overall_score,
                 "core_web_vitals": core_web_vitals,
                 "confidence": confidence,
-                "raw_data": audit_data,
+                **self._project_payload(audit_data),
             }
+            if self.history_store is not None:
+                self.history_store.submit_audit(result)
+            return result
 
         except Exception as e:
             self.log_error(e, "audit_results_processing", run_id, business_id)
@@ -390,71 +657,193 @@ class LighthouseService(BaseService):
             "confidence": "low",
         }
 
-    def _execute_fallback_audit(
-        self, website_url: str, business_id: str, run_id: Optional[str], strategy: str
+    async def _execute_fallback_audit_async(
+        self,
+        website_url: str,
+        business_id: str,
+        run_id: Optional[str],
+        deadline: Optional[Deadline] = None,
+    ) -> Dict[str, Any]:
+        """
+        Execute a reduced-scope audit when the primary audit timed out.
+        Uses the mobile strategy and the performance category only for
+        quicker completion; a single attempt, limited to the time left
+        before ``deadline``.
+        """
+        self.log_operation(
+            "Executing fallback audit",
+            run_id=run_id,
+            business_id=business_id,
+            website_url=website_url,
+            context="fallback_audit",
+        )
+
+        audit_result = await self.psi_client.run_pagespeed(
+            self._build_fallback_params(website_url),
+            read_timeout=self.fallback_timeout,
+            attempts=1,
+            run_id=run_id,
+            business_id=business_id,
+            deadline=deadline,
+        )
+        if not audit_result["success"]:
+            return self._fallback_failure(audit_result["error"])
+        return self._fallback_result(audit_result["data"], audit_result["status_code"])
+
+    @staticmethod
+    def _fallback_failure(error: str) -> Dict[str, Any]:
+        return {
+            "success": False,
+            "error": f"Fallback audit failed: {error}",
+            "error_code": "FALLBACK_FAILED",
+            "context": "fallback_audit",
+            "fallback_used": True,
+        }
+
+    def _build_fallback_params(self, website_url: str) -> Dict[str, str]:
+        """Build reduced-scope parameters for a fallback audit."""
+        return {
+            "url": website_url,
+            "key": self.api_key,
+            "strategy": RECOVERY_STRATEGY,
+            "category": "performance",  # Only performance for faster results
+            "prettyPrint": "false",
+        }
+
+    def _fallback_result(
+        self, audit_data: Dict[str, Any], status_code: int
     ) -> Dict[str, Any]:
+        """Build the result of a performance-only fallback audit."""
+        # Process with limited data
+        scores = {
+            "performance": self._extract_score(
+                audit_data.get("lighthouseResult", {}).get("categories", {}),
+                "performance",
+            ),
+            "accessibility": None,  # Not available in fallback
+            "best_practices": None,  # Not available in fallback
+            "seo": None,  # Not available in fallback
+        }
+
+        overall_score = scores["performance"]  # Only performance score available
+
+        return {
+            "success": True,
+            "status_code": status_code,
+            "fallback_used": True,
+            "strategy": RECOVERY_STRATEGY,
+            "scores": scores,
+            "overall_score": overall_score,
+            "confidence": "medium",  # Lower confidence due to limited data
+            **self._project_payload(audit_data),
+        }
+
+    async def _run_timing_probe_async(
+        self,
+        website_url: str,
+        business_id: str,
+        run_id: Optional[str],
+        deadline: Optional[Deadline],
+    ) -> Optional[Dict[str, Any]]:
         """
-        Execute fallback audit with reduced parameters when primary audit fails.
-        Uses faster strategy and reduced categories for quicker completion.
+        Fetch the page once over the shared fetcher and summarize its timing;
+        None when the fetch fails or runs past the probe timeout.
         """
+        timeout = self.probe_timeout
+        if deadline is not None:
+            timeout = deadline.clamp(timeout)
         try:
+            fetched = await asyncio.wait_for(
+                self.web_fetcher.fetch_html(
+                    website_url, max_bytes=self.probe_max_bytes
+                ),
+                timeout,
+            )
+        except asyncio.TimeoutError:
+            fetched = None
+        if fetched is None or not fetched.success:
             self.log_operation(
-                f"Executing fallback audit for {website_url}",
+                "Timing probe failed",
                 run_id=run_id,
                 business_id=business_id,
-                context="fallback_audit",
+                website_url=website_url,
+                context="timing_probe",
+                error=fetched.error if fetched is not None else "timed out",
             )
+            return None
+        return summarize_probe(fetched.ttfb, fetched.bytes_read, fetched.text)
 
-            # Build fallback parameters with reduced scope
-            fallback_params = {
-                "url": website_url,
-                "key": self.api_key,
-                "strategy": strategy,
-                "category": "performance",  # Only performance for faster results
-                "prettyPrint": "false",
-            }
+    def _probe_result(
+        self,
+        probe: Optional[Dict[str, Any]],
+        failed: Dict[str, Any],
+        business_id: str,
+        run_id: Optional[str],
+    ) -> Dict[str, Any]:
+        """Result estimated from a timing probe, or ``failed`` without one."""
+        if probe is None:
+            return failed
+        performance = probe["estimated_performance"]
+        self.log_operation(
+            "Estimated performance from timing probe",
+            run_id=run_id,
+            business_id=business_id,
+            performance=performance,
+            context="timing_probe",
+        )
+        return {
+            "success": True,
+            "fallback_used": True,
+            "estimated": True,
+            "fallback_reason": failed.get("error"),
+            "strategy": RECOVERY_STRATEGY,
+            "scores": {
+                "performance": performance,
+                "accessibility": None,  # Not measured by the probe
+                "best_practices": None,
+                "seo": None,
+            },
+            "overall_score": performance,
+            "confidence": "low",
+            "timing_probe": probe,
+            "audit_timestamp": time.time(),
+        }
 
-            # Execute with shorter timeout
-            timeout_tuple = (self.connect_timeout, self.fallback_timeout)
+    def _project_payload(self, audit_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Compact form of a PageSpeed payload for the audit result.
 
-            response = requests.get(
-                f"{self.base_url}?{urlencode(fallback_params)}",
-                timeout=timeout_tuple,
-                headers={"User-Agent": "LeadGen-Makeover-Agent/1.0"},
+        The full payload is only kept inline when LIGHTHOUSE_INCLUDE_RAW_DATA
+        is set; with a payload store configured it is also queued for
+        compressed storage and referenced by ``raw_data_ref``.
+        """
+        raw_data_ref = None
+        if self.payload_store is not None:
+            raw_data_ref = self.payload_store.submit(
+                self._payload_key(audit_data), audit_data
             )
+        return {
+            "audit_summary": project_audit_result(
+                audit_data, max_items=self.projection_max_audits
+            ),
+            "raw_data_ref": raw_data_ref,
+            "raw_data": audit_data if self.include_raw_data else None,
+        }
 
-            response.raise_for_status()
-            audit_data = response.json()
-
-            # Process with limited data
-            scores = {
-                "performance": self._extract_score(
-                    audit_data.get("lighthouseResult", {}).get("categories", {}),
-                    "performance",
-                ),
-                "accessibility": 0.0,  # Not available in fallback
-                "best_practices": 0.0,  # Not available in fallback
-                "seo": 0.0,  # Not available in fallback
-            }
-
-            overall_score = scores["performance"]  # Only performance score available
-
-            return {
-                "success": True,
-                "data": audit_data,
-                "status_code": response.status_code,
-                "fallback_used": True,
-                "scores": scores,
-                "overall_score": overall_score,
-                "confidence": "medium",  # Lower confidence due to limited data
-            }
-
-        except Exception as e:
-            self.log_error(e, "fallback_audit_failed", run_id, business_id)
-            return {
-                "success": False,
-                "error": f"Fallback audit failed: {str(e)}",
-                "error_code": "FALLBACK_FAILED",
-                "context": "fallback_audit",
-                "fallback_used": True,
-            }
+    @staticmethod
+    def _payload_key(audit_data: Dict[str, Any]) -> str:
+        """Stable id of a PageSpeed run, derived without serializing the payload."""
+        lighthouse = audit_data.get("lighthouseResult", {})
+        fetch_time = lighthouse.get("fetchTime") or audit_data.get(
+            "analysisUTCTimestamp"
+        )
+        if not fetch_time:
+            return uuid.uuid4().hex
+        identity = "|".join(
+            (
+                str(lighthouse.get("requestedUrl") or audit_data.get("id")),
+                str(lighthouse.get("configSettings", {}).get("formFactor")),
+                str(fetch_time),
+            )
+        )
+        return hashlib.sha256(identity.encode("utf-8")).hexdigest()[:32]
@@ -0,0 +1,367 @@
+"""
+Local Lighthouse runner.
+Runs the Lighthouse CLI against a pool of headless Chrome instances on this host, as an alternative to the PageSpeed Insights API.
+"""
+
+import asyncio
+import json
+import shlex
+import shutil
+import socket
+import tempfile
+import time
+from typing import Any, Dict, List, Optional, Sequence
+
+from src.core.base_service import BaseService
+from src.core.config import get_api_config
+from src.utils.deadline import Deadline
+
+# Audits are not started with less time than this left before the deadline
+MIN_AUDIT_SECONDS = 1.0
+
+# How long a freshly launched Chrome gets to open its DevTools port
+CHROME_STARTUP_SECONDS = 15.0
+
+# PageSpeed Insights strategy to Lighthouse CLI flags
+STRATEGY_FLAGS = {
+    "mobile": ["--form-factor=mobile"],
+    "desktop": ["--preset=desktop"],
+}
+
+DEFAULT_CHROME_FLAGS = ("--headless=new", "--no-sandbox", "--disable-dev-shm-usage")
+
+
+def _free_port() -> int:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+class _Browser:
+    """One pooled Chrome process and the number of audits it has run."""
+
+    def __init__(self, process: asyncio.subprocess.Process, port: int, profile: str):
+        self.process = process
+        self.port = port
+        self.profile = profile
+        self.audits = 0
+
+    @property
+    def alive(self) -> bool:
+        return self.process.returncode is None
+
+
+class LocalLighthouseRunner(BaseService):
+    """
+    Pool of headless Chrome instances driven by the Lighthouse CLI.
+
+    ``run_pagespeed`` takes the same parameters and returns the same result
+    shape as ``PageSpeedClient.run_pagespeed``, with the Lighthouse report
+    wrapped as ``{"lighthouseResult": ...}``. LighthouseService can
+    therefore use either one and produce identical normalized scores and
+    Core Web Vitals.
+
+    At most ``pool_size`` audits run at once, one per Chrome instance. A
+    browser is replaced after ``recycle_after`` audits, and also after it
+    crashes or an audit on it times out or fails, so a wedged or leaking
+    Chrome never serves more than one further audit.
+    """
+
+    def __init__(
+        self,
+        lighthouse_command: Optional[Sequence[str]] = None,
+        chrome_command: Optional[Sequence[str]] = None,
+        pool_size: Optional[int] = None,
+        recycle_after: Optional[int] = None,
+        timeout: Optional[float] = None,
+        chrome_flags: Sequence[str] = DEFAULT_CHROME_FLAGS,
+    ):
+        super().__init__("LocalLighthouseRunner")
+        self.api_config = get_api_config()
+        self.lighthouse_command = list(
+            lighthouse_command
+            or shlex.split(self.api_config.LIGHTHOUSE_LOCAL_COMMAND)
+        )
+        self.chrome_command = list(
+            chrome_command
+            or shlex.split(self.api_config.LIGHTHOUSE_LOCAL_CHROME_COMMAND)
+        )
+        self.pool_size = max(
+            1, pool_size or self.api_config.LIGHTHOUSE_LOCAL_POOL_SIZE
+        )
+        self.recycle_after = max(
+            1, recycle_after or self.api_config.LIGHTHOUSE_LOCAL_RECYCLE_AFTER
+        )
+        self.timeout = timeout or self.api_config.LIGHTHOUSE_LOCAL_TIMEOUT_SECONDS
+        self.chrome_flags = list(chrome_flags)
+        self.requests = 0
+        self.failures = 0
+        self.timeouts = 0
+        self.browsers_launched = 0
+        self.browsers_recycled = 0
+
+        self._idle: Optional[asyncio.Queue] = None
+        self._browsers: List[_Browser] = []
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def validate_input(self, data: Any) -> bool:
+        """Validate that data is a params dict with a ``url``."""
+        return isinstance(data, dict) and bool(data.get("url"))
+
+    async def run_pagespeed(
+        self,
+        params: Dict[str, str],
+        read_timeout: Optional[float] = None,
+        attempts: Optional[int] = None,
+        run_id: Optional[str] = None,
+        business_id: Optional[str] = None,
+        deadline: Optional[Deadline] = None,
+    ) -> Dict[str, Any]:
+        """
+        Run one Lighthouse audit locally.
+
+        Args:
+            params: PageSpeed Insights parameters; ``url``, ``strategy`` and
+                ``category`` are used, API-only ones such as ``key`` ignored
+            read_timeout: Time limit of the audit; defaults to ``timeout``
+            attempts: Accepted for compatibility; local audits are not retried
+            run_id: Run identifier for logging
+            business_id: Business identifier for logging
+            deadline: Overall deadline; caps the time limit
+
+        Returns:
+            ``{"success": True, "data", "status_code"}`` on success, otherwise
+            an error dict with error_code TIMEOUT or REQUEST_FAILED
+        """
+        timeout = read_timeout or self.timeout
+        if deadline is not None:
+            timeout = deadline.clamp(timeout)
+            if timeout < MIN_AUDIT_SECONDS:
+                return self._error(
+                    "Audit not started at the deadline",
+                    "TIMEOUT",
+                    deadline_exceeded=True,
+                )
+
+        categories = [c for c in params.get("category", "").split(",") if c]
+        self.requests += 1
+        idle = self._get_pool()
+        browser = await idle.get()
+        result: Optional[Dict[str, Any]] = None
+        try:
+            browser = await self._ready(browser)
+            result = await self._audit(
+                browser,
+                params["url"],
+                params.get("strategy", "desktop"),
+                categories,
+                timeout,
+            )
+        except Exception as e:
+            result = self._error(f"Local audit failed: {str(e)}", "REQUEST_FAILED")
+        finally:
+            if browser is not None:
+                browser.audits += 1
+                if result is None or not result["success"]:
+                    # Whatever state it was left in, the next audit gets a fresh one
+                    browser.audits = self.recycle_after
+            idle.put_nowait(browser)
+
+        if not result["success"]:
+            self.failures += 1
+            if result["error_code"] == "TIMEOUT":
+                self.timeouts += 1
+            self.log_error(
+                Exception(result["error"]),
+                "local_lighthouse_audit",
+                run_id,
+                business_id,
+            )
+        return result
+
+    async def aclose(self) -> None:
+        """Stop every pooled Chrome instance."""
+        same_loop = self._loop is asyncio.get_running_loop()
+        for browser in list(self._browsers):
+            if same_loop:
+                await self._terminate(browser)
+            else:
+                self._kill(browser)
+        self._browsers = []
+        self._idle = None
+        self._loop = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Pool size and audit counters."""
+        return {
+            "pool_size": self.pool_size,
+            "browsers_running": sum(1 for browser in self._browsers if browser.alive),
+            "browsers_launched": self.browsers_launched,
+            "browsers_recycled": self.browsers_recycled,
+            "requests": self.requests,
+            "failures": self.failures,
+            "timeouts": self.timeouts,
+        }
+
+    def _get_pool(self) -> asyncio.Queue:
+        # Subprocesses and the queue are bound to the loop they were created on
+        loop = asyncio.get_running_loop()
+        if self._idle is None or self._loop is not loop:
+            # The previous loop's browsers cannot be awaited from this one;
+            # kill them outright so no Chrome process or profile is left behind
+            for browser in self._browsers:
+                self._kill(browser)
+            self._idle = asyncio.Queue()
+            for _ in range(self.pool_size):
+                self._idle.put_nowait(None)
+            self._browsers = []
+            self._loop = loop
+        return self._idle
+
+    async def _ready(self, browser: Optional[_Browser]) -> _Browser:
+        """Return ``browser``, or a fresh one when it is missing, dead or used up."""
+        if (
+            browser is not None
+            and browser.alive
+            and browser.audits < self.recycle_after
+        ):
+            return browser
+        if browser is not None:
+            self.browsers_recycled += 1
+            await self._terminate(browser)
+        return await self._launch()
+
+    async def _launch(self) -> _Browser:
+        port = _free_port()
+        profile = tempfile.mkdtemp(prefix="leadgen-chrome-")
+        process = await asyncio.create_subprocess_exec(
+            *self.chrome_command,
+            f"--remote-debugging-port={port}",
+            f"--user-data-dir={profile}",
+            *self.chrome_flags,
+            "about:blank",
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.DEVNULL,
+        )
+        browser = _Browser(process, port, profile)
+        self._browsers.append(browser)
+        self.browsers_launched += 1
+        await self._wait_for_port(browser)
+        return browser
+
+    async def _wait_for_port(self, browser: _Browser) -> None:
+        started = time.monotonic()
+        while time.monotonic() - started < CHROME_STARTUP_SECONDS:
+            if not browser.alive:
+                raise RuntimeError("Chrome exited during startup")
+            try:
+                _, writer = await asyncio.open_connection("127.0.0.1", browser.port)
+            except OSError:
+                await asyncio.sleep(0.05)
+                continue
+            writer.close()
+            return
+        await self._terminate(browser)
+        raise RuntimeError("Chrome did not open its DevTools port")
+
+    async def _audit(
+        self,
+        browser: _Browser,
+        url: str,
+        strategy: str,
+        categories: List[str],
+        timeout: float,
+    ) -> Dict[str, Any]:
+        args = [
+            url,
+            f"--port={browser.port}",
+            "--output=json",
+            "--output-path=stdout",
+            "--quiet",
+            *STRATEGY_FLAGS.get(strategy, STRATEGY_FLAGS["desktop"]),
+        ]
+        if categories:
+            args.append(f"--only-categories={','.join(categories)}")
+
+        process = await asyncio.create_subprocess_exec(
+            *self.lighthouse_command,
+            *args,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        try:
+            stdout, stderr = await asyncio.wait_for(process.communicate(), timeout)
+        except asyncio.TimeoutError:
+            process.kill()
+            await process.wait()
+            return self._error("Local audit timed out", "TIMEOUT")
+        except asyncio.CancelledError:
+            process.kill()
+            raise
+
+        if process.returncode != 0:
+            message = stderr.decode("utf-8", "replace").strip().splitlines()
+            return self._error(
+                f"Lighthouse exited with {process.returncode}: "
+                f"{message[-1] if message else 'no output'}",
+                "REQUEST_FAILED",
+            )
+        try:
+            report = json.loads(stdout)
+        except ValueError as e:
+            return self._error(f"Invalid Lighthouse report: {str(e)}", "REQUEST_FAILED")
+        if report.get("runtimeError", {}).get("code"):
+            # Same condition PageSpeed Insights reports as an HTTP 500
+            return self._error(
+                f"Lighthouse runtime error: {report['runtimeError']['code']}",
+                "REQUEST_FAILED",
+            )
+        return {
+            "success": True,
+            "data": {"lighthouseResult": report},
+            "status_code": 200,
+        }
+
+    async def _terminate(self, browser: _Browser) -> None:
+        if browser.alive:
+            browser.process.kill()
+            await browser.process.wait()
+        if browser in self._browsers:
+            self._browsers.remove(browser)
+        shutil.rmtree(browser.profile, ignore_errors=True)
+
+    @staticmethod
+    def _kill(browser: _Browser) -> None:
+        if browser.alive:
+            try:
+                browser.process.kill()
+            except ProcessLookupError:
+                pass
+        shutil.rmtree(browser.profile, ignore_errors=True)
+
+    @staticmethod
+    def _error(error: str, error_code: str, **extra: Any) -> Dict[str, Any]:
+        return {
+            "success": False,
+            "error": error,
+            "error_code": error_code,
+            "context": "audit_execution",
+            **extra,
+        }
+
+
+_shared_runner: Optional[LocalLighthouseRunner] = None
+
+
+def get_local_lighthouse_runner() -> LocalLighthouseRunner:
+    """Get the process-wide local runner so every audit shares one browser pool."""
+    global _shared_runner
+    if _shared_runner is None:
+        _shared_runner = LocalLighthouseRunner()
+    return _shared_runner
+
+
+async def close_local_lighthouse_runner() -> None:
+    """Stop the process-wide browser pool, if it was started."""
+    if _shared_runner is not None:
+        await _shared_runner.aclose()
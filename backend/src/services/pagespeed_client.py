@@ -0,0 +1,322 @@
+"""
+Asynchronous Google PageSpeed Insights client.
+Keeps one pooled connection per event loop and retries transient failures with non-blocking backoff.
+"""
+
+import asyncio
+import random
+import time
+import weakref
+from typing import Any, Dict, Optional
+from urllib.parse import urlparse
+
+import httpx
+
+from src.core.base_service import BaseService
+from src.core.config import get_api_config
+from src.utils.deadline import Deadline
+from src.utils.latency import LatencyTracker
+
+PAGESPEED_API_URL = "https://www.googleapis.com/pagespeedonline/v5/runPagespeed"
+USER_AGENT = "LeadGen-Makeover-Agent/1.0"
+
+# Responses worth retrying: throttling and transient server errors
+RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+# Attempts are not started with less time than this left before the deadline
+MIN_ATTEMPT_SECONDS = 1.0
+
+
+class PageSpeedClient(BaseService):
+    """
+    Pooled PageSpeed Insights client.
+
+    Timeouts, connection errors, 429 and 5xx responses are retried up to
+    ``retry_attempts`` times. Retries back off exponentially with full jitter,
+    honouring ``Retry-After`` when the API sends it, and wait with
+    ``asyncio.sleep`` so other requests keep running meanwhile.
+
+    With adaptive timeouts, each attempt's read timeout is a high percentile
+    of recently observed audit latencies for the audited host (or for all
+    hosts, until the host has enough samples), bounded by the configured
+    read timeout. A caller's ``Deadline`` caps every attempt and backoff.
+    """
+
+    def __init__(
+        self,
+        base_url: str = PAGESPEED_API_URL,
+        max_connections: Optional[int] = None,
+        retry_attempts: Optional[int] = None,
+        backoff_seconds: Optional[float] = None,
+        max_backoff_seconds: Optional[float] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
+        super().__init__("PageSpeedClient")
+        self.api_config = get_api_config()
+        self.base_url = base_url
+        self.connect_timeout = self.api_config.LIGHTHOUSE_CONNECT_TIMEOUT_SECONDS
+        self.read_timeout = self.api_config.LIGHTHOUSE_READ_TIMEOUT_SECONDS
+        self.max_connections = (
+            max_connections or self.api_config.LIGHTHOUSE_MAX_CONNECTIONS
+        )
+        self.retry_attempts = max(
+            1,
+            (
+                retry_attempts
+                if retry_attempts is not None
+                else self.api_config.LIGHTHOUSE_RETRY_ATTEMPTS
+            ),
+        )
+        self.backoff_seconds = (
+            backoff_seconds
+            if backoff_seconds is not None
+            else self.api_config.LIGHTHOUSE_RETRY_BACKOFF_SECONDS
+        )
+        self.max_backoff_seconds = (
+            max_backoff_seconds
+            if max_backoff_seconds is not None
+            else self.api_config.LIGHTHOUSE_RETRY_MAX_BACKOFF_SECONDS
+        )
+        self.adaptive_timeouts = self.api_config.LIGHTHOUSE_ADAPTIVE_TIMEOUT_ENABLED
+        self.timeout_percentile = self.api_config.LIGHTHOUSE_ADAPTIVE_TIMEOUT_PERCENTILE
+        self.timeout_multiplier = self.api_config.LIGHTHOUSE_ADAPTIVE_TIMEOUT_MULTIPLIER
+        self.min_timeout = self.api_config.LIGHTHOUSE_ADAPTIVE_TIMEOUT_MIN_SECONDS
+        self.min_samples = self.api_config.LIGHTHOUSE_ADAPTIVE_TIMEOUT_MIN_SAMPLES
+        self.latency = LatencyTracker(self.api_config.LIGHTHOUSE_LATENCY_WINDOW)
+        self._transport = transport
+        self.requests = 0
+        self.retries = 0
+        self.deadline_exceeded = 0
+
+        # Clients are bound to the loop they were created on, so keep one per loop
+        self._clients: "weakref.WeakKeyDictionary[Any, httpx.AsyncClient]"
+        self._clients = weakref.WeakKeyDictionary()
+
+    def validate_input(self, data: Any) -> bool:
+        """Validate that data is a params dict with a ``url``."""
+        return isinstance(data, dict) and bool(data.get("url"))
+
+    async def run_pagespeed(
+        self,
+        params: Dict[str, str],
+        read_timeout: Optional[float] = None,
+        attempts: Optional[int] = None,
+        run_id: Optional[str] = None,
+        business_id: Optional[str] = None,
+        deadline: Optional[Deadline] = None,
+    ) -> Dict[str, Any]:
+        """
+        Run one PageSpeed Insights audit.
+
+        Args:
+            params: Query parameters (url, key, strategy, category, ...)
+            read_timeout: Per-attempt read timeout; defaults to the adaptive
+                timeout for the audited host
+            attempts: Attempts before giving up; defaults to ``retry_attempts``
+            run_id: Run identifier for logging
+            business_id: Business identifier for logging
+            deadline: Overall deadline; attempts and backoff only use the time
+                left, and no attempt starts with under MIN_ATTEMPT_SECONDS
+
+        Returns:
+            ``{"success": True, "data", "status_code"}`` on success, otherwise
+            an error dict with error_code TIMEOUT, RATE_LIMIT_EXCEEDED or
+            REQUEST_FAILED. Running out of time reports TIMEOUT with
+            ``deadline_exceeded``.
+        """
+        client = self._get_client()
+        host = urlparse(params.get("url", "")).netloc.lower()
+        adaptive = not read_timeout
+        read_timeout = read_timeout or self.timeout_for(host)
+
+        attempts = attempts or self.retry_attempts
+        error: Dict[str, Any] = {}
+        made = 0
+        for attempt in range(attempts):
+            if attempt:
+                backoff = self._backoff(attempt, error.get("retry_after"))
+                if deadline is not None and (
+                    deadline.remaining() - backoff < MIN_ATTEMPT_SECONDS
+                ):
+                    error["deadline_exceeded"] = True
+                    break
+                self.retries += 1
+                await asyncio.sleep(backoff)
+                if adaptive and error.get("error_code") == "TIMEOUT":
+                    # The adaptive timeout was too short for this audit
+                    read_timeout = self.read_timeout
+
+            attempt_timeout = read_timeout
+            if deadline is not None:
+                attempt_timeout = deadline.clamp(read_timeout)
+                if attempt_timeout < MIN_ATTEMPT_SECONDS:
+                    error = error or self._error(
+                        "Audit request timed out at the deadline", "TIMEOUT"
+                    )
+                    error["deadline_exceeded"] = True
+                    break
+            timeout = httpx.Timeout(
+                attempt_timeout, connect=min(self.connect_timeout, attempt_timeout)
+            )
+
+            self.requests += 1
+            made += 1
+            started = time.monotonic()
+            try:
+                response = await client.get(
+                    self.base_url, params=params, timeout=timeout
+                )
+            except httpx.TimeoutException:
+                if attempt_timeout == read_timeout:
+                    # Took at least this long; without the sample the adaptive
+                    # timeout would only ever learn from audits that beat it
+                    self.latency.record(
+                        host, max(attempt_timeout, time.monotonic() - started)
+                    )
+                error = self._error("Audit request timed out", "TIMEOUT")
+                continue
+            except httpx.TransportError as e:
+                error = self._error(
+                    f"Audit request failed: {str(e)}", "REQUEST_FAILED"
+                )
+                continue
+
+            if response.status_code in RETRYABLE_STATUS_CODES:
+                error_code = (
+                    "RATE_LIMIT_EXCEEDED"
+                    if response.status_code == 429
+                    else "REQUEST_FAILED"
+                )
+                error = self._error(
+                    f"Audit request failed: HTTP {response.status_code}",
+                    error_code,
+                    status_code=response.status_code,
+                    retry_after=self._retry_after(response),
+                )
+                continue
+
+            if response.is_error:
+                return self._error(
+                    f"Audit request failed: HTTP {response.status_code}",
+                    "REQUEST_FAILED",
+                    status_code=response.status_code,
+                )
+
+            try:
+                data = response.json()
+            except ValueError as e:
+                return self._error(
+                    f"Invalid audit response: {str(e)}",
+                    "REQUEST_FAILED",
+                    status_code=response.status_code,
+                )
+            self.latency.record(host, time.monotonic() - started)
+            return {"success": True, "data": data, "status_code": response.status_code}
+
+        if error.get("deadline_exceeded"):
+            self.deadline_exceeded += 1
+        self.log_error(
+            Exception(error.get("error", "Audit request failed")),
+            "pagespeed_request",
+            run_id,
+            business_id,
+        )
+        error.pop("retry_after", None)
+        error["attempts"] = made
+        return error
+
+    def timeout_for(self, host: str) -> float:
+        """
+        Read timeout for an audit of ``host``.
+
+        The configured read timeout until enough latencies are observed;
+        then the configured percentile of the host's latencies (or of all
+        hosts' while the host has too few) times the headroom multiplier,
+        between LIGHTHOUSE_ADAPTIVE_TIMEOUT_MIN_SECONDS and the read timeout.
+        """
+        if not self.adaptive_timeouts:
+            return self.read_timeout
+        observed = self.latency.percentile(
+            self.timeout_percentile, key=host, min_samples=self.min_samples
+        )
+        if observed is None:
+            observed = self.latency.percentile(
+                self.timeout_percentile, min_samples=self.min_samples
+            )
+        if observed is None:
+            return self.read_timeout
+        adaptive = observed * self.timeout_multiplier
+        return max(self.min_timeout, min(self.read_timeout, adaptive))
+
+    def _backoff(self, attempt: int, retry_after: Optional[float]) -> float:
+        """Seconds to wait before retry number ``attempt`` (1-based)."""
+        if retry_after is not None:
+            return min(retry_after, self.max_backoff_seconds)
+        ceiling = min(
+            self.max_backoff_seconds, self.backoff_seconds * 2 ** (attempt - 1)
+        )
+        return random.uniform(0, ceiling)
+
+    @staticmethod
+    def _retry_after(response: httpx.Response) -> Optional[float]:
+        try:
+            return max(0.0, float(response.headers.get("retry-after", "")))
+        except ValueError:
+            return None
+
+    @staticmethod
+    def _error(error: str, error_code: str, **extra: Any) -> Dict[str, Any]:
+        return {
+            "success": False,
+            "error": error,
+            "error_code": error_code,
+            "context": "audit_execution",
+            **extra,
+        }
+
+    async def aclose(self) -> None:
+        """Close the pooled client for the running event loop."""
+        client = self._clients.pop(asyncio.get_running_loop(), None)
+        if client is not None:
+            await client.aclose()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Request and retry counters."""
+        return {
+            "max_connections": self.max_connections,
+            "retry_attempts": self.retry_attempts,
+            "requests": self.requests,
+            "retries": self.retries,
+            "deadline_exceeded": self.deadline_exceeded,
+            "latency_seconds": self.latency.get_stats(),
+        }
+
+    def _get_client(self) -> httpx.AsyncClient:
+        loop = asyncio.get_running_loop()
+        client = self._clients.get(loop)
+        if client is None:
+            # Clients of closed loops can no longer be closed; drop them
+            for stale in [other for other in self._clients if other.is_closed()]:
+                del self._clients[stale]
+            limits = httpx.Limits(
+                max_connections=self.max_connections,
+                max_keepalive_connections=self.max_connections,
+            )
+            client = httpx.AsyncClient(
+                transport=self._transport,
+                limits=limits,
+                headers={"User-Agent": USER_AGENT},
+            )
+            self._clients[loop] = client
+        return client
+
+
+_shared_client: Optional[PageSpeedClient] = None
+
+
+def get_pagespeed_client() -> PageSpeedClient:
+    """Get the process-wide PageSpeedClient so every audit shares one pool."""
+    global _shared_client
+    if _shared_client is None:
+        _shared_client = PageSpeedClient()
+    return _shared_client
@@ -9,7 +9,7 @@ from dataclasses import dataclass, asdict
 from enum import Enum
 
 from src.core.base_service import BaseService
-from src.services import RateLimiter
+from src.services.rate_limiter import get_rate_limiter
 from src.core.config import get_api_config
 
 
@@ -42,7 +42,7 @@ class RateLimitMonitor(BaseService):
 
     def __init__(self):
         super().__init__("RateLimitMonitor")
-        self.rate_limiter = RateLimiter()
+        self.rate_limiter = get_rate_limiter()
         self.api_config = get_api_config()
         self.alerts: List[RateLimitAlert] = []
         self.alert_thresholds = {
@@ -238,12 +238,12 @@ class RateLimitMonitor(BaseService):
         for alert in new_alerts:
             if alert.level == AlertLevel.CRITICAL:
                 self.logger.error(
-                    f"CRITICAL ALERT: {alert.message} for {alert.api_name}"
+                    "CRITICAL ALERT: %s for %s", alert.message, alert.api_name
                 )
             elif alert.level == AlertLevel.WARNING:
-                self.logger.warning(f"WARNING: {alert.message} for {alert.api_name}")
+                self.logger.warning("WARNING: %s for %s", alert.message, alert.api_name)
             else:
-                self.logger.info(f"INFO: {alert.message} for {alert.api_name}")
+                self.logger.info("INFO: %s for %s", alert.message, alert.api_name)
 
     def _cleanup_old_alerts(self):
         """Remove old alerts to prevent memory issues."""
@@ -3,26 +3,133 @@ Rate limiting service with circuit breaker pattern.
 Implements rate limiting for external APIs and circuit breaker for failure handling.
 """
 
+import asyncio
+import heapq
+import itertools
+import threading
 import time
-from typing import Dict, Optional, Tuple
+from enum import IntEnum
+from typing import Callable, Dict, List, Optional, Tuple
 from datetime import datetime
 
 # Handle absolute vs package-relative imports so the module works both when
 # `src` is a package (tests) and when `src` is on PYTHONPATH root.
 try:
     from core.base_service import BaseService
-    from core.config import get_api_config
+    from core.config import get_api_config, get_data_path
+    from utils.rate_limit_store import (
+        RateLimitStore,
+        RateLimitStoreError,
+        create_rate_limit_store,
+    )
 except ImportError:  # Running inside the src package
     from ..core.base_service import BaseService
-    from ..core.config import get_api_config
+    from ..core.config import get_api_config, get_data_path
+    from ..utils.rate_limit_store import (
+        RateLimitStore,
+        RateLimitStoreError,
+        create_rate_limit_store,
+    )
+
+# Bounds on how often a queued caller re-checks capacity
+MIN_POLL_SECONDS = 0.01
+MAX_POLL_SECONDS = 1.0
+
+
+class RequestPriority(IntEnum):
+    """Queue class of a caller waiting for capacity; lower values go first."""
+
+    INTERACTIVE = 0
+    NORMAL = 1
+    BATCH = 2
+
+
+class Reservation:
+    """
+    Outcome of ``acquire``: whether a slot was granted, and the slot itself.
+
+    A granted slot is counted as soon as it is claimed. Pass the reservation
+    to ``record_request`` once the call is made, or to ``release`` if it
+    never is, so the slot is counted exactly once or given back.
+    """
+
+    __slots__ = ("api", "granted", "reason", "claimed_at", "settled")
+
+    def __init__(
+        self,
+        api: str,
+        granted: bool,
+        reason: str,
+        claimed_at: Optional[float] = None,
+    ):
+        self.api = api
+        self.granted = granted
+        self.reason = reason
+        # Store time the slot was counted at; None when nothing was counted
+        self.claimed_at = claimed_at
+        self.settled = claimed_at is None
+
+    def __bool__(self) -> bool:
+        return self.granted
+
+    def __repr__(self) -> str:
+        return f"Reservation({self.api!r}, {self.granted}, {self.reason!r})"
+
+
+class _Waiter:
+    """A caller queued for capacity, ordered by priority and then arrival."""
+
+    __slots__ = ("priority", "seq", "_notify")
+
+    def __init__(self, priority: int, seq: int, notify: Callable[[], None]):
+        self.priority = priority
+        self.seq = seq
+        self._notify = notify
+
+    def wake(self) -> bool:
+        """Signal the waiter; False if its event loop has closed."""
+        try:
+            self._notify()
+        except RuntimeError:
+            return False
+        return True
+
+    def __lt__(self, other: "_Waiter") -> bool:
+        return (self.priority, self.seq) < (other.priority, other.seq)
 
 
 class RateLimiter(BaseService):
-    """Rate limiting service with a circuit-breaker pattern."""
+    """
+    Rate limiting service with a circuit-breaker pattern.
+
+    Services and middleware share the process-wide instance from
+    ``get_rate_limiter`` so quotas and circuit breakers are enforced across
+    all of them. The stores are thread-safe on their own, so counts stay
+    exact when called from several threads or from coroutines running on
+    different event loops; the limiter's lock only guards its wait queues
+    and is never held during store I/O.
 
-    def __init__(self):
+    Windows and breakers live in the store named by ``RATE_LIMITER_STORE``
+    (see ``src.utils.rate_limit_store``). The default in-process store
+    counts each API with the ``RATE_LIMITER_ENGINE`` window; the ``sqlite``
+    and ``redis`` stores share quotas between workers and hosts. If a shared
+    store is unreachable, requests are allowed and the error is logged.
+    Called from an event loop, ``acquire``, ``record_request`` and
+    ``release`` run the I/O of those stores in worker threads.
+
+    ``acquire`` (and ``acquire_blocking`` for synchronous callers) waits for
+    capacity instead of refusing. Waiters are served one at a time per API,
+    by priority class and first come first served within a class, so a
+    backlog drains at exactly the quota rate.
+    """
+
+    def __init__(self, store: Optional[RateLimitStore] = None):
         super().__init__("RateLimiter")
         self.api_config = get_api_config()
+        self.store = store if store is not None else self._create_store()
+        self._lock = threading.RLock()
+        self._queues: Dict[str, List[_Waiter]] = {}
+        self._waiter_seq = itertools.count()
         self._rate_limits: Dict[str, Dict] = {}
         self._circuit_breakers: Dict[str, Dict] = {}
         self._setup_rate_limits()
@@ -31,65 +138,57 @@ class RateLimiter(BaseService):
     # Rate-limit bookkeeping
     # ---------------------------------------------------------------------
     def _setup_rate_limits(self):
-        """Initialise per-API rate-limit windows and circuit-breakers."""
+        """Initialise per-API rate limits and circuit-breaker settings."""
         self._rate_limits["google_places"] = {
             "limit": self.api_config.GOOGLE_PLACES_RATE_LIMIT_PER_MINUTE,
             "window": 60,  # seconds
-            "requests": [],
-            "last_reset": time.time(),
         }
         self._rate_limits["yelp_fusion"] = {
             "limit": self.api_config.YELP_FUSION_RATE_LIMIT_PER_DAY,
             "window": 86_400,  # 24 h
-            "requests": [],
-            "last_reset": time.time(),
         }
         self._rate_limits["lighthouse"] = {
             "limit": self.api_config.LIGHTHOUSE_RATE_LIMIT_PER_MINUTE,
             "window": 60,  # seconds
-            "requests": [],
-            "last_reset": time.time(),
         }
         self._rate_limits["heuristics"] = {
             "limit": self.api_config.HEURISTICS_RATE_LIMIT_PER_MINUTE,
             "window": 60,  # seconds
-            "requests": [],
-            "last_reset": time.time(),
         }
         self._rate_limits["fallback"] = {
             "limit": self.api_config.FALLBACK_RATE_LIMIT_PER_MINUTE,
             "window": 60,  # seconds
-            "requests": [],
-            "last_reset": time.time(),
         }
         self._rate_limits["business_discovery"] = {
             "limit": 60,  # 60 business discovery requests per minute
             "window": 60,  # seconds
-            "requests": [],
-            "last_reset": time.time(),
         }
         self._rate_limits["validation"] = {
             "limit": 100,  # 100 validation requests per minute
             "window": 60,  # seconds
-            "requests": [],
-            "last_reset": time.time(),
         }
-        for api in self._rate_limits:
+        for api, rl in self._rate_limits.items():
+            self.store.configure(api, rl["limit"], rl["window"])
             self._circuit_breakers[api] = {
-                "failures": 0,
-                "last_failure": None,
-                "state": "CLOSED",  # CLOSED | OPEN | HALF_OPEN
                 "threshold": self.api_config.CIRCUIT_BREAKER_FAILURE_THRESHOLD,
                 "recovery_timeout": self.api_config.CIRCUIT_BREAKER_RECOVERY_TIMEOUT,
             }
 
-    def _cleanup_old_requests(self, api: str):
-        rl = self._rate_limits[api]
-        now = time.time()
-        window_start = now - rl["window"]
-        rl["requests"] = [t for t in rl["requests"] if t >= window_start]
-        if now - rl["last_reset"] >= rl["window"]:
-            rl["last_reset"] = now
+    def _create_store(self) -> RateLimitStore:
+        """Build the store named by ``RATE_LIMITER_STORE``."""
+        name = self.api_config.RATE_LIMITER_STORE
+        options = {
+            "memory": {"engine": self.api_config.RATE_LIMITER_ENGINE},
+            "sqlite": {
+                "path": self.api_config.RATE_LIMITER_STORE_PATH
+                or get_data_path("leadgen_rate_limits.sqlite3", self.api_config)
+            },
+            "redis": {
+                "url": self.api_config.RATE_LIMITER_REDIS_URL,
+                "prefix": self.api_config.RATE_LIMITER_KEY_PREFIX,
+            },
+        }
+        return create_rate_limit_store(name, **options.get(name, {}))
 
     # ------------------------------------------------------------------
     # Public helpers
@@ -99,70 +198,327 @@ class RateLimiter(BaseService):
     ) -> Tuple[bool, str]:
         if api not in self._rate_limits:
             return False, f"Unknown API: {api}"
-        state = self._check_circuit_breaker(api)
-        if state != "CLOSED":
-            return False, f"Circuit breaker is {state}"
-        self._cleanup_old_requests(api)
-        rl = self._rate_limits[api]
-        if len(rl["requests"]) >= rl["limit"]:
-            return False, f"Rate limit exceeded: {len(rl['requests'])}/{rl['limit']}"
+        try:
+            state = self._check_circuit_breaker(api)
+            if state != "CLOSED":
+                return False, f"Circuit breaker is {state}"
+            rl = self._rate_limits[api]
+            used = self.store.usage(api, time.time())
+            if used >= rl["limit"]:
+                return False, f"Rate limit exceeded: {used}/{rl['limit']}"
+        except RateLimitStoreError as e:
+            # Fail open: the providers still enforce their own quotas
+            self.log_error(e, "rate_limit_store", run_id)
+            return True, "Rate limit store unavailable"
         return True, "OK"
 
-    def record_request(self, api: str, success: bool, run_id: Optional[str] = None):
+    def record_request(
+        self,
+        api: str,
+        success: bool,
+        run_id: Optional[str] = None,
+        reservation: Optional[Reservation] = None,
+    ):
+        """
+        Report the outcome of a request to ``api``.
+
+        The request is counted unless ``reservation``, returned by
+        ``acquire``, already holds its slot.
+        """
         if api not in self._rate_limits:
             return
-        now = time.time()
-        self._rate_limits[api]["requests"].append(now)
-        if success:
-            self._record_success(api)
-        else:
-            self._record_failure(api, now)
-        self.log_operation(
-            f"Recorded {'successful' if success else 'failed'} request to {api}",
-            run_id=run_id,
-        )
+        # Counted when the slot was claimed
+        counted = reservation is not None and reservation.claimed_at is not None
+        if counted:
+            reservation.settled = True
+        self._run_store_io(self._record, api, success, counted, time.time(), run_id)
+
+    def _record(
+        self,
+        api: str,
+        success: bool,
+        counted: bool,
+        now: float,
+        run_id: Optional[str],
+    ) -> None:
+        try:
+            if not counted:
+                self.store.add(api, now)
+            if success:
+                self._record_success(api)
+            else:
+                self._record_failure(api, now)
+        except RateLimitStoreError as e:
+            self.log_error(e, "rate_limit_store", run_id)
+            return
+        self.log_operation("record_request", run_id=run_id, api=api, success=success)
 
     def get_rate_limit_info(self, api: str):
         if api not in self._rate_limits:
             return None
-        self._cleanup_old_requests(api)
+        now = time.time()
         rl = self._rate_limits[api]
+        try:
+            used = self.store.usage(api, now)
+            reset_at = self.store.reset_at(api, now)
+        except RateLimitStoreError as e:
+            self.log_error(e, "rate_limit_store")
+            used, reset_at = 0, now + rl["window"]
         return {
             "api_name": api,
-            "current_usage": len(rl["requests"]),
+            "current_usage": used,
             "limit": rl["limit"],
-            "remaining": rl["limit"] - len(rl["requests"]),
-            "reset_time": datetime.fromtimestamp(
-                rl["last_reset"] + rl["window"]
-            ).isoformat(),
+            "remaining": rl["limit"] - used,
+            "reset_time": datetime.fromtimestamp(reset_at).isoformat(),
         }
 
+    def release(self, reservation: Reservation, run_id: Optional[str] = None):
+        """Give back a slot claimed by ``acquire`` for a request never made."""
+        if reservation.settled:
+            return
+        reservation.settled = True
+        self._run_store_io(self._discard, reservation.api, reservation.claimed_at, run_id)
+
+    def _discard(self, api: str, claimed_at: float, run_id: Optional[str]) -> None:
+        try:
+            self.store.discard(api, claimed_at)
+        except RateLimitStoreError as e:
+            self.log_error(e, "rate_limit_store", run_id)
+            return
+        with self._lock:
+            self._wake_head(self._queues.get(api))
+
+    async def acquire(
+        self,
+        api: str,
+        timeout: Optional[float] = None,
+        priority: RequestPriority = RequestPriority.NORMAL,
+        run_id: Optional[str] = None,
+    ) -> Reservation:
+        """
+        Wait until a request to ``api`` may be made, then claim the slot.
+
+        The slot is counted immediately. Pass the returned reservation to
+        ``record_request``, which does not count it again, or to ``release``
+        if the request is not made after all.
+
+        Args:
+            api: API name, as for ``can_make_request``
+            timeout: Longest time to wait in seconds; None waits indefinitely
+                and 0 only checks
+            priority: Queue class; higher classes are always served first
+            run_id: Run identifier for logging
+
+        Returns:
+            A granted reservation with reason ``"OK"`` once a slot is
+            claimed; otherwise one that is not granted, with the reason: an
+            unknown API, an open circuit breaker or the timeout expiring
+        """
+        if api not in self._rate_limits:
+            return Reservation(api, False, f"Unknown API: {api}")
+        loop = asyncio.get_running_loop()
+        woken = asyncio.Event()
+        waiter = self._enqueue(
+            api, priority, lambda: loop.call_soon_threadsafe(woken.set)
+        )
+        deadline = None if timeout is None else time.monotonic() + timeout
+        try:
+            while True:
+                woken.clear()
+                head = self._is_head(api, waiter)
+                claim = await self._claim_async(api, run_id) if head else None
+                result, wait = self._settle(api, head, claim, deadline, timeout)
+                if result is not None:
+                    return result
+                try:
+                    await asyncio.wait_for(woken.wait(), wait)
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            self._dequeue(api, waiter)
+
+    def acquire_blocking(
+        self,
+        api: str,
+        timeout: Optional[float] = None,
+        priority: RequestPriority = RequestPriority.NORMAL,
+        run_id: Optional[str] = None,
+    ) -> Reservation:
+        """Blocking ``acquire`` for synchronous code running in worker threads."""
+        if api not in self._rate_limits:
+            return Reservation(api, False, f"Unknown API: {api}")
+        woken = threading.Event()
+        waiter = self._enqueue(api, priority, woken.set)
+        deadline = None if timeout is None else time.monotonic() + timeout
+        try:
+            while True:
+                woken.clear()
+                result, wait = self._poll(api, waiter, deadline, timeout, run_id)
+                if result is not None:
+                    return result
+                woken.wait(wait)
+        finally:
+            self._dequeue(api, waiter)
+
+    def get_queue_length(self, api: str) -> int:
+        """Number of callers waiting in ``acquire`` for ``api``."""
+        with self._lock:
+            return len(self._queues.get(api, ()))
+
+    def get_circuit_breaker(self, api: str) -> Optional[Dict]:
+        """Breaker ``state``, ``failures``, ``last_failure`` and settings of ``api``."""
+        if api not in self._circuit_breakers:
+            return None
+        return {**self.store.get_breaker(api), **self._circuit_breakers[api]}
+
+    # ------------------------------------------------------------------
+    # Wait-queue helpers
+    # ------------------------------------------------------------------
+    def _enqueue(
+        self, api: str, priority: int, wake: Callable[[], None]
+    ) -> _Waiter:
+        waiter = _Waiter(int(priority), next(self._waiter_seq), wake)
+        with self._lock:
+            heapq.heappush(self._queues.setdefault(api, []), waiter)
+        return waiter
+
+    def _dequeue(self, api: str, waiter: _Waiter) -> None:
+        with self._lock:
+            queue = self._queues[api]
+            if waiter not in queue:
+                # Already dropped by _wake_head
+                return
+            was_head = queue[0] is waiter
+            queue.remove(waiter)
+            heapq.heapify(queue)
+            if was_head:
+                self._wake_head(queue)
+
+    @staticmethod
+    def _wake_head(queue: Optional[List[_Waiter]]) -> None:
+        """Wake the first waiter, dropping any whose event loop has closed."""
+        while queue:
+            if queue[0].wake():
+                return
+            # Its loop will never run again, so it would hold the head forever
+            heapq.heappop(queue)
+
+    def _poll(
+        self,
+        api: str,
+        waiter: _Waiter,
+        deadline: Optional[float],
+        timeout: Optional[float],
+        run_id: Optional[str],
+    ) -> Tuple[Optional[Reservation], float]:
+        """Claim a slot if ``waiter`` is first in line; else say how long to wait."""
+        head = self._is_head(api, waiter)
+        claim = self._claim(api, run_id) if head else None
+        return self._settle(api, head, claim, deadline, timeout)
+
+    def _is_head(self, api: str, waiter: _Waiter) -> bool:
+        with self._lock:
+            return self._queues[api][0] is waiter
+
+    def _claim(self, api: str, run_id: Optional[str]) -> Optional[Reservation]:
+        """Claim a slot for the head of the queue; None when there is no capacity."""
+        try:
+            state = self._check_circuit_breaker(api)
+            if state != "CLOSED":
+                return Reservation(api, False, f"Circuit breaker is {state}")
+            # One atomic step, so workers sharing the store never overshoot
+            now = time.time()
+            if self.store.try_add(api, now, self._rate_limits[api]["limit"]):
+                return Reservation(api, True, "OK", now)
+        except RateLimitStoreError as e:
+            self.log_error(e, "rate_limit_store", run_id)
+            return Reservation(api, True, "Rate limit store unavailable")
+        return None
+
+    async def _claim_async(
+        self, api: str, run_id: Optional[str]
+    ) -> Optional[Reservation]:
+        """``_claim`` for coroutines; blocking stores are called from a worker thread."""
+        if not self.store.blocking:
+            return self._claim(api, run_id)
+        claim = asyncio.ensure_future(asyncio.to_thread(self._claim, api, run_id))
+        try:
+            return await asyncio.shield(claim)
+        except asyncio.CancelledError:
+            # The thread may still claim a slot nobody will use; give it back
+            claim.add_done_callback(self._release_abandoned)
+            raise
+
+    def _release_abandoned(self, claim: "asyncio.Future") -> None:
+        if claim.cancelled() or claim.exception() is not None:
+            return
+        reservation = claim.result()
+        if reservation is not None:
+            self.release(reservation)
+
+    def _run_store_io(self, fn: Callable[..., None], *args) -> None:
+        """
+        Run ``fn`` now, or in a worker thread when called on an event loop
+        and the store may block; ``fn`` reports its own errors.
+        """
+        if self.store.blocking:
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                pass
+            else:
+                loop.run_in_executor(None, fn, *args)
+                return
+        fn(*args)
+
+    def _settle(
+        self,
+        api: str,
+        head: bool,
+        claim: Optional[Reservation],
+        deadline: Optional[float],
+        timeout: Optional[float],
+    ) -> Tuple[Optional[Reservation], float]:
+        """Return the claim, a timeout, or how long to wait before polling again."""
+        if claim is not None:
+            return claim, 0.0
+        rl = self._rate_limits[api]
+        remaining = None if deadline is None else deadline - time.monotonic()
+        if remaining is not None and remaining <= 0:
+            reason = f"No capacity within {timeout:g}s"
+            return Reservation(api, False, reason), 0.0
+        # Only the head needs to watch the window; the rest are woken in turn
+        wait = MAX_POLL_SECONDS
+        if head:
+            wait = min(max(rl["window"] / rl["limit"], MIN_POLL_SECONDS), wait)
+        return None, wait if remaining is None else min(wait, remaining)
+
     # ------------------------------------------------------------------
     # Circuit-breaker helpers
     # ------------------------------------------------------------------
     def _check_circuit_breaker(self, api: str) -> str:
-        cb = self._circuit_breakers[api]
+        cb = self.store.get_breaker(api)
         now = time.time()
         if (
             cb["state"] == "OPEN"
             and cb["last_failure"]
-            and now - cb["last_failure"] >= cb["recovery_timeout"]
+            and now - cb["last_failure"]
+            >= self._circuit_breakers[api]["recovery_timeout"]
         ):
             cb["state"] = "HALF_OPEN"
+            self.store.set_breaker(api, "HALF_OPEN", cb["failures"], cb["last_failure"])
         return cb["state"]
 
     def _record_failure(self, api: str, when: float):
-        cb = self._circuit_breakers[api]
-        cb["failures"] += 1
-        cb["last_failure"] = when
-        if cb["failures"] >= cb["threshold"]:
-            cb["state"] = "OPEN"
+        threshold = self._circuit_breakers[api]["threshold"]
+        cb = self.store.record_failure(api, when, threshold)
+        if cb["state"] == "OPEN":
             self.log_operation(f"Circuit breaker for {api} opened due to failures")
 
     def _record_success(self, api: str):
-        cb = self._circuit_breakers[api]
+        cb = self.store.get_breaker(api)
         if cb["state"] == "HALF_OPEN":
-            cb.update({"state": "CLOSED", "failures": 0, "last_failure": None})
+            self.store.set_breaker(api, "CLOSED", 0, None)
             self.log_operation(f"Circuit breaker for {api} closed after recovery")
 
     # ------------------------------------------------------------------
@@ -171,15 +527,51 @@ class RateLimiter(BaseService):
     def validate_input(self, data: any) -> bool:  # noqa: ANN401
         return isinstance(data, str) and data in self._rate_limits
 
+    def reset(self) -> None:
+        """Reload limits from settings and clear every window and breaker."""
+        with self._lock:
+            self.api_config = get_api_config()
+            self.store.clear()
+            self.store.close()
+            self.store = self._create_store()
+            self._rate_limits = {}
+            self._circuit_breakers = {}
+            self._setup_rate_limits()
+
+    def close(self) -> None:
+        """Release the store's connections."""
+        with self._lock:
+            self.store.close()
+
     def reset_circuit_breaker(self, api: str, run_id: Optional[str] = None):
         if api in self._circuit_breakers:
-            self._circuit_breakers[api].update(
-                {
-                    "state": "CLOSED",
-                    "failures": 0,
-                    "last_failure": None,
-                }
-            )
+            self.store.set_breaker(api, "CLOSED", 0, None)
             self.log_operation(
                 f"Manually reset circuit breaker for {api}", run_id=run_id
             )
+
+
+_shared_limiter: Optional[RateLimiter] = None
+_shared_limiter_lock = threading.Lock()
+
+
+def get_rate_limiter() -> RateLimiter:
+    """Get the process-wide RateLimiter every service and middleware shares."""
+    global _shared_limiter
+    if _shared_limiter is None:
+        with _shared_limiter_lock:
+            if _shared_limiter is None:
+                _shared_limiter = RateLimiter()
+    return _shared_limiter
+
+
+def reset_rate_limiter() -> None:
+    """Empty the windows and close the breakers of the process-wide RateLimiter."""
+    if _shared_limiter is not None:
+        _shared_limiter.reset()
+
+
+def close_rate_limiter() -> None:
+    """Release the process-wide RateLimiter's store connections, if it was created."""
+    if _shared_limiter is not None:
+        _shared_limiter.close()
@@ -241,7 +241,7 @@ class ReviewManagementService(BaseService):
             # For now, return empty list as placeholder
             pending_reviews = []
 
-            self.logger.debug(f"Retrieved {len(pending_reviews)} pending reviews")
+            self.logger.debug("Retrieved %d pending reviews", len(pending_reviews))
             return pending_reviews
 
         except Exception as e:
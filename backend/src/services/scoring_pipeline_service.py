@@ -0,0 +1,308 @@
+"""
+Server-side website scoring pipeline.
+Runs the Lighthouse audit and heuristic evaluation concurrently, falls back to heuristics when Lighthouse fails and validates the combined scores.
+"""
+
+import asyncio
+import time
+import uuid
+from typing import Any, Awaitable, Dict, Optional, Tuple
+
+from src.core.base_service import BaseService
+from src.services.fallback_scoring_service import FallbackScoringService
+from src.services.heuristic_evaluation_service import HeuristicEvaluationService
+from src.services.lighthouse_service import LighthouseService
+from src.services.score_validation_service import ScoreValidationService
+from src.schemas.website_scoring import ConfidenceLevel, WebsiteScore
+from src.utils.deadline import Deadline
+
+# Result detail copied from a successful heuristic evaluation
+HEURISTIC_DETAILS = (
+    "trust_signals",
+    "cro_elements",
+    "mobile_usability",
+    "content_quality",
+    "social_proof",
+)
+
+
+class ScoringPipelineService(BaseService):
+    """
+    Scores a website in one call.
+
+    The Lighthouse audit and the heuristic evaluation start together, so a
+    run takes as long as the slower of the two rather than their sum. When
+    both succeed their scores are cross-validated by ScoreValidationService;
+    when Lighthouse fails the heuristic result already in hand is turned into
+    a fallback score without evaluating the page again.
+    """
+
+    def __init__(
+        self,
+        lighthouse_service: Optional[LighthouseService] = None,
+        heuristic_service: Optional[HeuristicEvaluationService] = None,
+        fallback_service: Optional[FallbackScoringService] = None,
+        score_validation_service: Optional[ScoreValidationService] = None,
+    ):
+        super().__init__("ScoringPipelineService")
+        self.lighthouse_service = lighthouse_service or LighthouseService()
+        self.heuristic_service = heuristic_service or HeuristicEvaluationService()
+        self.fallback_service = fallback_service or FallbackScoringService(
+            self.lighthouse_service
+        )
+        self.score_validation_service = (
+            score_validation_service or ScoreValidationService()
+        )
+
+    def validate_input(self, data: Any) -> bool:
+        """Validate input data for the service."""
+        if not isinstance(data, dict):
+            return False
+
+        required_fields = ["website_url", "business_id"]
+        return all(field in data for field in required_fields)
+
+    async def score_website(
+        self,
+        website_url: str,
+        business_id: str,
+        run_id: Optional[str] = None,
+        strategy: str = "desktop",
+        deadline: Optional[Deadline] = None,
+    ) -> Dict[str, Any]:
+        """
+        Score a website with Lighthouse, heuristics and score validation.
+
+        Args:
+            website_url: URL of the website to score
+            business_id: Business identifier for tracking
+            run_id: Run identifier for tracking; generated when not provided
+            strategy: Lighthouse audit strategy ('desktop' or 'mobile')
+            deadline: Overall deadline. The Lighthouse audit fits its retries
+                and fallback into it; a stage still running at the deadline
+                is abandoned and reported as a TIMEOUT failure.
+
+        Returns:
+            Dictionary in the shape of WebsiteScoringResponse. ``scoring_method``
+            is "comprehensive" when both methods succeeded, "lighthouse" or
+            "fallback" when only one did; ``timings`` reports each stage in
+            seconds. A reduced-scope recovery audit, which only measures
+            performance, is reported under ``lighthouse_scores`` but scored
+            through the heuristic fallback, or on its own with low confidence
+            when the heuristic evaluation failed.
+        """
+        run_id = run_id or str(uuid.uuid4())
+        start_time = time.perf_counter()
+        self.log_operation(
+            "Starting scoring pipeline",
+            run_id=run_id,
+            business_id=business_id,
+            website_url=website_url,
+            strategy=strategy,
+        )
+
+        (lighthouse_result, lighthouse_time), (heuristic_result, heuristic_time) = (
+            await asyncio.gather(
+                self._timed(
+                    self.lighthouse_service.run_lighthouse_audit_async(
+                        website_url, business_id, run_id, strategy, deadline
+                    ),
+                    "lighthouse_audit",
+                    deadline,
+                ),
+                self._timed(
+                    self.heuristic_service.run_heuristic_evaluation_async(
+                        website_url, business_id, run_id
+                    ),
+                    "heuristic_evaluation",
+                    deadline,
+                ),
+            )
+        )
+        timings = {"lighthouse": lighthouse_time, "heuristics": heuristic_time}
+
+        result = {
+            "website_url": website_url,
+            "business_id": business_id,
+            "run_id": run_id,
+            "lighthouse_scores": None,
+            "core_web_vitals": None,
+            "heuristic_scores": None,
+            "fallback_scores": None,
+            "validation_result": None,
+            "priority_issues": [],
+        }
+        if heuristic_result.get("success"):
+            result["heuristic_scores"] = heuristic_result["scores"]
+            for detail in HEURISTIC_DETAILS:
+                result[detail] = heuristic_result.get(detail)
+
+        lighthouse_scores = None
+        if lighthouse_result.get("success"):
+            lighthouse_scores = WebsiteScore(
+                **lighthouse_result["scores"],
+                overall=lighthouse_result["overall_score"],
+            )
+            result["lighthouse_scores"] = lighthouse_scores
+            result["core_web_vitals"] = lighthouse_result.get("core_web_vitals")
+
+        if lighthouse_scores is not None and not self._is_partial(lighthouse_result):
+            if heuristic_result.get("success"):
+                validation_start = time.perf_counter()
+                validation = await self.score_validation_service.validate_scores(
+                    lighthouse_scores=[lighthouse_scores],
+                    heuristic_scores=[heuristic_result["scores"]],
+                    business_id=business_id,
+                    run_id=run_id,
+                )
+                timings["validation"] = time.perf_counter() - validation_start
+                result.update(
+                    scoring_method="comprehensive",
+                    validation_result=validation,
+                    overall_score=validation.final_score.weighted_score,
+                    confidence_level=ConfidenceLevel(validation.confidence_level),
+                    priority_issues=validation.issue_priorities,
+                )
+            else:
+                result.update(
+                    scoring_method="lighthouse",
+                    overall_score=lighthouse_scores.overall,
+                    confidence_level=ConfidenceLevel(
+                        lighthouse_result.get("confidence", "low")
+                    ),
+                )
+            return self._finish(result, timings, start_time, "completed")
+
+        if not heuristic_result.get("success"):
+            if lighthouse_scores is not None:
+                # A recovered audit is all there is; report it as partial
+                result.update(
+                    scoring_method="lighthouse",
+                    overall_score=lighthouse_scores.overall,
+                    confidence_level=ConfidenceLevel.LOW,
+                )
+                return self._finish(result, timings, start_time, "degraded")
+            return self._failure(
+                result,
+                timings,
+                start_time,
+                f"Lighthouse audit failed: {lighthouse_result.get('error')}; "
+                f"heuristic evaluation failed: {heuristic_result.get('error')}",
+                heuristic_result.get("error_code")
+                or lighthouse_result.get("error_code"),
+                "scoring_pipeline",
+            )
+
+        fallback = self.fallback_service.score_heuristic_result(
+            website_url,
+            business_id,
+            self._lighthouse_failure(lighthouse_result),
+            heuristic_result,
+            run_id,
+        )
+        if not fallback.get("success"):
+            return self._failure(
+                result,
+                timings,
+                start_time,
+                fallback.get("error", "Fallback scoring failed"),
+                fallback.get("error_code", "FALLBACK_FAILED"),
+                fallback.get("context", "fallback_scoring"),
+            )
+
+        fallback_score = fallback["fallback_score"]
+        result.update(
+            scoring_method="fallback",
+            fallback_scores=fallback_score,
+            overall_score=fallback_score.overall_score,
+            confidence_level=fallback_score.confidence_level,
+            recommendations=[fallback["fallback_quality"].recommendation],
+        )
+        return self._finish(result, timings, start_time, "degraded")
+
+    @staticmethod
+    def _is_partial(lighthouse_result: Dict[str, Any]) -> bool:
+        """Whether an audit result came from the reduced-scope recovery audit."""
+        return bool(
+            lighthouse_result.get("fallback_used") or lighthouse_result.get("estimated")
+        )
+
+    @staticmethod
+    def _lighthouse_failure(lighthouse_result: Dict[str, Any]) -> str:
+        """Failure reason for fallback scoring of a failed or partial audit."""
+        if lighthouse_result.get("success"):
+            # Recovery audits only run after the full audit timed out
+            return "Lighthouse audit timed out; only a reduced-scope audit completed"
+        return lighthouse_result.get("error", "Unknown error")
+
+    async def _timed(
+        self,
+        operation: Awaitable[Dict[str, Any]],
+        context: str,
+        deadline: Optional[Deadline] = None,
+    ) -> Tuple[Dict[str, Any], float]:
+        """Await one stage, returning its result and duration in seconds."""
+        start = time.perf_counter()
+        try:
+            timeout = deadline.remaining() if deadline is not None else None
+            result = await asyncio.wait_for(operation, timeout)
+        except asyncio.TimeoutError:
+            result = {
+                "success": False,
+                "error": f"{context} timed out at the deadline",
+                "error_code": "TIMEOUT",
+                "context": context,
+                "deadline_exceeded": True,
+            }
+        except Exception as e:
+            # One failed stage must not cancel the other
+            self.log_error(e, context)
+            result = {"success": False, "error": str(e), "context": context}
+        return result, time.perf_counter() - start
+
+    def _finish(
+        self,
+        result: Dict[str, Any],
+        timings: Dict[str, float],
+        start_time: float,
+        status: str,
+    ) -> Dict[str, Any]:
+        timings["total"] = time.perf_counter() - start_time
+        self.log_operation(
+            "Completed scoring pipeline",
+            run_id=result["run_id"],
+            business_id=result["business_id"],
+            total_seconds=timings["total"],
+            scoring_method=result.get("scoring_method"),
+        )
+        return {
+            **result,
+            "success": True,
+            "scoring_timestamp": time.time(),
+            "scoring_status": status,
+            "timings": timings,
+        }
+
+    def _failure(
+        self,
+        result: Dict[str, Any],
+        timings: Dict[str, float],
+        start_time: float,
+        error: str,
+        error_code: Optional[str],
+        context: str,
+    ) -> Dict[str, Any]:
+        timings["total"] = time.perf_counter() - start_time
+        return {
+            **result,
+            "success": False,
+            "error": error,
+            "error_code": error_code or "SCORING_FAILED",
+            "context": context,
+            "scoring_method": "none",
+            "scoring_timestamp": time.time(),
+            "scoring_status": "failed",
+            "overall_score": 0.0,
+            "confidence_level": ConfidenceLevel.LOW,
+            "timings": timings,
+        }
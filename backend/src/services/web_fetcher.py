@@ -0,0 +1,482 @@
+"""
+Asynchronous web page fetcher for website analysis.
+Shares a pooled HTTP/1.1 + HTTP/2 client with per-host connection limits, keep-alive and DNS caching.
+"""
+
+import asyncio
+import socket
+import time
+import weakref
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+import httpcore
+import httpx
+
+from src.core.base_service import BaseService
+from src.core.config import get_api_config
+from src.utils.html_stream import HTMLStreamReader, NotHTMLError
+from src.utils.http_cache import CachedPage, HTTPCache
+
+# HTTP/2 needs the optional ``h2`` package; fall back to HTTP/1.1 without it.
+try:
+    import h2  # noqa: F401
+
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+
+@dataclass
+class FetchResult:
+    """Outcome of fetching a single URL."""
+
+    url: str
+    final_url: Optional[str] = None
+    status_code: Optional[int] = None
+    content: bytes = b""
+    text: Optional[str] = None
+    encoding: Optional[str] = None
+    bytes_read: int = 0
+    truncated: bool = False
+    content_hash: Optional[str] = None
+    from_cache: bool = False
+    headers: Dict[str, str] = field(default_factory=dict)
+    http_version: Optional[str] = None
+    elapsed: float = 0.0
+    ttfb: float = 0.0
+    error: Optional[str] = None
+    error_code: Optional[str] = None
+
+    @property
+    def success(self) -> bool:
+        """True when the page was fetched with a non-error status."""
+        return self.error is None
+
+
+@dataclass
+class _HostSlot:
+    """Per-host connection limit and the number of requests using it."""
+
+    semaphore: asyncio.Semaphore
+    users: int = 0
+
+
+class DNSCache:
+    """Time-bounded cache of resolved host addresses."""
+
+    def __init__(self, ttl_seconds: float = 300.0):
+        self.ttl_seconds = ttl_seconds
+        self._entries: Dict[Tuple[str, int], Tuple[float, List[str]]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    async def resolve(self, host: str, port: int) -> List[str]:
+        """Return the IP addresses for ``host``, resolving on a miss or expiry."""
+        key = (host, port)
+        entry = self._entries.get(key)
+        now = time.monotonic()
+        if entry is not None and entry[0] > now:
+            self.hits += 1
+            return entry[1]
+
+        self.misses += 1
+        loop = asyncio.get_running_loop()
+        infos = await loop.getaddrinfo(host, port, type=socket.SOCK_STREAM)
+        addresses = list(dict.fromkeys(info[4][0] for info in infos))
+        self._entries[key] = (now + self.ttl_seconds, addresses)
+        return addresses
+
+    def clear(self) -> None:
+        """Drop every cached entry."""
+        self._entries.clear()
+
+
+class CachingDNSBackend(httpcore.AsyncNetworkBackend):
+    """
+    Network backend that resolves hosts through a DNSCache.
+
+    TLS server names still come from the request URL, so connecting to a
+    cached IP address does not affect certificate verification.
+    """
+
+    def __init__(
+        self,
+        dns_cache: DNSCache,
+        backend: Optional[httpcore.AsyncNetworkBackend] = None,
+    ):
+        self.dns_cache = dns_cache
+        self._backend = backend or httpcore.AnyIOBackend()
+
+    async def connect_tcp(
+        self,
+        host: str,
+        port: int,
+        timeout: Optional[float] = None,
+        local_address: Optional[str] = None,
+        socket_options=None,
+    ) -> httpcore.AsyncNetworkStream:
+        try:
+            addresses = await self.dns_cache.resolve(host, port)
+        except OSError as e:
+            raise httpcore.ConnectError(str(e)) from e
+
+        last_error: Optional[Exception] = None
+        for address in addresses:
+            try:
+                return await self._backend.connect_tcp(
+                    address,
+                    port,
+                    timeout=timeout,
+                    local_address=local_address,
+                    socket_options=socket_options,
+                )
+            except (httpcore.ConnectError, httpcore.ConnectTimeout) as e:
+                last_error = e
+        if last_error is not None:
+            raise last_error
+        raise httpcore.ConnectError(f"No addresses found for {host}")
+
+    async def connect_unix_socket(self, path, timeout=None, socket_options=None):
+        return await self._backend.connect_unix_socket(
+            path, timeout=timeout, socket_options=socket_options
+        )
+
+    async def sleep(self, seconds: float) -> None:
+        await self._backend.sleep(seconds)
+
+
+class PooledTransport(httpx.AsyncHTTPTransport):
+    """httpx transport whose connection pool resolves hosts through a DNSCache."""
+
+    def __init__(self, limits: httpx.Limits, http2: bool, dns_cache: DNSCache):
+        super().__init__(limits=limits, http2=http2)
+        self._pool = httpcore.AsyncConnectionPool(
+            ssl_context=httpx.create_ssl_context(),
+            max_connections=limits.max_connections,
+            max_keepalive_connections=limits.max_keepalive_connections,
+            keepalive_expiry=limits.keepalive_expiry,
+            http1=True,
+            http2=http2,
+            network_backend=CachingDNSBackend(dns_cache),
+        )
+
+
+class WebFetcher(BaseService):
+    """
+    Shared asynchronous page fetcher.
+
+    One pooled client is kept per event loop so connections stay alive across
+    requests. Concurrent requests to the same host are capped at
+    ``max_connections_per_host``; requests to other hosts are unaffected.
+    """
+
+    def __init__(
+        self,
+        timeout: Optional[float] = None,
+        max_connections: Optional[int] = None,
+        max_connections_per_host: Optional[int] = None,
+        keepalive_expiry: Optional[float] = None,
+        dns_cache_ttl: Optional[float] = None,
+        http2: Optional[bool] = None,
+        max_page_bytes: Optional[int] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
+        super().__init__("WebFetcher")
+        self.api_config = get_api_config()
+        self.timeout = (
+            timeout
+            if timeout is not None
+            else self.api_config.HEURISTICS_EVALUATION_TIMEOUT_SECONDS
+        )
+        self.max_connections = (
+            max_connections or self.api_config.HEURISTICS_MAX_CONNECTIONS
+        )
+        self.max_connections_per_host = (
+            max_connections_per_host
+            or self.api_config.HEURISTICS_MAX_CONNECTIONS_PER_HOST
+        )
+        self.keepalive_expiry = (
+            keepalive_expiry
+            if keepalive_expiry is not None
+            else self.api_config.HEURISTICS_KEEPALIVE_EXPIRY_SECONDS
+        )
+        self.http2 = (
+            http2 if http2 is not None else self.api_config.HEURISTICS_HTTP2_ENABLED
+        ) and HTTP2_AVAILABLE
+        self.dns_cache = DNSCache(
+            dns_cache_ttl
+            if dns_cache_ttl is not None
+            else self.api_config.HEURISTICS_DNS_CACHE_TTL_SECONDS
+        )
+        self.max_page_bytes = (
+            max_page_bytes
+            if max_page_bytes is not None
+            else self.api_config.HEURISTICS_MAX_PAGE_BYTES
+        )
+        self._transport = transport
+
+        # Clients are bound to the loop they were created on, so keep one per loop
+        self._clients: "weakref.WeakKeyDictionary[Any, httpx.AsyncClient]"
+        self._clients = weakref.WeakKeyDictionary()
+        # Held only while a host has requests in flight
+        self._host_slots: Dict[Tuple[asyncio.AbstractEventLoop, str], _HostSlot] = {}
+
+    def validate_input(self, data: Any) -> bool:
+        """Validate that data is an absolute http(s) URL."""
+        if not isinstance(data, str):
+            return False
+        parts = urlsplit(data)
+        return parts.scheme in ("http", "https") and bool(parts.netloc)
+
+    async def fetch(
+        self, url: str, headers: Optional[Dict[str, str]] = None
+    ) -> FetchResult:
+        """
+        Fetch a URL, following redirects.
+
+        Args:
+            url: Absolute http(s) URL
+            headers: Extra request headers
+
+        Returns:
+            FetchResult with the raw body in ``content``; network and HTTP
+            errors are reported in ``error`` and ``error_code`` rather than
+            raised
+        """
+        return await self._fetch(url, headers, self._read_content)
+
+    async def fetch_html(
+        self,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        max_bytes: Optional[int] = None,
+        cache: Optional[HTTPCache] = None,
+    ) -> FetchResult:
+        """
+        Stream an HTML page, decoding it as it downloads.
+
+        Non-HTML responses (PDFs, images, video, archives) are abandoned as
+        soon as the Content-Type header or the first bytes give them away.
+        Bodies over the byte budget are truncated and the download stopped.
+
+        Args:
+            url: Absolute http(s) URL
+            headers: Extra request headers
+            max_bytes: Byte budget; defaults to HEURISTICS_MAX_PAGE_BYTES,
+                0 disables the limit
+            cache: Page cache; fresh entries are served without a request and
+                stale ones revalidated with a conditional GET
+
+        Returns:
+            FetchResult with the decoded document in ``text`` (``content`` is
+            left empty); non-HTML responses fail with error_code NOT_HTML
+        """
+        budget = self.max_page_bytes if max_bytes is None else max_bytes
+
+        cached = None
+        if cache is not None and self.validate_input(url):
+            cached = await asyncio.to_thread(cache.get, url)
+            if cached is not None and cache.is_fresh(cached):
+                return self._cached_result(url, cached)
+            if cached is not None:
+                headers = {**(headers or {}), **cached.conditional_headers()}
+
+        async def read_html(response: httpx.Response, result: FetchResult) -> None:
+            if cached is not None and response.status_code == 304:
+                page = await asyncio.to_thread(
+                    cache.revalidate, cached, response.headers
+                )
+                result.status_code = 200
+                result.text = page.text
+                result.encoding = page.encoding
+                result.truncated = page.truncated
+                result.content_hash = page.content_hash
+                result.from_cache = True
+                return
+
+            reader = HTMLStreamReader(response.headers.get("content-type"), budget)
+            async for chunk in response.aiter_bytes():
+                if not reader.feed(chunk):
+                    break
+            result.text = reader.finish()
+            result.encoding = reader.encoding
+            result.bytes_read = reader.bytes_read
+            result.truncated = reader.truncated
+
+        result = await self._fetch(url, headers, read_html)
+        if cache is not None and result.success and not result.from_cache:
+            page = await asyncio.to_thread(
+                cache.put,
+                url,
+                result.text,
+                result.headers,
+                final_url=result.final_url,
+                encoding=result.encoding,
+                truncated=result.truncated,
+            )
+            result.content_hash = page.content_hash if page else None
+        return result
+
+    @staticmethod
+    def _cached_result(url: str, page: CachedPage) -> FetchResult:
+        return FetchResult(
+            url=url,
+            final_url=page.final_url,
+            status_code=200,
+            text=page.text,
+            encoding=page.encoding,
+            truncated=page.truncated,
+            content_hash=page.content_hash,
+            from_cache=True,
+        )
+
+    async def _fetch(
+        self,
+        url: str,
+        headers: Optional[Dict[str, str]],
+        read_body: Callable[[httpx.Response, FetchResult], Awaitable[None]],
+    ) -> FetchResult:
+        start_time = time.monotonic()
+        if not self.validate_input(url):
+            return FetchResult(
+                url=url, error=f"Invalid URL: {url}", error_code="INVALID_URL"
+            )
+
+        client = self._get_client()
+        host = urlsplit(url).hostname or ""
+        try:
+            async with self._host_slot(host):
+                # Bound the whole download, not just each network read
+                result = await asyncio.wait_for(
+                    self._stream(client, url, headers, read_body),
+                    timeout=self.timeout,
+                )
+            result.elapsed = time.monotonic() - start_time
+            return result
+
+        except (httpx.TimeoutException, asyncio.TimeoutError):
+            self.log_error(Exception("Website fetch timeout"), "website_fetching")
+            return FetchResult(
+                url=url,
+                elapsed=time.monotonic() - start_time,
+                error="Website fetch timeout",
+                error_code="TIMEOUT",
+            )
+        except NotHTMLError as e:
+            self.log_operation("Skipping non-HTML response", url=url, reason=str(e))
+            return FetchResult(
+                url=url,
+                elapsed=time.monotonic() - start_time,
+                error=str(e),
+                error_code="NOT_HTML",
+            )
+        except httpx.HTTPError as e:
+            self.log_error(e, "website_fetching")
+            return FetchResult(
+                url=url,
+                elapsed=time.monotonic() - start_time,
+                error=str(e),
+                error_code="FETCH_FAILED",
+            )
+
+    async def _stream(
+        self,
+        client: httpx.AsyncClient,
+        url: str,
+        headers: Optional[Dict[str, str]],
+        read_body: Callable[[httpx.Response, FetchResult], Awaitable[None]],
+    ) -> FetchResult:
+        opened = time.monotonic()
+        async with client.stream("GET", url, headers=headers) as response:
+            result = FetchResult(
+                url=url,
+                final_url=str(response.url),
+                status_code=response.status_code,
+                headers=dict(response.headers),
+                http_version=response.http_version,
+                # Time to the response headers, redirects included
+                ttfb=time.monotonic() - opened,
+            )
+            if response.is_error:
+                result.error = f"HTTP {response.status_code}"
+                result.error_code = "HTTP_ERROR"
+                return result
+
+            await read_body(response, result)
+            return result
+
+    @staticmethod
+    async def _read_content(response: httpx.Response, result: FetchResult) -> None:
+        result.content = await response.aread()
+        result.bytes_read = len(result.content)
+
+    async def aclose(self) -> None:
+        """Close the pooled client for the running event loop."""
+        client = self._clients.pop(asyncio.get_running_loop(), None)
+        if client is not None:
+            await client.aclose()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Connection and DNS cache statistics."""
+        return {
+            "http2_enabled": self.http2,
+            "max_connections": self.max_connections,
+            "max_connections_per_host": self.max_connections_per_host,
+            "max_page_bytes": self.max_page_bytes,
+            "active_hosts": len(self._host_slots),
+            "dns_cache_hits": self.dns_cache.hits,
+            "dns_cache_misses": self.dns_cache.misses,
+        }
+
+    def _get_client(self) -> httpx.AsyncClient:
+        loop = asyncio.get_running_loop()
+        client = self._clients.get(loop)
+        if client is None:
+            # Clients of closed loops can no longer be closed; drop them
+            for stale in [other for other in self._clients if other.is_closed()]:
+                del self._clients[stale]
+            limits = httpx.Limits(
+                max_connections=self.max_connections,
+                max_keepalive_connections=self.max_connections,
+                keepalive_expiry=self.keepalive_expiry,
+            )
+            transport = self._transport or PooledTransport(
+                limits=limits, http2=self.http2, dns_cache=self.dns_cache
+            )
+            client = httpx.AsyncClient(
+                transport=transport,
+                timeout=self.timeout,
+                follow_redirects=True,
+            )
+            self._clients[loop] = client
+        return client
+
+    @asynccontextmanager
+    async def _host_slot(self, host: str) -> AsyncIterator[None]:
+        key = (asyncio.get_running_loop(), host)
+        slot = self._host_slots.get(key)
+        if slot is None:
+            slot = _HostSlot(asyncio.Semaphore(self.max_connections_per_host))
+            self._host_slots[key] = slot
+        slot.users += 1
+        try:
+            async with slot.semaphore:
+                yield
+        finally:
+            slot.users -= 1
+            if not slot.users:
+                del self._host_slots[key]
+
+
+_shared_fetcher: Optional[WebFetcher] = None
+
+
+def get_web_fetcher() -> WebFetcher:
+    """Get the process-wide WebFetcher so every caller shares one pool."""
+    global _shared_fetcher
+    if _shared_fetcher is None:
+        _shared_fetcher = WebFetcher()
+    return _shared_fetcher
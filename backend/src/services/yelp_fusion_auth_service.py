@@ -6,7 +6,7 @@ Handles authentication and connection testing for Yelp Fusion API.
 import httpx
 from typing import Dict, Any, Optional
 from src.core import BaseService, get_api_config
-from src.services import RateLimiter
+from src.services.rate_limiter import get_rate_limiter
 
 
 class YelpFusionAuthService(BaseService):
@@ -15,7 +15,7 @@ class YelpFusionAuthService(BaseService):
     def __init__(self):
         super().__init__("YelpFusionAuthService")
         self.api_config = get_api_config()
-        self.rate_limiter = RateLimiter()
+        self.rate_limiter = get_rate_limiter()
         self.base_url = "https://api.yelp.com/v3"
         self.api_key = self.api_config.YELP_FUSION_API_KEY
 
@@ -219,7 +219,7 @@ class YelpFusionAuthService(BaseService):
 
             if connection_test["success"]:
                 rate_limit_info = self.rate_limiter.get_rate_limit_info("yelp_fusion")
-                circuit_breaker = self.rate_limiter._circuit_breakers["yelp_fusion"]
+                circuit_breaker = self.rate_limiter.get_circuit_breaker("yelp_fusion")
 
                 return {
                     "success": True,
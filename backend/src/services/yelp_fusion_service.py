@@ -7,7 +7,7 @@ import httpx
 import re
 from typing import Dict, Any, Optional, List
 from src.core import BaseService, get_api_config
-from src.services import RateLimiter
+from src.services.rate_limiter import get_rate_limiter
 from src.schemas.yelp_fusion import (
     YelpBusinessSearchRequest,
     YelpBusinessData,
@@ -27,7 +27,7 @@ class YelpFusionService(BaseService):
     def __init__(self):
         super().__init__("YelpFusionService")
         self.api_config = get_api_config()
-        self.rate_limiter = RateLimiter()
+        self.rate_limiter = get_rate_limiter()
         self.base_url = "https://api.yelp.com/v3"
         self.api_key = self.api_config.YELP_FUSION_API_KEY
         self.max_results_per_request = 50  # Yelp Fusion API limit
@@ -0,0 +1,192 @@
+"""
+Time-bounded cache of audit results with stale-while-revalidate.
+Wraps a TieredCache so results survive restarts; concurrent misses are coalesced through a SingleFlight.
+"""
+
+import asyncio
+import threading
+import time
+from typing import Any, Awaitable, Callable, Dict, Iterable, Optional, Set, Tuple
+
+from src.utils.result_cache import TieredCache
+from src.utils.single_flight import SingleFlight
+from src.utils.urls import normalize_url
+
+# Lookup outcomes, reported to callers as ``cache_status``
+FRESH = "hit"
+STALE = "stale"
+MISS = "miss"
+COALESCED = "coalesced"
+
+
+def audit_cache_key(url: str, strategy: str, categories: Iterable[str]) -> str:
+    """Cache key for an audit of ``url`` under ``strategy`` and ``categories``."""
+    return f"{normalize_url(url)}|{strategy}|{','.join(sorted(categories))}"
+
+
+class AuditResultCache:
+    """
+    Audit results with a freshness TTL and a serve-stale window.
+
+    Entries younger than the TTL are served as-is. Entries past the TTL but
+    within ``stale_seconds`` more are served immediately while a single
+    background refresh replaces them. Older entries, and misses, run the
+    audit; concurrent callers for the same key share one execution.
+    """
+
+    def __init__(
+        self,
+        cache: TieredCache,
+        ttl_seconds: float,
+        stale_seconds: float = 0.0,
+        strategy_ttls: Optional[Dict[str, float]] = None,
+        flight: Optional[SingleFlight] = None,
+        namespace: str = "audit",
+    ):
+        self.cache = cache
+        self.flight = flight or SingleFlight()
+        self.namespace = namespace
+        self.ttl_seconds = ttl_seconds
+        self.stale_seconds = stale_seconds
+        self.strategy_ttls = {
+            strategy: ttl for strategy, ttl in (strategy_ttls or {}).items() if ttl
+        }
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.refreshes = 0
+
+        self._lock = threading.Lock()
+        self._refreshing: Set[str] = set()
+        self._background: Set[asyncio.Task] = set()
+
+    def ttl_for(self, strategy: str) -> float:
+        """Freshness TTL for results of ``strategy``."""
+        return self.strategy_ttls.get(strategy, self.ttl_seconds)
+
+    def lookup(
+        self, key: str, strategy: str
+    ) -> Tuple[Optional[Dict[str, Any]], str, float]:
+        """
+        Look up a cached result without running anything.
+
+        Returns:
+            ``(result, state, age_seconds)`` where state is FRESH, STALE or
+            MISS; entries past the stale window are reported as MISS
+        """
+        return self._classify(self.cache.get(key), strategy)
+
+    def store(self, key: str, result: Dict[str, Any]) -> None:
+        """Store a result as fresh from now."""
+        self.cache.set(key, self._entry(result))
+
+    async def get_or_run(
+        self,
+        key: str,
+        strategy: str,
+        run: Callable[[], Awaitable[Dict[str, Any]]],
+        cacheable: Callable[[Dict[str, Any]], bool],
+    ) -> Tuple[Dict[str, Any], str, float]:
+        """
+        Serve a cached result or run the audit.
+
+        Args:
+            key: Cache key from ``audit_cache_key``
+            strategy: Strategy of the audit, for its TTL
+            run: Coroutine factory running the audit
+            cacheable: Whether a fresh result may be stored
+
+        Returns:
+            ``(result, status, age_seconds)``; status is FRESH, STALE, MISS or
+            COALESCED
+        """
+        # The persistent tier may be SQLite or Redis; keep it off the loop
+        entry = await self.cache.get_async(key)
+        result, state, age = self._classify(entry, strategy)
+        if state == FRESH:
+            return result, FRESH, age
+        if state == STALE:
+            if self._claim_refresh(key):
+                task = asyncio.create_task(self._refresh(key, run, cacheable))
+                self._background.add(task)
+                task.add_done_callback(self._background.discard)
+            return result, STALE, age
+
+        result, shared = await self._run_and_store(key, run, cacheable)
+        if shared:
+            self.coalesced += 1
+            return result, COALESCED, 0.0
+        self.misses += 1
+        return result, MISS, 0.0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Hit, stale, miss and coalescing counters."""
+        return {
+            "ttl_seconds": self.ttl_seconds,
+            "stale_seconds": self.stale_seconds,
+            "hits": self.hits,
+            "stale_hits": self.stale_hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "refreshes": self.refreshes,
+            **{f"tier_{name}": value for name, value in self.cache.get_stats().items()},
+        }
+
+    def _classify(
+        self, entry: Optional[Dict[str, Any]], strategy: str
+    ) -> Tuple[Optional[Dict[str, Any]], str, float]:
+        if entry is None:
+            return None, MISS, 0.0
+
+        age = time.time() - entry["stored_at"]
+        ttl = self.ttl_for(strategy)
+        if age < ttl:
+            self.hits += 1
+            return entry["result"], FRESH, age
+        if age < ttl + self.stale_seconds:
+            self.stale_hits += 1
+            return entry["result"], STALE, age
+        return None, MISS, age
+
+    @staticmethod
+    def _entry(result: Dict[str, Any]) -> Dict[str, Any]:
+        return {"stored_at": time.time(), "result": result}
+
+    def _flight_key(self, key: str) -> Tuple[str, str]:
+        return (self.namespace, key)
+
+    def _claim_refresh(self, key: str) -> bool:
+        """Reserve the single background refresh of ``key``, if none is pending."""
+        with self._lock:
+            if key in self._refreshing or self.flight.in_flight(self._flight_key(key)):
+                return False
+            self._refreshing.add(key)
+            self.refreshes += 1
+            return True
+
+    async def _refresh(
+        self,
+        key: str,
+        run: Callable[[], Awaitable[Dict[str, Any]]],
+        cacheable: Callable[[Dict[str, Any]], bool],
+    ) -> None:
+        try:
+            await self._run_and_store(key, run, cacheable)
+        finally:
+            with self._lock:
+                self._refreshing.discard(key)
+
+    async def _run_and_store(
+        self,
+        key: str,
+        run: Callable[[], Awaitable[Dict[str, Any]]],
+        cacheable: Callable[[Dict[str, Any]], bool],
+    ) -> Tuple[Dict[str, Any], bool]:
+        async def work() -> Dict[str, Any]:
+            result = await run()
+            if cacheable(result):
+                await self.cache.set_async(key, self._entry(result))
+            return result
+
+        return await self.flight.do(self._flight_key(key), work)
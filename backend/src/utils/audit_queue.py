@@ -0,0 +1,250 @@
+"""
+Persistent priority queue of Lighthouse audit jobs.
+Jobs live in SQLite so a restart resumes a batch where it stopped instead of starting over.
+"""
+
+import json
+import sqlite3
+import threading
+import time
+import uuid
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+# Job states
+PENDING = "pending"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+
+
+@dataclass
+class AuditJob:
+    """One queued audit."""
+
+    id: int
+    batch_id: str
+    url: str
+    strategy: str
+    business_id: str
+    run_id: Optional[str]
+    priority: int
+    status: str
+    attempts: int
+    enqueued_at: float
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    result: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+
+
+class AuditQueue:
+    """
+    SQLite-backed queue; lower ``priority`` values are dispatched first and
+    equal priorities in submission order.
+
+    ``path`` defaults to an in-memory database, which does not survive a
+    restart. Small key/value state (such as quota usage) is stored alongside.
+    """
+
+    _COLUMNS = (
+        "id, batch_id, url, strategy, business_id, run_id, priority, status, "
+        "attempts, enqueued_at, started_at, finished_at, result, error"
+    )
+
+    def __init__(self, path: Union[str, Path, None] = None):
+        self.path = Path(path) if path else None
+        if self.path is not None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(
+            str(self.path) if self.path else ":memory:",
+            timeout=30.0,
+            check_same_thread=False,
+            isolation_level=None,
+        )
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS audit_jobs ("
+            "id INTEGER PRIMARY KEY AUTOINCREMENT, batch_id TEXT NOT NULL, "
+            "url TEXT NOT NULL, strategy TEXT NOT NULL, business_id TEXT NOT NULL, "
+            "run_id TEXT, priority INTEGER NOT NULL, status TEXT NOT NULL, "
+            "attempts INTEGER NOT NULL DEFAULT 0, enqueued_at REAL NOT NULL, "
+            "started_at REAL, finished_at REAL, result TEXT, error TEXT)"
+        )
+        self._db.execute(
+            "CREATE INDEX IF NOT EXISTS audit_jobs_next "
+            "ON audit_jobs (status, priority, id)"
+        )
+        self._db.execute(
+            "CREATE INDEX IF NOT EXISTS audit_jobs_batch ON audit_jobs (batch_id)"
+        )
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS audit_queue_state "
+            "(key TEXT PRIMARY KEY, value TEXT NOT NULL)"
+        )
+
+    def push(
+        self,
+        items: Iterable[Tuple[str, str]],
+        strategy: str,
+        priority: int,
+        run_id: Optional[str] = None,
+        batch_id: Optional[str] = None,
+    ) -> Tuple[str, List[int]]:
+        """
+        Queue one job per ``(url, business_id)`` item.
+
+        Returns:
+            ``(batch_id, job_ids)``
+        """
+        batch_id = batch_id or str(uuid.uuid4())
+        now = time.time()
+        rows = [
+            (batch_id, url, strategy, business_id, run_id, priority, PENDING, now)
+            for url, business_id in items
+        ]
+        with self._lock:
+            self._db.execute("BEGIN")
+            try:
+                first = self._db.execute(
+                    "SELECT COALESCE(MAX(id), 0) FROM audit_jobs"
+                ).fetchone()[0]
+                self._db.executemany(
+                    "INSERT INTO audit_jobs (batch_id, url, strategy, business_id, "
+                    "run_id, priority, status, enqueued_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    rows,
+                )
+                ids = [
+                    row[0]
+                    for row in self._db.execute(
+                        "SELECT id FROM audit_jobs WHERE batch_id = ? AND id > ? "
+                        "ORDER BY id",
+                        (batch_id, first),
+                    )
+                ]
+                self._db.execute("COMMIT")
+            except Exception:
+                self._db.execute("ROLLBACK")
+                raise
+        return batch_id, ids
+
+    def pop(self) -> Optional[AuditJob]:
+        """Claim the next pending job, marking it running; None when empty."""
+        with self._lock:
+            row = self._db.execute(
+                f"SELECT {self._COLUMNS} FROM audit_jobs WHERE status = ? "
+                "ORDER BY priority, id LIMIT 1",
+                (PENDING,),
+            ).fetchone()
+            if row is None:
+                return None
+            started = time.time()
+            self._db.execute(
+                "UPDATE audit_jobs SET status = ?, started_at = ?, "
+                "attempts = attempts + 1 WHERE id = ?",
+                (RUNNING, started, row[0]),
+            )
+        job = self._job(row)
+        job.status, job.started_at = RUNNING, started
+        job.attempts += 1
+        return job
+
+    def complete(self, job_id: int, result: Dict[str, Any]) -> None:
+        """Record a finished job; failed audits are stored as FAILED."""
+        status = DONE if result.get("success") else FAILED
+        with self._lock:
+            self._db.execute(
+                "UPDATE audit_jobs SET status = ?, finished_at = ?, result = ?, "
+                "error = ? WHERE id = ?",
+                (
+                    status,
+                    time.time(),
+                    json.dumps(result, separators=(",", ":"), default=str),
+                    None if status == DONE else result.get("error"),
+                    job_id,
+                ),
+            )
+
+    def requeue(self, job_id: int) -> None:
+        """Put a claimed job back in the queue, ahead of later submissions."""
+        with self._lock:
+            self._db.execute(
+                "UPDATE audit_jobs SET status = ?, started_at = NULL WHERE id = ?",
+                (PENDING, job_id),
+            )
+
+    def requeue_running(self) -> int:
+        """Return jobs interrupted by a restart to the queue; returns how many."""
+        with self._lock:
+            cursor = self._db.execute(
+                "UPDATE audit_jobs SET status = ?, started_at = NULL "
+                "WHERE status = ?",
+                (PENDING, RUNNING),
+            )
+        return cursor.rowcount
+
+    def get(self, job_id: int) -> Optional[AuditJob]:
+        with self._lock:
+            row = self._db.execute(
+                f"SELECT {self._COLUMNS} FROM audit_jobs WHERE id = ?", (job_id,)
+            ).fetchone()
+        return self._job(row) if row else None
+
+    def batch_jobs(self, batch_id: str) -> List[AuditJob]:
+        """Every job of a batch in submission order."""
+        with self._lock:
+            rows = self._db.execute(
+                f"SELECT {self._COLUMNS} FROM audit_jobs WHERE batch_id = ? "
+                "ORDER BY id",
+                (batch_id,),
+            ).fetchall()
+        return [self._job(row) for row in rows]
+
+    def counts(self, batch_id: Optional[str] = None) -> Dict[str, int]:
+        """Jobs per status, for one batch or the whole queue."""
+        query = "SELECT status, COUNT(*) FROM audit_jobs"
+        params: tuple = ()
+        if batch_id is not None:
+            query += " WHERE batch_id = ?"
+            params = (batch_id,)
+        with self._lock:
+            rows = self._db.execute(query + " GROUP BY status", params).fetchall()
+        counts = {PENDING: 0, RUNNING: 0, DONE: 0, FAILED: 0}
+        counts.update(dict(rows))
+        return counts
+
+    def pending_ahead(self, priority: int, job_id: int) -> int:
+        """Pending jobs that will be dispatched before ``job_id``."""
+        with self._lock:
+            return self._db.execute(
+                "SELECT COUNT(*) FROM audit_jobs WHERE status = ? AND "
+                "(priority < ? OR (priority = ? AND id < ?))",
+                (PENDING, priority, priority, job_id),
+            ).fetchone()[0]
+
+    def get_state(self, key: str) -> Optional[Any]:
+        with self._lock:
+            row = self._db.execute(
+                "SELECT value FROM audit_queue_state WHERE key = ?", (key,)
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def set_state(self, key: str, value: Any) -> None:
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO audit_queue_state (key, value) VALUES (?, ?)",
+                (key, json.dumps(value)),
+            )
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
+
+    @staticmethod
+    def _job(row: tuple) -> AuditJob:
+        job = AuditJob(*row)
+        if job.result is not None:
+            job.result = json.loads(job.result)
+        return job
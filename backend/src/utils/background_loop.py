@@ -0,0 +1,98 @@
+"""
+Long-lived background event loop for synchronous entry points.
+Sync wrappers run their coroutines here, so per-loop pools are built only once.
+"""
+
+import asyncio
+import threading
+from typing import Awaitable, Callable, Coroutine, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class BackgroundLoop:
+    """
+    An event loop running forever on a daemon thread.
+
+    ``run`` submits a coroutine and blocks the calling thread until it
+    finishes. It works from plain threads and from code running on another
+    event loop; calling it from a coroutine on the background loop itself
+    would deadlock and raises ``RuntimeError`` instead.
+    """
+
+    def __init__(self, name: str = "background-loop"):
+        self.name = name
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        """The background loop, started on first use."""
+        with self._lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                ready = threading.Event()
+                self._thread = threading.Thread(
+                    target=self._serve,
+                    args=(loop, ready),
+                    name=self.name,
+                    daemon=True,
+                )
+                self._thread.start()
+                ready.wait()
+                self._loop = loop
+            return self._loop
+
+    def run(
+        self, coro: Coroutine[object, object, T], timeout: Optional[float] = None
+    ) -> T:
+        """Run ``coro`` on the background loop and return its result."""
+        loop = self.loop
+        if threading.current_thread() is self._thread:
+            coro.close()
+            raise RuntimeError(
+                "Cannot block on the background loop from its own thread; "
+                "await the coroutine instead"
+            )
+        return asyncio.run_coroutine_threadsafe(coro, loop).result(timeout)
+
+    def close(self, shutdown: Optional[Callable[[], Awaitable[None]]] = None) -> None:
+        """
+        Stop the loop and join its thread.
+
+        Args:
+            shutdown: Coroutine function run on the loop first, e.g. to
+                close pooled clients that were created on it
+        """
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop = self._thread = None
+        if loop is None or thread is None:
+            return
+        if shutdown is not None:
+            asyncio.run_coroutine_threadsafe(shutdown(), loop).result()
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
+
+    @staticmethod
+    def _serve(loop: asyncio.AbstractEventLoop, ready: threading.Event) -> None:
+        asyncio.set_event_loop(loop)
+        loop.call_soon(ready.set)
+        loop.run_forever()
+
+
+_shared_loop = BackgroundLoop()
+
+
+def run_sync(coro: Coroutine[object, object, T], timeout: Optional[float] = None) -> T:
+    """Run ``coro`` to completion on the process-wide background loop."""
+    return _shared_loop.run(coro, timeout)
+
+
+def close_background_loop(
+    shutdown: Optional[Callable[[], Awaitable[None]]] = None
+) -> None:
+    """Stop the process-wide background loop, if it was started."""
+    _shared_loop.close(shutdown)
@@ -0,0 +1,42 @@
+"""
+Request deadlines propagated through multi-step operations.
+A caller fixes one overall deadline; each retry, fallback or stage takes its timeout from the time left.
+"""
+
+import time
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass(frozen=True)
+class Deadline:
+    """
+    Point on the monotonic clock by which an operation must finish.
+
+    Create one with ``Deadline.after(seconds)`` and pass it down; callees
+    use ``remaining`` or ``clamp`` instead of their own fixed timeouts.
+    """
+
+    at: float
+
+    @classmethod
+    def after(cls, seconds: float) -> "Deadline":
+        """Deadline ``seconds`` from now."""
+        return cls(time.monotonic() + seconds)
+
+    @classmethod
+    def optional(cls, seconds: Optional[float]) -> Optional["Deadline"]:
+        """Deadline ``seconds`` from now, or None when no budget is given."""
+        return cls.after(seconds) if seconds is not None else None
+
+    def remaining(self) -> float:
+        """Seconds left, never negative."""
+        return max(0.0, self.at - time.monotonic())
+
+    @property
+    def expired(self) -> bool:
+        return self.remaining() <= 0.0
+
+    def clamp(self, timeout: float) -> float:
+        """``timeout`` shortened to the time left."""
+        return min(timeout, self.remaining())
@@ -0,0 +1,441 @@
+"""
+HTML parser backends for heuristic website evaluation.
+Each backend turns raw page markup into the PageFeatures index consumed by the heuristic checks.
+"""
+
+import re
+from abc import ABC, abstractmethod
+from html.parser import HTMLParser
+from typing import Dict, List, Optional, Type, Union
+
+from bs4 import BeautifulSoup
+from bs4.dammit import EntitySubstitution, UnicodeDammit
+
+from src.utils.page_features import (
+    CONTROL_TAGS,
+    HEADING_TAGS,
+    Anchor,
+    Control,
+    Form,
+    FormInput,
+    PageFeatures,
+    extract_page_features,
+)
+
+DEFAULT_PARSER_BACKEND = "streaming"
+
+# Tree-building rules of BeautifulSoup's html.parser builder, mirrored by the
+# streaming backend so both produce the same index.
+VOID_TAGS = frozenset(
+    [
+        "area",
+        "base",
+        "basefont",
+        "bgsound",
+        "br",
+        "col",
+        "command",
+        "embed",
+        "frame",
+        "hr",
+        "image",
+        "img",
+        "input",
+        "isindex",
+        "keygen",
+        "link",
+        "menuitem",
+        "meta",
+        "nextid",
+        "param",
+        "source",
+        "spacer",
+        "track",
+        "wbr",
+    ]
+)
+PRESERVE_WHITESPACE_TAGS = frozenset(["pre", "textarea"])
+# Strings inside these tags are not document text (scripts, CSS, templates, ruby)
+NON_TEXT_CONTAINER_TAGS = frozenset(["rt", "rp", "style", "script", "template"])
+MULTI_VALUED_ATTRIBUTES = {
+    "*": frozenset(["class", "accesskey", "dropzone"]),
+    "a": frozenset(["rel", "rev"]),
+    "link": frozenset(["rel", "rev"]),
+    "td": frozenset(["headers"]),
+    "th": frozenset(["headers"]),
+    "form": frozenset(["accept-charset"]),
+    "object": frozenset(["archive"]),
+    "area": frozenset(["rel"]),
+    "icon": frozenset(["sizes"]),
+    "iframe": frozenset(["sandbox"]),
+    "output": frozenset(["for"]),
+}
+ASCII_SPACES = "\x20\x0a\x09\x0c\x0d"
+
+_NON_WHITESPACE = re.compile(r"\S+")
+_DECIMAL_REFERENCE = re.compile(r"^([0-9]+)(.*)")
+_HEX_REFERENCE = re.compile(r"^([0-9a-f]+)(.*)")
+
+Markup = Union[bytes, str]
+
+
+class PageParser(ABC):
+    """Base class for HTML parser backends."""
+
+    name: str = ""
+
+    @abstractmethod
+    def parse(self, markup: Markup) -> PageFeatures:
+        """
+        Parse page markup into a PageFeatures index.
+
+        Args:
+            markup: Raw response body (bytes) or decoded HTML
+
+        Returns:
+            PageFeatures for the page
+        """
+
+
+class SoupPageParser(PageParser):
+    """
+    Reference backend: builds a full BeautifulSoup tree, then indexes it.
+
+    Slowest and most memory hungry, but the behaviour every other backend is
+    checked against.
+    """
+
+    name = "bs4"
+
+    def parse(self, markup: Markup) -> PageFeatures:
+        return extract_page_features(BeautifulSoup(markup, "html.parser"))
+
+
+class StreamingPageParser(PageParser):
+    """
+    Streaming backend: builds the index directly from tokenizer events.
+
+    Uses the same tokenizer as BeautifulSoup's html.parser builder and
+    replays its tree-building rules (void elements, end-tag recovery,
+    whitespace collapsing, script/style/template strings) on a stack of open
+    elements, so no document tree is ever materialised.
+    """
+
+    name = "streaming"
+
+    def parse(self, markup: Markup) -> PageFeatures:
+        if isinstance(markup, bytes):
+            markup = UnicodeDammit(markup, is_html=True).unicode_markup or ""
+
+        collector = _FeatureCollector()
+        collector.feed(markup)
+        collector.close()
+        return collector.finish()
+
+
+PARSER_BACKENDS: Dict[str, Type[PageParser]] = {
+    SoupPageParser.name: SoupPageParser,
+    StreamingPageParser.name: StreamingPageParser,
+}
+
+
+def register_parser_backend(parser_class: Type[PageParser]) -> None:
+    """Register an additional parser backend under its ``name``."""
+    PARSER_BACKENDS[parser_class.name] = parser_class
+
+
+def get_page_parser(name: Optional[str] = None) -> PageParser:
+    """
+    Get a parser backend by name.
+
+    Args:
+        name: Backend name (``"bs4"`` or ``"streaming"``); defaults to
+            DEFAULT_PARSER_BACKEND
+
+    Returns:
+        PageParser instance
+
+    Raises:
+        ValueError: If no backend is registered under ``name``
+    """
+    parser_class = PARSER_BACKENDS.get(name or DEFAULT_PARSER_BACKEND)
+    if parser_class is None:
+        raise ValueError(
+            f"Unknown HTML parser backend '{name}'. "
+            f"Available backends: {', '.join(sorted(PARSER_BACKENDS))}"
+        )
+    return parser_class()
+
+
+class _OpenElement:
+    """An element on the streaming parser's stack of open elements."""
+
+    __slots__ = ("name", "child_count", "only_child", "on_close")
+
+    def __init__(self, name: str):
+        self.name = name
+        self.child_count = 0
+        # The single child so far: a string, or the closed child's own .string
+        self.only_child: Optional[str] = None
+        self.on_close = None
+
+    def add_child(self, string: Optional[str]) -> None:
+        self.child_count += 1
+        self.only_child = string if self.child_count == 1 else None
+
+    @property
+    def string(self) -> Optional[str]:
+        """Equivalent of BeautifulSoup's Tag.string."""
+        return self.only_child if self.child_count == 1 else None
+
+
+class _FeatureCollector(HTMLParser):
+    """HTMLParser subclass that fills a PageFeatures index while tokenizing."""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=False)
+        self.features = PageFeatures()
+        self._text_parts: List[str] = []
+        self._attribute_names = set()
+        self._element_counts: Dict[str, int] = {}
+
+        self._stack: List[_OpenElement] = [_OpenElement("[document]")]
+        self._open_counts: Dict[str, int] = {}
+        self._data: List[str] = []
+        self._preserve_whitespace_depth = 0
+        self._container_stack: List[str] = []
+        # Void elements closed at their start tag, awaiting a redundant end tag.
+        # A counter rather than bs4's list keeps the lookup O(1).
+        self._already_closed_void: Dict[str, int] = {}
+
+        self._open_anchors: List[List[str]] = []
+        self._open_forms: List[Form] = []
+        self._open_form_texts: List[List[str]] = []
+
+    def finish(self) -> PageFeatures:
+        """Close any elements left open and return the finished index."""
+        self._end_data()
+        while len(self._stack) > 1:
+            self._pop()
+
+        features = self.features
+        features.text = "".join(self._text_parts).lower()
+        features.attribute_names = frozenset(self._attribute_names)
+        features.element_counts = self._element_counts
+        return features
+
+    # Tokenizer events
+
+    def handle_startendtag(self, tag, attrs):
+        self.handle_starttag(tag, attrs, handle_void=False)
+        self.handle_endtag(tag, check_already_closed=False)
+
+    def handle_starttag(self, tag, attrs, handle_void=True):
+        self._end_data()
+
+        attr_dict: Dict[str, Union[str, List[str]]] = {}
+        for key, value in attrs:
+            attr_dict[key] = "" if value is None else value
+        multi_valued = MULTI_VALUED_ATTRIBUTES["*"] | MULTI_VALUED_ATTRIBUTES.get(
+            tag, frozenset()
+        )
+        for key in multi_valued.intersection(attr_dict):
+            attr_dict[key] = _NON_WHITESPACE.findall(attr_dict[key])
+
+        self._open(tag, attr_dict)
+
+        if tag in VOID_TAGS and handle_void:
+            self.handle_endtag(tag, check_already_closed=False)
+            self._already_closed_void[tag] = self._already_closed_void.get(tag, 0) + 1
+
+    def handle_endtag(self, tag, check_already_closed=True):
+        if check_already_closed and self._already_closed_void.get(tag):
+            self._already_closed_void[tag] -= 1
+            return
+
+        self._end_data()
+        if not self._open_counts.get(tag):
+            return
+        while len(self._stack) > 1:
+            if self._pop().name == tag:
+                break
+
+    def handle_data(self, data):
+        self._data.append(data)
+
+    def handle_charref(self, name):
+        reference = _HEX_REFERENCE if name[:1] in ("x", "X") else _DECIMAL_REFERENCE
+        digits = name[1:] if reference is _HEX_REFERENCE else name
+        base = 16 if reference is _HEX_REFERENCE else 10
+
+        extra_data = ""
+        try:
+            number = int(digits, base)
+        except ValueError:
+            match = reference.search(digits)
+            if match is None:
+                self.handle_data(digits)
+                return
+            number = int(match.group(1), base)
+            extra_data = match.group(2)
+
+        self.handle_data(UnicodeDammit.numeric_character_reference(number)[0])
+        self.handle_data(extra_data)
+
+    def handle_entityref(self, name):
+        character = EntitySubstitution.HTML_ENTITY_TO_CHARACTER.get(name)
+        self.handle_data(character if character is not None else f"&{name}")
+
+    def handle_comment(self, data):
+        self._end_data()
+        self._data.append(data)
+        self._end_data(is_text=False)
+
+    def handle_decl(self, decl):
+        self._end_data()
+        self._data.append(decl[len("DOCTYPE ") :])
+        self._end_data(is_text=False)
+
+    def unknown_decl(self, data):
+        is_cdata = data.upper().startswith("CDATA[")
+        self._end_data()
+        self._data.append(data[len("CDATA[") :] if is_cdata else data)
+        # CDATA sections count as text even inside script/style containers
+        self._end_data(is_text=is_cdata, force_text=is_cdata)
+
+    def handle_pi(self, data):
+        self._end_data()
+        self._data.append(data)
+        self._end_data(is_text=False)
+
+    # Tree-building rules
+
+    def _end_data(self, is_text: bool = True, force_text: bool = False) -> None:
+        if not self._data:
+            return
+
+        string = "".join(self._data)
+        self._data = []
+        if not self._preserve_whitespace_depth and not string.strip(ASCII_SPACES):
+            string = "\n" if "\n" in string else " "
+
+        self._stack[-1].add_child(string)
+
+        if is_text and (force_text or not self._container_stack):
+            self._text_parts.append(string)
+            for parts in self._open_anchors:
+                parts.append(string)
+            for parts in self._open_form_texts:
+                parts.append(string)
+
+    def _open(self, name: str, attrs: Dict[str, Union[str, List[str]]]) -> None:
+        features = self.features
+        self._element_counts[name] = self._element_counts.get(name, 0) + 1
+
+        for attr_name, attr_value in attrs.items():
+            self._attribute_names.add(attr_name)
+            if isinstance(attr_value, str):
+                features.attribute_values.append(attr_value)
+            else:
+                features.attribute_values.extend(attr_value)
+
+        element = _OpenElement(name)
+        control = None
+        if name in CONTROL_TAGS:
+            classes = attrs.get("class", [])
+            control = Control(name=name, classes=list(classes))
+            features.controls.append(control)
+
+        if name == "a" and attrs.get("href") is not None:
+            anchor = Anchor(text="", href=attrs["href"])
+            anchor_parts: List[str] = []
+            features.anchors.append(anchor)
+            self._open_anchors.append(anchor_parts)
+            element.on_close = _close_anchor(
+                self._open_anchors, anchor, anchor_parts, control
+            )
+        elif name == "form":
+            form = Form(action=attrs.get("action", ""))
+            form_parts: List[str] = []
+            features.forms.append(form)
+            self._open_forms.append(form)
+            self._open_form_texts.append(form_parts)
+            element.on_close = _close_form(
+                self._open_forms, self._open_form_texts, form, form_parts
+            )
+        elif control is not None:
+            element.on_close = _close_control(control)
+        elif name == "img":
+            features.image_alts.append(attrs.get("alt"))
+        elif name == "meta":
+            features.meta_tags.append(attrs)
+        elif name in HEADING_TAGS:
+            features.headings.append(name)
+        elif name == "script":
+            features.script_types.append(attrs.get("type"))
+        elif name == "link" and attrs.get("media") is not None:
+            features.link_media.append(attrs["media"])
+        elif name == "style":
+            element.on_close = _close_style(features.style_texts)
+
+        if name == "input":
+            form_input = FormInput(
+                type=attrs.get("type", ""), name=attrs.get("name", "")
+            )
+            for form in self._open_forms:
+                form.inputs.append(form_input)
+
+        self._stack.append(element)
+        self._open_counts[name] = self._open_counts.get(name, 0) + 1
+        if name in PRESERVE_WHITESPACE_TAGS:
+            self._preserve_whitespace_depth += 1
+        if name in NON_TEXT_CONTAINER_TAGS:
+            self._container_stack.append(name)
+
+    def _pop(self) -> _OpenElement:
+        element = self._stack.pop()
+        name = element.name
+        self._open_counts[name] -= 1
+        if name in PRESERVE_WHITESPACE_TAGS:
+            self._preserve_whitespace_depth -= 1
+        if name in NON_TEXT_CONTAINER_TAGS:
+            self._container_stack.pop()
+
+        if element.on_close is not None:
+            element.on_close(element)
+        self._stack[-1].add_child(element.string)
+        return element
+
+
+def _close_anchor(open_anchors, anchor, parts, control):
+    def close(element):
+        anchor.text = "".join(parts)
+        open_anchors.pop()
+        if control is not None:
+            control.string = element.string
+
+    return close
+
+
+def _close_form(open_forms, open_form_texts, form, parts):
+    def close(element):
+        form.text = "".join(parts).lower()
+        open_forms.pop()
+        open_form_texts.pop()
+
+    return close
+
+
+def _close_control(control):
+    def close(element):
+        control.string = element.string
+
+    return close
+
+
+def _close_style(style_texts):
+    def close(element):
+        if element.string is not None:
+            style_texts.append(element.string)
+
+    return close
@@ -0,0 +1,225 @@
+"""
+Bounded, incremental decoding of downloaded HTML.
+Sniffs the content type, detects the charset once and decodes chunks as they arrive under a byte budget.
+"""
+
+import codecs
+from typing import List, Optional
+
+from bs4.dammit import EncodingDetector
+
+# Bytes inspected before deciding on content type and charset
+SNIFF_BYTES = 4096
+# Read size for synchronous streamed downloads
+STREAM_CHUNK_SIZE = 64 * 1024
+
+HTML_CONTENT_TYPES = frozenset(["text/html", "application/xhtml+xml"])
+# Generic types servers use when they do not know better; sniff the body instead
+AMBIGUOUS_CONTENT_TYPES = frozenset(
+    ["", "text/plain", "application/octet-stream", "application/xml", "text/xml"]
+)
+
+# Leading bytes of binary formats commonly served in place of a page
+BINARY_SIGNATURES = (
+    b"%PDF-",
+    b"\x89PNG\r\n\x1a\n",
+    b"GIF87a",
+    b"GIF89a",
+    b"\xff\xd8\xff",  # JPEG
+    b"RIFF",  # WebP, WAV, AVI
+    b"\x1a\x45\xdf\xa3",  # WebM / Matroska
+    b"OggS",
+    b"ID3",  # MP3
+    b"fLaC",
+    b"PK\x03\x04",  # ZIP, DOCX, XLSX
+    b"\x1f\x8b",  # gzip archive
+    b"7z\xbc\xaf\x27\x1c",
+    b"Rar!\x1a\x07",
+    b"%!PS",
+    b"MZ",  # Windows executable
+    b"\x7fELF",
+    b"wOFF",
+    b"wOF2",
+)
+
+# Declared encodings that browsers decode as a superset
+ENCODING_ALIASES = {
+    "iso-8859-1": "windows-1252",
+    "latin-1": "windows-1252",
+    "latin1": "windows-1252",
+    "ascii": "windows-1252",
+    "us-ascii": "windows-1252",
+    # A document that could declare UTF-16 in ASCII-compatible markup is not UTF-16
+    "utf-16": "utf-8",
+    "utf-16le": "utf-8",
+    "utf-16be": "utf-8",
+}
+
+
+class NotHTMLError(Exception):
+    """Raised when a response turns out not to be an HTML document."""
+
+
+def media_type(content_type: Optional[str]) -> str:
+    """Lower-cased media type of a Content-Type header, without parameters."""
+    if not content_type:
+        return ""
+    return content_type.split(";", 1)[0].strip().lower()
+
+
+def header_charset(content_type: Optional[str]) -> Optional[str]:
+    """Charset parameter of a Content-Type header, if any."""
+    if not content_type:
+        return None
+    for parameter in content_type.split(";")[1:]:
+        name, _, value = parameter.partition("=")
+        if name.strip().lower() == "charset":
+            return value.strip().strip("\"'").lower() or None
+    return None
+
+
+def check_content_type(content_type: Optional[str]) -> None:
+    """
+    Reject responses whose declared type is clearly not HTML.
+
+    Raises:
+        NotHTMLError: For types such as application/pdf, image/* or video/*
+    """
+    declared = media_type(content_type)
+    if declared in HTML_CONTENT_TYPES or declared in AMBIGUOUS_CONTENT_TYPES:
+        return
+    raise NotHTMLError(f"Unsupported content type: {declared}")
+
+
+def sniff_binary(head: bytes) -> Optional[str]:
+    """
+    Return a description if the leading bytes look like a binary file.
+
+    Checks well-known file signatures, then the WHATWG rule that text
+    resources contain no control bytes such as NUL.
+    """
+    stripped = head.lstrip(b" \t\r\n\x0c")
+    for signature in BINARY_SIGNATURES:
+        if stripped.startswith(signature):
+            return f"binary signature {signature[:8]!r}"
+    if head[4:8] == b"ftyp":  # MP4 / MOV / HEIF
+        return "binary signature b'ftyp'"
+    if head.startswith((b"\xff\xfe", b"\xfe\xff")):  # UTF-16 byte order mark
+        return None
+    if any(byte in head for byte in (b"\x00", b"\x01", b"\x02", b"\x03")):
+        return "binary control bytes"
+    return None
+
+
+def detect_encoding(head: bytes, content_type: Optional[str] = None) -> str:
+    """
+    Pick the character encoding for a document from its first bytes.
+
+    Order: byte order mark, HTTP charset parameter, ``<meta>``/XML
+    declaration, then UTF-8 if the head is valid UTF-8, else windows-1252.
+    """
+    _, bom_encoding = EncodingDetector.strip_byte_order_mark(head)
+    if bom_encoding:
+        # The -sig / generic UTF-16 codecs consume the BOM themselves
+        return "utf-8-sig" if bom_encoding == "utf-8" else "utf-16"
+
+    for candidate in (
+        header_charset(content_type),
+        EncodingDetector.find_declared_encoding(head, is_html=True),
+    ):
+        encoding = _normalize_encoding(candidate)
+        if encoding:
+            return encoding
+
+    try:
+        codecs.getincrementaldecoder("utf-8")().decode(head, final=False)
+        return "utf-8"
+    except UnicodeDecodeError:
+        return "cp1252"
+
+
+def _normalize_encoding(name: Optional[str]) -> Optional[str]:
+    if not name:
+        return None
+    name = ENCODING_ALIASES.get(name.lower(), name.lower())
+    try:
+        return codecs.lookup(name).name
+    except LookupError:
+        return None
+
+
+class HTMLStreamReader:
+    """
+    Incrementally decode a downloaded HTML body under a byte budget.
+
+    Feed raw chunks as they arrive. The first ``SNIFF_BYTES`` are buffered to
+    sniff for binary content and detect the charset once; every later chunk
+    is decoded straight away and the raw bytes are dropped.
+
+    Usage::
+
+        reader = HTMLStreamReader(content_type, max_bytes)
+        for chunk in chunks:
+            if not reader.feed(chunk):
+                break  # budget exhausted, stop downloading
+        html = reader.finish()
+    """
+
+    def __init__(self, content_type: Optional[str] = None, max_bytes: int = 0):
+        check_content_type(content_type)
+        self.content_type = content_type
+        self.max_bytes = max_bytes
+        self.bytes_read = 0
+        self.truncated = False
+        self.encoding: Optional[str] = None
+        self._head = b""
+        self._decoder = None
+        self._parts: List[str] = []
+
+    def feed(self, chunk: bytes) -> bool:
+        """
+        Add a chunk of the body.
+
+        Returns:
+            False once the byte budget is exhausted and reading should stop
+
+        Raises:
+            NotHTMLError: If the body is sniffed as a binary file
+        """
+        if self.max_bytes and self.bytes_read + len(chunk) > self.max_bytes:
+            chunk = chunk[: self.max_bytes - self.bytes_read]
+            self.truncated = True
+        self.bytes_read += len(chunk)
+
+        if self._decoder is None:
+            self._head += chunk
+            if len(self._head) >= SNIFF_BYTES or self.truncated:
+                self._start_decoding()
+        else:
+            self._parts.append(self._decoder.decode(chunk))
+
+        return not self.truncated
+
+    def finish(self) -> str:
+        """
+        Decode any remaining bytes and return the document text.
+
+        Raises:
+            NotHTMLError: If the body is sniffed as a binary file
+        """
+        if self._decoder is None:
+            self._start_decoding()
+        self._parts.append(self._decoder.decode(b"", final=True))
+        text = "".join(self._parts)
+        self._parts = [text]
+        return text
+
+    def _start_decoding(self) -> None:
+        head, self._head = self._head, b""
+        reason = sniff_binary(head[:SNIFF_BYTES])
+        if reason:
+            raise NotHTMLError(f"Response body is not HTML ({reason})")
+
+        self.encoding = detect_encoding(head[:SNIFF_BYTES], self.content_type)
+        self._decoder = codecs.getincrementaldecoder(self.encoding)(errors="replace")
+        self._parts.append(self._decoder.decode(head))
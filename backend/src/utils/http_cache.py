@@ -0,0 +1,364 @@
+"""
+Persistent on-disk cache of fetched pages with conditional revalidation.
+Entries are keyed on the normalized URL; bodies are stored compressed and content-addressed so identical pages share storage.
+"""
+
+import hashlib
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+import zlib
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Mapping, Optional, Union
+
+from src.core.config import get_api_config, get_data_path
+from src.utils.urls import normalize_url
+
+INDEX_FILENAME = "index.sqlite3"
+BODIES_DIRNAME = "bodies"
+COMPRESSION_LEVEL = 6
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    url TEXT PRIMARY KEY,
+    final_url TEXT,
+    content_hash TEXT NOT NULL,
+    etag TEXT,
+    last_modified TEXT,
+    encoding TEXT,
+    truncated INTEGER NOT NULL DEFAULT 0,
+    stored_at REAL NOT NULL,
+    accessed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS entries_accessed_at ON entries (accessed_at);
+CREATE INDEX IF NOT EXISTS entries_content_hash ON entries (content_hash);
+CREATE TABLE IF NOT EXISTS bodies (
+    content_hash TEXT PRIMARY KEY,
+    size INTEGER NOT NULL
+);
+"""
+
+
+@dataclass
+class CachedPage:
+    """A cached page and the validators needed to revalidate it."""
+
+    url: str
+    final_url: Optional[str]
+    text: str
+    content_hash: str
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    encoding: Optional[str] = None
+    truncated: bool = False
+    stored_at: float = 0.0
+
+    def age(self, now: Optional[float] = None) -> float:
+        """Seconds since the entry was stored or last revalidated."""
+        return (time.time() if now is None else now) - self.stored_at
+
+    def conditional_headers(self) -> Dict[str, str]:
+        """Request headers for a conditional GET against this entry."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class HTTPCache:
+    """
+    Disk-backed page cache with TTL freshness and LRU size eviction.
+
+    Entries younger than ``ttl_seconds`` are served without a request. Older
+    entries are revalidated with ``If-None-Match``/``If-Modified-Since``; a
+    304 response refreshes them in place. Once the compressed bodies exceed
+    ``max_bytes`` the least recently used entries are evicted.
+
+    The index is a SQLite database, so one cache directory can be shared by
+    several threads and worker processes.
+    """
+
+    def __init__(
+        self,
+        directory: Union[str, Path],
+        ttl_seconds: float = 3600.0,
+        max_bytes: int = 256 * 1024 * 1024,
+    ):
+        self.directory = Path(directory)
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.revalidations = 0
+        self.evictions = 0
+
+        self._bodies_dir = self.directory / BODIES_DIRNAME
+        self._bodies_dir.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(
+            str(self.directory / INDEX_FILENAME),
+            timeout=30.0,
+            check_same_thread=False,
+            isolation_level=None,
+        )
+        self._db.executescript(_SCHEMA)
+
+    def get(self, url: str) -> Optional[CachedPage]:
+        """
+        Look up a page, fresh or stale, and mark it recently used.
+
+        Returns:
+            The cached page, or None if absent or its body is missing
+        """
+        key = normalize_url(url)
+        with self._lock:
+            row = self._db.execute(
+                "SELECT final_url, content_hash, etag, last_modified, encoding, "
+                "truncated, stored_at FROM entries WHERE url = ?",
+                (key,),
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+
+            text = self._read_body(row[1])
+            if text is None:
+                self._db.execute("DELETE FROM entries WHERE url = ?", (key,))
+                self.misses += 1
+                return None
+
+            self._db.execute(
+                "UPDATE entries SET accessed_at = ? WHERE url = ?", (time.time(), key)
+            )
+            self.hits += 1
+
+        return CachedPage(
+            url=key,
+            final_url=row[0],
+            text=text,
+            content_hash=row[1],
+            etag=row[2],
+            last_modified=row[3],
+            encoding=row[4],
+            truncated=bool(row[5]),
+            stored_at=row[6],
+        )
+
+    def is_fresh(self, page: CachedPage) -> bool:
+        """True if the page can be served without revalidation."""
+        return page.age() < self.ttl_seconds
+
+    def put(
+        self,
+        url: str,
+        text: str,
+        headers: Optional[Mapping[str, str]] = None,
+        final_url: Optional[str] = None,
+        encoding: Optional[str] = None,
+        truncated: bool = False,
+    ) -> Optional[CachedPage]:
+        """
+        Store a freshly downloaded page.
+
+        Args:
+            url: Requested URL
+            text: Decoded page
+            headers: Response headers, for validators and Cache-Control
+            final_url: URL after redirects
+            encoding: Encoding the page was decoded with
+            truncated: Whether the page was cut off at the byte budget
+
+        Returns:
+            The stored entry, or None if the response forbids storing
+        """
+        headers = {name.lower(): value for name, value in (headers or {}).items()}
+        if "no-store" in headers.get("cache-control", "").lower():
+            return None
+
+        key = normalize_url(url)
+        body = text.encode("utf-8")
+        content_hash = hashlib.sha256(body).hexdigest()
+        now = time.time()
+        page = CachedPage(
+            url=key,
+            final_url=final_url,
+            text=text,
+            content_hash=content_hash,
+            etag=headers.get("etag"),
+            last_modified=headers.get("last-modified"),
+            encoding=encoding,
+            truncated=truncated,
+            stored_at=now,
+        )
+
+        with self._lock:
+            previous = self._db.execute(
+                "SELECT content_hash FROM entries WHERE url = ?", (key,)
+            ).fetchone()
+            self._write_body(content_hash, body)
+            self._db.execute(
+                "INSERT OR REPLACE INTO entries (url, final_url, content_hash, etag, "
+                "last_modified, encoding, truncated, stored_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    key,
+                    final_url,
+                    content_hash,
+                    page.etag,
+                    page.last_modified,
+                    encoding,
+                    int(truncated),
+                    now,
+                    now,
+                ),
+            )
+            if previous and previous[0] != content_hash:
+                self._drop_body_if_unreferenced(previous[0])
+            self._evict()
+
+        return page
+
+    def revalidate(
+        self, page: CachedPage, headers: Optional[Mapping[str, str]] = None
+    ) -> CachedPage:
+        """
+        Mark a page fresh again after a 304 Not Modified response.
+
+        Validators sent with the 304 replace the stored ones.
+        """
+        headers = {name.lower(): value for name, value in (headers or {}).items()}
+        page.etag = headers.get("etag", page.etag)
+        page.last_modified = headers.get("last-modified", page.last_modified)
+        page.stored_at = time.time()
+
+        with self._lock:
+            self._db.execute(
+                "UPDATE entries SET etag = ?, last_modified = ?, stored_at = ?, "
+                "accessed_at = ? WHERE url = ?",
+                (
+                    page.etag,
+                    page.last_modified,
+                    page.stored_at,
+                    page.stored_at,
+                    page.url,
+                ),
+            )
+            self.revalidations += 1
+        return page
+
+    def clear(self) -> None:
+        """Remove every entry and stored body."""
+        with self._lock:
+            hashes = [
+                row[0] for row in self._db.execute("SELECT content_hash FROM bodies")
+            ]
+            self._db.execute("DELETE FROM entries")
+            self._db.execute("DELETE FROM bodies")
+            for content_hash in hashes:
+                self._body_path(content_hash).unlink(missing_ok=True)
+
+    def close(self) -> None:
+        """Close the index database."""
+        with self._lock:
+            self._db.close()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics."""
+        with self._lock:
+            entries = self._db.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+            total_bytes = self._total_bytes()
+        return {
+            "directory": str(self.directory),
+            "entries": entries,
+            "total_bytes": total_bytes,
+            "max_bytes": self.max_bytes,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self.hits,
+            "misses": self.misses,
+            "revalidations": self.revalidations,
+            "evictions": self.evictions,
+        }
+
+    def _body_path(self, content_hash: str) -> Path:
+        return self._bodies_dir / content_hash[:2] / f"{content_hash}.zz"
+
+    def _read_body(self, content_hash: str) -> Optional[str]:
+        try:
+            data = self._body_path(content_hash).read_bytes()
+            return zlib.decompress(data).decode("utf-8")
+        except (OSError, zlib.error, UnicodeDecodeError):
+            return None
+
+    def _write_body(self, content_hash: str, body: bytes) -> None:
+        path = self._body_path(content_hash)
+        if not path.exists():
+            # Write to a temporary file first so readers never see partial bodies
+            path.parent.mkdir(exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as handle:
+                    handle.write(zlib.compress(body, COMPRESSION_LEVEL))
+                os.replace(tmp_path, path)
+            except BaseException:
+                Path(tmp_path).unlink(missing_ok=True)
+                raise
+        self._db.execute(
+            "INSERT OR IGNORE INTO bodies (content_hash, size) VALUES (?, ?)",
+            (content_hash, path.stat().st_size),
+        )
+
+    def _drop_body_if_unreferenced(self, content_hash: str) -> int:
+        """Delete a body no entry points at; returns the bytes freed."""
+        referenced = self._db.execute(
+            "SELECT 1 FROM entries WHERE content_hash = ? LIMIT 1", (content_hash,)
+        ).fetchone()
+        if referenced is not None:
+            return 0
+
+        row = self._db.execute(
+            "SELECT size FROM bodies WHERE content_hash = ?", (content_hash,)
+        ).fetchone()
+        self._db.execute("DELETE FROM bodies WHERE content_hash = ?", (content_hash,))
+        self._body_path(content_hash).unlink(missing_ok=True)
+        return row[0] if row else 0
+
+    def _total_bytes(self) -> int:
+        row = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM bodies").fetchone()
+        return row[0]
+
+    def _evict(self) -> None:
+        """Drop least recently used entries until bodies fit in ``max_bytes``."""
+        total = self._total_bytes()
+        while total > self.max_bytes:
+            row = self._db.execute(
+                "SELECT url, content_hash FROM entries ORDER BY accessed_at LIMIT 1"
+            ).fetchone()
+            if row is None:
+                break
+            self._db.execute("DELETE FROM entries WHERE url = ?", (row[0],))
+            total -= self._drop_body_if_unreferenced(row[1])
+            self.evictions += 1
+
+
+_shared_cache: Optional[HTTPCache] = None
+
+
+def get_http_cache() -> HTTPCache:
+    """Get the process-wide page cache configured from settings."""
+    global _shared_cache
+    if _shared_cache is None:
+        config = get_api_config()
+        directory = config.HEURISTICS_FETCH_CACHE_DIR or get_data_path(
+            "leadgen_fetch_cache", config
+        )
+        _shared_cache = HTTPCache(
+            directory,
+            ttl_seconds=config.HEURISTICS_FETCH_CACHE_TTL_SECONDS,
+            max_bytes=config.HEURISTICS_FETCH_CACHE_MAX_BYTES,
+        )
+    return _shared_cache
@@ -0,0 +1,109 @@
+"""
+Latency statistics helpers.
+Percentile summaries for batch timing reports and adaptive timeouts.
+"""
+
+import math
+import threading
+from collections import deque
+from typing import Deque, Dict, Hashable, Optional, Sequence
+
+DEFAULT_PERCENTILES = (50, 90, 95, 99)
+
+
+def percentile(values: Sequence[float], pct: float) -> float:
+    """
+    Linearly interpolated percentile of a sample.
+
+    Args:
+        values: Sample values, in any order
+        pct: Percentile between 0 and 100
+
+    Returns:
+        The percentile value, or 0.0 for an empty sample
+    """
+    if not values:
+        return 0.0
+    if not 0 <= pct <= 100:
+        raise ValueError("pct must be between 0 and 100")
+
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * pct / 100
+    lower = math.floor(rank)
+    upper = math.ceil(rank)
+    if lower == upper:
+        return float(ordered[lower])
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (rank - lower)
+
+
+def summarize_latencies(
+    values: Sequence[float], percentiles: Sequence[float] = DEFAULT_PERCENTILES
+) -> Dict[str, float]:
+    """
+    Summarize a latency sample.
+
+    Returns:
+        ``count``, ``mean``, ``min``, ``max`` and ``p<N>`` for each requested
+        percentile; all zero for an empty sample
+    """
+    summary: Dict[str, float] = {
+        "count": len(values),
+        "mean": sum(values) / len(values) if values else 0.0,
+        "min": float(min(values)) if values else 0.0,
+        "max": float(max(values)) if values else 0.0,
+    }
+    for pct in percentiles:
+        summary[f"p{pct:g}"] = percentile(values, pct)
+    return summary
+
+
+class LatencyTracker:
+    """
+    Rolling latency samples, overall and per key (e.g. per host).
+
+    Only the most recent ``window`` samples of each series are kept, so the
+    percentiles follow recent behaviour. Safe to share between threads.
+    """
+
+    def __init__(self, window: int = 200, max_keys: int = 1000):
+        self.window = window
+        self.max_keys = max_keys
+        self._overall: Deque[float] = deque(maxlen=window)
+        self._by_key: Dict[Hashable, Deque[float]] = {}
+        self._lock = threading.Lock()
+
+    def record(self, key: Hashable, seconds: float) -> None:
+        """Add one observation for ``key``."""
+        with self._lock:
+            self._overall.append(seconds)
+            samples = self._by_key.get(key)
+            if samples is None:
+                if len(self._by_key) >= self.max_keys:
+                    # Forget the longest-known key; dicts keep insertion order
+                    del self._by_key[next(iter(self._by_key))]
+                samples = self._by_key[key] = deque(maxlen=self.window)
+            samples.append(seconds)
+
+    def percentile(
+        self, pct: float, key: Optional[Hashable] = None, min_samples: int = 1
+    ) -> Optional[float]:
+        """
+        Percentile of the samples for ``key``, or of all samples.
+
+        Returns:
+            The percentile, or None with fewer than ``min_samples`` samples
+        """
+        with self._lock:
+            samples = list(
+                self._overall if key is None else self._by_key.get(key, ())
+            )
+        if len(samples) < max(1, min_samples):
+            return None
+        return percentile(samples, pct)
+
+    def get_stats(self) -> Dict[str, float]:
+        """Summary of all recent samples."""
+        with self._lock:
+            samples = list(self._overall)
+            keys = len(self._by_key)
+        return {**summarize_latencies(samples), "keys": keys}
@@ -0,0 +1,94 @@
+"""
+Compact projection of PageSpeed Insights results.
+Keeps failing audits, opportunities and run metadata so the multi-megabyte raw payload need not be retained.
+"""
+
+from typing import Any, Dict, List, Optional, Tuple
+
+# Audits scoring below this (0-1 scale) count as failing, as in the Lighthouse report
+FAILING_SCORE_THRESHOLD = 0.9
+
+# Display modes whose score is meaningful; informative/manual/notApplicable are not
+SCORED_DISPLAY_MODES = frozenset({"binary", "numeric", "metricSavings"})
+
+
+def audit_savings(audit: Dict[str, Any]) -> Tuple[Optional[float], Optional[int]]:
+    """
+    Estimated savings of an audit.
+
+    Returns:
+        ``(milliseconds, bytes)``; either is None when the audit reports none.
+        Milliseconds fall back to the largest ``metricSavings`` value on
+        Lighthouse versions that no longer report ``overallSavingsMs``.
+    """
+    details = audit.get("details") or {}
+    savings_ms = details.get("overallSavingsMs")
+    if savings_ms is None:
+        metric_savings = [
+            value
+            for value in (audit.get("metricSavings") or {}).values()
+            if isinstance(value, (int, float))
+        ]
+        savings_ms = max(metric_savings) if metric_savings else None
+    savings_bytes = details.get("overallSavingsBytes")
+    return (
+        float(savings_ms) if savings_ms is not None else None,
+        int(savings_bytes) if savings_bytes is not None else None,
+    )
+
+
+def project_audit_result(
+    audit_data: Dict[str, Any], max_items: int = 20
+) -> Dict[str, Any]:
+    """
+    Extract the parts of a PageSpeed Insights response worth keeping.
+
+    Args:
+        audit_data: Full ``runPagespeed`` response
+        max_items: Maximum failing audits and opportunities to keep, worst
+            and largest first
+
+    Returns:
+        Dictionary with run metadata, ``failing_audits``, ``opportunities``
+        and their total ``estimated_savings_ms``
+    """
+    lighthouse = audit_data.get("lighthouseResult") or {}
+    audits = lighthouse.get("audits") or {}
+
+    failing: List[Dict[str, Any]] = []
+    opportunities: List[Dict[str, Any]] = []
+    for audit_id, audit in audits.items():
+        score = audit.get("score")
+        if score is None or audit.get("scoreDisplayMode") not in SCORED_DISPLAY_MODES:
+            continue
+        if score >= FAILING_SCORE_THRESHOLD:
+            continue
+
+        savings_ms, savings_bytes = audit_savings(audit)
+        finding = {
+            "id": audit.get("id", audit_id),
+            "title": audit.get("title"),
+            "score": score,
+            "display_value": audit.get("displayValue"),
+            "savings_ms": savings_ms,
+            "savings_bytes": savings_bytes,
+        }
+        failing.append(finding)
+        details_type = (audit.get("details") or {}).get("type")
+        if details_type == "opportunity" and savings_ms:
+            opportunities.append(finding)
+
+    failing.sort(key=lambda finding: (finding["score"], -(finding["savings_ms"] or 0)))
+    opportunities.sort(key=lambda finding: finding["savings_ms"], reverse=True)
+    opportunities = opportunities[:max_items]
+
+    runtime_error = lighthouse.get("runtimeError") or {}
+    return {
+        "lighthouse_version": lighthouse.get("lighthouseVersion"),
+        "final_url": lighthouse.get("finalDisplayedUrl") or lighthouse.get("finalUrl"),
+        "fetch_time": lighthouse.get("fetchTime"),
+        "runtime_error": runtime_error.get("message"),
+        "failing_audits": failing[:max_items],
+        "opportunities": opportunities,
+        "estimated_savings_ms": sum(finding["savings_ms"] for finding in opportunities),
+    }
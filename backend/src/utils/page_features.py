@@ -0,0 +1,243 @@
+"""
+Page feature index for heuristic website evaluation.
+Extracts everything the heuristic checks need from a parsed page in a single tree traversal.
+"""
+
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Dict, FrozenSet, List, Optional
+
+from bs4 import BeautifulSoup, CData, NavigableString, Tag
+
+# String types that BeautifulSoup's get_text() treats as document text.
+# Script, stylesheet, template and comment strings are excluded.
+TEXT_STRING_TYPES = (NavigableString, CData)
+
+# Tags that count as interactive controls (touch targets / CTA candidates)
+CONTROL_TAGS = ("button", "a", "input")
+
+HEADING_TAGS = ("h1", "h2", "h3", "h4", "h5", "h6")
+
+
+@dataclass
+class Anchor:
+    """A link with an href attribute."""
+
+    text: str
+    href: str
+
+    @property
+    def is_internal(self) -> bool:
+        """Fragment or relative link pointing into the same site."""
+        return self.href.startswith("#") or not self.href.startswith("http")
+
+    @property
+    def is_external(self) -> bool:
+        """Absolute link pointing at another (non-local) host."""
+        return self.href.startswith("http") and not self.href.startswith(
+            "http://localhost"
+        )
+
+
+@dataclass
+class Control:
+    """An interactive element (button, link or input)."""
+
+    name: str
+    string: Optional[str] = None
+    classes: List[str] = field(default_factory=list)
+
+
+@dataclass
+class FormInput:
+    """An input field inside a form."""
+
+    type: str = ""
+    name: str = ""
+
+
+@dataclass
+class Form:
+    """A form with its action, text and input fields."""
+
+    action: str = ""
+    text: str = ""
+    inputs: List[FormInput] = field(default_factory=list)
+
+
+@dataclass
+class PageFeatures:
+    """
+    Pre-extracted page index shared by all heuristic checks.
+
+    ``text`` is the lower-cased document text as returned by
+    ``BeautifulSoup.get_text()`` (script and style contents excluded).
+    ``attribute_values`` flattens every attribute value on the page, with
+    multi-valued attributes such as ``class`` split into individual tokens.
+    """
+
+    text: str = ""
+    anchors: List[Anchor] = field(default_factory=list)
+    controls: List[Control] = field(default_factory=list)
+    image_alts: List[Optional[str]] = field(default_factory=list)
+    forms: List[Form] = field(default_factory=list)
+    meta_tags: List[Dict[str, str]] = field(default_factory=list)
+    headings: List[str] = field(default_factory=list)
+    script_types: List[Optional[str]] = field(default_factory=list)
+    link_media: List[str] = field(default_factory=list)
+    style_texts: List[str] = field(default_factory=list)
+    attribute_names: FrozenSet[str] = frozenset()
+    attribute_values: List[str] = field(default_factory=list)
+    element_counts: Dict[str, int] = field(default_factory=dict)
+
+    def find_meta(self, name: str) -> Optional[Dict[str, str]]:
+        """Return the first meta tag whose ``name`` attribute equals ``name``."""
+        for meta in self.meta_tags:
+            if meta.get("name") == name:
+                return meta
+        return None
+
+    def count(self, *tag_names: str) -> int:
+        """Number of elements with any of the given tag names."""
+        return sum(self.element_counts.get(name, 0) for name in tag_names)
+
+
+def extract_page_features(soup: BeautifulSoup) -> PageFeatures:
+    """
+    Build a PageFeatures index from a parsed document.
+
+    Walks the tree once, collecting text, links, controls, images, forms,
+    meta tags, headings, scripts and attributes as it goes.
+
+    Args:
+        soup: Parsed BeautifulSoup document
+
+    Returns:
+        PageFeatures for the document
+    """
+    features = PageFeatures()
+    text_parts: List[str] = []
+    attribute_names = set()
+    element_counts: Counter = Counter()
+
+    # Text collectors for the anchors/forms currently being walked
+    open_anchors: List[List[str]] = []
+    open_forms: List[Form] = []
+    open_form_texts: List[List[str]] = []
+
+    # Iterative depth-first walk; each stack entry is (children, on_exit)
+    stack = [(iter(soup.contents), None)]
+    while stack:
+        children, on_exit = stack[-1]
+        node = next(children, None)
+        if node is None:
+            stack.pop()
+            if on_exit is not None:
+                on_exit()
+            continue
+
+        if isinstance(node, NavigableString):
+            if type(node) in TEXT_STRING_TYPES:
+                text_parts.append(node)
+                for parts in open_anchors:
+                    parts.append(node)
+                for parts in open_form_texts:
+                    parts.append(node)
+            continue
+
+        if not isinstance(node, Tag):
+            continue
+
+        name = node.name
+        attrs = node.attrs
+        element_counts[name] += 1
+
+        for attr_name, attr_value in attrs.items():
+            attribute_names.add(attr_name)
+            if isinstance(attr_value, str):
+                features.attribute_values.append(attr_value)
+            elif isinstance(attr_value, list):
+                features.attribute_values.extend(
+                    value for value in attr_value if isinstance(value, str)
+                )
+
+        on_exit = None
+        if name in CONTROL_TAGS:
+            string = node.string
+            features.controls.append(
+                Control(
+                    name=name,
+                    string=str(string) if string is not None else None,
+                    classes=_as_list(attrs.get("class")),
+                )
+            )
+        if name == "a" and attrs.get("href") is not None:
+            anchor_parts: List[str] = []
+            open_anchors.append(anchor_parts)
+            anchor = Anchor(text="", href=attrs["href"])
+            features.anchors.append(anchor)
+            on_exit = _anchor_closer(anchor, anchor_parts, open_anchors)
+        elif name == "form":
+            form = Form(action=attrs.get("action", ""))
+            form_parts: List[str] = []
+            open_forms.append(form)
+            open_form_texts.append(form_parts)
+            features.forms.append(form)
+            on_exit = _form_closer(form, form_parts, open_forms, open_form_texts)
+        elif name == "input":
+            form_input = FormInput(
+                type=attrs.get("type", ""), name=attrs.get("name", "")
+            )
+            for form in open_forms:
+                form.inputs.append(form_input)
+        elif name == "img":
+            features.image_alts.append(attrs.get("alt"))
+        elif name == "meta":
+            features.meta_tags.append(dict(attrs))
+        elif name in HEADING_TAGS:
+            features.headings.append(name)
+        elif name == "script":
+            features.script_types.append(attrs.get("type"))
+        elif name == "link" and attrs.get("media") is not None:
+            features.link_media.append(attrs["media"])
+        elif name == "style":
+            string = node.string
+            if string is not None:
+                features.style_texts.append(str(string))
+
+        stack.append((iter(node.contents), on_exit))
+
+    features.text = "".join(text_parts).lower()
+    features.attribute_names = frozenset(attribute_names)
+    features.element_counts = dict(element_counts)
+    return features
+
+
+def _anchor_closer(anchor: Anchor, parts: List[str], open_anchors: List[List[str]]):
+    def close():
+        anchor.text = "".join(parts)
+        open_anchors.pop()
+
+    return close
+
+
+def _form_closer(
+    form: Form,
+    parts: List[str],
+    open_forms: List[Form],
+    open_form_texts: List[List[str]],
+):
+    def close():
+        form.text = "".join(parts).lower()
+        open_forms.pop()
+        open_form_texts.pop()
+
+    return close
+
+
+def _as_list(value) -> List[str]:
+    if value is None:
+        return []
+    if isinstance(value, str):
+        return [value]
+    return [item for item in value if isinstance(item, str)]
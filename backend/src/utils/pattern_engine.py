@@ -0,0 +1,140 @@
+"""
+Compiled pattern engine for heuristic signal detection.
+Combines named pattern groups into a single alternation so a page is scanned once for every signal.
+"""
+
+import re
+from functools import lru_cache
+from typing import Dict, FrozenSet, Iterable, List, Mapping, Set, Tuple
+
+# Separator used when joining independent text segments (attribute values,
+# link texts) into one scannable string. No heuristic pattern can match a NUL
+# byte, so a match can never span two segments.
+SEGMENT_SEPARATOR = "\x00"
+
+
+class PatternEngine:
+    """
+    Precompiled matcher for groups of signal patterns.
+
+    All unique patterns are combined into one alternation and the input is
+    scanned left to right exactly once. Each time the alternation hits, the
+    patterns matching at that position are identified, their signals recorded,
+    and scanning resumes from the same position with an alternation of only the
+    still-unresolved patterns. Patterns shared by several signals (for example
+    ``review`` used by both CRO testimonials and social proof) are compiled and
+    matched once.
+
+    Matching is case-insensitive: input is lower-cased once per scan, and
+    patterns written in lower case are compiled without ``re.IGNORECASE`` so
+    the regex engine keeps its literal-prefix fast path.
+    """
+
+    def __init__(self, signal_patterns: Mapping[str, Iterable[str]]):
+        self._signal_patterns: Tuple[Tuple[str, Tuple[str, ...]], ...] = tuple(
+            (signal, tuple(patterns)) for signal, patterns in signal_patterns.items()
+        )
+        pattern_signals: Dict[str, Set[str]] = {}
+        for signal, patterns in self._signal_patterns:
+            for pattern in patterns:
+                pattern_signals.setdefault(pattern, set()).add(signal)
+
+        self._patterns: Tuple[str, ...] = tuple(pattern_signals)
+        self._pattern_signals: Tuple[FrozenSet[str], ...] = tuple(
+            frozenset(pattern_signals[pattern]) for pattern in self._patterns
+        )
+        self._flags = (
+            0
+            if all(pattern == pattern.lower() for pattern in self._patterns)
+            else re.IGNORECASE
+        )
+
+    @property
+    def signals(self) -> FrozenSet[str]:
+        """All signal names known to the engine."""
+        return frozenset(signal for signal, _ in self._signal_patterns)
+
+    def scan(self, *segments: str) -> Set[str]:
+        """
+        Return every signal whose patterns match any of the given segments.
+
+        Segments are joined with ``SEGMENT_SEPARATOR`` so that a match can never
+        span two of them, then scanned in a single left-to-right pass.
+        """
+        text = SEGMENT_SEPARATOR.join(segment for segment in segments if segment)
+        hits: Set[str] = set()
+        if not text:
+            return hits
+        text = text.lower()
+
+        unresolved = tuple(range(len(self._patterns)))
+        position = 0
+        while unresolved:
+            match = self._alternation(unresolved).search(text, position)
+            if match is None:
+                break
+
+            # The alternation only reports the first branch that matched, so
+            # check every unresolved pattern at this position to catch
+            # overlapping signals (e.g. "contact sales" vs "\bcontact\b").
+            position = match.start()
+            for index in unresolved:
+                if self._single(index).match(text, position):
+                    hits |= self._pattern_signals[index]
+
+            unresolved = tuple(
+                index
+                for index in unresolved
+                if not self._pattern_signals[index] <= hits
+            )
+
+        return hits
+
+    def _alternation(self, indices: Tuple[int, ...]) -> "re.Pattern[str]":
+        return _compile_alternation(
+            tuple(self._patterns[index] for index in indices), self._flags
+        )
+
+    def _single(self, index: int) -> "re.Pattern[str]":
+        return _compile_alternation((self._patterns[index],), self._flags)
+
+
+@lru_cache(maxsize=512)
+def _compile_alternation(patterns: Tuple[str, ...], flags: int) -> "re.Pattern[str]":
+    """
+    Compile patterns into one non-capturing alternation.
+
+    Capturing (or named) groups around each branch disable the regex engine's
+    literal-prefix scan and make the combined search an order of magnitude
+    slower, so branches are identified separately after a hit instead.
+    """
+    return re.compile("|".join(f"(?:{pattern})" for pattern in patterns), flags)
+
+
+@lru_cache(maxsize=32)
+def _cached_engine(
+    signal_patterns: Tuple[Tuple[str, Tuple[str, ...]], ...]
+) -> PatternEngine:
+    return PatternEngine(dict(signal_patterns))
+
+
+def build_pattern_engine(
+    pattern_groups: Mapping[str, Mapping[str, List[str]]]
+) -> PatternEngine:
+    """
+    Build (or reuse) a pattern engine for namespaced pattern groups.
+
+    Args:
+        pattern_groups: Mapping of namespace to ``{signal: [patterns]}``, e.g.
+            ``{"trust": self.trust_patterns}``. Signals are exposed as
+            ``"<namespace>.<signal>"``.
+
+    Returns:
+        A shared PatternEngine; identical pattern sets reuse the same instance.
+    """
+    signal_patterns = tuple(
+        (f"{namespace}.{signal}", tuple(patterns))
+        for namespace, groups in pattern_groups.items()
+        for signal, patterns in groups.items()
+    )
+    return _cached_engine(signal_patterns)
@@ -0,0 +1,167 @@
+"""
+Compressed store for large JSON payloads such as full PageSpeed Insights results.
+Serialization, compression and the write itself happen on a background thread, off the request path.
+"""
+
+import json
+import sqlite3
+import threading
+import time
+import zlib
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+from src.core.config import get_api_config, get_data_path
+
+COMPRESSION_LEVEL = 6
+
+
+def compress_payload(payload: Any) -> bytes:
+    """Serialize a JSON-compatible payload and zlib-compress it."""
+    data = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    return zlib.compress(data, COMPRESSION_LEVEL)
+
+
+def decompress_payload(blob: bytes) -> Any:
+    """Inverse of ``compress_payload``."""
+    return json.loads(zlib.decompress(blob).decode("utf-8"))
+
+
+class PayloadStore:
+    """
+    SQLite-backed store of compressed payloads keyed by caller-chosen ids.
+
+    ``submit`` queues a write and returns immediately; a single writer thread
+    compresses and stores payloads in submission order. When ``max_entries``
+    is set the oldest payloads are pruned periodically.
+    """
+
+    # Writes between pruning passes
+    PRUNE_INTERVAL = 256
+
+    def __init__(self, path: Union[str, Path], max_entries: Optional[int] = None):
+        self.path = Path(path)
+        self.max_entries = max_entries
+        self.writes = 0
+        self.stored_bytes = 0
+        self.write_errors = 0
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(
+            str(self.path), timeout=30.0, check_same_thread=False, isolation_level=None
+        )
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS payloads "
+            "(key TEXT PRIMARY KEY, data BLOB NOT NULL, stored_at REAL NOT NULL)"
+        )
+        self._db.execute(
+            "CREATE INDEX IF NOT EXISTS payloads_stored_at ON payloads (stored_at)"
+        )
+        self._writer = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="payload-store"
+        )
+        self._last_write: Optional[Future] = None
+
+    def put(self, key: str, payload: Any) -> int:
+        """
+        Compress and store a payload synchronously.
+
+        Returns:
+            Size of the stored, compressed payload in bytes
+        """
+        blob = compress_payload(payload)
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO payloads (key, data, stored_at) "
+                "VALUES (?, ?, ?)",
+                (key, blob, time.time()),
+            )
+            self.writes += 1
+            self.stored_bytes += len(blob)
+            if self.max_entries and self.writes % self.PRUNE_INTERVAL == 0:
+                self._prune()
+        return len(blob)
+
+    def submit(self, key: str, payload: Any) -> str:
+        """
+        Queue a payload for storage on the writer thread.
+
+        The payload must not be mutated afterwards.
+
+        Returns:
+            ``key``, for retrieving the payload later
+        """
+        self._last_write = self._writer.submit(self._put_quietly, key, payload)
+        return key
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the payload stored under ``key``, or None."""
+        with self._lock:
+            row = self._db.execute(
+                "SELECT data FROM payloads WHERE key = ?", (key,)
+            ).fetchone()
+        return decompress_payload(row[0]) if row else None
+
+    def flush(self, timeout: Optional[float] = None) -> None:
+        """Wait until every submitted payload has been written."""
+        if self._last_write is not None:
+            self._last_write.result(timeout)
+
+    def close(self) -> None:
+        """Finish queued writes and close the database."""
+        self._writer.shutdown(wait=True)
+        with self._lock:
+            self._db.close()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get write counters."""
+        with self._lock:
+            entries = self._db.execute("SELECT COUNT(*) FROM payloads").fetchone()[0]
+        return {
+            "path": str(self.path),
+            "entries": entries,
+            "writes": self.writes,
+            "stored_bytes": self.stored_bytes,
+            "write_errors": self.write_errors,
+        }
+
+    def _put_quietly(self, key: str, payload: Any) -> None:
+        # Background writes must never surface in the request that queued them
+        try:
+            self.put(key, payload)
+        except (sqlite3.Error, TypeError, ValueError):
+            self.write_errors += 1
+
+    def _prune(self) -> None:
+        self._db.execute(
+            "DELETE FROM payloads WHERE key NOT IN "
+            "(SELECT key FROM payloads ORDER BY stored_at DESC LIMIT ?)",
+            (self.max_entries,),
+        )
+
+
+_shared_store: Optional[PayloadStore] = None
+
+
+def get_payload_store() -> PayloadStore:
+    """Get the process-wide Lighthouse payload store configured from settings."""
+    global _shared_store
+    if _shared_store is None:
+        config = get_api_config()
+        path = config.LIGHTHOUSE_PAYLOAD_STORE_PATH or get_data_path(
+            "leadgen_lighthouse_payloads.sqlite3", config
+        )
+        _shared_store = PayloadStore(
+            path, max_entries=config.LIGHTHOUSE_PAYLOAD_STORE_MAX_ENTRIES
+        )
+    return _shared_store
+
+
+def close_payload_store() -> None:
+    """Flush and close the process-wide payload store, if it was opened."""
+    global _shared_store
+    if _shared_store is not None:
+        _shared_store.close()
+        _shared_store = None
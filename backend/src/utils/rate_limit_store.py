@@ -0,0 +1,609 @@
+"""
+Storage backends for RateLimiter windows and circuit breakers.
+The in-process store serves one worker; the SQLite and Redis stores share quotas across workers and hosts.
+"""
+
+import hashlib
+import socket
+import sqlite3
+import threading
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Type, Union
+from urllib.parse import urlparse
+
+from src.utils.rate_windows import create_window, sliding_window_usage
+
+CLOSED_BREAKER = {"state": "CLOSED", "failures": 0, "last_failure": None}
+
+
+class RateLimitStoreError(Exception):
+    """Raised when a shared rate-limit store cannot be reached or fails."""
+
+
+class RateLimitStore(ABC):
+    """
+    Request windows and circuit-breaker state for each API.
+
+    ``configure`` is called once per API before any other method. Every
+    method is atomic on its own, so several processes sharing one store
+    count every request exactly once.
+
+    ``blocking`` stores may wait on disk or network I/O; async callers run
+    their calls in a worker thread rather than on the event loop.
+    """
+
+    name: str = ""
+    blocking: bool = True
+
+    def __init__(self):
+        self._windows: Dict[str, float] = {}
+
+    def configure(self, api: str, limit: int, window: float) -> None:
+        """Register ``api`` as allowing ``limit`` requests per ``window`` seconds."""
+        self._windows[api] = window
+
+    @abstractmethod
+    def usage(self, api: str, now: float) -> int:
+        """Requests to ``api`` counted in the window ending at ``now``."""
+
+    @abstractmethod
+    def add(self, api: str, now: float) -> None:
+        """Count one request to ``api`` at ``now``."""
+
+    @abstractmethod
+    def try_add(self, api: str, now: float, limit: int) -> bool:
+        """
+        Count one request to ``api`` only if fewer than ``limit`` are counted.
+
+        The check and the increment are one atomic step, so workers sharing
+        the store can never together exceed ``limit``.
+        """
+
+    @abstractmethod
+    def discard(self, api: str, at: float) -> None:
+        """Uncount a request counted at ``at`` that was never made."""
+
+    def reset_at(self, api: str, now: float) -> float:
+        """Epoch time at which the current window ends."""
+        window = self._windows[api]
+        return now - now % window + window
+
+    @abstractmethod
+    def get_breaker(self, api: str) -> Dict[str, Any]:
+        """Circuit breaker ``state``, ``failures`` and ``last_failure`` of ``api``."""
+
+    @abstractmethod
+    def set_breaker(
+        self, api: str, state: str, failures: int, last_failure: Optional[float]
+    ) -> None:
+        """Overwrite the circuit breaker of ``api``."""
+
+    @abstractmethod
+    def record_failure(self, api: str, now: float, threshold: int) -> Dict[str, Any]:
+        """Count a failure, opening the breaker at ``threshold``; return the breaker."""
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Forget every window and close every breaker."""
+
+    def close(self) -> None:
+        """Release connections held by the store."""
+
+    def _bucket(self, api: str, now: float) -> Tuple[float, float]:
+        """Start of the current bucket and the window width of ``api``."""
+        window = self._windows[api]
+        return now - now % window, window
+
+
+class MemoryRateLimitStore(RateLimitStore):
+    """
+    Per-process store, counting each API with a window from ``rate_windows``.
+
+    Limits are enforced per worker, so N workers together allow N times the
+    configured quota. ``engine`` picks the window implementation.
+    """
+
+    name = "memory"
+    blocking = False
+
+    def __init__(self, engine: str = "sliding_window"):
+        super().__init__()
+        self.engine = engine
+        self._counters: Dict[str, Any] = {}
+        self._breakers: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def configure(self, api: str, limit: int, window: float) -> None:
+        super().configure(api, limit, window)
+        self._counters[api] = create_window(self.engine, limit, window)
+
+    def usage(self, api: str, now: float) -> int:
+        with self._lock:
+            return self._counters[api].usage(now)
+
+    def add(self, api: str, now: float) -> None:
+        with self._lock:
+            self._counters[api].add(now)
+
+    def try_add(self, api: str, now: float, limit: int) -> bool:
+        with self._lock:
+            counter = self._counters[api]
+            if counter.usage(now) >= limit:
+                return False
+            counter.add(now)
+            return True
+
+    def discard(self, api: str, at: float) -> None:
+        with self._lock:
+            self._counters[api].discard(at)
+
+    def reset_at(self, api: str, now: float) -> float:
+        with self._lock:
+            return self._counters[api].reset_at(now)
+
+    def get_breaker(self, api: str) -> Dict[str, Any]:
+        with self._lock:
+            return dict(self._breakers.get(api, CLOSED_BREAKER))
+
+    def set_breaker(
+        self, api: str, state: str, failures: int, last_failure: Optional[float]
+    ) -> None:
+        with self._lock:
+            self._breakers[api] = {
+                "state": state,
+                "failures": failures,
+                "last_failure": last_failure,
+            }
+
+    def record_failure(self, api: str, now: float, threshold: int) -> Dict[str, Any]:
+        with self._lock:
+            breaker = self._breakers.setdefault(api, dict(CLOSED_BREAKER))
+            breaker["failures"] += 1
+            breaker["last_failure"] = now
+            if breaker["failures"] >= threshold:
+                breaker["state"] = "OPEN"
+            return dict(breaker)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._breakers.clear()
+            for api, counter in self._counters.items():
+                self._counters[api] = create_window(
+                    self.engine, counter.limit, counter.window
+                )
+
+
+class SQLiteRateLimitStore(RateLimitStore):
+    """
+    Store shared by every process on one host through a SQLite file.
+
+    Requests are counted in two-bucket sliding windows. Each update runs in
+    its own ``BEGIN IMMEDIATE`` transaction, so concurrent workers
+    serialize on the database write lock and no request is lost.
+    """
+
+    name = "sqlite"
+
+    def __init__(self, path: Union[str, Path]):
+        super().__init__()
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(
+            str(self.path), timeout=30.0, check_same_thread=False, isolation_level=None
+        )
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS rate_limit_buckets ("
+            "api TEXT NOT NULL, start REAL NOT NULL, count INTEGER NOT NULL, "
+            "PRIMARY KEY (api, start)) WITHOUT ROWID"
+        )
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS circuit_breakers ("
+            "api TEXT PRIMARY KEY, state TEXT NOT NULL, "
+            "failures INTEGER NOT NULL, last_failure REAL)"
+        )
+
+    def _counts(self, api: str, start: float, window: float) -> Tuple[int, int]:
+        rows = dict(
+            self._db.execute(
+                "SELECT start, count FROM rate_limit_buckets "
+                "WHERE api = ? AND start IN (?, ?)",
+                (api, start - window, start),
+            ).fetchall()
+        )
+        return rows.get(start - window, 0), rows.get(start, 0)
+
+    def usage(self, api: str, now: float) -> int:
+        start, window = self._bucket(api, now)
+        with self._lock:
+            previous, current = self._counts(api, start, window)
+        return sliding_window_usage(previous, current, now - start, window)
+
+    def add(self, api: str, now: float) -> None:
+        start, window = self._bucket(api, now)
+        with self._lock, self._transaction():
+            self._increment(api, start, window)
+
+    def try_add(self, api: str, now: float, limit: int) -> bool:
+        start, window = self._bucket(api, now)
+        # Reading inside the write transaction keeps other workers out
+        # between the check and the increment
+        with self._lock, self._transaction():
+            previous, current = self._counts(api, start, window)
+            if sliding_window_usage(previous, current, now - start, window) >= limit:
+                return False
+            self._increment(api, start, window)
+        return True
+
+    def discard(self, api: str, at: float) -> None:
+        start, _ = self._bucket(api, at)
+        with self._lock, self._transaction():
+            self._db.execute(
+                "UPDATE rate_limit_buckets SET count = count - 1 "
+                "WHERE api = ? AND start = ? AND count > 0",
+                (api, start),
+            )
+
+    def _increment(self, api: str, start: float, window: float) -> None:
+        self._db.execute(
+            "INSERT INTO rate_limit_buckets (api, start, count) VALUES (?, ?, 1) "
+            "ON CONFLICT (api, start) DO UPDATE SET count = count + 1",
+            (api, start),
+        )
+        self._db.execute(
+            "DELETE FROM rate_limit_buckets WHERE api = ? AND start < ?",
+            (api, start - window),
+        )
+
+    def get_breaker(self, api: str) -> Dict[str, Any]:
+        with self._lock:
+            return self._breaker(api)
+
+    def set_breaker(
+        self, api: str, state: str, failures: int, last_failure: Optional[float]
+    ) -> None:
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO circuit_breakers "
+                "(api, state, failures, last_failure) VALUES (?, ?, ?, ?)",
+                (api, state, failures, last_failure),
+            )
+
+    def record_failure(self, api: str, now: float, threshold: int) -> Dict[str, Any]:
+        with self._lock, self._transaction():
+            breaker = self._breaker(api)
+            breaker["failures"] += 1
+            breaker["last_failure"] = now
+            if breaker["failures"] >= threshold:
+                breaker["state"] = "OPEN"
+            self._db.execute(
+                "INSERT OR REPLACE INTO circuit_breakers "
+                "(api, state, failures, last_failure) VALUES (?, ?, ?, ?)",
+                (api, breaker["state"], breaker["failures"], now),
+            )
+        return breaker
+
+    def clear(self) -> None:
+        with self._lock, self._transaction():
+            self._db.execute("DELETE FROM rate_limit_buckets")
+            self._db.execute("DELETE FROM circuit_breakers")
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
+
+    def _breaker(self, api: str) -> Dict[str, Any]:
+        row = self._db.execute(
+            "SELECT state, failures, last_failure FROM circuit_breakers WHERE api = ?",
+            (api,),
+        ).fetchone()
+        if row is None:
+            return dict(CLOSED_BREAKER)
+        return {"state": row[0], "failures": row[1], "last_failure": row[2]}
+
+    def _transaction(self) -> "_ImmediateTransaction":
+        return _ImmediateTransaction(self._db)
+
+
+class _ImmediateTransaction:
+    """Take the database write lock up front, committing or rolling back on exit."""
+
+    def __init__(self, db: sqlite3.Connection):
+        self._db = db
+
+    def __enter__(self) -> None:
+        self._db.execute("BEGIN IMMEDIATE")
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self._db.execute("ROLLBACK" if exc_type else "COMMIT")
+
+
+class RedisConnection:
+    """
+    Minimal blocking Redis client speaking RESP2 over one socket.
+
+    Commands are serialized by a lock. A connection that fails while the
+    command is being sent is reopened once before the error is raised. A
+    reply lost after sending is never retried, since the command may
+    already have run and most of the store's scripts are not idempotent.
+    """
+
+    def __init__(self, url: str, timeout: float = 5.0):
+        parsed = urlparse(url)
+        if parsed.scheme not in ("redis", ""):
+            raise ValueError(f"Unsupported Redis URL scheme: {parsed.scheme}")
+        self.host = parsed.hostname or "localhost"
+        self.port = parsed.port or 6379
+        self.password = parsed.password
+        self.db = int((parsed.path or "/0").lstrip("/") or 0)
+        self.timeout = timeout
+        self._sock: Optional[socket.socket] = None
+        self._reader = None
+        self._lock = threading.Lock()
+
+    def execute(self, *args: Any) -> Any:
+        """Send one command and return its decoded reply."""
+        with self._lock:
+            for attempt in (1, 2):
+                try:
+                    if self._sock is None:
+                        self._connect()
+                    self._send(args)
+                    break
+                except OSError as e:
+                    self._disconnect()
+                    if attempt == 2:
+                        raise RateLimitStoreError(f"Redis unavailable: {e}") from e
+            try:
+                return self._read()
+            except OSError as e:
+                self._disconnect()
+                raise RateLimitStoreError(f"Redis reply lost: {e}") from e
+
+    def close(self) -> None:
+        with self._lock:
+            self._disconnect()
+
+    def _connect(self) -> None:
+        self._sock = socket.create_connection((self.host, self.port), self.timeout)
+        self._reader = self._sock.makefile("rb")
+        if self.password:
+            self._send(("AUTH", self.password))
+            self._read()
+        if self.db:
+            self._send(("SELECT", self.db))
+            self._read()
+
+    def _disconnect(self) -> None:
+        if self._sock is not None:
+            self._reader.close()
+            self._sock.close()
+        self._sock = None
+        self._reader = None
+
+    def _send(self, args: Sequence[Any]) -> None:
+        parts = [b"*%d\r\n" % len(args)]
+        for arg in args:
+            data = arg if isinstance(arg, bytes) else str(arg).encode()
+            parts.append(b"$%d\r\n%s\r\n" % (len(data), data))
+        self._sock.sendall(b"".join(parts))
+
+    def _read(self) -> Any:
+        line = self._reader.readline()
+        if not line:
+            raise ConnectionError("Connection closed by server")
+        kind, body = line[:1], line[1:-2]
+        if kind == b"+":
+            return body.decode()
+        if kind == b"-":
+            raise RateLimitStoreError(body.decode())
+        if kind == b":":
+            return int(body)
+        if kind == b"$":
+            size = int(body)
+            if size < 0:
+                return None
+            return self._reader.read(size + 2)[:-2].decode()
+        if kind == b"*":
+            size = int(body)
+            return None if size < 0 else [self._read() for _ in range(size)]
+        raise RateLimitStoreError(f"Unexpected Redis reply: {line!r}")
+
+
+class RedisScript:
+    """Lua script run by EVALSHA, falling back to EVAL when the server lacks it."""
+
+    def __init__(self, source: str):
+        self.source = source
+        self.sha = hashlib.sha1(source.encode()).hexdigest()
+
+    def __call__(
+        self, connection: RedisConnection, keys: Sequence[str], args: Sequence[Any]
+    ) -> Any:
+        try:
+            return connection.execute("EVALSHA", self.sha, len(keys), *keys, *args)
+        except RateLimitStoreError as e:
+            if not str(e).startswith("NOSCRIPT"):
+                raise
+        return connection.execute("EVAL", self.source, len(keys), *keys, *args)
+
+
+# KEYS: current bucket, previous bucket. ARGV: bucket expiry in seconds
+ADD_SCRIPT = RedisScript(
+    """
+local current = redis.call('INCR', KEYS[1])
+if current == 1 then
+    redis.call('EXPIRE', KEYS[1], ARGV[1])
+end
+local previous = tonumber(redis.call('GET', KEYS[2]) or '0')
+return {previous, current}
+"""
+)
+
+# KEYS: current bucket, previous bucket.
+# ARGV: limit, seconds into the current bucket, window, bucket expiry in seconds.
+# Same estimate as rate_windows.sliding_window_usage, checked and counted at once.
+TRY_ADD_SCRIPT = RedisScript(
+    """
+local current = tonumber(redis.call('GET', KEYS[1]) or '0')
+local previous = tonumber(redis.call('GET', KEYS[2]) or '0')
+local overlap = 1 - tonumber(ARGV[2]) / tonumber(ARGV[3])
+local used = math.ceil(previous * overlap + current - 1e-9)
+if used >= tonumber(ARGV[1]) then
+    return 0
+end
+if redis.call('INCR', KEYS[1]) == 1 then
+    redis.call('EXPIRE', KEYS[1], ARGV[4])
+end
+return 1
+"""
+)
+
+# KEYS: bucket the request was counted in. Expired buckets are left alone.
+DISCARD_SCRIPT = RedisScript(
+    """
+if tonumber(redis.call('GET', KEYS[1]) or '0') > 0 then
+    return redis.call('DECR', KEYS[1])
+end
+return 0
+"""
+)
+
+# KEYS: breaker hash. ARGV: failure time, threshold
+RECORD_FAILURE_SCRIPT = RedisScript(
+    """
+local failures = redis.call('HINCRBY', KEYS[1], 'failures', 1)
+redis.call('HSET', KEYS[1], 'last_failure', ARGV[1])
+if failures >= tonumber(ARGV[2]) then
+    redis.call('HSET', KEYS[1], 'state', 'OPEN')
+end
+return redis.call('HGETALL', KEYS[1])
+"""
+)
+
+class RedisRateLimitStore(RateLimitStore):
+    """
+    Store shared by every worker on every host through Redis.
+
+    Each bucket of a two-bucket sliding window is an integer key that
+    expires after two windows; each breaker is a hash. Updates that read
+    and write run as Lua scripts, so they are atomic on the server. Bucket
+    boundaries come from the callers' clocks, which must be kept in sync.
+    """
+
+    name = "redis"
+
+    def __init__(
+        self,
+        url: str = "redis://localhost:6379/0",
+        prefix: str = "leadgen:ratelimit",
+        timeout: float = 5.0,
+    ):
+        super().__init__()
+        self.prefix = prefix
+        self._redis = RedisConnection(url, timeout)
+
+    def _bucket_keys(self, api: str, now: float) -> Tuple[List[str], float, float]:
+        start, window = self._bucket(api, now)
+        keys = [
+            f"{self.prefix}:{api}:{start:.0f}",
+            f"{self.prefix}:{api}:{start - window:.0f}",
+        ]
+        return keys, start, window
+
+    def usage(self, api: str, now: float) -> int:
+        keys, start, window = self._bucket_keys(api, now)
+        current, previous = self._redis.execute("MGET", *keys)
+        return sliding_window_usage(
+            int(previous or 0), int(current or 0), now - start, window
+        )
+
+    def add(self, api: str, now: float) -> None:
+        keys, _, window = self._bucket_keys(api, now)
+        ADD_SCRIPT(self._redis, keys, [int(window * 2) + 1])
+
+    def try_add(self, api: str, now: float, limit: int) -> bool:
+        keys, start, window = self._bucket_keys(api, now)
+        args = [limit, repr(max(0.0, now - start)), repr(window), int(window * 2) + 1]
+        return TRY_ADD_SCRIPT(self._redis, keys, args) == 1
+
+    def discard(self, api: str, at: float) -> None:
+        keys, _, _ = self._bucket_keys(api, at)
+        DISCARD_SCRIPT(self._redis, keys[:1], [])
+
+    def get_breaker(self, api: str) -> Dict[str, Any]:
+        return self._parse_breaker(
+            self._redis.execute("HGETALL", f"{self.prefix}:breaker:{api}")
+        )
+
+    def set_breaker(
+        self, api: str, state: str, failures: int, last_failure: Optional[float]
+    ) -> None:
+        self._redis.execute(
+            "HSET",
+            f"{self.prefix}:breaker:{api}",
+            "state",
+            state,
+            "failures",
+            failures,
+            "last_failure",
+            "" if last_failure is None else repr(last_failure),
+        )
+
+    def record_failure(self, api: str, now: float, threshold: int) -> Dict[str, Any]:
+        reply = RECORD_FAILURE_SCRIPT(
+            self._redis, [f"{self.prefix}:breaker:{api}"], [repr(now), threshold]
+        )
+        return self._parse_breaker(reply)
+
+    def clear(self) -> None:
+        # SCAN walks the keyspace in small steps; KEYS would block the server
+        cursor = "0"
+        while True:
+            cursor, keys = self._redis.execute(
+                "SCAN", cursor, "MATCH", f"{self.prefix}:*", "COUNT", 500
+            )
+            if keys:
+                self._redis.execute("DEL", *keys)
+            if cursor == "0":
+                break
+
+    def close(self) -> None:
+        self._redis.close()
+
+    @staticmethod
+    def _parse_breaker(reply: Optional[List[str]]) -> Dict[str, Any]:
+        fields = dict(zip(reply[::2], reply[1::2])) if reply else {}
+        return {
+            "state": fields.get("state") or "CLOSED",
+            "failures": int(fields.get("failures") or 0),
+            "last_failure": float(fields["last_failure"])
+            if fields.get("last_failure")
+            else None,
+        }
+
+
+# Registry of stores, selectable by name from configuration
+RATE_LIMIT_STORES: Dict[str, Type[RateLimitStore]] = {
+    MemoryRateLimitStore.name: MemoryRateLimitStore,
+    SQLiteRateLimitStore.name: SQLiteRateLimitStore,
+    RedisRateLimitStore.name: RedisRateLimitStore,
+}
+
+
+def create_rate_limit_store(name: str, **kwargs) -> RateLimitStore:
+    """
+    Instantiate a registered rate-limit store.
+
+    Raises:
+        ValueError: If no store is registered under ``name``
+    """
+    store_class = RATE_LIMIT_STORES.get(name)
+    if store_class is None:
+        raise ValueError(
+            f"Unknown rate limit store '{name}'. "
+            f"Available stores: {', '.join(sorted(RATE_LIMIT_STORES))}"
+        )
+    return store_class(**kwargs)
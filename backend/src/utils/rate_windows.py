@@ -0,0 +1,170 @@
+"""
+Request-counting windows behind RateLimiter.
+Each engine answers "how many requests in the last window?" and "when does it free up?" for one API.
+"""
+
+import math
+import time
+from typing import List
+
+from src.utils.token_bucket import TokenBucket
+
+# Guards ceil() against float noise such as 2.0000000000000004
+_EPSILON = 1e-9
+
+
+def sliding_window_usage(
+    previous: int, current: int, elapsed: float, window: float
+) -> int:
+    """
+    Estimated requests in the last ``window`` seconds from two bucket counts.
+
+    ``elapsed`` is how far ``now`` is into the current bucket; the previous
+    bucket counts in proportion to how much of it the window still covers.
+    """
+    overlap = 1.0 - elapsed / window
+    return math.ceil(previous * overlap + current - _EPSILON)
+
+
+class SlidingWindowCounter:
+    """
+    Two-bucket sliding-window counter.
+
+    Requests are counted in fixed buckets of ``window`` seconds aligned to the
+    epoch. The usage over the last ``window`` seconds is estimated as the
+    current bucket plus the previous bucket weighted by how much of it still
+    overlaps the sliding window. Checks and updates are O(1) in time and
+    memory, whatever the request rate.
+    """
+
+    def __init__(self, limit: int, window: float):
+        self.limit = limit
+        self.window = window
+        self._start = 0.0
+        self._current = 0
+        self._previous = 0
+
+    def _roll(self, now: float) -> None:
+        start = now - now % self.window
+        if start <= self._start:
+            # Late timestamps from racing threads count in the current bucket
+            return
+        # The previous bucket only counts while it is the adjacent one
+        adjacent = start - self._start == self.window
+        self._previous = self._current if adjacent else 0
+        self._current = 0
+        self._start = start
+
+    def usage(self, now: float) -> int:
+        self._roll(now)
+        return sliding_window_usage(
+            self._previous,
+            self._current,
+            max(0.0, now - self._start),
+            self.window,
+        )
+
+    def add(self, now: float) -> None:
+        self._roll(now)
+        self._current += 1
+
+    def discard(self, at: float) -> None:
+        # Only buckets still counted can give the request back
+        if at >= self._start:
+            self._current = max(0, self._current - 1)
+        elif at >= self._start - self.window:
+            self._previous = max(0, self._previous - 1)
+
+    def reset_at(self, now: float) -> float:
+        self._roll(now)
+        return self._start + self.window
+
+
+class TokenBucketWindow:
+    """
+    Token bucket holding ``limit`` tokens that refills over ``window`` seconds.
+
+    Every recorded request spends a token, failed ones included, so the
+    balance can go negative; usage is the number of tokens missing from a
+    full bucket. Unlike the window counters it refills smoothly instead of
+    in one step.
+    """
+
+    def __init__(self, limit: int, window: float):
+        self.limit = limit
+        self.window = window
+        self._now = time.time()
+        self._bucket = TokenBucket(limit / window, limit, clock=self._clock)
+
+    def _clock(self) -> float:
+        return self._now
+
+    def usage(self, now: float) -> int:
+        self._now = now
+        return max(0, math.ceil(self.limit - self._bucket.tokens - _EPSILON))
+
+    def add(self, now: float) -> None:
+        self._now = now
+        self._bucket.spend()
+
+    def discard(self, at: float) -> None:
+        self._bucket.refund()
+
+    def reset_at(self, now: float) -> float:
+        self._now = now
+        missing = self.limit - self._bucket.tokens
+        return now + max(0.0, missing) / self._bucket.rate
+
+
+class ExactWindow:
+    """
+    Sliding window keeping the timestamp of every request.
+
+    Exact, but a check costs O(requests in the window) in time and memory.
+    Kept for comparison and for limits low enough that this does not matter.
+    """
+
+    def __init__(self, limit: int, window: float):
+        self.limit = limit
+        self.window = window
+        self._requests: List[float] = []
+        self._last_reset = time.time()
+
+    def _cleanup(self, now: float) -> None:
+        window_start = now - self.window
+        self._requests = [t for t in self._requests if t >= window_start]
+        if now - self._last_reset >= self.window:
+            self._last_reset = now
+
+    def usage(self, now: float) -> int:
+        self._cleanup(now)
+        return len(self._requests)
+
+    def add(self, now: float) -> None:
+        self._requests.append(now)
+
+    def discard(self, at: float) -> None:
+        if at in self._requests:
+            self._requests.remove(at)
+
+    def reset_at(self, now: float) -> float:
+        self._cleanup(now)
+        return self._last_reset + self.window
+
+
+ENGINES = {
+    "sliding_window": SlidingWindowCounter,
+    "token_bucket": TokenBucketWindow,
+    "exact": ExactWindow,
+}
+
+
+def create_window(engine: str, limit: int, window: float):
+    """Build the ``engine`` window for ``limit`` requests per ``window`` seconds."""
+    try:
+        return ENGINES[engine](limit, window)
+    except KeyError:
+        raise ValueError(
+            f"Unknown rate limiter engine {engine!r}; "
+            f"expected one of {', '.join(ENGINES)}"
+        ) from None
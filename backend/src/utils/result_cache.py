@@ -0,0 +1,262 @@
+"""
+Two-tier cache for computed results.
+An in-process LRU tier sits in front of an optional pluggable persistent tier such as SQLite.
+"""
+
+import asyncio
+import json
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional, Type, Union
+
+
+class CacheBackend(ABC):
+    """Key/value store for JSON-serializable results."""
+
+    name: str = ""
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[Any]:
+        """Return the value stored under ``key``, or None."""
+
+    @abstractmethod
+    def set(self, key: str, value: Any) -> None:
+        """Store ``value`` under ``key``, replacing any previous value."""
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        """Remove ``key`` if present."""
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Remove every entry."""
+
+    def __len__(self) -> int:
+        return 0
+
+
+class MemoryCacheBackend(CacheBackend):
+    """Thread-safe in-process LRU cache holding at most ``max_entries`` values."""
+
+    name = "memory"
+
+    def __init__(self, max_entries: int = 10_000):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any) -> None:
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class SQLiteCacheBackend(CacheBackend):
+    """
+    Persistent cache in a SQLite database.
+
+    Values are stored as JSON. When ``max_entries`` is set the oldest writes
+    are pruned periodically so the table stays bounded.
+    """
+
+    name = "sqlite"
+
+    # Writes between pruning passes
+    PRUNE_INTERVAL = 256
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        table: str = "results",
+        max_entries: Optional[int] = None,
+    ):
+        if not table.isidentifier():
+            raise ValueError(f"Invalid table name: {table}")
+        self.path = Path(path)
+        self.table = table
+        self.max_entries = max_entries
+        self._writes = 0
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(
+            str(self.path), timeout=30.0, check_same_thread=False, isolation_level=None
+        )
+        self._db.execute(
+            f"CREATE TABLE IF NOT EXISTS {table} "
+            "(key TEXT PRIMARY KEY, value TEXT NOT NULL, stored_at REAL NOT NULL)"
+        )
+        self._db.execute(
+            f"CREATE INDEX IF NOT EXISTS {table}_stored_at ON {table} (stored_at)"
+        )
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            row = self._db.execute(
+                f"SELECT value FROM {self.table} WHERE key = ?", (key,)
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def set(self, key: str, value: Any) -> None:
+        data = json.dumps(value, separators=(",", ":"))
+        with self._lock:
+            self._db.execute(
+                f"INSERT OR REPLACE INTO {self.table} (key, value, stored_at) "
+                "VALUES (?, ?, ?)",
+                (key, data, time.time()),
+            )
+            self._writes += 1
+            if self.max_entries and self._writes % self.PRUNE_INTERVAL == 0:
+                self._prune()
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._db.execute(f"DELETE FROM {self.table} WHERE key = ?", (key,))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._db.execute(f"DELETE FROM {self.table}")
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._db.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._db.execute(f"SELECT COUNT(*) FROM {self.table}").fetchone()[0]
+
+    def _prune(self) -> None:
+        self._db.execute(
+            f"DELETE FROM {self.table} WHERE key NOT IN "
+            f"(SELECT key FROM {self.table} ORDER BY stored_at DESC LIMIT ?)",
+            (self.max_entries,),
+        )
+
+
+class TieredCache:
+    """
+    In-process LRU in front of an optional persistent backend.
+
+    Lookups try memory first, then the persistent tier; persistent hits are
+    promoted into memory. Writes go to both tiers.
+    """
+
+    def __init__(
+        self,
+        memory: Optional[MemoryCacheBackend] = None,
+        persistent: Optional[CacheBackend] = None,
+    ):
+        self.memory = memory if memory is not None else MemoryCacheBackend()
+        self.persistent = persistent
+        self.memory_hits = 0
+        self.persistent_hits = 0
+        self.misses = 0
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value for ``key``, or None."""
+        value = self.memory.get(key)
+        if value is not None:
+            self.memory_hits += 1
+            return value
+
+        if self.persistent is not None:
+            value = self.persistent.get(key)
+            if value is not None:
+                self.persistent_hits += 1
+                self.memory.set(key, value)
+                return value
+
+        self.misses += 1
+        return None
+
+    def set(self, key: str, value: Any) -> None:
+        """Store ``value`` in every tier."""
+        self.memory.set(key, value)
+        if self.persistent is not None:
+            self.persistent.set(key, value)
+
+    async def get_async(self, key: str) -> Optional[Any]:
+        """``get`` for coroutines; the persistent tier is read in a worker thread."""
+        value = self.memory.get(key)
+        if value is not None:
+            self.memory_hits += 1
+            return value
+        if self.persistent is None:
+            self.misses += 1
+            return None
+        return await asyncio.to_thread(self.get, key)
+
+    async def set_async(self, key: str, value: Any) -> None:
+        """``set`` for coroutines; the persistent tier is written in a worker thread."""
+        self.memory.set(key, value)
+        if self.persistent is not None:
+            await asyncio.to_thread(self.persistent.set, key, value)
+
+    def clear(self) -> None:
+        """Empty every tier."""
+        self.memory.clear()
+        if self.persistent is not None:
+            self.persistent.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get hit/miss counters per tier."""
+        return {
+            "memory_entries": len(self.memory),
+            "persistent_backend": self.persistent.name if self.persistent else None,
+            "memory_hits": self.memory_hits,
+            "persistent_hits": self.persistent_hits,
+            "misses": self.misses,
+        }
+
+
+# Registry of persistent tiers, selectable by name from configuration
+CACHE_BACKENDS: Dict[str, Type[CacheBackend]] = {
+    SQLiteCacheBackend.name: SQLiteCacheBackend,
+}
+
+
+def register_cache_backend(backend_class: Type[CacheBackend]) -> Type[CacheBackend]:
+    """Register a persistent cache backend under its ``name``."""
+    CACHE_BACKENDS[backend_class.name] = backend_class
+    return backend_class
+
+
+def create_cache_backend(name: str, **kwargs) -> CacheBackend:
+    """
+    Instantiate a registered persistent cache backend.
+
+    Raises:
+        ValueError: If no backend is registered under ``name``
+    """
+    backend_class = CACHE_BACKENDS.get(name)
+    if backend_class is None:
+        raise ValueError(
+            f"Unknown cache backend '{name}'. "
+            f"Available backends: {', '.join(sorted(CACHE_BACKENDS))}"
+        )
+    return backend_class(**kwargs)
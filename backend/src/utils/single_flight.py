@@ -0,0 +1,187 @@
+"""
+Single-flight execution shared by the scoring services.
+Concurrent calls with the same key wait for one execution and share its result, in asyncio and in threads.
+"""
+
+import asyncio
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple, TypeVar
+
+from src.utils.urls import normalize_url
+
+T = TypeVar("T")
+
+
+def flight_key(service: str, url: str, **options: Any) -> Tuple[Hashable, ...]:
+    """
+    Key identifying identical work: the service, normalized URL and options.
+
+    Options are sorted by name so keyword order does not matter; values must
+    be hashable.
+    """
+    return (service, normalize_url(url), *sorted(options.items()))
+
+
+@dataclass
+class FlightStats:
+    """Counters for one key namespace (usually a service name)."""
+
+    calls: int = 0
+    executions: int = 0
+    deduplicated: int = 0
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "executions": self.executions,
+            "deduplicated": self.deduplicated,
+            "dedup_ratio": self.deduplicated / self.calls if self.calls else 0.0,
+        }
+
+
+@dataclass
+class _AsyncCall:
+    task: asyncio.Task
+    waiters: int = 0
+
+
+@dataclass
+class _SyncCall:
+    done: threading.Event = field(default_factory=threading.Event)
+    result: Any = None
+    error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """
+    Deduplicates concurrent executions of the same keyed work.
+
+    The first caller for a key runs the work; callers arriving while it is in
+    flight wait for and share its result or exception. Nothing is cached:
+    once the work finishes the next call runs it again.
+
+    Coroutine calls are coalesced per event loop. The shared task is
+    shielded, so a waiter being cancelled does not cancel the work for the
+    others; it is cancelled only when its last waiter is. Blocking calls are
+    coalesced across threads.
+    """
+
+    def __init__(self):
+        self._tasks: Dict[Tuple[asyncio.AbstractEventLoop, Hashable], _AsyncCall] = {}
+        self._calls: Dict[Hashable, _SyncCall] = {}
+        self._lock = threading.Lock()
+        self._stats: Dict[str, FlightStats] = {}
+
+    async def do(
+        self, key: Hashable, work: Callable[[], Awaitable[T]]
+    ) -> Tuple[T, bool]:
+        """
+        Run ``work`` unless an identical call is already in flight.
+
+        Args:
+            key: Identity of the work, e.g. from ``flight_key``
+            work: Coroutine factory, only called by the first caller
+
+        Returns:
+            ``(result, shared)`` where ``shared`` is true if this call waited
+            for another caller's execution
+        """
+        loop = asyncio.get_running_loop()
+        call = self._tasks.get((loop, key))
+        shared = call is not None and not call.task.done()
+        if not shared:
+            call = _AsyncCall(loop.create_task(self._run_async(loop, key, work)))
+            self._tasks[(loop, key)] = call
+        self._record(key, shared)
+
+        call.waiters += 1
+        try:
+            return await asyncio.shield(call.task), shared
+        except asyncio.CancelledError:
+            # Nobody is left to use the result
+            if call.waiters == 1:
+                call.task.cancel()
+            raise
+        finally:
+            call.waiters -= 1
+
+    def do_sync(self, key: Hashable, work: Callable[[], T]) -> Tuple[T, bool]:
+        """Blocking counterpart of ``do`` for code running in threads."""
+        with self._lock:
+            call = self._calls.get(key)
+            shared = call is not None
+            if not shared:
+                call = _SyncCall()
+                self._calls[key] = call
+        self._record(key, shared)
+
+        if shared:
+            call.done.wait()
+        else:
+            try:
+                call.result = work()
+            except BaseException as e:
+                call.error = e
+            finally:
+                with self._lock:
+                    del self._calls[key]
+                call.done.set()
+
+        if call.error is not None:
+            raise call.error
+        return call.result, shared
+
+    def in_flight(self, key: Hashable) -> bool:
+        """True if work for ``key`` is running on this loop or in a thread."""
+        if key in self._calls:
+            return True
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return False
+        call = self._tasks.get((loop, key))
+        return call is not None and not call.task.done()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Per-namespace call, execution and deduplication counters."""
+        with self._lock:
+            stats = {name: counters.as_dict() for name, counters in self._stats.items()}
+            in_flight = len(self._calls) + sum(
+                1 for call in self._tasks.values() if not call.task.done()
+            )
+        return {"in_flight": in_flight, "namespaces": stats}
+
+    def reset_stats(self) -> None:
+        """Zero every counter."""
+        with self._lock:
+            self._stats.clear()
+
+    async def _run_async(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        key: Hashable,
+        work: Callable[[], Awaitable[T]],
+    ) -> T:
+        try:
+            return await work()
+        finally:
+            self._tasks.pop((loop, key), None)
+
+    def _record(self, key: Hashable, shared: bool) -> None:
+        namespace = str(key[0]) if isinstance(key, tuple) and key else "default"
+        with self._lock:
+            counters = self._stats.setdefault(namespace, FlightStats())
+            counters.calls += 1
+            if shared:
+                counters.deduplicated += 1
+            else:
+                counters.executions += 1
+
+
+_shared_flight = SingleFlight()
+
+
+def get_single_flight() -> SingleFlight:
+    """Get the process-wide SingleFlight shared by the scoring services."""
+    return _shared_flight
@@ -0,0 +1,96 @@
+"""
+Link discovery for multi-page heuristic evaluation.
+Picks the same-origin privacy, terms, about, contact and pricing pages linked from a landing page.
+"""
+
+import re
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Pattern, Tuple
+from urllib.parse import urldefrag, urljoin, urlsplit
+
+from src.utils.page_features import Anchor
+
+# Page kinds in crawl priority order, each matched against link paths and text
+CRAWL_TARGETS: Dict[str, Pattern] = {
+    "privacy": re.compile(r"privacy|datenschutz|gdpr|cookie-policy", re.IGNORECASE),
+    "contact": re.compile(r"contact|get-in-touch|reach-us", re.IGNORECASE),
+    "about": re.compile(r"about|who-we-are|our-story|our-team|company", re.IGNORECASE),
+    "terms": re.compile(
+        r"terms|conditions|\btos\b|legal|user-agreement|imprint|impressum",
+        re.IGNORECASE,
+    ),
+    "pricing": re.compile(r"pricing|prices|plans|rates|packages", re.IGNORECASE),
+}
+
+SKIPPED_SCHEMES = ("mailto:", "tel:", "javascript:", "data:", "sms:")
+
+
+@dataclass(frozen=True)
+class CrawlLink:
+    """A linked page selected for crawling."""
+
+    kind: str
+    url: str
+
+
+def _origin(url: str) -> Tuple[str, str, Optional[int]]:
+    parts = urlsplit(url)
+    host = (parts.hostname or "").lower()
+    if host.startswith("www."):
+        host = host[4:]
+    port = parts.port
+    if port == {"http": 80, "https": 443}.get(parts.scheme):
+        port = None
+    return parts.scheme.lower(), host, port
+
+
+def same_origin(url: str, other: str) -> bool:
+    """True if both URLs share scheme, host (ignoring ``www.``) and port."""
+    return _origin(url) == _origin(other)
+
+
+def discover_crawl_links(
+    base_url: str, anchors: Iterable[Anchor], max_pages: int
+) -> List[CrawlLink]:
+    """
+    Select same-origin pages worth crawling from a landing page's links.
+
+    At most one page is chosen per kind, in ``CRAWL_TARGETS`` order, and
+    never the landing page itself.
+
+    Args:
+        base_url: Final URL of the landing page, for resolving relative links
+        anchors: Links found on the landing page
+        max_pages: Maximum number of pages to return
+
+    Returns:
+        Links to crawl, highest priority first
+    """
+    if max_pages <= 0:
+        return []
+
+    landing, _ = urldefrag(base_url)
+    found: Dict[str, str] = {}
+    seen = {landing}
+    for anchor in anchors:
+        href = anchor.href.strip()
+        if not href:
+            continue
+        if href.startswith("#") or href.lower().startswith(SKIPPED_SCHEMES):
+            continue
+
+        url, _ = urldefrag(urljoin(base_url, href))
+        if url in seen or not same_origin(url, base_url):
+            continue
+
+        path = urlsplit(url).path
+        for kind, pattern in CRAWL_TARGETS.items():
+            if kind in found:
+                continue
+            if pattern.search(path) or pattern.search(anchor.text):
+                found[kind] = url
+                seen.add(url)
+                break
+
+    links = [CrawlLink(kind, found[kind]) for kind in CRAWL_TARGETS if kind in found]
+    return links[:max_pages]
@@ -0,0 +1,172 @@
+"""
+Structured, non-blocking logging for services.
+Callers only enqueue records; one listener thread formats them as JSON lines and writes them.
+"""
+
+import atexit
+import itertools
+import json
+import logging
+import queue
+import sys
+import threading
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Dict, Optional, TextIO
+
+# Parent of every service logger; the only one with a handler
+SERVICE_LOGGER = "services"
+
+# Line format services logged with before JSON output
+_TEXT_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+
+
+class JsonFormatter(logging.Formatter):
+    """
+    One JSON object per record.
+
+    The record's ``fields`` (passed as ``extra={"fields": {...}}``) are
+    merged into the object next to ``timestamp``, ``level``, ``logger`` and
+    ``message``; values JSON cannot encode are written with ``str()``.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry: Dict[str, Any] = {
+            "timestamp": datetime.fromtimestamp(
+                record.created, timezone.utc
+            ).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        for key, value in (getattr(record, "fields", None) or {}).items():
+            entry.setdefault(key, value)
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str)
+
+
+class TextFormatter(logging.Formatter):
+    """Human-readable lines with the record's fields appended as ``key:value``."""
+
+    def __init__(self):
+        super().__init__(_TEXT_FORMAT)
+
+    def format(self, record: logging.LogRecord) -> str:
+        line = super().format(record)
+        fields = getattr(record, "fields", None)
+        if fields:
+            line += " | " + " | ".join(f"{k}:{v}" for k, v in fields.items())
+        return line
+
+
+class DeferredQueueHandler(QueueHandler):
+    """
+    QueueHandler that leaves all formatting to the listener thread.
+
+    The stock handler renders the message in the calling thread so records
+    can be pickled to another process. This queue never leaves the process,
+    so the caller only pays for ``put_nowait`` on a ``SimpleQueue``. Log
+    arguments and fields must therefore not be mutated after the call.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+class LogSampler:
+    """
+    Keeps one in every ``1 / rate`` records, deterministically.
+
+    A rate of 1 keeps everything and 0 drops everything. The counter is an
+    ``itertools.count``, whose ``next()`` is atomic, so no lock is taken.
+    """
+
+    def __init__(self, rate: float = 1.0):
+        self.rate = min(max(rate, 0.0), 1.0)
+        self._every = round(1 / self.rate) if self.rate > 0 else 0
+        self._counter = itertools.count()
+
+    def keep(self) -> bool:
+        if self._every == 1:
+            return True
+        if self._every == 0:
+            return False
+        return next(self._counter) % self._every == 0
+
+
+_listener: Optional[QueueListener] = None
+_handler: Optional[DeferredQueueHandler] = None
+_samplers: Dict[str, LogSampler] = {}
+_lock = threading.Lock()
+
+
+def configure_service_logging(
+    level: str = "INFO",
+    fmt: str = "json",
+    stream: Optional[TextIO] = None,
+    force: bool = False,
+) -> logging.Logger:
+    """
+    Route every service logger through one queue and a background writer.
+
+    Args:
+        level: Level of the ``services`` logger
+        fmt: ``"json"`` for JSON lines, ``"text"`` for the classic format
+        stream: Where the listener writes; defaults to stderr
+        force: Replace an existing configuration instead of keeping it
+
+    Returns:
+        The ``services`` parent logger
+    """
+    global _listener, _handler
+    logger = logging.getLogger(SERVICE_LOGGER)
+    with _lock:
+        if _listener is not None and not force:
+            return logger
+        _stop_listener(logger)
+
+        output = logging.StreamHandler(stream or sys.stderr)
+        output.setFormatter(TextFormatter() if fmt == "text" else JsonFormatter())
+        records: queue.SimpleQueue = queue.SimpleQueue()
+        _handler = DeferredQueueHandler(records)
+        _listener = QueueListener(records, output, respect_handler_level=True)
+        _listener.start()
+
+        logger.addHandler(_handler)
+        logger.setLevel(level.upper())
+        logger.propagate = False
+    return logger
+
+
+def shutdown_service_logging() -> None:
+    """Write out queued records and stop the listener thread."""
+    with _lock:
+        _stop_listener(logging.getLogger(SERVICE_LOGGER))
+
+
+def _stop_listener(logger: logging.Logger) -> None:
+    global _listener, _handler
+    if _handler is not None:
+        logger.removeHandler(_handler)
+        _handler = None
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+def get_service_logger(name: str) -> logging.Logger:
+    """Logger for one service class; its records go to the ``services`` handler."""
+    return logging.getLogger(f"{SERVICE_LOGGER}.{name}")
+
+
+def get_log_sampler(service_name: str, rate: float = 1.0) -> LogSampler:
+    """Shared sampler of ``service_name``, so every instance counts together."""
+    sampler = _samplers.get(service_name)
+    if sampler is None or sampler.rate != min(max(rate, 0.0), 1.0):
+        with _lock:
+            sampler = _samplers[service_name] = LogSampler(rate)
+    return sampler
+
+
+atexit.register(shutdown_service_logging)
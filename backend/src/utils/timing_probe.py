@@ -0,0 +1,72 @@
+"""
+Local timing probe used as a fast proxy for a Lighthouse performance score.
+Scores time to first byte, document size and subresource count of a single fetch of the page.
+"""
+
+import re
+from typing import Any, Dict, Optional
+
+# (good, poor) thresholds; "good" maps to a score of 90 and "poor" to 50,
+# as with Lighthouse's metric scoring curves
+TTFB_THRESHOLDS_MS = (800.0, 1800.0)  # web.dev TTFB guidance
+DOCUMENT_BYTES_THRESHOLDS = (100_000.0, 500_000.0)
+REQUEST_COUNT_THRESHOLDS = (50.0, 150.0)
+
+METRIC_WEIGHTS = {"ttfb": 0.5, "document_bytes": 0.25, "request_count": 0.25}
+
+# Subresources the browser would fetch while loading the page
+SUBRESOURCE_PATTERN = re.compile(
+    r"<(?:script|img|iframe|video|audio|source|embed)\b[^>]*\bsrc\s*="
+    r"|<link\b[^>]*\brel\s*=\s*[\"']?(?:stylesheet|preload|modulepreload|icon)",
+    re.IGNORECASE,
+)
+
+
+def count_requests(html: str) -> int:
+    """Requests needed to load the page: the document plus its subresources."""
+    return 1 + len(SUBRESOURCE_PATTERN.findall(html))
+
+
+def metric_score(value: float, good: float, poor: float) -> float:
+    """
+    Score a lower-is-better metric from 0 to 100.
+
+    100 at zero, 90 at ``good``, 50 at ``poor`` and 0 at twice ``poor``,
+    linear in between.
+    """
+    if value <= good:
+        return 100.0 - 10.0 * value / good
+    if value <= poor:
+        return 90.0 - 40.0 * (value - good) / (poor - good)
+    return max(0.0, 50.0 - 50.0 * (value - poor) / poor)
+
+
+def summarize_probe(
+    ttfb_seconds: float, document_bytes: int, html: Optional[str]
+) -> Dict[str, Any]:
+    """
+    Metrics and estimated performance score of one page fetch.
+
+    Args:
+        ttfb_seconds: Time from sending the request to the response headers
+        document_bytes: Size of the (decoded) HTML document
+        html: The document, for counting subresources
+
+    Returns:
+        ``ttfb_ms``, ``document_bytes``, ``request_count`` and
+        ``estimated_performance`` (0-100)
+    """
+    ttfb_ms = ttfb_seconds * 1000.0
+    request_count = count_requests(html or "")
+    scores = {
+        "ttfb": metric_score(ttfb_ms, *TTFB_THRESHOLDS_MS),
+        "document_bytes": metric_score(document_bytes, *DOCUMENT_BYTES_THRESHOLDS),
+        "request_count": metric_score(request_count, *REQUEST_COUNT_THRESHOLDS),
+    }
+    estimate = sum(METRIC_WEIGHTS[name] * score for name, score in scores.items())
+    return {
+        "ttfb_ms": round(ttfb_ms, 1),
+        "document_bytes": document_bytes,
+        "request_count": request_count,
+        "estimated_performance": round(estimate, 1),
+    }
@@ -0,0 +1,175 @@
+"""
+Token bucket and calendar-day quota used to pace outgoing API requests.
+Both answer "may I send now?" and "how long until I may?" without sleeping themselves.
+"""
+
+import threading
+import time
+from datetime import datetime, time as dt_time, timedelta, timezone
+from typing import Callable, Optional, Tuple
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+
+class TokenBucket:
+    """
+    Tokens refill continuously at ``rate`` per second up to ``capacity``.
+
+    Each request spends one token, so bursts are bounded by ``capacity`` and
+    the sustained rate by ``rate``. To stay under N requests in any window of
+    W seconds, use ``TokenBucket.for_window(N, W, burst)``.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: float,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if rate <= 0 or capacity < 1:
+            raise ValueError("rate must be positive and capacity at least 1")
+        self.rate = rate
+        self.capacity = capacity
+        self._clock = clock
+        self._tokens = capacity
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def for_window(
+        cls,
+        limit: int,
+        window_seconds: float,
+        burst: int,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> "TokenBucket":
+        """
+        Bucket that never exceeds ``limit`` requests in any ``window_seconds``.
+
+        A full bucket plus one window of refill must fit the limit, so the
+        refill rate is ``(limit - burst) / window_seconds``.
+        """
+        burst = max(1, min(burst, limit - 1)) if limit > 1 else 1
+        rate = max(limit - burst, 1) / window_seconds
+        return cls(rate, burst, clock)
+
+    def _refill(self) -> None:
+        now = self._clock()
+        # A clock that steps backwards must not drain the bucket
+        elapsed = max(0.0, now - self._updated)
+        self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+        self._updated = now
+
+    @property
+    def tokens(self) -> float:
+        """Tokens available now."""
+        with self._lock:
+            self._refill()
+            return self._tokens
+
+    def try_acquire(self, tokens: float = 1.0) -> bool:
+        """Spend ``tokens`` if available; never blocks."""
+        with self._lock:
+            self._refill()
+            if self._tokens < tokens:
+                return False
+            self._tokens -= tokens
+            return True
+
+    def spend(self, tokens: float = 1.0) -> None:
+        """Spend ``tokens`` unconditionally; the balance may go negative."""
+        with self._lock:
+            self._refill()
+            self._tokens -= tokens
+
+    def refund(self, tokens: float = 1.0) -> None:
+        """Give back ``tokens`` spent on a request that was never made."""
+        with self._lock:
+            self._refill()
+            self._tokens = min(self.capacity, self._tokens + tokens)
+
+    def wait_time(self, tokens: float = 1.0) -> float:
+        """Seconds until ``tokens`` are available, 0 when they already are."""
+        with self._lock:
+            self._refill()
+            return max(0.0, (tokens - self._tokens) / self.rate)
+
+    def time_for(self, count: int) -> float:
+        """Seconds needed to spend ``count`` tokens one after another."""
+        with self._lock:
+            self._refill()
+            return max(0.0, (count - self._tokens) / self.rate)
+
+
+class DailyQuota:
+    """
+    Fixed per-calendar-day request allowance.
+
+    Provider daily quotas reset at midnight in a fixed time zone (Google's at
+    midnight Pacific time) rather than over a rolling 24 hours. ``used`` and
+    ``day`` can be saved and passed back in to survive restarts.
+    """
+
+    def __init__(
+        self,
+        limit: int,
+        tz: str = "UTC",
+        used: int = 0,
+        day: Optional[str] = None,
+        now: Callable[[], float] = time.time,
+    ):
+        self.limit = limit
+        try:
+            self.tz = ZoneInfo(tz)
+        except (ZoneInfoNotFoundError, ValueError):
+            self.tz = timezone.utc
+        self._now = now
+        self._lock = threading.Lock()
+        self.day = self._today()
+        self.used = used if day == self.day else 0
+
+    def _today(self) -> str:
+        return datetime.fromtimestamp(self._now(), self.tz).date().isoformat()
+
+    def _roll(self) -> None:
+        today = self._today()
+        if today != self.day:
+            self.day = today
+            self.used = 0
+
+    @property
+    def remaining(self) -> int:
+        with self._lock:
+            self._roll()
+            return max(0, self.limit - self.used)
+
+    def try_acquire(self) -> bool:
+        """Count one request against today's allowance if any is left."""
+        with self._lock:
+            self._roll()
+            if self.used >= self.limit:
+                return False
+            self.used += 1
+            return True
+
+    def seconds_until_reset(self) -> float:
+        """
+        Seconds until the allowance resets at the next local midnight.
+
+        Days that start or end daylight saving time are 23 or 25 hours long,
+        so the reset is found on the calendar rather than 86400s after the
+        last one.
+        """
+        timestamp = self._now()
+        tomorrow = datetime.fromtimestamp(timestamp, self.tz).date() + timedelta(days=1)
+        midnight = datetime.combine(tomorrow, dt_time.min, tzinfo=self.tz)
+        return midnight.timestamp() - timestamp
+
+    def wait_time(self) -> float:
+        """Seconds until a request may be counted, 0 when one may now."""
+        return 0.0 if self.remaining > 0 else self.seconds_until_reset()
+
+    def snapshot(self) -> Tuple[str, int]:
+        """``(day, used)`` for persisting across restarts."""
+        with self._lock:
+            self._roll()
+            return self.day, self.used
@@ -0,0 +1,38 @@
+"""
+URL helpers shared by the fetch and audit caches.
+"""
+
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+DEFAULT_PORTS = {"http": 80, "https": 443}
+
+
+def normalize_url(url: str) -> str:
+    """
+    Canonical form of a URL for use as a cache key.
+
+    Lower-cases the scheme and host, drops default ports, fragments and
+    empty query strings, sorts query parameters and gives bare hosts a
+    ``/`` path, so trivially different spellings share one entry.
+
+    Args:
+        url: Absolute URL
+
+    Returns:
+        Normalized URL string
+    """
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or "").lower()
+    if ":" in host:  # IPv6 literal
+        host = f"[{host}]"
+    if parts.port and parts.port != DEFAULT_PORTS.get(scheme):
+        host = f"{host}:{parts.port}"
+    if parts.username:
+        credentials = parts.username
+        if parts.password:
+            credentials = f"{credentials}:{parts.password}"
+        host = f"{credentials}@{host}"
+
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    return urlunsplit((scheme, host, parts.path or "/", query, ""))
@@ -0,0 +1,497 @@
+"""
+Time-series store of Lighthouse scores and Core Web Vitals per business and URL.
+Serves range queries, down-sampled trends and before/after comparisons without calling PageSpeed Insights.
+"""
+
+import sqlite3
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+from src.core.config import get_api_config, get_data_path
+from src.utils.score_calculation import calculate_performance_trend
+
+# Stored metrics and the factor each is scaled by to keep it a small integer:
+# scores to tenths of a point, timings to whole milliseconds, CLS to 1/1000
+METRIC_SCALE: Dict[str, int] = {
+    "performance": 10,
+    "accessibility": 10,
+    "best_practices": 10,
+    "seo": 10,
+    "overall": 10,
+    "first_contentful_paint": 1,
+    "largest_contentful_paint": 1,
+    "cumulative_layout_shift": 1000,
+    "total_blocking_time": 1,
+    "speed_index": 1,
+}
+METRICS: Tuple[str, ...] = tuple(METRIC_SCALE)
+SCORE_METRICS = ("performance", "accessibility", "best_practices", "seo")
+VITALS_METRICS = METRICS[5:]
+
+# Bucket widths in seconds; months follow the calendar
+BUCKET_SECONDS = {"hour": 3600, "day": 86_400, "week": 604_800, "month": None}
+
+# 1970-01-05, the first Monday, so weekly buckets start on Mondays
+_WEEK_ORIGIN = 4 * 86_400
+
+
+def _bucket_expression(bucket: str, column: str = "ts") -> str:
+    """SQL expression of the UTC epoch second a point's bucket starts at."""
+    if bucket not in BUCKET_SECONDS:
+        raise ValueError(f"Unknown bucket: {bucket}")
+    if bucket == "month":
+        return (
+            f"CAST(strftime('%s', {column}, 'unixepoch', 'start of month') "
+            "AS INTEGER)"
+        )
+    if bucket == "week":
+        return f"(({column} - {_WEEK_ORIGIN}) / 604800) * 604800 + {_WEEK_ORIGIN}"
+    return f"({column} / {BUCKET_SECONDS[bucket]}) * {BUCKET_SECONDS[bucket]}"
+
+
+def _encode(name: str, value: Any) -> Optional[int]:
+    if value is None:
+        return None
+    try:
+        return int(round(float(value) * METRIC_SCALE[name]))
+    except (TypeError, ValueError):
+        return None
+
+
+def _decode(name: str, value: Optional[float], digits: int = 3) -> Optional[float]:
+    if value is None:
+        return None
+    return round(value / METRIC_SCALE[name], digits)
+
+
+def audit_metrics(audit_result: Dict[str, Any]) -> Dict[str, Any]:
+    """Metric values of a processed LighthouseService audit result."""
+    scores = audit_result.get("scores") or {}
+    vitals = audit_result.get("core_web_vitals") or {}
+    metrics = {name: scores.get(name) for name in SCORE_METRICS}
+    metrics["overall"] = audit_result.get("overall_score", scores.get("overall"))
+    metrics.update({name: vitals.get(name) for name in VITALS_METRICS})
+    return metrics
+
+
+class VitalsHistoryStore:
+    """
+    Append-optimized SQLite store of audit metrics.
+
+    Each (business_id, URL, strategy) series gets a small integer id, and
+    points are kept in a WITHOUT ROWID table keyed by ``(series_id, ts)``.
+    A series' points are therefore stored contiguously in time order, and a
+    range query is a single index range scan. Metrics are stored as scaled
+    integers, which SQLite packs into one to three bytes each.
+
+    Appends are buffered and written in one transaction per flush; queries
+    flush first so they always see every appended point. ``submit_audit``
+    hands the write to a single background thread so it stays off the
+    request path; that thread flushes whenever its queue drains, so a burst
+    of audits is one transaction and no point waits for the next append.
+    A second audit of a series within the same second is ignored.
+    """
+
+    # Buffered points and seconds before a flush
+    FLUSH_ROWS = 256
+    FLUSH_SECONDS = 5.0
+
+    def __init__(self, path: Union[str, Path, None] = None):
+        self.path = Path(path) if path else None
+        if self.path is not None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.appended = 0
+        self.write_errors = 0
+        self._lock = threading.Lock()
+        self._buffer: List[tuple] = []
+        self._last_flush = time.monotonic()
+        self._series: Dict[Tuple[str, str, str], int] = {}
+        self._db = sqlite3.connect(
+            str(self.path) if self.path else ":memory:",
+            timeout=30.0,
+            check_same_thread=False,
+            isolation_level=None,
+        )
+        self._writer = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="vitals-history"
+        )
+        self._last_write: Optional[Future] = None
+        self._pending_writes = 0
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS vitals_series ("
+            "id INTEGER PRIMARY KEY, business_id TEXT NOT NULL, "
+            "url TEXT NOT NULL, strategy TEXT NOT NULL, "
+            "UNIQUE (business_id, url, strategy))"
+        )
+        self._db.execute(
+            "CREATE INDEX IF NOT EXISTS vitals_series_url ON vitals_series (url)"
+        )
+        columns = ", ".join(f"{name} INTEGER" for name in METRICS)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS vitals_points ("
+            f"series_id INTEGER NOT NULL, ts INTEGER NOT NULL, {columns}, "
+            "PRIMARY KEY (series_id, ts)) WITHOUT ROWID"
+        )
+
+    def append(
+        self,
+        business_id: str,
+        website_url: str,
+        strategy: str,
+        metrics: Dict[str, Any],
+        timestamp: Optional[float] = None,
+    ) -> None:
+        """Buffer one point; ``metrics`` may omit or null any metric."""
+        ts = int(timestamp if timestamp is not None else time.time())
+        values = tuple(_encode(name, metrics.get(name)) for name in METRICS)
+        with self._lock:
+            series_id = self._series_id(business_id, website_url, strategy)
+            self._buffer.append((series_id, ts) + values)
+            self.appended += 1
+            due = time.monotonic() - self._last_flush >= self.FLUSH_SECONDS
+            if len(self._buffer) >= self.FLUSH_ROWS or due:
+                self._flush()
+
+    def record_audit(self, audit_result: Dict[str, Any]) -> bool:
+        """
+        Append a processed LighthouseService audit result.
+
+        A failed write is counted rather than raised, so it never fails the
+        audit that produced the result.
+
+        Returns:
+            False for failed or estimated results, which are not recorded
+        """
+        point = self._audit_point(audit_result)
+        return point is not None and self._append_quietly(*point)
+
+    def submit_audit(self, audit_result: Dict[str, Any]) -> bool:
+        """
+        Queue a processed LighthouseService audit result for the writer thread.
+
+        The metrics are read before returning, so the result may be changed
+        afterwards; the write itself happens in the background.
+
+        Returns:
+            False for failed or estimated results, which are not queued
+        """
+        point = self._audit_point(audit_result)
+        if point is None:
+            return False
+        with self._lock:
+            self._pending_writes += 1
+        self._last_write = self._writer.submit(self._write_submitted, point)
+        return True
+
+    def flush(self) -> None:
+        """Write queued and buffered points."""
+        self._wait_for_writes()
+        with self._lock:
+            self._flush()
+
+    def history(
+        self,
+        business_id: str,
+        website_url: Optional[str] = None,
+        strategy: Optional[str] = None,
+        start: Optional[float] = None,
+        end: Optional[float] = None,
+        limit: int = 1000,
+    ) -> List[Dict[str, Any]]:
+        """
+        Recorded points of a business in time order.
+
+        Args:
+            business_id: Business identifier
+            website_url: Only this URL
+            strategy: Only this strategy
+            start: Earliest timestamp, inclusive
+            end: Latest timestamp, exclusive
+            limit: Most recent points to return at most
+
+        Returns:
+            Points with ``timestamp``, ``website_url``, ``strategy``,
+            ``scores`` and ``core_web_vitals``
+        """
+        where, params = self._filters([business_id], website_url, strategy, start, end)
+        columns = ", ".join(f"p.{name}" for name in METRICS)
+        rows = self._query(
+            f"SELECT * FROM (SELECT p.ts, s.url, s.strategy, {columns} "
+            "FROM vitals_points p JOIN vitals_series s ON s.id = p.series_id "
+            f"WHERE {where} ORDER BY p.ts DESC LIMIT ?) ORDER BY ts",
+            params + [limit],
+        )
+        points = []
+        for ts, url, series_strategy, *values in rows:
+            decoded = {
+                name: _decode(name, value) for name, value in zip(METRICS, values)
+            }
+            points.append(
+                {
+                    "timestamp": float(ts),
+                    "website_url": url,
+                    "strategy": series_strategy,
+                    "scores": {name: decoded[name] for name in METRICS[:5]},
+                    "core_web_vitals": {name: decoded[name] for name in VITALS_METRICS},
+                }
+            )
+        return points
+
+    def trend(
+        self,
+        business_id: str,
+        website_url: Optional[str] = None,
+        strategy: Optional[str] = None,
+        start: Optional[float] = None,
+        end: Optional[float] = None,
+        bucket: str = "week",
+    ) -> Dict[str, Any]:
+        """
+        Per-bucket averages of every metric, aggregated in SQLite.
+
+        Returns:
+            ``buckets`` (start, count and metric averages, oldest first) and
+            ``summary`` from ``calculate_performance_trend`` over the
+            overall score of each bucket
+        """
+        expression = _bucket_expression(bucket, "p.ts")
+        where, params = self._filters([business_id], website_url, strategy, start, end)
+        averages = ", ".join(f"AVG(p.{name})" for name in METRICS)
+        rows = self._query(
+            f"SELECT {expression} AS bucket, COUNT(*), "
+            f"{averages} FROM vitals_points p "
+            "JOIN vitals_series s ON s.id = p.series_id "
+            f"WHERE {where} GROUP BY bucket ORDER BY bucket",
+            params,
+        )
+        buckets = []
+        for bucket_start, count, *values in rows:
+            entry = {"start": float(bucket_start), "count": count}
+            entry.update(
+                (name, _decode(name, value, 2)) for name, value in zip(METRICS, values)
+            )
+            buckets.append(entry)
+        overall = [
+            entry["overall"] for entry in buckets if entry["overall"] is not None
+        ]
+        return {
+            "business_id": business_id,
+            "bucket": bucket,
+            "buckets": buckets,
+            "summary": calculate_performance_trend(overall),
+        }
+
+    def compare(
+        self,
+        business_ids: Sequence[str],
+        pivot: float,
+        window_seconds: float,
+        strategy: Optional[str] = None,
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Average metrics in the window before and after ``pivot``, for many
+        businesses in one query.
+
+        Returns:
+            Per business id: ``before`` and ``after`` averages (None when the
+            window has no points), point counts and the ``change`` of each
+            metric
+        """
+        if not business_ids:
+            return {}
+        where, params = self._filters(
+            business_ids, None, strategy, pivot - window_seconds, pivot + window_seconds
+        )
+        averages = ", ".join(f"AVG(p.{name})" for name in METRICS)
+        rows = self._query(
+            f"SELECT s.business_id, p.ts >= ? AS is_after, COUNT(*), {averages} "
+            "FROM vitals_points p JOIN vitals_series s ON s.id = p.series_id "
+            f"WHERE {where} GROUP BY s.business_id, is_after",
+            [int(pivot)] + params,
+        )
+        comparison = {
+            business_id: {
+                "before": None,
+                "after": None,
+                "before_count": 0,
+                "after_count": 0,
+                "change": None,
+            }
+            for business_id in business_ids
+        }
+        for business_id, is_after, count, *values in rows:
+            period = "after" if is_after else "before"
+            comparison[business_id][period] = {
+                name: _decode(name, value, 2) for name, value in zip(METRICS, values)
+            }
+            comparison[business_id][f"{period}_count"] = count
+        for entry in comparison.values():
+            if entry["before"] and entry["after"]:
+                entry["change"] = {
+                    name: (
+                        round(entry["after"][name] - entry["before"][name], 2)
+                        if entry["after"][name] is not None
+                        and entry["before"][name] is not None
+                        else None
+                    )
+                    for name in METRICS
+                }
+        return comparison
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get series and point counts."""
+        series, points = self._query(
+            "SELECT (SELECT COUNT(*) FROM vitals_series), "
+            "(SELECT COUNT(*) FROM vitals_points)",
+            [],
+        )[0]
+        return {
+            "path": str(self.path) if self.path else None,
+            "series": series,
+            "points": points,
+            "appended": self.appended,
+            "write_errors": self.write_errors,
+        }
+
+    def close(self) -> None:
+        """Write queued and buffered points and close the database."""
+        self._writer.shutdown(wait=True)
+        with self._lock:
+            self._flush()
+            self._db.close()
+
+    def _audit_point(self, audit_result: Dict[str, Any]) -> Optional[tuple]:
+        if not audit_result.get("success") or audit_result.get("estimated"):
+            return None
+        try:
+            return (
+                audit_result["business_id"],
+                audit_result["website_url"],
+                audit_result.get("strategy") or "desktop",
+                audit_metrics(audit_result),
+                audit_result.get("audit_timestamp", time.time()),
+            )
+        except KeyError:
+            self.write_errors += 1
+            return None
+
+    def _append_quietly(
+        self,
+        business_id: str,
+        website_url: str,
+        strategy: str,
+        metrics: Dict[str, Any],
+        timestamp: Optional[float],
+    ) -> bool:
+        # A failed write must never fail the audit that produced the point
+        try:
+            self.append(business_id, website_url, strategy, metrics, timestamp)
+        except sqlite3.Error:
+            self.write_errors += 1
+            return False
+        return True
+
+    def _write_submitted(self, point: tuple) -> None:
+        self._append_quietly(*point)
+        with self._lock:
+            self._pending_writes -= 1
+            if self._pending_writes:
+                return
+            try:
+                self._flush()
+            except sqlite3.Error:
+                self.write_errors += 1
+
+    def _wait_for_writes(self) -> None:
+        if self._last_write is not None:
+            self._last_write.result()
+
+    def _series_id(self, business_id: str, website_url: str, strategy: str) -> int:
+        key = (business_id, website_url, strategy)
+        series_id = self._series.get(key)
+        if series_id is None:
+            self._db.execute(
+                "INSERT OR IGNORE INTO vitals_series (business_id, url, strategy) "
+                "VALUES (?, ?, ?)",
+                key,
+            )
+            series_id = self._db.execute(
+                "SELECT id FROM vitals_series "
+                "WHERE business_id = ? AND url = ? AND strategy = ?",
+                key,
+            ).fetchone()[0]
+            self._series[key] = series_id
+        return series_id
+
+    def _flush(self) -> None:
+        self._last_flush = time.monotonic()
+        if not self._buffer:
+            return
+        placeholders = ", ".join("?" for _ in range(len(METRICS) + 2))
+        self._db.execute("BEGIN")
+        try:
+            self._db.executemany(
+                f"INSERT OR IGNORE INTO vitals_points VALUES ({placeholders})",
+                self._buffer,
+            )
+            self._db.execute("COMMIT")
+        except Exception:
+            self._db.execute("ROLLBACK")
+            raise
+        self._buffer = []
+
+    def _query(self, sql: str, params: Iterable[Any]) -> List[tuple]:
+        self._wait_for_writes()
+        with self._lock:
+            self._flush()
+            return self._db.execute(sql, list(params)).fetchall()
+
+    @staticmethod
+    def _filters(
+        business_ids: Sequence[str],
+        website_url: Optional[str],
+        strategy: Optional[str],
+        start: Optional[float],
+        end: Optional[float],
+    ) -> Tuple[str, List[Any]]:
+        clauses = [f"s.business_id IN ({', '.join('?' for _ in business_ids)})"]
+        params: List[Any] = list(business_ids)
+        if website_url is not None:
+            clauses.append("s.url = ?")
+            params.append(website_url)
+        if strategy is not None:
+            clauses.append("s.strategy = ?")
+            params.append(strategy)
+        if start is not None:
+            clauses.append("p.ts >= ?")
+            params.append(int(start))
+        if end is not None:
+            clauses.append("p.ts < ?")
+            params.append(int(end))
+        return " AND ".join(clauses), params
+
+
+_shared_history: Optional[VitalsHistoryStore] = None
+
+
+def get_vitals_history_store() -> VitalsHistoryStore:
+    """Get the process-wide web-vitals history configured from settings."""
+    global _shared_history
+    if _shared_history is None:
+        config = get_api_config()
+        path = config.LIGHTHOUSE_HISTORY_PATH or get_data_path(
+            "leadgen_vitals_history.sqlite3", config
+        )
+        _shared_history = VitalsHistoryStore(path)
+    return _shared_history
+
+
+def close_vitals_history_store() -> None:
+    """Flush and close the process-wide history, if it was opened."""
+    global _shared_history
+    if _shared_history is not None:
+        _shared_history.close()
+        _shared_history = None
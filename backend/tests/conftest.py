@@ -23,6 +23,15 @@ if not os.getenv("YELP_FUSION_RATE_LIMIT_PER_DAY"):
     os.environ["YELP_FUSION_RATE_LIMIT_PER_DAY"] = "5000"
 
 
+@pytest.fixture(autouse=True)
+def reset_shared_rate_limiter():
+    """Give every test fresh rate-limit windows and circuit breakers."""
+    from src.services.rate_limiter import reset_rate_limiter
+
+    reset_rate_limiter()
+    yield
+
+
 @pytest.fixture
 def test_client():
     """Create a test client for the FastAPI application."""
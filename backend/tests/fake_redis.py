@@ -0,0 +1,303 @@
+"""
+In-process stand-in for a Redis server for the rate-limit store tests.
+Speaks RESP2 over TCP and runs Python equivalents of the rate-limit store's Lua scripts.
+"""
+
+import fnmatch
+import hashlib
+import math
+import socketserver
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from src.utils.rate_limit_store import (
+    ADD_SCRIPT,
+    DISCARD_SCRIPT,
+    RECORD_FAILURE_SCRIPT,
+    TRY_ADD_SCRIPT,
+)
+
+
+class _Status(str):
+    """Simple-string reply such as ``+OK``."""
+
+
+class _Error(Exception):
+    """Error reply such as ``-ERR unknown command``."""
+
+
+def _add(server: "FakeRedisServer", keys: List[str], args: List[str]) -> Any:
+    current = server.call("INCR", keys[0])
+    if current == 1:
+        server.call("EXPIRE", keys[0], args[0])
+    previous = int(server.call("GET", keys[1]) or "0")
+    return [previous, current]
+
+
+def _discard(server: "FakeRedisServer", keys: List[str], args: List[str]) -> Any:
+    if int(server.call("GET", keys[0]) or "0") > 0:
+        return server.call("DECR", keys[0])
+    return 0
+
+
+def _record_failure(
+    server: "FakeRedisServer", keys: List[str], args: List[str]
+) -> Any:
+    failures = server.call("HINCRBY", keys[0], "failures", 1)
+    server.call("HSET", keys[0], "last_failure", args[0])
+    if failures >= float(args[1]):
+        server.call("HSET", keys[0], "state", "OPEN")
+    return server.call("HGETALL", keys[0])
+
+
+def _try_add(server: "FakeRedisServer", keys: List[str], args: List[str]) -> Any:
+    current = int(server.call("GET", keys[0]) or "0")
+    previous = int(server.call("GET", keys[1]) or "0")
+    overlap = 1 - float(args[1]) / float(args[2])
+    if math.ceil(previous * overlap + current - 1e-9) >= int(args[0]):
+        return 0
+    if server.call("INCR", keys[0]) == 1:
+        server.call("EXPIRE", keys[0], args[3])
+    return 1
+
+
+# Lua scripts the fake can run, by SHA1, with their Python equivalents
+SCRIPTS: Dict[str, Callable[["FakeRedisServer", List[str], List[str]], Any]] = {
+    ADD_SCRIPT.sha: _add,
+    DISCARD_SCRIPT.sha: _discard,
+    RECORD_FAILURE_SCRIPT.sha: _record_failure,
+    TRY_ADD_SCRIPT.sha: _try_add,
+}
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    def handle(self) -> None:
+        fake: FakeRedisServer = self.server.fake
+        while True:
+            try:
+                args = self._read_command()
+            except (ConnectionError, ValueError):
+                return
+            if args is None:
+                return
+            try:
+                reply = fake.execute(args)
+            except _Error as e:
+                self.wfile.write(b"-%s\r\n" % str(e).encode())
+                continue
+            self.wfile.write(self._encode(reply))
+
+    def _read_command(self) -> Optional[List[str]]:
+        line = self.rfile.readline()
+        if not line:
+            return None
+        if not line.startswith(b"*"):
+            raise ValueError("Only RESP arrays are supported")
+        args = []
+        for _ in range(int(line[1:-2])):
+            size = int(self.rfile.readline()[1:-2])
+            args.append(self.rfile.read(size + 2)[:-2].decode())
+        return args
+
+    def _encode(self, reply: Any) -> bytes:
+        if reply is None:
+            return b"$-1\r\n"
+        if isinstance(reply, _Status):
+            return b"+%s\r\n" % reply.encode()
+        if isinstance(reply, int):
+            return b":%d\r\n" % reply
+        if isinstance(reply, list):
+            return b"*%d\r\n" % len(reply) + b"".join(self._encode(r) for r in reply)
+        data = str(reply).encode()
+        return b"$%d\r\n%s\r\n" % (len(data), data)
+
+
+class _Server(socketserver.ThreadingTCPServer):
+    allow_reuse_address = True
+    daemon_threads = True
+
+
+class FakeRedisServer:
+    """
+    Single-database Redis substitute listening on localhost.
+
+    Supports the string, hash and key commands the rate-limit store uses
+    (``SCAN``, not the blocking ``KEYS``) plus EVAL/EVALSHA for the scripts
+    in ``SCRIPTS``. Commands, scripts included, run one at a time under a
+    lock, matching Redis' atomicity.
+
+    Usage::
+
+        with FakeRedisServer() as server:
+            store = RedisRateLimitStore(server.url)
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0):
+        self._server = _Server((host, port), _Handler)
+        self._server.fake = self
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._data: Dict[str, Any] = {}
+        self._expires: Dict[str, float] = {}
+        self._loaded: set = set()
+        self.commands = 0
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"redis://{host}:{port}/0"
+
+    def start(self) -> "FakeRedisServer":
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def flush_scripts(self) -> None:
+        """Forget loaded scripts, like ``SCRIPT FLUSH``."""
+        with self._lock:
+            self._loaded.clear()
+
+    def __enter__(self) -> "FakeRedisServer":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def execute(self, args: Sequence[str]) -> Any:
+        """Run one client command atomically."""
+        with self._lock:
+            self.commands += 1
+            return self.call(*args)
+
+    def call(self, command: str, *args: Any) -> Any:
+        """Run a command; also what scripts use in place of ``redis.call``."""
+        handler = getattr(self, f"_cmd_{command.lower()}", None)
+        if handler is None:
+            raise _Error(f"ERR unknown command '{command}'")
+        return handler(*[str(a) for a in args])
+
+    def _live(self, key: str) -> Optional[Any]:
+        expires = self._expires.get(key)
+        if expires is not None and expires <= time.time():
+            self._data.pop(key, None)
+            self._expires.pop(key, None)
+        return self._data.get(key)
+
+    def _hash(self, key: str) -> Dict[str, str]:
+        value = self._live(key)
+        if value is None:
+            value = self._data[key] = {}
+        if not isinstance(value, dict):
+            raise _Error("WRONGTYPE Operation against a key holding the wrong kind")
+        return value
+
+    def _cmd_ping(self) -> Any:
+        return _Status("PONG")
+
+    def _cmd_auth(self, *args: str) -> Any:
+        return _Status("OK")
+
+    def _cmd_select(self, db: str) -> Any:
+        return _Status("OK")
+
+    def _cmd_get(self, key: str) -> Any:
+        value = self._live(key)
+        if isinstance(value, dict):
+            raise _Error("WRONGTYPE Operation against a key holding the wrong kind")
+        return value
+
+    def _cmd_set(self, key: str, value: str) -> Any:
+        self._data[key] = value
+        self._expires.pop(key, None)
+        return _Status("OK")
+
+    def _cmd_mget(self, *keys: str) -> Any:
+        return [
+            None if isinstance(self._live(k), dict) else self._live(k) for k in keys
+        ]
+
+    def _cmd_incr(self, key: str) -> Any:
+        try:
+            value = int(self._cmd_get(key) or 0) + 1
+        except ValueError:
+            raise _Error("ERR value is not an integer or out of range") from None
+        self._data[key] = str(value)
+        return value
+
+    def _cmd_decr(self, key: str) -> Any:
+        try:
+            value = int(self._cmd_get(key) or 0) - 1
+        except ValueError:
+            raise _Error("ERR value is not an integer or out of range") from None
+        self._data[key] = str(value)
+        return value
+
+    def _cmd_expire(self, key: str, seconds: str) -> Any:
+        if self._live(key) is None:
+            return 0
+        self._expires[key] = time.time() + int(seconds)
+        return 1
+
+    def _cmd_del(self, *keys: str) -> Any:
+        removed = 0
+        for key in keys:
+            if self._live(key) is not None:
+                del self._data[key]
+                self._expires.pop(key, None)
+                removed += 1
+        return removed
+
+    def _cmd_scan(self, cursor: str, *options: str) -> Any:
+        settings = dict(zip(options[::2], options[1::2]))
+        pattern = settings.get("MATCH", "*")
+        count = int(settings.get("COUNT", 10))
+        keys = sorted(self._data)
+        start = int(cursor)
+        page = keys[start : start + count]
+        following = start + count if start + count < len(keys) else 0
+        return [
+            str(following),
+            [
+                k
+                for k in page
+                if fnmatch.fnmatchcase(k, pattern) and self._live(k) is not None
+            ],
+        ]
+
+    def _cmd_hgetall(self, key: str) -> Any:
+        value = self._live(key)
+        if value is None:
+            return []
+        return [item for pair in self._hash(key).items() for item in pair]
+
+    def _cmd_hset(self, key: str, *pairs: str) -> Any:
+        if not pairs or len(pairs) % 2:
+            raise _Error("ERR wrong number of arguments for 'hset' command")
+        fields = self._hash(key)
+        added = sum(1 for name in pairs[::2] if name not in fields)
+        fields.update(zip(pairs[::2], pairs[1::2]))
+        return added
+
+    def _cmd_hincrby(self, key: str, field: str, amount: str) -> Any:
+        fields = self._hash(key)
+        value = int(fields.get(field, 0)) + int(amount)
+        fields[field] = str(value)
+        return value
+
+    def _cmd_evalsha(self, sha: str, numkeys: str, *rest: str) -> Any:
+        if sha not in self._loaded:
+            raise _Error("NOSCRIPT No matching script. Please use EVAL.")
+        count = int(numkeys)
+        return SCRIPTS[sha](self, list(rest[:count]), list(rest[count:]))
+
+    def _cmd_eval(self, source: str, numkeys: str, *rest: str) -> Any:
+        sha = hashlib.sha1(source.encode()).hexdigest()
+        if sha not in SCRIPTS:
+            raise _Error("ERR the fake server has no Python equivalent of this script")
+        self._loaded.add(sha)
+        return self._cmd_evalsha(sha, numkeys, *rest)
@@ -3,7 +3,7 @@ Unit tests for business search API endpoints.
 """
 
 import pytest
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import AsyncMock, Mock, patch, MagicMock
 from fastapi.testclient import TestClient
 from fastapi import HTTPException
 from src.main import app
@@ -78,9 +78,9 @@ class TestBusinessSearchAPI:
     def test_search_businesses_post_success(self, mock_service_class, client, sample_search_request, sample_search_response):
         """Test successful POST business search."""
         # Mock service
-        mock_service = Mock()
+        mock_service = Mock(search_businesses_async=AsyncMock())
         mock_service.validate_input.return_value = True
-        mock_service.search_businesses.return_value = sample_search_response
+        mock_service.search_businesses_async.return_value = sample_search_response
         mock_service_class.return_value = mock_service
         
         # Make request
@@ -98,7 +98,7 @@ class TestBusinessSearchAPI:
         
         # Verify service calls
         mock_service.validate_input.assert_called_once()
-        mock_service.search_businesses.assert_called_once()
+        mock_service.search_businesses_async.assert_called_once()
     
     @patch('src.api.v1.business_search.GooglePlacesService')
     def test_search_businesses_post_validation_failure(self, mock_service_class, client, sample_search_request):
@@ -120,9 +120,9 @@ class TestBusinessSearchAPI:
     def test_search_businesses_post_service_error(self, mock_service_class, client, sample_search_request):
         """Test POST business search when service returns error."""
         # Mock service
-        mock_service = Mock()
+        mock_service = Mock(search_businesses_async=AsyncMock())
         mock_service.validate_input.return_value = True
-        mock_service.search_businesses.return_value = BusinessSearchError(
+        mock_service.search_businesses_async.return_value = BusinessSearchError(
             error="API error occurred",
             error_code="API_ERROR",
             context="api_search_execution",
@@ -146,9 +146,9 @@ class TestBusinessSearchAPI:
     def test_search_businesses_get_success(self, mock_service_class, client, sample_search_response):
         """Test successful GET business search."""
         # Mock service
-        mock_service = Mock()
+        mock_service = Mock(search_businesses_async=AsyncMock())
         mock_service.validate_input.return_value = True
-        mock_service.search_businesses.return_value = sample_search_response
+        mock_service.search_businesses_async.return_value = sample_search_response
         mock_service_class.return_value = mock_service
         
         # Make request
@@ -170,7 +170,7 @@ class TestBusinessSearchAPI:
         
         # Verify service calls
         mock_service.validate_input.assert_called_once()
-        mock_service.search_businesses.assert_called_once()
+        mock_service.search_businesses_async.assert_called_once()
     
     @patch('src.api.v1.business_search.GooglePlacesService')
     def test_search_businesses_get_validation_failure(self, mock_service_class, client):
@@ -195,9 +195,9 @@ class TestBusinessSearchAPI:
     def test_search_businesses_get_service_error(self, mock_service_class, client):
         """Test GET business search when service returns error."""
         # Mock service
-        mock_service = Mock()
+        mock_service = Mock(search_businesses_async=AsyncMock())
         mock_service.validate_input.return_value = True
-        mock_service.search_businesses.return_value = BusinessSearchError(
+        mock_service.search_businesses_async.return_value = BusinessSearchError(
             error="API error occurred",
             error_code="API_ERROR",
             context="api_search_execution",
@@ -330,9 +330,9 @@ class TestBusinessSearchAPI:
         
         with patch('src.api.v1.business_search.GooglePlacesService') as mock_service_class:
             # Mock service
-            mock_service = Mock()
+            mock_service = Mock(search_businesses_async=AsyncMock())
             mock_service.validate_input.return_value = True
-            mock_service.search_businesses.return_value = BusinessSearchResponse(
+            mock_service.search_businesses_async.return_value = BusinessSearchResponse(
                 success=True,
                 query="restaurant",
                 location="San Francisco",
@@ -355,9 +355,9 @@ class TestBusinessSearchAPI:
         """Test GET business search without run_id (should generate one)."""
         with patch('src.api.v1.business_search.GooglePlacesService') as mock_service_class:
             # Mock service
-            mock_service = Mock()
+            mock_service = Mock(search_businesses_async=AsyncMock())
             mock_service.validate_input.return_value = True
-            mock_service.search_businesses.return_value = BusinessSearchResponse(
+            mock_service.search_businesses_async.return_value = BusinessSearchResponse(
                 success=True,
                 query="restaurant",
                 location="San Francisco",
@@ -383,9 +383,9 @@ class TestBusinessSearchAPI:
         """Test GET business search with provided run_id."""
         with patch('src.api.v1.business_search.GooglePlacesService') as mock_service_class:
             # Mock service
-            mock_service = Mock()
+            mock_service = Mock(search_businesses_async=AsyncMock())
             mock_service.validate_input.return_value = True
-            mock_service.search_businesses.return_value = BusinessSearchResponse(
+            mock_service.search_businesses_async.return_value = BusinessSearchResponse(
                 success=True,
                 query="restaurant",
                 location="San Francisco",
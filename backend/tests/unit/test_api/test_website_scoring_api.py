@@ -3,8 +3,9 @@ Unit tests for website scoring API endpoints.
 Tests both Lighthouse and Heuristic evaluation endpoints.
 """
 
+import json
 import pytest
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, patch
 from fastapi.testclient import TestClient
 from fastapi import HTTPException
 
@@ -532,3 +533,325 @@ class TestWebsiteScoringAPI:
             data = response.json()
             assert data["run_id"] is not None  # Should be auto-generated
             assert len(data["run_id"]) > 0
+    
+    def test_heuristic_batch_streams_ndjson(self):
+        """Test batch evaluation streams one line per site plus a summary."""
+        from src.api.v1.website_scoring import get_heuristic_evaluation_service
+        
+        def evaluation(business_id):
+            return {
+                "success": True,
+                "business_id": business_id,
+                "evaluation_timestamp": 1234567890.0,
+                "scores": {
+                    "trust_score": 80.0,
+                    "cro_score": 70.0,
+                    "mobile_score": 90.0,
+                    "content_score": 60.0,
+                    "social_score": 50.0,
+                    "overall_heuristic_score": 72.0,
+                    "confidence_level": "medium"
+                },
+                "trust_signals": {},
+                "cro_elements": {},
+                "mobile_usability": {},
+                "content_quality": {},
+                "social_proof": {},
+                "confidence": "medium",
+                "raw_data": {}
+            }
+        
+        captured = {}
+        
+        async def evaluate_stream(items, run_id=None, max_concurrency=None, crawl=None):
+            captured.update(items=items, run_id=run_id, max_concurrency=max_concurrency)
+            yield 1, {"success": False, "error": "HTTP 404", "error_code": "FETCH_FAILED"}, 0.1
+            yield 0, evaluation("biz-a"), 0.3
+        
+        mock_service = Mock()
+        mock_service.evaluate_stream = evaluate_stream
+        app.dependency_overrides[get_heuristic_evaluation_service] = lambda: mock_service
+        try:
+            with patch('src.api.v1.website_scoring._persist_heuristic_results') as mock_persist:
+                response = self.client.post(
+                    "/api/v1/website-scoring/heuristics/batch",
+                    json={
+                        "items": [
+                            {"business_id": "biz-a", "website_url": "https://a.example.com"},
+                            {"business_id": "biz-b", "website_url": "https://b.example.com"},
+                        ],
+                        "run_id": self.run_id,
+                        "max_concurrency": 2,
+                    },
+                )
+        finally:
+            app.dependency_overrides.clear()
+        
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        lines = [json.loads(line) for line in response.text.splitlines()]
+        assert len(lines) == 3
+        assert captured["items"] == [
+            ("biz-a", "https://a.example.com/"),
+            ("biz-b", "https://b.example.com/"),
+        ]
+        assert captured["max_concurrency"] == 2
+        
+        failure, success, summary = lines
+        assert failure["success"] is False
+        assert failure["business_id"] == "biz-b"
+        assert failure["error_code"] == "FETCH_FAILED"
+        assert success["success"] is True
+        assert success["business_id"] == "biz-a"
+        assert success["scores"]["overall_heuristic_score"] == 72.0
+        assert summary["type"] == "summary"
+        assert summary["run_id"] == self.run_id
+        assert (summary["total"], summary["succeeded"], summary["failed"]) == (2, 1, 1)
+        assert summary["error_codes"] == {"FETCH_FAILED": 1}
+        assert summary["latency_seconds"]["count"] == 2
+        assert summary["latency_seconds"]["p50"] == pytest.approx(0.2)
+        assert summary["latency_seconds"]["max"] == pytest.approx(0.3)
+        mock_persist.assert_called_once()
+    
+    def test_heuristic_batch_rejects_empty_items(self):
+        """Test batch evaluation requires at least one website."""
+        response = self.client.post(
+            "/api/v1/website-scoring/heuristics/batch",
+            json={"items": []},
+        )
+        
+        assert response.status_code == 422
+    
+    def test_heuristic_batch_rejects_oversized_batches(self):
+        """Test batch evaluation caps the number of websites per request."""
+        items = [
+            {"business_id": f"biz-{i}", "website_url": f"https://site{i}.example.com"}
+            for i in range(1_001)
+        ]
+        response = self.client.post(
+            "/api/v1/website-scoring/heuristics/batch",
+            json={"items": items},
+        )
+        
+        assert response.status_code == 422
+    
+    def test_deduplication_metrics(self):
+        """Test request coalescing counters are exposed per service."""
+        response = self.client.get("/api/v1/website-scoring/metrics/deduplication")
+        
+        assert response.status_code == 200
+        data = response.json()
+        assert "in_flight" in data
+        assert isinstance(data["namespaces"], dict)
+    
+    def test_score_website_pipeline(self):
+        """Test the pipeline endpoint returns one combined result."""
+        from src.api.v1.website_scoring import get_scoring_pipeline_service
+        
+        mock_service = Mock()
+        mock_service.score_website = AsyncMock(return_value={
+            "success": True,
+            "website_url": "https://example.com",
+            "business_id": self.business_id,
+            "run_id": self.run_id,
+            "scoring_timestamp": 1234567890.0,
+            "scoring_method": "fallback",
+            "scoring_status": "degraded",
+            "overall_score": 72.0,
+            "confidence_level": "low",
+            "validation_result": None,
+            "timings": {"lighthouse": 0.2, "heuristics": 0.5, "total": 0.5},
+        })
+        app.dependency_overrides[get_scoring_pipeline_service] = lambda: mock_service
+        try:
+            response = self.client.post(
+                "/api/v1/website-scoring/score",
+                json={
+                    "website_url": "https://example.com",
+                    "business_id": self.business_id,
+                    "run_id": self.run_id,
+                    "strategy": "mobile",
+                },
+            )
+        finally:
+            app.dependency_overrides.clear()
+        
+        assert response.status_code == 200
+        data = response.json()
+        assert data["scoring_method"] == "fallback"
+        assert data["overall_score"] == 72.0
+        assert data["timings"]["total"] == 0.5
+        mock_service.score_website.assert_awaited_once_with(
+            website_url="https://example.com",
+            business_id=self.business_id,
+            run_id=self.run_id,
+            strategy="mobile",
+            deadline=None,
+        )
+    
+    def test_score_website_pipeline_failure(self):
+        """Test a pipeline failure maps its error code to an HTTP status."""
+        from src.api.v1.website_scoring import get_scoring_pipeline_service
+        
+        mock_service = Mock()
+        mock_service.score_website = AsyncMock(return_value={
+            "success": False,
+            "error": "Rate limit exceeded",
+            "error_code": "RATE_LIMIT_EXCEEDED",
+            "context": "rate_limit_check",
+        })
+        app.dependency_overrides[get_scoring_pipeline_service] = lambda: mock_service
+        try:
+            response = self.client.post(
+                "/api/v1/website-scoring/score",
+                json={"website_url": "https://example.com", "business_id": self.business_id},
+            )
+        finally:
+            app.dependency_overrides.clear()
+        
+        assert response.status_code == 429
+        assert response.json()["detail"]["error_code"] == "RATE_LIMIT_EXCEEDED"
+    
+    def test_fallback_scoring_reports_recovered_audit(self):
+        """Test the fallback endpoint awaits the async path and returns the recovery."""
+        from src.api.v1.website_scoring import get_fallback_scoring_service
+        
+        recovered = {
+            "success": True,
+            "estimated": True,
+            "strategy": "mobile",
+            "scores": {"performance": 71.0},
+            "timing_probe": {"ttfb_ms": 420.0, "request_count": 12},
+        }
+        mock_service = Mock()
+        mock_service.validate_input.return_value = True
+        mock_service.run_fallback_scoring_async = AsyncMock(return_value={
+            "success": True,
+            "fallback_timestamp": 1234567890.0,
+            "fallback_score": {
+                "trust_score": 70.0,
+                "cro_score": 60.0,
+                "mobile_score": 80.0,
+                "content_score": 75.0,
+                "social_score": 50.0,
+                "overall_score": 67.0,
+                "confidence_level": "low",
+                "fallback_reason": "Request timed out",
+                "fallback_timestamp": 1234567890.0,
+            },
+            "fallback_reason": {
+                "failure_type": "TIMEOUT",
+                "error_message": "Request timed out",
+                "severity_level": "medium",
+                "fallback_decision": "retry_then_fallback",
+                "retry_attempts": 1,
+                "success_status": True,
+                "fallback_timestamp": 1234567890.0,
+            },
+            "fallback_quality": {
+                "reliability_score": 75.0,
+                "data_completeness": 85.0,
+                "confidence_adjustment": 0.7,
+                "quality_indicators": {},
+                "recommendation": "Results are moderately reliable",
+            },
+            "retry_attempts": 1,
+            "recovered_audit": recovered,
+        })
+        app.dependency_overrides[get_fallback_scoring_service] = lambda: mock_service
+        try:
+            response = self.client.post(
+                "/api/v1/website-scoring/fallback",
+                json={
+                    "website_url": "https://example.com",
+                    "business_id": self.business_id,
+                    "run_id": self.run_id,
+                    "lighthouse_failure_reason": "Request timed out",
+                },
+            )
+        finally:
+            app.dependency_overrides.clear()
+        
+        assert response.status_code == 200
+        assert response.json()["recovered_audit"] == recovered
+        mock_service.run_fallback_scoring_async.assert_awaited_once()
+        mock_service.run_fallback_scoring.assert_not_called()
+    
+    def test_lighthouse_batch_is_queued(self):
+        """Test a Lighthouse batch is queued and its status returned at once."""
+        from src.api.v1.website_scoring import get_lighthouse_batch_scheduler
+        
+        mock_scheduler = Mock()
+        mock_scheduler.submit_batch = AsyncMock(return_value={
+            "batch_id": "batch-1",
+            "total": 2,
+            "pending": 2,
+            "running": 0,
+            "completed": 0,
+            "failed": 0,
+            "progress": 0.0,
+            "eta_seconds": 31.5,
+            "throughput_per_minute": 0.0,
+        })
+        mock_scheduler.get_batch_status.return_value = None
+        app.dependency_overrides[get_lighthouse_batch_scheduler] = lambda: mock_scheduler
+        try:
+            response = self.client.post(
+                "/api/v1/website-scoring/lighthouse/batch",
+                json={
+                    "items": [
+                        {"website_url": "https://a.com", "business_id": "b1"},
+                        {"website_url": "https://b.com", "business_id": "b2"},
+                    ],
+                    "run_id": self.run_id,
+                },
+            )
+            missing = self.client.get(
+                "/api/v1/website-scoring/lighthouse/batch/unknown"
+            )
+        finally:
+            app.dependency_overrides.clear()
+        
+        assert response.status_code == 202
+        assert response.json()["batch_id"] == "batch-1"
+        items = mock_scheduler.submit_batch.call_args[0][0]
+        assert [business_id for _, business_id in items] == ["b1", "b2"]
+        assert missing.status_code == 404
+    
+    def test_lighthouse_trend_served_from_history(self):
+        """Test trends and comparisons come from the recorded history."""
+        from src.api.v1.website_scoring import get_vitals_history
+        from src.utils.vitals_history import VitalsHistoryStore
+        
+        history = VitalsHistoryStore()
+        for timestamp, score in ((1_767_225_600, 40.0), (1_769_904_000, 80.0)):
+            history.append(
+                self.business_id,
+                self.website_url,
+                "mobile",
+                {"overall": score, "largest_contentful_paint": 3000.0},
+                timestamp,
+            )
+        app.dependency_overrides[get_vitals_history] = lambda: history
+        try:
+            trend = self.client.get(
+                f"/api/v1/website-scoring/lighthouse/{self.business_id}/trend",
+                params={"bucket": "month", "strategy": "mobile"},
+            )
+            compare = self.client.post(
+                "/api/v1/website-scoring/lighthouse/history/compare",
+                json={
+                    "business_ids": [self.business_id],
+                    "pivot_timestamp": 1_768_000_000,
+                    "window_days": 60,
+                },
+            )
+        finally:
+            app.dependency_overrides.clear()
+        
+        assert trend.status_code == 200
+        assert [b["overall"] for b in trend.json()["buckets"]] == [40.0, 80.0]
+        assert trend.json()["summary"]["trend"] == 40.0
+        assert compare.status_code == 200
+        change = compare.json()["comparisons"][self.business_id]["change"]
+        assert change["overall"] == 40.0
@@ -3,9 +3,10 @@ Unit tests for FallbackScoringService.
 Tests fallback detection, retry logic, quality assessment, and error handling.
 """
 
+import asyncio
 import pytest
 import time
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import AsyncMock, Mock, patch, MagicMock
 from typing import Dict, Any
 
 from src.services.fallback_scoring_service import (
@@ -13,6 +14,7 @@ from src.services.fallback_scoring_service import (
     FailureSeverity,
     FallbackDecision
 )
+from src.services.rate_limiter import Reservation
 from src.schemas.website_scoring import (
     FallbackScore, FallbackReason, FallbackQuality, FallbackMetrics, ConfidenceLevel
 )
@@ -177,8 +179,9 @@ class TestFallbackScoringService:
         assert analysis["severity"] == FailureSeverity.MEDIUM
         assert analysis["decision"] == FallbackDecision.RETRY_THEN_FALLBACK
     
-    @patch('time.sleep')  # Mock sleep to speed up tests
-    def test_execute_retry_logic_success(self, mock_sleep, service):
+    @pytest.mark.asyncio
+    @patch('asyncio.sleep', new_callable=AsyncMock)  # Mock sleep to speed up tests
+    async def test_execute_retry_logic_success(self, mock_sleep, service):
         """Test successful retry logic execution."""
         failure_analysis = {
             "failure_type": "TIMEOUT",
@@ -186,16 +189,22 @@ class TestFallbackScoringService:
         }
         
         # Mock successful recovery on first retry
-        with patch.object(service, '_attempt_lighthouse_recovery', return_value=True):
-            retry_attempts = service._execute_retry_logic(
+        recovered = {"success": True, "scores": {"performance": 62.0}}
+        with patch.object(
+            service, '_attempt_lighthouse_recovery_async',
+            new=AsyncMock(return_value=recovered)
+        ):
+            retry_attempts, recovered_audit = await service._execute_retry_logic_async(
                 "https://example.com", "business123", "run123", failure_analysis
             )
         
         assert retry_attempts == 1
+        assert recovered_audit == recovered
         mock_sleep.assert_called_once_with(1.0)  # First retry delay
     
-    @patch('time.sleep')  # Mock sleep to speed up tests
-    def test_execute_retry_logic_all_failures(self, mock_sleep, service):
+    @pytest.mark.asyncio
+    @patch('asyncio.sleep', new_callable=AsyncMock)  # Mock sleep to speed up tests
+    async def test_execute_retry_logic_all_failures(self, mock_sleep, service):
         """Test retry logic when all attempts fail."""
         failure_analysis = {
             "failure_type": "NETWORK_ERROR",
@@ -203,35 +212,107 @@ class TestFallbackScoringService:
         }
         
         # Mock all recovery attempts fail
-        with patch.object(service, '_attempt_lighthouse_recovery', return_value=False):
-            retry_attempts = service._execute_retry_logic(
+        with patch.object(
+            service, '_attempt_lighthouse_recovery_async',
+            new=AsyncMock(return_value=None)
+        ):
+            retry_attempts, recovered_audit = await service._execute_retry_logic_async(
                 "https://example.com", "business123", "run123", failure_analysis
             )
         
         assert retry_attempts == 3
+        assert recovered_audit is None
         assert mock_sleep.call_count == 3  # All retry delays
     
-    def test_attempt_lighthouse_recovery(self, service):
-        """Test Lighthouse recovery attempt."""
-        # Mock the recovery attempt
-        with patch.object(service, '_attempt_lighthouse_recovery', return_value=False):
-            result = service._attempt_lighthouse_recovery(
-                "https://example.com", "business123", "run123"
+    @pytest.mark.asyncio
+    async def test_attempt_lighthouse_recovery(self, service):
+        """Test Lighthouse recovery runs a reduced-scope audit."""
+        service.lighthouse_service = Mock()
+        service.lighthouse_service.recover_audit_async = AsyncMock(return_value={
+            "success": False, "error_code": "FALLBACK_FAILED"
+        })
+        
+        result = await service._attempt_lighthouse_recovery_async(
+            "https://example.com", "business123", "run123"
+        )
+        
+        assert result is None
+        service.lighthouse_service.recover_audit_async.assert_awaited_once_with(
+            "https://example.com", "business123", "run123"
+        )
+    
+    @pytest.mark.asyncio
+    async def test_async_retry_backoff_does_not_block(self, service):
+        """Test async retries sleep without blocking the event loop."""
+        service.retry_delay_base = 0.05
+        estimate = {"success": True, "estimated": True, "scores": {"performance": 71.0}}
+        service.lighthouse_service = Mock()
+        service.lighthouse_service.recover_audit_async = AsyncMock(
+            side_effect=[{"success": False, "error_code": "FALLBACK_FAILED"}, estimate]
+        )
+        ticks = 0
+        
+        async def ticker():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+        
+        ticking = asyncio.create_task(ticker())
+        try:
+            retry_attempts, recovered_audit = await service._execute_retry_logic_async(
+                "https://example.com", "business123", "run123",
+                {"failure_type": "TIMEOUT", "retry_count": 2},
             )
+        finally:
+            ticking.cancel()
         
-        assert result is False
+        assert retry_attempts == 2
+        assert recovered_audit == estimate
+        # 0.05s + 0.1s of backoff, during which the loop kept running
+        assert ticks >= 10
     
-    def test_run_heuristic_evaluation_success(self, service, mock_heuristic_result):
+    @pytest.mark.asyncio
+    async def test_run_fallback_scoring_async_includes_recovered_audit(
+        self, service, mock_heuristic_result
+    ):
+        """Test the async path reports the audit recovered during retries."""
+        service.retry_delay_base = 0
+        service.rate_limiter = Mock()
+        service.rate_limiter.acquire = AsyncMock(return_value=Reservation("fallback", True, "OK"))
+        estimate = {"success": True, "estimated": True, "scores": {"performance": 71.0}}
+        service.lighthouse_service = Mock()
+        service.lighthouse_service.recover_audit_async = AsyncMock(return_value=estimate)
+        service.heuristic_service = Mock()
+        service.heuristic_service.run_heuristic_evaluation_async = AsyncMock(
+            return_value=mock_heuristic_result
+        )
+        
+        result = await service.run_fallback_scoring_async(
+            "https://example.com", "business123", "Request timed out", "run123"
+        )
+        
+        assert result["success"] is True
+        assert result["retry_attempts"] == 1
+        assert result["recovered_audit"] == estimate
+        service.heuristic_service.run_heuristic_evaluation.assert_not_called()
+    
+    @pytest.mark.asyncio
+    async def test_run_heuristic_evaluation_success(self, service, mock_heuristic_result):
         """Test successful heuristic evaluation."""
-        with patch.object(service.heuristic_service, 'run_heuristic_evaluation', return_value=mock_heuristic_result):
-            result = service._run_heuristic_evaluation(
+        with patch.object(
+            service.heuristic_service, 'run_heuristic_evaluation_async',
+            new=AsyncMock(return_value=mock_heuristic_result)
+        ):
+            result = await service._run_heuristic_evaluation_async(
                 "https://example.com", "business123", "run123"
             )
         
         assert result["success"] is True
         assert result["scores"]["overall_heuristic_score"] == 73.6
     
-    def test_run_heuristic_evaluation_failure(self, service):
+    @pytest.mark.asyncio
+    async def test_run_heuristic_evaluation_failure(self, service):
         """Test heuristic evaluation failure."""
         failed_result = {
             "success": False,
@@ -239,8 +320,11 @@ class TestFallbackScoringService:
             "context": "evaluation_execution"
         }
         
-        with patch.object(service.heuristic_service, 'run_heuristic_evaluation', return_value=failed_result):
-            result = service._run_heuristic_evaluation(
+        with patch.object(
+            service.heuristic_service, 'run_heuristic_evaluation_async',
+            new=AsyncMock(return_value=failed_result)
+        ):
+            result = await service._run_heuristic_evaluation_async(
                 "https://example.com", "business123", "run123"
             )
         
@@ -390,10 +474,10 @@ class TestFallbackScoringService:
         assert "low reliability" in recommendation.lower()
         assert "critical decisions" in recommendation.lower()
     
-    @patch('src.services.rate_limiter.RateLimiter.can_make_request')
-    def test_run_fallback_scoring_rate_limit_exceeded(self, mock_can_make_request, service):
+    @patch('src.services.rate_limiter.RateLimiter.acquire', new_callable=AsyncMock)
+    def test_run_fallback_scoring_rate_limit_exceeded(self, mock_acquire, service):
         """Test fallback scoring when rate limit is exceeded."""
-        mock_can_make_request.return_value = (False, "Rate limit exceeded")
+        mock_acquire.return_value = Reservation("fallback", False, "Rate limit exceeded")
         
         result = service.run_fallback_scoring(
             "https://example.com",
@@ -405,12 +489,27 @@ class TestFallbackScoringService:
         assert result["success"] is False
         assert "Rate limit exceeded" in result["error"]
         assert result["context"] == "rate_limit_check"
-    
-    @patch('src.services.rate_limiter.RateLimiter.can_make_request')
+
+    @pytest.mark.asyncio
+    @patch('src.services.rate_limiter.RateLimiter.acquire', new_callable=AsyncMock)
+    async def test_run_fallback_scoring_from_a_running_loop(self, mock_acquire, service):
+        """Test the synchronous entry point can be called while an event loop is running."""
+        mock_acquire.return_value = Reservation("fallback", False, "Rate limit exceeded")
+
+        result = service.run_fallback_scoring(
+            "https://example.com",
+            "business123",
+            "Request timed out",
+            "run123"
+        )
+
+        assert result["context"] == "rate_limit_check"
+
+    @patch('src.services.rate_limiter.RateLimiter.acquire', new_callable=AsyncMock)
     @patch('src.services.fallback_scoring_service.FallbackScoringService._analyze_failure')
-    def test_run_fallback_scoring_no_fallback_recommended(self, mock_analyze_failure, mock_can_make_request, service):
+    def test_run_fallback_scoring_no_fallback_recommended(self, mock_analyze_failure, mock_acquire, service):
         """Test fallback scoring when fallback is not recommended."""
-        mock_can_make_request.return_value = (True, "OK")
+        mock_acquire.return_value = Reservation("fallback", True, "OK")
         mock_analyze_failure.return_value = {
             "decision": FallbackDecision.NO_FALLBACK,
             "severity": FailureSeverity.CRITICAL
@@ -427,10 +526,10 @@ class TestFallbackScoringService:
         assert "not recommended" in result["error"]
         assert result["context"] == "fallback_strategy"
     
-    @patch('src.services.rate_limiter.RateLimiter.can_make_request')
+    @patch('src.services.rate_limiter.RateLimiter.acquire', new_callable=AsyncMock)
     @patch('src.services.fallback_scoring_service.FallbackScoringService._analyze_failure')
-    @patch('src.services.fallback_scoring_service.FallbackScoringService._execute_retry_logic')
-    @patch('src.services.fallback_scoring_service.FallbackScoringService._run_heuristic_evaluation')
+    @patch('src.services.fallback_scoring_service.FallbackScoringService._execute_retry_logic_async', new_callable=AsyncMock)
+    @patch('src.services.fallback_scoring_service.FallbackScoringService._run_heuristic_evaluation_async', new_callable=AsyncMock)
     @patch('src.services.fallback_scoring_service.FallbackScoringService._create_fallback_score')
     @patch('src.services.fallback_scoring_service.FallbackScoringService._create_fallback_reason')
     @patch('src.services.fallback_scoring_service.FallbackScoringService._assess_fallback_quality')
@@ -444,19 +543,20 @@ class TestFallbackScoringService:
         mock_run_heuristic,
         mock_execute_retry,
         mock_analyze_failure,
-        mock_can_make_request,
+        mock_acquire,
         service,
         mock_heuristic_result
     ):
         """Test successful fallback scoring execution."""
         # Setup mocks
-        mock_can_make_request.return_value = (True, "OK")
+        reservation = Reservation("fallback", True, "OK")
+        mock_acquire.return_value = reservation
         mock_analyze_failure.return_value = {
             "decision": FallbackDecision.RETRY_THEN_FALLBACK,
             "severity": FailureSeverity.MEDIUM,
             "retry_count": 2
         }
-        mock_execute_retry.return_value = 1
+        mock_execute_retry.return_value = (1, None)
         mock_run_heuristic.return_value = mock_heuristic_result
         
         mock_fallback_score = FallbackScore(
@@ -511,14 +611,14 @@ class TestFallbackScoringService:
         assert result["fallback_quality"] == mock_fallback_quality
         
         # Verify mocks were called
-        mock_can_make_request.assert_called_once_with("fallback", "run123")
+        mock_acquire.assert_awaited_once_with("fallback", service.quota_wait, run_id="run123")
         mock_analyze_failure.assert_called_once_with("Request timed out")
-        mock_execute_retry.assert_called_once()
-        mock_run_heuristic.assert_called_once()
+        mock_execute_retry.assert_awaited_once()
+        mock_run_heuristic.assert_awaited_once()
         mock_create_score.assert_called_once()
         mock_create_reason.assert_called_once()
         mock_assess_quality.assert_called_once()
-        mock_record_request.assert_called_once_with("fallback", True, "run123")
+        mock_record_request.assert_called_once_with("fallback", True, "run123", reservation)
     
     def test_get_fallback_metrics(self, service):
         """Test fallback metrics retrieval."""
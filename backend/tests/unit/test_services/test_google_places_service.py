@@ -2,10 +2,14 @@
 Unit tests for Google Places business search service.
 """
 
+import asyncio
+import time
+
 import pytest
 from unittest.mock import Mock, patch, MagicMock
 from typing import Dict, Any
 from src.services import GooglePlacesService
+from src.services.rate_limiter import RateLimiter, Reservation
 from src.schemas import (
     BusinessSearchRequest, BusinessData, BusinessSearchResponse, 
     BusinessSearchError, LocationType
@@ -21,7 +25,8 @@ class TestGooglePlacesService:
         with patch('src.services.google_places_service.get_api_config') as mock_config:
             mock_config.return_value = Mock(
                 GOOGLE_PLACES_API_KEY="test_api_key",
-                API_TIMEOUT_SECONDS=30
+                API_TIMEOUT_SECONDS=30,
+                RATE_LIMITER_ACQUIRE_TIMEOUT_SECONDS=30.0
             )
             return GooglePlacesService()
     
@@ -30,6 +35,7 @@ class TestGooglePlacesService:
         """Mock rate limiter that allows all requests."""
         mock_limiter = Mock()
         mock_limiter.can_make_request.return_value = (True, None)
+        mock_limiter.acquire_blocking.return_value = Reservation("google_places", True, "OK")
         mock_limiter.record_request.return_value = None
         return mock_limiter
     
@@ -83,7 +89,7 @@ class TestGooglePlacesService:
         """Test successful business search."""
         # Mock rate limiter
         service.rate_limiter = Mock()
-        service.rate_limiter.can_make_request.return_value = (True, None)
+        service.rate_limiter.acquire_blocking.return_value = Reservation("google_places", True, "OK")
         service.rate_limiter.record_request.return_value = None
         
         # Mock HTTP client response
@@ -122,12 +128,57 @@ class TestGooglePlacesService:
         assert business.website == "https://testrestaurant.com"
         assert business.rating == 4.5
     
+    @pytest.mark.asyncio
+    @patch('src.services.google_places_service.httpx.Client')
+    async def test_search_businesses_async_leaves_the_loop_free(
+        self, mock_client, service, sample_search_request, sample_business_data
+    ):
+        """Test waiting for quota and the HTTP request do not block the event loop."""
+        limiter = service.rate_limiter = RateLimiter()
+        limiter._rate_limits["google_places"]["limit"] = 1
+        held = limiter.acquire_blocking("google_places", timeout=0)
+        response = Mock(status_code=200)
+        response.json.return_value = {"status": "OK", "results": [sample_business_data]}
+
+        def slow_get(*args, **kwargs):
+            time.sleep(0.1)
+            return response
+
+        mock_client.return_value.__enter__.return_value.get.side_effect = slow_get
+        ticks = 0
+
+        async def tick():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.005)
+                ticks += 1
+
+        ticker = asyncio.create_task(tick())
+        search = asyncio.create_task(service.search_businesses_async(sample_search_request))
+        while not limiter.get_queue_length("google_places"):
+            await asyncio.sleep(0)
+        queued_at = ticks
+        await asyncio.sleep(0.05)
+        assert ticks > queued_at
+
+        released_at = ticks
+        limiter.release(held)
+        result = await asyncio.wait_for(search, 5)
+        ticker.cancel()
+        limiter.close()
+
+        assert isinstance(result, BusinessSearchResponse)
+        assert result.total_results == 1
+        assert ticks - released_at >= 5
+    
     @patch('src.services.google_places_service.httpx.Client')
     def test_search_businesses_rate_limit_exceeded(self, mock_client, service, sample_search_request):
         """Test business search when rate limit is exceeded."""
         # Mock rate limiter to deny request
         service.rate_limiter = Mock()
-        service.rate_limiter.can_make_request.return_value = (False, "Rate limit exceeded")
+        service.rate_limiter.acquire_blocking.return_value = Reservation(
+            "google_places", False, "Rate limit exceeded"
+        )
         
         # Execute search
         result = service.search_businesses(sample_search_request)
@@ -143,7 +194,7 @@ class TestGooglePlacesService:
         """Test business search with invalid location."""
         # Mock rate limiter
         service.rate_limiter = Mock()
-        service.rate_limiter.can_make_request.return_value = (True, None)
+        service.rate_limiter.acquire_blocking.return_value = Reservation("google_places", True, "OK")
         
         # Set invalid location
         sample_search_request.location = ""
@@ -163,7 +214,7 @@ class TestGooglePlacesService:
         """Test business search when API returns error."""
         # Mock rate limiter
         service.rate_limiter = Mock()
-        service.rate_limiter.can_make_request.return_value = (True, None)
+        service.rate_limiter.acquire_blocking.return_value = Reservation("google_places", True, "OK")
         service.rate_limiter.record_request.return_value = None
         
         # Mock HTTP client response with API error
@@ -195,7 +246,7 @@ class TestGooglePlacesService:
         """Test business search when HTTP request fails."""
         # Mock rate limiter
         service.rate_limiter = Mock()
-        service.rate_limiter.can_make_request.return_value = (True, None)
+        service.rate_limiter.acquire_blocking.return_value = Reservation("google_places", True, "OK")
         service.rate_limiter.record_request.return_value = None
         
         # Mock HTTP client response with HTTP error
@@ -224,7 +275,7 @@ class TestGooglePlacesService:
         """Test business search when request times out."""
         # Mock rate limiter
         service.rate_limiter = Mock()
-        service.rate_limiter.can_make_request.return_value = (True, None)
+        service.rate_limiter.acquire_blocking.return_value = Reservation("google_places", True, "OK")
         
         # Mock HTTP client to raise timeout exception
         mock_client_instance = Mock()
@@ -4,11 +4,27 @@ Tests heuristic evaluation functionality including trust signals, CRO elements,
 """
 
 import pytest
-from unittest.mock import Mock, patch, MagicMock
+import asyncio
+import pickle
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from unittest.mock import AsyncMock, Mock, patch, MagicMock
 from bs4 import BeautifulSoup
 import requests
 
-from src.services.heuristic_evaluation_service import HeuristicEvaluationService
+from src.services.heuristic_evaluation_service import (
+    HeuristicEvaluationService,
+    _evaluate_in_worker,
+    _init_evaluation_worker,
+    _pack_evaluation,
+    _unpack_evaluation,
+)
+from src.services.rate_limiter import Reservation, RequestPriority
+from src.services.web_fetcher import FetchResult
+from src.utils.html_parsers import StreamingPageParser
+from src.utils.http_cache import HTTPCache
+from src.utils.page_features import PageFeatures, extract_page_features
+from src.utils.result_cache import MemoryCacheBackend, TieredCache
 from src.schemas.website_scoring import (
     TrustSignals, CROElements, MobileUsability, ContentQuality, SocialProof,
     HeuristicScore, ConfidenceLevel
@@ -20,12 +36,24 @@ class TestHeuristicEvaluationService:
     
     def setup_method(self):
         """Set up test fixtures."""
-        with patch('src.services.heuristic_evaluation_service.get_api_config'):
-            with patch('src.services.heuristic_evaluation_service.RateLimiter'):
+        with patch('src.services.heuristic_evaluation_service.get_api_config') as mock_config:
+            mock_config.return_value.HEURISTICS_HTML_PARSER = "streaming"
+            mock_config.return_value.HEURISTICS_MAX_CONCURRENCY = 10
+            mock_config.return_value.HEURISTICS_MAX_PAGE_BYTES = 1_000_000
+            mock_config.return_value.HEURISTICS_FETCH_CACHE_ENABLED = False
+            mock_config.return_value.HEURISTICS_RESULT_CACHE_ENABLED = False
+            mock_config.return_value.HEURISTICS_CRAWL_ENABLED = False
+            mock_config.return_value.HEURISTICS_CRAWL_MAX_PAGES = 5
+            mock_config.return_value.HEURISTICS_CRAWL_TIME_BUDGET_SECONDS = 5.0
+            mock_config.return_value.HEURISTICS_PROCESS_POOL_WORKERS = 0
+            with patch('src.services.heuristic_evaluation_service.get_rate_limiter'):
                 self.service = HeuristicEvaluationService()
                 self.service.api_config.HEURISTICS_EVALUATION_TIMEOUT_SECONDS = 15
                 self.service.rate_limiter = Mock()
                 self.service.rate_limiter.can_make_request.return_value = (True, "OK")
+                self.service.rate_limiter.acquire = AsyncMock(
+                    return_value=Reservation("heuristics", True, "OK")
+                )
                 self.service.rate_limiter.record_request.return_value = None
         
         self.run_id = "test-run-12345"
@@ -54,49 +82,101 @@ class TestHeuristicEvaluationService:
             assert self.service.validate_input(data) is False
     
     @patch('src.services.heuristic_evaluation_service.requests.get')
-    def test_fetch_website_success(self, mock_get):
+    def test_download_page_success(self, mock_get):
         """Test successful website fetching."""
         # Mock response
         mock_response = Mock()
         mock_response.status_code = 200
         mock_response.text = '<html><head><title>Test</title></head><body>Test content</body></html>'
         mock_response.content = b'<html><head><title>Test</title></head><body>Test content</body></html>'
+        mock_response.headers = {'Content-Type': 'text/html; charset=utf-8'}
+        mock_response.iter_content.return_value = [mock_response.content]
         mock_get.return_value = mock_response
         
-        html_content, soup = self.service._fetch_website(
-            self.website_url
-        )
+        html_content = self.service._download_page(self.website_url)
+        features = self.service.page_parser.parse(html_content)
         
-        assert html_content is not None
-        assert soup is not None
-        assert isinstance(soup, BeautifulSoup)
-        assert soup.title.string == 'Test'
+        assert html_content == mock_response.content.decode()
+        assert isinstance(features, PageFeatures)
+        assert features.text == 'testtest content'
     
     @patch('src.services.heuristic_evaluation_service.requests.get')
-    def test_fetch_website_timeout(self, mock_get):
+    def test_download_page_timeout(self, mock_get):
         """Test website fetching timeout handling."""
         mock_get.side_effect = requests.Timeout("Request timed out")
         
-        html_content, soup = self.service._fetch_website(self.website_url)
-        assert html_content is None
-        assert soup is None
+        assert self.service._download_page(self.website_url) is None
     
     @patch('src.services.heuristic_evaluation_service.requests.get')
-    def test_fetch_website_request_exception(self, mock_get):
+    def test_download_page_request_exception(self, mock_get):
         """Test website fetching request exception handling."""
         mock_get.side_effect = requests.RequestException("Request failed")
         
-        html_content, soup = self.service._fetch_website(self.website_url)
+        assert self.service._download_page(self.website_url) is None
+    
+    @patch('src.services.heuristic_evaluation_service.requests.get')
+    def test_download_page_skips_non_html(self, mock_get):
+        """Test non-HTML responses are abandoned before the body is read."""
+        mock_response = Mock()
+        mock_response.headers = {'Content-Type': 'application/pdf'}
+        mock_get.return_value = mock_response
+        
+        html_content = self.service._download_page(self.website_url)
+        
         assert html_content is None
-        assert soup is None
+        mock_response.iter_content.assert_not_called()
+        mock_response.close.assert_called_once()
+    
+    @patch('src.services.heuristic_evaluation_service.requests.get')
+    def test_download_page_truncates_large_pages(self, mock_get):
+        """Test downloads stop at the configured byte budget."""
+        self.service.max_page_bytes = 10_000
+        chunks = [b'<html><body>' + b'x' * 8000] + [b'<p>filler</p>' * 1000] * 50
+        mock_response = Mock()
+        mock_response.headers = {'Content-Type': 'text/html'}
+        mock_response.iter_content.return_value = iter(chunks)
+        mock_get.return_value = mock_response
+        
+        html_content = self.service._download_page(self.website_url)
+        
+        assert len(html_content) == 10_000
+        assert mock_get.call_args.kwargs['stream'] is True
+        mock_response.close.assert_called_once()
+    
+    @patch('src.services.heuristic_evaluation_service.requests.get')
+    def test_download_page_uses_cache(self, mock_get, tmp_path):
+        """Test cached pages are reused and revalidated with a conditional GET."""
+        self.service.fetch_cache = HTTPCache(tmp_path, ttl_seconds=60)
+        html = b'<html><body>Contact us</body></html>'
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.url = self.website_url
+        mock_response.headers = {'Content-Type': 'text/html', 'ETag': '"v1"'}
+        mock_response.iter_content.return_value = [html]
+        mock_get.return_value = mock_response
+        
+        first = self.service._download_page(self.website_url)
+        fresh = self.service._download_page(self.website_url)
+        assert mock_get.call_count == 1
+        
+        self.service.fetch_cache.ttl_seconds = 0
+        not_modified = Mock()
+        not_modified.status_code = 304
+        not_modified.headers = {'ETag': '"v1"'}
+        mock_get.return_value = not_modified
+        revalidated = self.service._download_page(self.website_url)
+        
+        assert first == fresh == revalidated == html.decode()
+        assert mock_get.call_args.kwargs['headers']['If-None-Match'] == '"v1"'
+        not_modified.iter_content.assert_not_called()
     
     def test_evaluate_trust_signals_https(self):
         """Test trust signal evaluation with HTTPS."""
         html = '<html><body><a href="/privacy">Privacy</a><a href="/contact">Contact</a></body></html>'
-        soup = BeautifulSoup(html, 'html.parser')
+        features = extract_page_features(BeautifulSoup(html, 'html.parser'))
         
         trust_signals = self.service._evaluate_trust_signals(
-            "https://example.com", soup
+            "https://example.com", features
         )
         
         assert trust_signals.has_https is True
@@ -106,10 +186,10 @@ class TestHeuristicEvaluationService:
     def test_evaluate_trust_signals_http(self):
         """Test trust signal evaluation with HTTP."""
         html = '<html><body><a href="/privacy">Privacy</a></body></html>'
-        soup = BeautifulSoup(html, 'html.parser')
+        features = extract_page_features(BeautifulSoup(html, 'html.parser'))
         
         trust_signals = self.service._evaluate_trust_signals(
-            "http://example.com", soup
+            "http://example.com", features
         )
         
         assert trust_signals.has_https is False
@@ -126,10 +206,10 @@ class TestHeuristicEvaluationService:
         </body>
         </html>
         '''
-        soup = BeautifulSoup(html, 'html.parser')
+        features = extract_page_features(BeautifulSoup(html, 'html.parser'))
         
         trust_signals = self.service._evaluate_trust_signals(
-            self.website_url, soup
+            self.website_url, features
         )
         
         assert trust_signals.has_phone_number is True
@@ -150,9 +230,9 @@ class TestHeuristicEvaluationService:
         </body>
         </html>
         '''
-        soup = BeautifulSoup(html, 'html.parser')
+        features = extract_page_features(BeautifulSoup(html, 'html.parser'))
         
-        cro_elements = self.service._evaluate_cro_elements(soup)
+        cro_elements = self.service._evaluate_cro_elements(features)
         
         assert cro_elements.has_cta_buttons is True
         assert cro_elements.has_contact_forms is True
@@ -173,9 +253,9 @@ class TestHeuristicEvaluationService:
         </body>
         </html>
         '''
-        soup = BeautifulSoup(html, 'html.parser')
+        features = extract_page_features(BeautifulSoup(html, 'html.parser'))
         
-        mobile_usability = self.service._evaluate_mobile_usability(soup)
+        mobile_usability = self.service._evaluate_mobile_usability(features)
         
         assert mobile_usability.has_viewport_meta is True
         assert mobile_usability.has_touch_targets is True
@@ -199,9 +279,9 @@ class TestHeuristicEvaluationService:
         </body>
         </html>
         '''
-        soup = BeautifulSoup(html, 'html.parser')
+        features = extract_page_features(BeautifulSoup(html, 'html.parser'))
         
-        content_quality = self.service._evaluate_content_quality(soup)
+        content_quality = self.service._evaluate_content_quality(features)
         
         assert content_quality.has_proper_headings is True
         assert content_quality.has_alt_text is True
@@ -225,9 +305,9 @@ class TestHeuristicEvaluationService:
         </body>
         </html>
         '''
-        soup = BeautifulSoup(html, 'html.parser')
+        features = extract_page_features(BeautifulSoup(html, 'html.parser'))
         
-        social_proof = self.service._evaluate_social_proof(soup)
+        social_proof = self.service._evaluate_social_proof(features)
         
         assert social_proof.has_social_media_links is True
         assert social_proof.has_customer_reviews is True
@@ -454,6 +534,8 @@ class TestHeuristicEvaluationService:
         mock_response.status_code = 200
         mock_response.text = '<html><body><button>Get Started</button><form></form></body></html>'
         mock_response.content = b'<html><body><button>Get Started</button><form></form></body></html>'
+        mock_response.headers = {'Content-Type': 'text/html; charset=utf-8'}
+        mock_response.iter_content.return_value = [mock_response.content]
         mock_get.return_value = mock_response
         
         result = self.service.run_heuristic_evaluation(
@@ -502,8 +584,506 @@ class TestHeuristicEvaluationService:
         # They were part of an earlier design that was simplified
         pass
     
+    @pytest.mark.asyncio
+    async def test_run_heuristic_evaluation_async_success(self):
+        """Test non-blocking evaluation through the shared fetcher."""
+        html = '<html><body><button>Get Started</button><a href="/privacy">Privacy</a></body></html>'
+        self.service.web_fetcher = Mock()
+        self.service.web_fetcher.fetch_html = AsyncMock(
+            return_value=FetchResult(url=self.website_url, status_code=200, text=html)
+        )
+        
+        result = await self.service.run_heuristic_evaluation_async(
+            self.website_url, self.business_id, self.run_id
+        )
+        
+        assert result["success"] is True
+        assert result["cro_elements"]["has_cta_buttons"] is True
+        assert result["trust_signals"]["has_privacy_policy"] is True
+        assert result["raw_data"]["html_length"] == len(html)
+        self.service.rate_limiter.record_request.assert_called_with(
+            "heuristics", True, self.run_id, self.service.rate_limiter.acquire.return_value
+        )
+    
+    @pytest.mark.asyncio
+    async def test_run_heuristic_evaluation_async_fetch_failed(self):
+        """Test async evaluation reports fetch failures."""
+        self.service.web_fetcher = Mock()
+        self.service.web_fetcher.fetch_html = AsyncMock(
+            return_value=FetchResult(url=self.website_url, error="HTTP 500", error_code="HTTP_ERROR")
+        )
+        
+        result = await self.service.run_heuristic_evaluation_async(
+            self.website_url, self.business_id, self.run_id
+        )
+        
+        assert result["success"] is False
+        assert result["error_code"] == "FETCH_FAILED"
+    
+    @pytest.mark.asyncio
+    async def test_run_heuristic_evaluation_async_rate_limit_exceeded(self):
+        """Test async evaluation honours the rate limiter."""
+        self.service.rate_limiter.acquire.return_value = Reservation(
+            "heuristics", False, "Timed out waiting for capacity"
+        )
+        self.service.web_fetcher = Mock()
+        self.service.web_fetcher.fetch_html = AsyncMock()
+        
+        result = await self.service.run_heuristic_evaluation_async(
+            self.website_url, self.business_id, self.run_id
+        )
+        
+        assert result["error_code"] == "RATE_LIMIT_EXCEEDED"
+        self.service.web_fetcher.fetch_html.assert_not_called()
+    
+    @pytest.mark.asyncio
+    async def test_run_heuristic_evaluation_async_fetch_failure_releases_slot(self):
+        """Test an unreachable site gives its rate limit slot back."""
+        self.service.web_fetcher = Mock()
+        self.service.web_fetcher.fetch_html = AsyncMock(
+            return_value=FetchResult(url=self.website_url, error="HTTP 500", error_code="HTTP_ERROR")
+        )
+        
+        await self.service.run_heuristic_evaluation_async(
+            self.website_url, self.business_id, self.run_id
+        )
+        
+        self.service.rate_limiter.release.assert_called_once_with(
+            self.service.rate_limiter.acquire.return_value, self.run_id
+        )
+        self.service.rate_limiter.record_request.assert_not_called()
+    
+    @pytest.mark.asyncio
+    async def test_evaluate_stream_paces_items_through_the_rate_limiter(self):
+        """Test batch items wait for capacity at batch priority instead of failing."""
+        self.service.web_fetcher = Mock()
+        self.service.web_fetcher.fetch_html = AsyncMock(
+            return_value=FetchResult(url=self.website_url, status_code=200, text="<html></html>")
+        )
+        items = [(f"biz-{i}", f"https://site{i}.example.com") for i in range(3)]
+        
+        streamed = [
+            entry async for entry in self.service.evaluate_stream(items, run_id=self.run_id)
+        ]
+        
+        assert all(result["success"] for _, result, _ in streamed)
+        assert self.service.rate_limiter.acquire.await_count == 3
+        for call in self.service.rate_limiter.acquire.await_args_list:
+            assert call.args == ("heuristics", None, RequestPriority.BATCH, self.run_id)
+        self.service.rate_limiter.can_make_request.assert_not_called()
+    
+    @pytest.mark.asyncio
+    async def test_evaluate_stream_starts_items_as_slots_free_up(self):
+        """Test a large batch is not scheduled all at once."""
+        self.service.max_concurrency = 2
+        in_flight = 0
+        peak = 0
+        
+        async def fetch_html(url, headers=None, max_bytes=None, cache=None):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.005)
+            in_flight -= 1
+            return FetchResult(url=url, status_code=200, text="<html></html>")
+        
+        self.service.web_fetcher = Mock()
+        self.service.web_fetcher.fetch_html = fetch_html
+        items = [(f"biz-{i}", f"https://site{i}.example.com") for i in range(10)]
+        
+        streamed = [
+            entry async for entry in self.service.evaluate_stream(items, run_id=self.run_id)
+        ]
+        
+        assert sorted(index for index, _, _ in streamed) == list(range(10))
+        assert peak == 2
+    
+    @pytest.mark.asyncio
+    async def test_evaluate_many_runs_concurrently(self):
+        """Test many sites are evaluated concurrently and returned in order."""
+        in_flight = 0
+        peak = 0
+        
+        async def fetch_html(url, headers=None, max_bytes=None, cache=None):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            if "broken" in url:
+                return FetchResult(url=url, error="HTTP 404", error_code="HTTP_ERROR")
+            return FetchResult(url=url, status_code=200, text="<html><body>Contact us</body></html>")
+        
+        self.service.web_fetcher = Mock()
+        self.service.web_fetcher.fetch_html = fetch_html
+        urls = [f"https://site{i}.example.com" for i in range(8)] + ["https://broken.example.com"]
+        
+        results = await self.service.evaluate_many(urls, run_id=self.run_id, max_concurrency=4)
+        
+        assert [result.get("business_id") for result in results] == urls
+        assert all(result["success"] for result in results[:-1])
+        assert results[-1]["error_code"] == "FETCH_FAILED"
+        assert 1 < peak <= 4
+    
+    @pytest.mark.asyncio
+    async def test_crawl_merges_linked_page_evidence(self):
+        """Test crawl mode fetches linked policy pages and merges their signals."""
+        pages = {
+            "https://example.com": (
+                '<html><body><h1>Bakery</h1>'
+                '<a href="/menu">Menu</a>'
+                '<a href="/contact">Say hello</a>'
+                '<a href="https://twitter.com/privacy">Twitter privacy</a>'
+                '</body></html>'
+            ),
+            "https://example.com/contact": (
+                '<html><body><form action="/send"><input type="email" name="email">'
+                '<button>Send</button></form></body></html>'
+            ),
+        }
+        fetched = []
+        
+        async def fetch_html(url, headers=None, max_bytes=None, cache=None):
+            fetched.append(url)
+            if url not in pages:
+                return FetchResult(url=url, error="HTTP 404", error_code="HTTP_ERROR")
+            return FetchResult(url=url, final_url=url, status_code=200, text=pages[url])
+        
+        self.service.web_fetcher = Mock()
+        self.service.web_fetcher.fetch_html = fetch_html
+        
+        landing_only = await self.service.run_heuristic_evaluation_async(
+            self.website_url, self.business_id, self.run_id
+        )
+        fetched.clear()
+        result = await self.service.run_heuristic_evaluation_async(
+            self.website_url, self.business_id, self.run_id, crawl=True
+        )
+        
+        assert fetched == ["https://example.com", "https://example.com/contact"]
+        assert landing_only["cro_elements"]["has_contact_forms"] is False
+        assert result["success"] is True
+        assert result["trust_signals"]["has_contact_info"] is True
+        assert result["cro_elements"]["has_contact_forms"] is True
+        assert result["scores"].overall_heuristic_score > landing_only["scores"].overall_heuristic_score
+        assert result["raw_data"]["crawled_pages"] == [
+            {"url": "https://example.com/contact", "kind": "contact", "html_length": len(pages["https://example.com/contact"])}
+        ]
+    
+    @pytest.mark.asyncio
+    async def test_crawl_needs_pricing_table_on_pricing_page(self):
+        """Test reaching a pricing page alone is not evidence of a pricing table."""
+        pages = {
+            "https://example.com": '<html><body><a href="/rates">Rates</a></body></html>',
+            "https://example.com/rates": '<html><body><h1>Call us for a quote</h1></body></html>',
+        }
+        
+        async def fetch_html(url, headers=None, max_bytes=None, cache=None):
+            return FetchResult(url=url, final_url=url, status_code=200, text=pages[url])
+        
+        self.service.web_fetcher = Mock()
+        self.service.web_fetcher.fetch_html = fetch_html
+        
+        result = await self.service.run_heuristic_evaluation_async(
+            self.website_url, self.business_id, self.run_id, crawl=True
+        )
+        
+        assert [page["kind"] for page in result["raw_data"]["crawled_pages"]] == ["pricing"]
+        assert result["cro_elements"]["has_pricing_tables"] is False
+    
+    @pytest.mark.asyncio
+    async def test_crawl_respects_time_budget(self):
+        """Test linked pages that miss the time budget are skipped."""
+        self.service.crawl_time_budget = 0.05
+        landing = '<html><body><a href="/privacy">Privacy</a><a href="/about">About</a></body></html>'
+        
+        async def fetch_html(url, headers=None, max_bytes=None, cache=None):
+            if url.endswith("/about"):
+                await asyncio.sleep(1)
+            return FetchResult(url=url, final_url=url, status_code=200, text=landing)
+        
+        self.service.web_fetcher = Mock()
+        self.service.web_fetcher.fetch_html = fetch_html
+        
+        result = await self.service.run_heuristic_evaluation_async(
+            self.website_url, self.business_id, self.run_id, crawl=True
+        )
+        
+        assert result["success"] is True
+        assert [page["kind"] for page in result["raw_data"]["crawled_pages"]] == ["privacy"]
+    
+    @pytest.mark.asyncio
+    async def test_evaluate_many_business_ids_mismatch(self):
+        """Test business ids must line up with URLs."""
+        with pytest.raises(ValueError):
+            await self.service.evaluate_many(["https://a.example.com"], business_ids=[])
+    
+    @pytest.mark.asyncio
+    async def test_evaluate_stream_yields_in_completion_order(self):
+        """Test streamed results arrive as they finish, tagged with their index."""
+        delays = {"https://slow.example.com": 0.05, "https://fast.example.com": 0.0}
+        
+        async def fetch_html(url, headers=None, max_bytes=None, cache=None):
+            await asyncio.sleep(delays.get(url, 0.01))
+            if "broken" in url:
+                return FetchResult(url=url, error="HTTP 404", error_code="HTTP_ERROR")
+            return FetchResult(url=url, status_code=200, text="<html><body>Contact us</body></html>")
+        
+        self.service.web_fetcher = Mock()
+        self.service.web_fetcher.fetch_html = fetch_html
+        items = [
+            ("biz-slow", "https://slow.example.com"),
+            ("biz-fast", "https://fast.example.com"),
+            ("biz-broken", "https://broken.example.com"),
+        ]
+        
+        streamed = [
+            entry async for entry in self.service.evaluate_stream(items, run_id=self.run_id)
+        ]
+        
+        assert [index for index, _, _ in streamed] == [1, 2, 0]
+        assert [result["success"] for _, result, _ in streamed] == [True, False, True]
+        assert streamed[1][1]["error_code"] == "FETCH_FAILED"
+        assert streamed[-1][2] >= 0.05
+    
+    @pytest.mark.asyncio
+    async def test_evaluate_stream_cancels_pending_on_early_exit(self):
+        """Test closing the stream early cancels evaluations still in flight."""
+        cancelled = []
+        
+        async def fetch_html(url, headers=None, max_bytes=None, cache=None):
+            try:
+                await asyncio.sleep(0 if url.endswith("0.example.com") else 5)
+            except asyncio.CancelledError:
+                cancelled.append(url)
+                raise
+            return FetchResult(url=url, status_code=200, text="<html></html>")
+        
+        self.service.web_fetcher = Mock()
+        self.service.web_fetcher.fetch_html = fetch_html
+        items = [(f"biz-{i}", f"https://site{i}.example.com") for i in range(3)]
+        
+        stream = self.service.evaluate_stream(items, run_id=self.run_id, max_concurrency=3)
+        index, result, _ = await stream.__anext__()
+        await stream.aclose()
+        
+        assert index == 0 and result["success"] is True
+        assert sorted(cancelled) == ["https://site1.example.com", "https://site2.example.com"]
+    
+    @pytest.mark.asyncio
+    async def test_concurrent_evaluations_of_one_url_fetch_once(self):
+        """Test duplicate concurrent evaluations share one fetch and are attributed per caller."""
+        fetched = []
+        
+        async def fetch_html(url, headers=None, max_bytes=None, cache=None):
+            fetched.append(url)
+            await asyncio.sleep(0.02)
+            return FetchResult(url=url, status_code=200, text="<html><body>Contact us</body></html>")
+        
+        self.service.web_fetcher = Mock()
+        self.service.web_fetcher.fetch_html = fetch_html
+        
+        first, second = await asyncio.gather(
+            self.service.run_heuristic_evaluation_async(self.website_url, "biz-1", "run-1"),
+            self.service.run_heuristic_evaluation_async(self.website_url + "/", "biz-2", "run-2"),
+        )
+        
+        assert fetched == [self.website_url]
+        assert first["success"] is True and second["success"] is True
+        assert (first["business_id"], first["run_id"]) == ("biz-1", "run-1")
+        assert (second["business_id"], second["run_id"]) == ("biz-2", "run-2")
+        assert second["scores"] is first["scores"]
+    
+    @patch('src.services.heuristic_evaluation_service.requests.get')
+    def test_result_cache_skips_parsing_identical_pages(self, mock_get):
+        """Test identical content is scored once and then served from the cache."""
+        self.service.result_cache = TieredCache(MemoryCacheBackend(100))
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.headers = {'Content-Type': 'text/html'}
+        mock_response.iter_content.side_effect = lambda chunk_size: [
+            b'<html><body><button>Get Started</button><a href="/privacy">Privacy</a></body></html>'
+        ]
+        mock_get.return_value = mock_response
+        
+        with patch.object(
+            self.service.page_parser, 'parse', wraps=self.service.page_parser.parse
+        ) as parse:
+            first = self.service.run_heuristic_evaluation(self.website_url, self.business_id, self.run_id)
+            second = self.service.run_heuristic_evaluation(self.website_url, self.business_id, self.run_id)
+        
+        assert parse.call_count == 1
+        assert first["raw_data"]["result_cached"] is False
+        assert second["raw_data"]["result_cached"] is True
+        assert second["scores"] == first["scores"]
+        assert isinstance(second["scores"], HeuristicScore)
+        for category in ("trust_signals", "cro_elements", "mobile_usability", "content_quality", "social_proof"):
+            assert second[category] == first[category]
+        assert self.service.rate_limiter.record_request.call_count == 2
+    
+    def test_result_cache_key(self):
+        """Test the cache key tracks content, URL scheme and ruleset."""
+        key = self.service._result_cache_key("https://example.com", "<html></html>")
+        
+        assert key == self.service._result_cache_key("https://example.com/other", "<html></html>")
+        assert key != self.service._result_cache_key("https://example.com", "<html> </html>")
+        assert key != self.service._result_cache_key("http://example.com", "<html></html>")
+    
+    def test_ruleset_version_changes_with_patterns(self):
+        """Test editing a pattern invalidates cached results."""
+        version = self.service._ruleset_version()
+        assert version == self.service.ruleset_version
+        
+        self.service.trust_patterns["privacy_policy"].append(r"datenschutz")
+        
+        assert self.service._ruleset_version() != version
+    
+    def test_packed_evaluation_round_trip(self):
+        """Test evaluations survive packing for transfer between processes."""
+        html = '<html><head><meta name="viewport" content="width=device-width"></head><body><button>Get Started</button><a href="/privacy">Privacy Policy</a></body></html>'
+        evaluation = self.service._evaluate_features(
+            self.website_url, extract_page_features(BeautifulSoup(html, 'html.parser'))
+        )
+        
+        packed = _pack_evaluation(evaluation)
+        
+        assert _unpack_evaluation(packed) == evaluation
+        assert len(pickle.dumps(packed)) * 4 < len(pickle.dumps(evaluation))
+    
+    @pytest.mark.asyncio
+    async def test_process_pool_evaluation(self):
+        """Test pages are scored in a recycled worker process when a pool is set."""
+        html = '<html><body><button>Get Started</button><a href="/privacy">Privacy Policy</a></body></html>'
+        self.service.web_fetcher = Mock()
+        self.service.web_fetcher.fetch_html = AsyncMock(
+            return_value=FetchResult(url=self.website_url, status_code=200, text=html)
+        )
+        self.service.result_cache = TieredCache(MemoryCacheBackend(100))
+        expected = self.service._evaluate_features(
+            self.website_url, self.service.page_parser.parse(html)
+        )
+        pool = ProcessPoolExecutor(
+            max_workers=1, max_tasks_per_child=1, initializer=_init_evaluation_worker
+        )
+        self.service.evaluation_pool = pool
+        try:
+            first = await self.service.run_heuristic_evaluation_async(
+                self.website_url, self.business_id, self.run_id
+            )
+            self.service.result_cache.clear()
+            second = await self.service.run_heuristic_evaluation_async(
+                self.website_url, self.business_id, self.run_id
+            )
+        finally:
+            pool.shutdown()
+        
+        assert first["success"] is True
+        assert first["raw_data"]["result_cached"] is False
+        assert first["scores"].model_dump(mode="json") == expected["scores"]
+        assert first["trust_signals"] == expected["trust_signals"]
+        assert second["cro_elements"] == expected["cro_elements"]
+    
+    def test_pool_worker_builds_only_the_evaluator(self):
+        """Test pool workers score pages without building the I/O service."""
+        html = '<html><body><button>Get Started</button></body></html>'
+        with patch('src.services.heuristic_evaluation_service.get_rate_limiter') as limiter, \
+                patch('src.services.heuristic_evaluation_service.get_web_fetcher') as fetcher, \
+                patch('src.services.heuristic_evaluation_service._shared_evaluation_pool') as pool:
+            _init_evaluation_worker("streaming")
+            packed = _evaluate_in_worker(self.website_url, html)
+        
+        limiter.assert_not_called()
+        fetcher.assert_not_called()
+        pool.assert_not_called()
+        assert _unpack_evaluation(packed) == self.service._evaluate_features(
+            self.website_url, self.service.page_parser.parse(html)
+        )
+    
+    @pytest.mark.asyncio
+    async def test_broken_process_pool_falls_back_to_threads(self):
+        """Test a crashed worker pool does not fail the evaluation."""
+        self.service.web_fetcher = Mock()
+        self.service.web_fetcher.fetch_html = AsyncMock(
+            return_value=FetchResult(url=self.website_url, status_code=200, text="<html><body>Contact us</body></html>")
+        )
+        
+        class BrokenPool(Executor):
+            def __init__(self):
+                self.shutdown_called = False
+            
+            def submit(self, fn, *args, **kwargs):
+                future = Future()
+                future.set_exception(BrokenProcessPool("worker died"))
+                return future
+            
+            def shutdown(self, wait=True, *, cancel_futures=False):
+                self.shutdown_called = True
+        
+        pool = BrokenPool()
+        self.service.evaluation_pool = pool
+        
+        result = await self.service.run_heuristic_evaluation_async(
+            self.website_url, self.business_id, self.run_id
+        )
+        
+        assert result["success"] is True
+        assert pool.shutdown_called is True
+    
+    def test_page_parser_backend_from_config(self):
+        """Test the HTML parser backend is selected from configuration."""
+        assert isinstance(self.service.page_parser, StreamingPageParser)
+
+        with patch('src.services.heuristic_evaluation_service.get_api_config') as mock_config:
+            mock_config.return_value.HEURISTICS_HTML_PARSER = "unknown"
+            with patch('src.services.heuristic_evaluation_service.get_rate_limiter'):
+                with pytest.raises(ValueError):
+                    HeuristicEvaluationService()
+    
     def test_pattern_methods(self):
         """Test pattern matching methods."""
         # These methods are not implemented in the current service
         # They were part of an earlier design that was simplified
         pass
+    
+    def test_match_signal_patterns(self):
+        """Test single-pass matching across text, links and attributes."""
+        html = '''
+        <html>
+        <body>
+            <a href="/legal">Terms of Service</a>
+            <div class="testimonial-card">Read more</div>
+            <p>Contact sales for a free trial</p>
+        </body>
+        </html>
+        '''
+        features = extract_page_features(BeautifulSoup(html, 'html.parser'))
+        
+        hits = self.service._match_signal_patterns(features)
+        
+        assert "trust.terms_of_service" in hits
+        assert "cro.testimonials" in hits
+        assert "social.testimonials" in hits
+        assert "cro.cta_buttons" in hits
+        assert "trust.contact_info" in hits
+        assert "trust.privacy_policy" not in hits
+
+    def test_element_checks_use_pattern_engine(self):
+        """Test review and partner checks reuse the single-pass signal hits."""
+        html = '''
+        <html>
+        <body>
+            <span class="star-widget"></span>
+            <img alt="Partner logo" src="p.png">
+        </body>
+        </html>
+        '''
+        features = extract_page_features(BeautifulSoup(html, 'html.parser'))
+        hits = self.service._match_signal_patterns(features)
+
+        assert "elements.reviews" in hits
+        assert "elements.partner_logos" in hits
+        with patch('src.services.heuristic_evaluator.re.search') as search:
+            assert self.service._check_review_elements(features, hits) is True
+            assert self.service._check_partner_logos(features, hits) is True
+            assert self.service._check_partner_logos(features) is True
+        search.assert_not_called()
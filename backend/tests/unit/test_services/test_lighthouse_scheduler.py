@@ -0,0 +1,212 @@
+"""
+Unit tests for the Lighthouse batch scheduler.
+"""
+
+import asyncio
+import threading
+from unittest.mock import Mock
+
+import pytest
+
+from src.schemas.website_scoring import AuditPriority
+from src.services.lighthouse_scheduler import LighthouseBatchScheduler
+from src.utils.audit_queue import PENDING, AuditQueue
+from src.utils.token_bucket import DailyQuota, TokenBucket
+
+
+def _audit_result(url, business_id):
+    return {
+        "success": True,
+        "website_url": url,
+        "business_id": business_id,
+        "scores": {"performance": 80.0},
+        "overall_score": 80.0,
+    }
+
+
+class TestLighthouseBatchScheduler:
+    """Test cases for LighthouseBatchScheduler."""
+
+    def setup_method(self):
+        self.dispatched = []
+        self.release = None
+
+        async def run_audit(
+            url, business_id, run_id=None, strategy="mobile", priority=None
+        ):
+            self.dispatched.append(url)
+            if self.release is not None:
+                await self.release.wait()
+            return _audit_result(url, business_id)
+
+        self.lighthouse_service = Mock()
+        self.lighthouse_service.run_lighthouse_audit_async = run_audit
+
+    def _scheduler(self, queue=None, rate=1000.0, burst=100, daily=1000, **kwargs):
+        return LighthouseBatchScheduler(
+            lighthouse_service=self.lighthouse_service,
+            queue=queue or AuditQueue(),
+            minute_bucket=TokenBucket(rate, burst),
+            daily_quota=DailyQuota(daily),
+            **kwargs,
+        )
+
+    async def _drain(self, scheduler, batch_id, timeout=2.0):
+        async def finished():
+            while scheduler.get_batch_status(batch_id)["progress"] < 1:
+                await asyncio.sleep(0.005)
+
+        await asyncio.wait_for(finished(), timeout)
+
+    @pytest.mark.asyncio
+    async def test_batch_is_audited_and_reported(self):
+        """Test a queued batch runs to completion with per-URL results."""
+        scheduler = self._scheduler()
+        items = [(f"https://site{i}.com", f"biz-{i}") for i in range(20)]
+
+        status = await scheduler.submit_batch(items, run_id="run-1")
+        assert status["total"] == 20
+        await self._drain(scheduler, status["batch_id"])
+
+        final = scheduler.get_batch_status(status["batch_id"], include_results=True)
+        await scheduler.stop()
+
+        assert final["completed"] == 20
+        assert final["eta_seconds"] == 0.0
+        assert final["results"][3]["overall_score"] == 80.0
+        assert final["results"][3]["business_id"] == "biz-3"
+        assert sorted(self.dispatched) == sorted(url for url, _ in items)
+
+    @pytest.mark.asyncio
+    async def test_batch_is_queued_off_the_event_loop(self):
+        """Test the SQLite queue is written from a worker thread."""
+        queue = AuditQueue()
+        threads = []
+        push = queue.push
+
+        def recording_push(*args):
+            threads.append(threading.current_thread())
+            return push(*args)
+
+        queue.push = recording_push
+        scheduler = self._scheduler(queue=queue)
+
+        status = await scheduler.submit_batch([("https://a.com", "b1")])
+        await self._drain(scheduler, status["batch_id"])
+        await scheduler.stop()
+
+        assert threads and threads[0] is not threading.main_thread()
+
+    @pytest.mark.asyncio
+    async def test_dispatch_is_paced_by_token_bucket(self):
+        """Test audits beyond the burst wait for tokens to refill."""
+        scheduler = self._scheduler(rate=50.0, burst=2)
+        status = await scheduler.submit_batch(
+            [(f"https://site{i}.com", "biz") for i in range(7)]
+        )
+
+        await asyncio.sleep(0.03)
+        early = len(self.dispatched)
+        await self._drain(scheduler, status["batch_id"])
+        await scheduler.stop()
+
+        # A burst of 2, then one every 20ms
+        assert 2 <= early <= 4
+        assert len(self.dispatched) == 7
+
+    @pytest.mark.asyncio
+    async def test_interactive_audit_jumps_the_batch_queue(self):
+        """Test an interactive audit is dispatched before pending batch work."""
+        self.release = asyncio.Event()
+        scheduler = self._scheduler(concurrency=1)
+        status = await scheduler.submit_batch(
+            [(f"https://batch{i}.com", "biz") for i in range(5)]
+        )
+        await asyncio.sleep(0.01)
+
+        interactive = asyncio.create_task(
+            scheduler.audit(
+                "https://now.com", "biz-now", priority=AuditPriority.INTERACTIVE
+            )
+        )
+        await asyncio.sleep(0.01)
+        self.release.set()
+        result = await asyncio.wait_for(interactive, 1)
+        await self._drain(scheduler, status["batch_id"])
+        await scheduler.stop()
+
+        assert result["website_url"] == "https://now.com"
+        # The first batch job was already running; the interactive one is next
+        assert self.dispatched[:2] == ["https://batch0.com", "https://now.com"]
+
+    @pytest.mark.asyncio
+    async def test_daily_quota_stops_dispatch_and_is_persisted(self):
+        """Test nothing is dispatched past the daily quota, and usage is saved."""
+        queue = AuditQueue()
+        scheduler = self._scheduler(queue=queue, daily=3)
+        status = await scheduler.submit_batch(
+            [(f"https://site{i}.com", "biz") for i in range(5)]
+        )
+
+        await asyncio.sleep(0.05)
+        current = scheduler.get_batch_status(status["batch_id"])
+        stats = scheduler.get_stats()
+        await scheduler.stop()
+
+        assert len(self.dispatched) == 3
+        assert current["pending"] == 2
+        assert current["eta_seconds"] > 0
+        assert stats["daily_quota"]["remaining"] == 0
+        assert queue.get_state("daily_quota")[1] == 3
+
+    @pytest.mark.asyncio
+    async def test_rate_limited_audit_is_requeued(self, monkeypatch):
+        """Test a 429 from PageSpeed puts the job back instead of failing it."""
+        monkeypatch.setattr(
+            "src.services.lighthouse_scheduler.RATE_LIMIT_BACKOFF_SECONDS", 0.02
+        )
+        calls = []
+
+        async def run_audit(
+            url, business_id, run_id=None, strategy="mobile", priority=None
+        ):
+            calls.append(url)
+            if len(calls) == 1:
+                return {"success": False, "error_code": "RATE_LIMIT_EXCEEDED"}
+            return _audit_result(url, business_id)
+
+        self.lighthouse_service.run_lighthouse_audit_async = run_audit
+        scheduler = self._scheduler()
+
+        result = await asyncio.wait_for(scheduler.audit("https://a.com", "biz"), 1)
+        await scheduler.stop()
+
+        assert result["success"] is True
+        assert calls == ["https://a.com", "https://a.com"]
+        assert scheduler.get_stats()["requeued"] == 1
+
+    @pytest.mark.asyncio
+    async def test_interrupted_jobs_resume_after_restart(self, tmp_path):
+        """Test jobs running when the process stopped are dispatched again."""
+        path = tmp_path / "queue.sqlite3"
+        self.release = asyncio.Event()
+        first = self._scheduler(queue=AuditQueue(path), concurrency=1)
+        status = await first.submit_batch(
+            [("https://a.com", "b1"), ("https://b.com", "b2")]
+        )
+        await asyncio.sleep(0.01)
+        first._dispatcher.cancel()
+        for task in list(first._tasks):
+            task.cancel()
+        await asyncio.sleep(0)
+        first.queue.close()
+
+        self.release = None
+        self.dispatched.clear()
+        second = self._scheduler(queue=AuditQueue(path))
+        assert second.queue.counts()[PENDING] == 1
+        second.start()
+        await self._drain(second, status["batch_id"])
+        await second.stop()
+
+        assert sorted(self.dispatched) == ["https://a.com", "https://b.com"]
@@ -4,10 +4,13 @@ Tests website performance auditing functionality with mocked API responses.
 """
 
 import pytest
-from unittest.mock import Mock, patch, MagicMock
-import requests
+import asyncio
+from unittest.mock import AsyncMock, Mock, patch, MagicMock
 
 from src.services.lighthouse_service import LighthouseService
+from src.services.rate_limiter import Reservation, RequestPriority
+from src.services.web_fetcher import FetchResult
+from src.utils.deadline import Deadline
 
 
 class TestLighthouseService:
@@ -22,7 +25,16 @@ class TestLighthouseService:
                 LIGHTHOUSE_AUDIT_TIMEOUT_SECONDS=30,
                 LIGHTHOUSE_CONNECT_TIMEOUT_SECONDS=10,
                 LIGHTHOUSE_READ_TIMEOUT_SECONDS=25,
-                LIGHTHOUSE_FALLBACK_TIMEOUT_SECONDS=15
+                LIGHTHOUSE_FALLBACK_TIMEOUT_SECONDS=15,
+                LIGHTHOUSE_RECOVERY_PROBE_ENABLED=False,
+                LIGHTHOUSE_RECOVERY_PROBE_TIMEOUT_SECONDS=5.0,
+                LIGHTHOUSE_RECOVERY_PROBE_MAX_BYTES=2_000_000,
+                RATE_LIMITER_ACQUIRE_TIMEOUT_SECONDS=30.0,
+                LIGHTHOUSE_INCLUDE_RAW_DATA=False,
+                LIGHTHOUSE_PROJECTION_MAX_AUDITS=20,
+                LIGHTHOUSE_PAYLOAD_STORE_ENABLED=False,
+                LIGHTHOUSE_HISTORY_ENABLED=False,
+                LIGHTHOUSE_CACHE_ENABLED=False
             )
             return LighthouseService()
     
@@ -67,44 +79,6 @@ class TestLighthouseService:
         """Test URL validation with invalid URLs."""
         assert service._validate_url("not-a-url") is False
     
-    @patch('src.services.lighthouse_service.requests.get')
-    def test_execute_audit_success(self, mock_get, service, sample_lighthouse_response):
-        """Test successful audit execution."""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = sample_lighthouse_response
-        mock_response.raise_for_status.return_value = None
-        mock_get.return_value = mock_response
-        
-        service.rate_limiter = Mock()
-        service.rate_limiter.can_make_request.return_value = (True, "OK")
-        
-        result = service._execute_audit_with_retry(
-            {'url': 'https://example.com', 'strategy': 'desktop'},
-            'test_run_123',
-            'test_business_123'
-        )
-        
-        assert result["success"] is True
-        assert result["data"] == sample_lighthouse_response
-    
-    @patch('src.services.lighthouse_service.requests.get')
-    def test_execute_audit_timeout(self, mock_get, service):
-        """Test audit execution timeout handling."""
-        mock_get.side_effect = requests.Timeout("Request timed out")
-        
-        service.rate_limiter = Mock()
-        service.rate_limiter.can_make_request.return_value = (True, "OK")
-        
-        result = service._execute_audit_with_retry(
-            {'url': 'https://example.com', 'strategy': 'desktop'},
-            'test_run_123',
-            'test_business_123'
-        )
-        
-        assert result["success"] is False
-        assert result["error_code"] == "TIMEOUT"
-    
     def test_extract_score_valid(self, service, sample_lighthouse_response):
         """Test score extraction from valid categories."""
         categories = sample_lighthouse_response['lighthouseResult']['categories']
@@ -124,18 +98,14 @@ class TestLighthouseService:
         confidence = service._determine_confidence(sample_lighthouse_response)
         assert confidence == "high"
     
-    @patch('src.services.lighthouse_service.requests.get')
-    def test_run_lighthouse_audit_success(self, mock_get, service, sample_lighthouse_response):
-        """Test successful Lighthouse audit execution."""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = sample_lighthouse_response
-        mock_response.raise_for_status.return_value = None
-        mock_get.return_value = mock_response
-        
+    def test_run_lighthouse_audit_success(self, service, sample_lighthouse_response):
+        """Test the synchronous audit runs through the pooled PageSpeed client."""
         service.rate_limiter = Mock()
-        service.rate_limiter.can_make_request.return_value = (True, "OK")
-        service.rate_limiter.record_request.return_value = None
+        service.rate_limiter.acquire = AsyncMock(return_value=Reservation("lighthouse", True, "OK"))
+        service.psi_client = Mock()
+        service.psi_client.run_pagespeed = AsyncMock(return_value={
+            "success": True, "data": sample_lighthouse_response, "status_code": 200
+        })
         
         result = service.run_lighthouse_audit(
             "https://example.com",
@@ -147,11 +117,30 @@ class TestLighthouseService:
         assert result["success"] is True
         assert result["scores"]["performance"] == 85.0
         assert result["confidence"] == "high"
-    
+        service.psi_client.run_pagespeed.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_run_lighthouse_audit_from_a_running_loop(self, service, sample_lighthouse_response):
+        """Test the synchronous audit can be called while an event loop is running."""
+        service.rate_limiter = Mock()
+        service.rate_limiter.acquire = AsyncMock(return_value=Reservation("lighthouse", True, "OK"))
+        service.psi_client = Mock()
+        service.psi_client.run_pagespeed = AsyncMock(return_value={
+            "success": True, "data": sample_lighthouse_response, "status_code": 200
+        })
+
+        result = service.run_lighthouse_audit("https://example.com", "test_business_123")
+
+        assert result["success"] is True
+
     def test_run_lighthouse_audit_rate_limit_exceeded(self, service):
         """Test Lighthouse audit with rate limit exceeded."""
         service.rate_limiter = Mock()
-        service.rate_limiter.can_make_request.return_value = (False, "Rate limit exceeded")
+        service.rate_limiter.acquire = AsyncMock(
+            return_value=Reservation("lighthouse", False, "Rate limit exceeded")
+        )
+        service.psi_client = Mock()
+        service.psi_client.run_pagespeed = AsyncMock()
         
         result = service.run_lighthouse_audit(
             "https://example.com",
@@ -162,6 +151,7 @@ class TestLighthouseService:
         
         assert result["success"] is False
         assert "Rate limit exceeded" in result["error"]
+        service.psi_client.run_pagespeed.assert_not_called()
     
     def test_run_lighthouse_audit_invalid_url(self, service):
         """Test Lighthouse audit with invalid URL."""
@@ -175,112 +165,396 @@ class TestLighthouseService:
         assert result["success"] is False
         assert result["error"] == "Invalid website URL format"
     
-    @patch('src.services.lighthouse_service.requests.get')
-    def test_fallback_audit_success(self, mock_get, service):
-        """Test successful fallback audit execution."""
-        # Mock primary audit failure with timeout
+    def test_fallback_audit_success(self, service):
+        """Test a timed-out audit is recovered with a reduced-scope audit."""
         service.rate_limiter = Mock()
-        service.rate_limiter.can_make_request.return_value = (True, "OK")
-        service.rate_limiter.record_request.return_value = None
-        
-        # Mock fallback audit success
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "lighthouseResult": {
-                "categories": {
-                    "performance": {"score": 0.75}
-                }
-            }
-        }
-        mock_response.raise_for_status.return_value = None
-        mock_get.return_value = mock_response
-        
-        # Mock primary audit to fail with timeout
-        with patch.object(service, '_execute_audit_with_retry') as mock_primary:
-            mock_primary.return_value = {
+        service.rate_limiter.acquire = AsyncMock(return_value=Reservation("lighthouse", True, "OK"))
+        service.psi_client = Mock()
+        service.psi_client.run_pagespeed = AsyncMock(side_effect=[
+            {
                 "success": False,
                 "error": "Audit request timed out",
                 "error_code": "TIMEOUT",
                 "context": "audit_execution"
-            }
-            
-            result = service.run_lighthouse_audit(
-                "https://example.com",
-                "test_business_123",
-                "test_run_456",
-                "desktop"
-            )
-            
-            assert result["success"] is True
-            assert result["fallback_used"] is True
-            assert result["scores"]["performance"] == 75.0
-            assert result["confidence"] == "medium"
+            },
+            {
+                "success": True,
+                "data": {"lighthouseResult": {"categories": {"performance": {"score": 0.75}}}},
+                "status_code": 200
+            },
+        ])
+        
+        result = service.run_lighthouse_audit(
+            "https://example.com",
+            "test_business_123",
+            "test_run_456",
+            "desktop"
+        )
+        
+        assert result["success"] is True
+        assert result["fallback_used"] is True
+        assert result["scores"]["performance"] == 75.0
+        assert result["scores"]["seo"] is None
+        assert result["confidence"] == "medium"
+        fallback_params = service.psi_client.run_pagespeed.call_args.args[0]
+        assert fallback_params["category"] == "performance"
     
-    @patch('src.services.lighthouse_service.requests.get')
-    def test_fallback_audit_failure(self, mock_get, service):
+    def test_fallback_audit_failure(self, service):
         """Test fallback audit failure handling."""
-        # Mock primary audit failure with timeout
         service.rate_limiter = Mock()
-        service.rate_limiter.can_make_request.return_value = (True, "OK")
-        service.rate_limiter.record_request.return_value = None
-        
-        # Mock fallback audit failure
-        mock_get.side_effect = requests.RequestException("Fallback failed")
-        
-        # Mock primary audit to fail with timeout
-        with patch.object(service, '_execute_audit_with_retry') as mock_primary:
-            mock_primary.return_value = {
+        service.rate_limiter.acquire = AsyncMock(return_value=Reservation("lighthouse", True, "OK"))
+        service.psi_client = Mock()
+        service.psi_client.run_pagespeed = AsyncMock(side_effect=[
+            {
                 "success": False,
                 "error": "Audit request timed out",
                 "error_code": "TIMEOUT",
                 "context": "audit_execution"
-            }
-            
-            result = service.run_lighthouse_audit(
-                "https://example.com",
-                "test_business_123",
-                "test_run_456",
-                "desktop"
-            )
-            
-            assert result["success"] is False
-            assert result["error_code"] == "FALLBACK_FAILED"
+            },
+            {
+                "success": False,
+                "error": "Audit request failed: Fallback failed",
+                "error_code": "REQUEST_FAILED",
+                "context": "audit_execution"
+            },
+        ])
+        
+        result = service.run_lighthouse_audit(
+            "https://example.com",
+            "test_business_123",
+            "test_run_456",
+            "desktop"
+        )
+        
+        assert result["success"] is False
+        assert result["error_code"] == "FALLBACK_FAILED"
     
     def test_timeout_configuration(self, service):
         """Test timeout configuration values."""
         assert service.timeout == 30
-        assert service.connect_timeout == 10
-        assert service.read_timeout == 25
         assert service.fallback_timeout == 15
     
-    @patch('src.services.lighthouse_service.requests.get')
-    def test_enhanced_timeout_handling(self, mock_get, service):
-        """Test enhanced timeout handling with connect and read timeouts."""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"lighthouseResult": {"categories": {}}}
-        mock_response.raise_for_status.return_value = None
-        mock_get.return_value = mock_response
+    @pytest.mark.asyncio
+    async def test_run_lighthouse_audit_async_success(self, service, sample_lighthouse_response):
+        """Test the async audit goes through the pooled PageSpeed client."""
+        service.rate_limiter = Mock()
+        service.rate_limiter.acquire = AsyncMock(return_value=Reservation("lighthouse", True, "OK"))
+        service.psi_client = Mock()
+        service.psi_client.run_pagespeed = AsyncMock(return_value={
+            "success": True, "data": sample_lighthouse_response, "status_code": 200
+        })
         
+        result = await service.run_lighthouse_audit_async(
+            "https://example.com", "test_business_123", "test_run_456", "mobile"
+        )
+        
+        assert result["success"] is True
+        assert result["scores"]["performance"] == 85.0
+        params = service.psi_client.run_pagespeed.call_args.args[0]
+        assert params["strategy"] == "mobile"
+        service.rate_limiter.record_request.assert_called_once_with(
+            "lighthouse", True, "test_run_456", service.rate_limiter.acquire.return_value
+        )
+    
+    @pytest.mark.asyncio
+    async def test_run_lighthouse_audit_async_queues_with_priority(
+        self, service, sample_lighthouse_response
+    ):
+        """Test the caller's priority reaches the rate limiter without a cache."""
+        assert service.audit_cache is None
         service.rate_limiter = Mock()
-        service.rate_limiter.can_make_request.return_value = (True, "OK")
-        service.rate_limiter.record_request.return_value = None
+        service.rate_limiter.acquire = AsyncMock(return_value=Reservation("lighthouse", True, "OK"))
+        service.psi_client = Mock()
+        service.psi_client.run_pagespeed = AsyncMock(return_value={
+            "success": True, "data": sample_lighthouse_response, "status_code": 200
+        })
+
+        await service.run_lighthouse_audit_async(
+            "https://example.com", "test_business_123", "test_run_456",
+            priority=RequestPriority.INTERACTIVE,
+        )
+
+        priority = service.rate_limiter.acquire.call_args.args[2]
+        assert priority == RequestPriority.INTERACTIVE
+    
+    @pytest.mark.asyncio
+    async def test_run_lighthouse_audit_async_timeout_falls_back(self, service):
+        """Test a timed-out async audit retries once with reduced scope."""
+        service.rate_limiter = Mock()
+        service.rate_limiter.acquire = AsyncMock(return_value=Reservation("lighthouse", True, "OK"))
+        service.psi_client = Mock()
+        service.psi_client.run_pagespeed = AsyncMock(side_effect=[
+            {"success": False, "error": "Audit request timed out", "error_code": "TIMEOUT"},
+            {
+                "success": True,
+                "data": {"lighthouseResult": {"categories": {"performance": {"score": 0.75}}}},
+                "status_code": 200,
+            },
+        ])
+        
+        result = await service.run_lighthouse_audit_async(
+            "https://example.com", "test_business_123", "test_run_456"
+        )
+        
+        assert result["success"] is True
+        assert result["fallback_used"] is True
+        assert result["scores"]["performance"] == 75.0
+        fallback_call = service.psi_client.run_pagespeed.call_args_list[1]
+        assert fallback_call.args[0]["category"] == "performance"
+        assert fallback_call.kwargs["read_timeout"] == 15
+        assert fallback_call.kwargs["attempts"] == 1
+    
+    @pytest.mark.asyncio
+    async def test_run_lighthouse_audit_async_propagates_deadline(self, service):
+        """Test the primary and fallback audits share the caller's deadline."""
+        service.rate_limiter = Mock()
+        service.rate_limiter.acquire = AsyncMock(return_value=Reservation("lighthouse", True, "OK"))
+        service.psi_client = Mock()
+        service.psi_client.run_pagespeed = AsyncMock(return_value={
+            "success": False, "error": "Audit request timed out", "error_code": "TIMEOUT",
+        })
+        deadline = Deadline.after(20)
+        
+        result = await service.run_lighthouse_audit_async(
+            "https://example.com", "test_business_123", "test_run_456", deadline=deadline
+        )
         
-        # Test that timeout tuple is used
-        with patch.object(service, '_execute_audit_with_retry') as mock_execute:
-            mock_execute.return_value = {
+        assert result["error_code"] == "FALLBACK_FAILED"
+        primary, fallback = service.psi_client.run_pagespeed.call_args_list
+        assert primary.kwargs["deadline"] is deadline
+        assert fallback.kwargs["deadline"] is deadline
+    
+    @pytest.mark.asyncio
+    async def test_recovery_estimates_from_timing_probe(self, service):
+        """Test a failed recovery audit falls back to the local timing probe."""
+        service.rate_limiter = Mock()
+        service.rate_limiter.acquire = AsyncMock(return_value=Reservation("lighthouse", True, "OK"))
+        service.psi_client = Mock()
+        service.psi_client.run_pagespeed = AsyncMock(return_value={
+            "success": False, "error": "Audit request timed out", "error_code": "TIMEOUT",
+        })
+        service.probe_enabled = True
+        service.web_fetcher = Mock()
+        service.web_fetcher.fetch_html = AsyncMock(return_value=FetchResult(
+            url="https://example.com",
+            status_code=200,
+            text='<script src="app.js"></script><img src="hero.jpg">',
+            bytes_read=40_000,
+            ttfb=0.3,
+        ))
+        
+        result = await service.run_lighthouse_audit_async(
+            "https://example.com", "test_business_123", "test_run_456", "desktop"
+        )
+        
+        assert result["success"] is True
+        assert result["estimated"] is True
+        assert result["confidence"] == "low"
+        assert result["strategy"] == "mobile"
+        assert result["timing_probe"]["ttfb_ms"] == 300.0
+        assert result["timing_probe"]["request_count"] == 3
+        assert result["scores"]["performance"] == result["timing_probe"]["estimated_performance"]
+        fallback_call = service.psi_client.run_pagespeed.call_args_list[1]
+        assert fallback_call.args[0]["strategy"] == "mobile"
+        assert fallback_call.args[0]["category"] == "performance"
+    
+    @pytest.mark.asyncio
+    async def test_recovery_prefers_pagespeed_and_cancels_probe(self, service):
+        """Test a successful recovery audit wins over a still-running probe."""
+        async def run_pagespeed(params, **kwargs):
+            await asyncio.sleep(0.01)
+            return {
                 "success": True,
-                "data": {"lighthouseResult": {"categories": {}}},
-                "status_code": 200
+                "data": {"lighthouseResult": {"categories": {"performance": {"score": 0.6}}}},
+                "status_code": 200,
             }
+        
+        service.psi_client = Mock()
+        service.psi_client.run_pagespeed = run_pagespeed
+        service.probe_enabled = True
+        probe_cancelled = asyncio.Event()
+        
+        async def slow_fetch(*args, **kwargs):
+            try:
+                await asyncio.sleep(5)
+            except asyncio.CancelledError:
+                probe_cancelled.set()
+                raise
+        
+        service.web_fetcher = Mock()
+        service.web_fetcher.fetch_html = slow_fetch
+        
+        result = await service.recover_audit_async(
+            "https://example.com", "test_business_123", "test_run_456"
+        )
+        
+        assert result["scores"]["performance"] == 60.0
+        assert "estimated" not in result
+        await asyncio.wait_for(probe_cancelled.wait(), 1)
+    
+    def test_sync_recovery_runs_async_recovery(self, service):
+        """Test the blocking entry point drives the async recovery path."""
+        service.psi_client = Mock()
+        service.psi_client.run_pagespeed = AsyncMock(return_value={
+            "success": False, "error": "Audit request timed out", "error_code": "TIMEOUT",
+        })
+        service.probe_enabled = True
+        service.web_fetcher = Mock()
+        service.web_fetcher.fetch_html = AsyncMock(return_value=FetchResult(
+            url="https://example.com",
+            status_code=200,
+            text='<img src="a.png">',
+            bytes_read=23,
+            ttfb=1.2,
+        ))
+        
+        result = service.recover_audit("https://example.com", "test_business_123")
+        
+        assert result["success"] is True
+        assert result["estimated"] is True
+        assert result["timing_probe"]["ttfb_ms"] == 1200.0
+        assert result["timing_probe"]["document_bytes"] == 23
+        service.psi_client.run_pagespeed.assert_awaited_once()
+    
+    @pytest.mark.asyncio
+    async def test_audit_runs_strategies_concurrently(self, service, sample_lighthouse_response):
+        """Test mobile and desktop audits overlap and are returned together."""
+        service.rate_limiter = Mock()
+        service.rate_limiter.acquire = AsyncMock(return_value=Reservation("lighthouse", True, "OK"))
+        in_flight = 0
+        peak = 0
+        
+        async def run_pagespeed(params, **kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            if params["strategy"] == "desktop":
+                return {"success": False, "error": "HTTP 400", "error_code": "REQUEST_FAILED"}
+            return {"success": True, "data": sample_lighthouse_response, "status_code": 200}
+        
+        service.psi_client = Mock()
+        service.psi_client.run_pagespeed = run_pagespeed
+        
+        result = await service.audit(
+            "https://example.com", "test_business_123", "test_run_456",
+            strategies=("mobile", "desktop", "mobile"),
+        )
+        
+        assert peak == 2
+        assert result["success"] is True
+        assert result["strategies"] == ["mobile", "desktop"]
+        assert result["failed_strategies"] == ["desktop"]
+        assert result["audits"]["mobile"]["scores"]["seo"] == 95.0
+        assert result["audits"]["desktop"]["error_code"] == "REQUEST_FAILED"
+    
+    def test_process_audit_results_drops_raw_payload(self, service, sample_lighthouse_response):
+        """Test results carry the compact summary instead of the raw payload."""
+        sample_lighthouse_response["lighthouseResult"]["audits"]["unused-javascript"] = {
+            "id": "unused-javascript",
+            "title": "Reduce unused JavaScript",
+            "score": 0.4,
+            "scoreDisplayMode": "metricSavings",
+            "details": {"type": "opportunity", "overallSavingsMs": 900},
+        }
+        
+        result = service._process_audit_results(
+            sample_lighthouse_response, "https://example.com", "test_business_123", "test_run_456"
+        )
+        
+        assert result["raw_data"] is None
+        assert result["raw_data_ref"] is None
+        assert result["audit_summary"]["opportunities"][0]["id"] == "unused-javascript"
+        assert result["core_web_vitals"]["largest_contentful_paint"] == 2100.0
+    
+    def test_process_audit_results_keeps_raw_payload_when_configured(self, service, sample_lighthouse_response):
+        """Test LIGHTHOUSE_INCLUDE_RAW_DATA restores the inline payload."""
+        service.include_raw_data = True
+        
+        result = service._process_audit_results(
+            sample_lighthouse_response, "https://example.com", "test_business_123", "test_run_456"
+        )
+        
+        assert result["raw_data"] is sample_lighthouse_response
+    
+    def test_process_audit_results_stores_compressed_payload(self, service, sample_lighthouse_response, tmp_path):
+        """Test the full payload is queued to the payload store and referenced."""
+        from src.utils.payload_store import PayloadStore
+        
+        service.payload_store = PayloadStore(tmp_path / "payloads.sqlite3")
+        sample_lighthouse_response["lighthouseResult"]["fetchTime"] = "2024-01-01T00:00:00.000Z"
+        
+        result = service._process_audit_results(
+            sample_lighthouse_response, "https://example.com", "test_business_123", "test_run_456"
+        )
+        service.payload_store.flush(timeout=5)
+        
+        assert result["raw_data"] is None
+        assert result["raw_data_ref"] == service._payload_key(sample_lighthouse_response)
+        assert service.payload_store.get(result["raw_data_ref"]) == sample_lighthouse_response
+        service.payload_store.close()
+    
+    def test_process_audit_results_records_history(self, service, sample_lighthouse_response):
+        """Test processed audits are appended to the web-vitals history."""
+        from src.utils.vitals_history import VitalsHistoryStore
+        
+        service.history_store = VitalsHistoryStore()
+        
+        result = service._process_audit_results(
+            sample_lighthouse_response, "https://example.com", "test_business_123", "test_run_456"
+        )
+        points = service.history_store.history("test_business_123")
+        
+        assert len(points) == 1
+        assert points[0]["website_url"] == "https://example.com"
+        assert points[0]["scores"]["overall"] == result["overall_score"]
+        assert points[0]["scores"]["performance"] == result["scores"]["performance"]
+    
+    @pytest.mark.asyncio
+    async def test_audit_cache_serves_repeat_audits(self, service, sample_lighthouse_response):
+        """Test a repeat audit of an equivalent URL is served from the cache."""
+        from src.utils.audit_cache import AuditResultCache
+        from src.utils.result_cache import TieredCache
+        
+        service.audit_cache = AuditResultCache(TieredCache(), ttl_seconds=60)
+        service.rate_limiter = Mock()
+        service.rate_limiter.acquire = AsyncMock(return_value=Reservation("lighthouse", True, "OK"))
+        service.psi_client = Mock()
+        service.psi_client.run_pagespeed = AsyncMock(return_value={
+            "success": True, "data": sample_lighthouse_response, "status_code": 200
+        })
+        
+        first = await service.run_lighthouse_audit_async(
+            "https://Example.com", "business-a", "run-1", "mobile"
+        )
+        second = await service.run_lighthouse_audit_async(
+            "https://example.com/#top", "business-b", "run-2", "mobile"
+        )
+        desktop = await service.run_lighthouse_audit_async(
+            "https://example.com", "business-b", "run-2", "desktop"
+        )
+        
+        assert first["cache_status"] == "miss"
+        assert second["cache_status"] == "hit"
+        assert second["business_id"] == "business-b"
+        assert second["run_id"] == "run-2"
+        assert second["scores"] == first["scores"]
+        assert desktop["cache_status"] == "miss"
+        assert service.psi_client.run_pagespeed.await_count == 2
+        assert service.rate_limiter.acquire.await_count == 2
+    
+    def test_audit_cache_sync_path(self, service, sample_lighthouse_response):
+        """Test the synchronous audit also reads and fills the cache."""
+        from src.utils.audit_cache import AuditResultCache
+        from src.utils.result_cache import TieredCache
+        
+        service.audit_cache = AuditResultCache(TieredCache(), ttl_seconds=60)
+        with patch.object(service, '_run_lighthouse_audit_async') as mock_run:
+            mock_run.return_value = {"success": True, "scores": {"performance": 85.0}}
             
-            service.run_lighthouse_audit(
-                "https://example.com",
-                "test_business_123",
-                "test_run_456",
-                "desktop"
-            )
-            
-            # Verify timeout tuple was used in the mock
-            mock_execute.assert_called_once()
+            first = service.run_lighthouse_audit("https://example.com", "business-a")
+            second = service.run_lighthouse_audit("https://example.com", "business-a")
+        
+        assert (first["cache_status"], second["cache_status"]) == ("miss", "hit")
+        mock_run.assert_called_once()
@@ -0,0 +1,241 @@
+"""
+Unit tests for the local Lighthouse runner.
+Runs the real subprocess pool against fake Chrome and Lighthouse executables.
+"""
+
+import asyncio
+import os
+import sys
+import textwrap
+import time
+
+import pytest
+
+from src.services.lighthouse_service import LighthouseService
+from src.services.local_lighthouse_runner import LocalLighthouseRunner
+from src.utils.deadline import Deadline
+from src.utils.vitals_history import VitalsHistoryStore
+
+FAKE_CHROME = """
+import socket
+import sys
+
+port = int(next(a for a in sys.argv if a.startswith("--remote-debugging-port="))
+           .split("=")[1])
+server = socket.socket()
+server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+server.bind(("127.0.0.1", port))
+server.listen()
+while True:
+    server.accept()[0].close()
+"""
+
+FAKE_LIGHTHOUSE = """
+import json
+import socket
+import sys
+import time
+
+url = sys.argv[1]
+args = dict(a[2:].split("=", 1) for a in sys.argv[2:] if "=" in a)
+socket.create_connection(("127.0.0.1", int(args["port"])), timeout=2).close()
+if "slow" in url:
+    time.sleep(float(url.rsplit("/", 1)[1]))
+if "crash" in url:
+    sys.stderr.write("Runtime error encountered: NO_FCP\\n")
+    sys.exit(1)
+categories = args.get("only-categories", "").split(",")
+print(json.dumps({
+    "requestedUrl": url,
+    "configSettings": {
+        "formFactor": "desktop" if args.get("preset") == "desktop" else "mobile"
+    },
+    "categories": {
+        c: {"id": c, "score": s}
+        for c, s in (("performance", 0.91), ("accessibility", 0.8),
+                     ("best-practices", 0.75), ("seo", 0.6))
+        if c in categories
+    },
+    "audits": {
+        "first-contentful-paint": {"numericValue": 900.5},
+        "largest-contentful-paint": {"numericValue": 1800.0},
+        "cumulative-layout-shift": {"numericValue": 0.02},
+        "total-blocking-time": {"numericValue": 120.0},
+        "speed-index": {"numericValue": 1500.0},
+    },
+}))
+"""
+
+ALL_CATEGORIES = "performance,accessibility,best-practices,seo"
+
+
+def _running(pid: int) -> bool:
+    """True while ``pid`` is a live (not exited or zombie) process."""
+    try:
+        with open(f"/proc/{pid}/stat") as stat:
+            return stat.read().rsplit(")", 1)[1].split()[0] != "Z"
+    except FileNotFoundError:
+        return False
+
+
+class TestLocalLighthouseRunner:
+    """Test cases for LocalLighthouseRunner."""
+
+    @pytest.fixture
+    def make_runner(self, tmp_path):
+        chrome = tmp_path / "chrome.py"
+        chrome.write_text(textwrap.dedent(FAKE_CHROME))
+        lighthouse = tmp_path / "lighthouse.py"
+        lighthouse.write_text(textwrap.dedent(FAKE_LIGHTHOUSE))
+        runners = []
+
+        def make(**kwargs):
+            kwargs.setdefault("pool_size", 1)
+            kwargs.setdefault("recycle_after", 50)
+            kwargs.setdefault("timeout", 10.0)
+            runner = LocalLighthouseRunner(
+                lighthouse_command=[sys.executable, str(lighthouse)],
+                chrome_command=[sys.executable, str(chrome)],
+                chrome_flags=(),
+                **kwargs,
+            )
+            runners.append(runner)
+            return runner
+
+        yield make
+        # Tests close their runner; this only catches browsers a failure left
+        for runner in runners:
+            for browser in runner._browsers:
+                if browser.alive:
+                    browser.process.kill()
+
+    @staticmethod
+    def _params(url, strategy="mobile", category=ALL_CATEGORIES):
+        return {
+            "url": url,
+            "key": "unused",
+            "strategy": strategy,
+            "category": category,
+        }
+
+    @pytest.mark.asyncio
+    async def test_result_matches_pagespeed_shape(self, make_runner):
+        """Test LighthouseService normalizes a local report like a PSI payload."""
+        runner = make_runner()
+        service = LighthouseService(
+            psi_client=runner, history_store=VitalsHistoryStore()
+        )
+        service.audit_cache = None
+
+        result = await service.run_lighthouse_audit_async(
+            "https://local-shape.example.com", "biz-1", strategy="desktop"
+        )
+        await runner.aclose()
+
+        assert result["success"] is True
+        assert result["strategy"] == "desktop"
+        assert result["scores"] == {
+            "performance": 91.0,
+            "accessibility": 80.0,
+            "best_practices": 75.0,
+            "seo": 60.0,
+        }
+        assert result["core_web_vitals"]["largest_contentful_paint"] == 1800.0
+        assert result["confidence"] == "high"
+
+    @pytest.mark.asyncio
+    async def test_pool_bounds_concurrency(self, make_runner):
+        """Test audits beyond the pool size wait for a browser."""
+        runner = make_runner(pool_size=2)
+        started = time.monotonic()
+
+        results = await asyncio.gather(
+            *(
+                runner.run_pagespeed(self._params(f"https://slow{i}.com/0.3"))
+                for i in range(4)
+            )
+        )
+        elapsed = time.monotonic() - started
+        stats = runner.get_stats()
+        await runner.aclose()
+
+        assert all(result["success"] for result in results)
+        assert stats["browsers_launched"] == 2
+        assert elapsed >= 0.6
+
+    @pytest.mark.asyncio
+    async def test_browsers_are_recycled(self, make_runner):
+        """Test a browser is replaced after ``recycle_after`` audits."""
+        runner = make_runner(recycle_after=2)
+
+        for i in range(5):
+            result = await runner.run_pagespeed(self._params(f"https://site{i}.com"))
+            assert result["success"] is True
+        stats = runner.get_stats()
+        await runner.aclose()
+
+        assert stats["browsers_launched"] == 3
+        assert stats["browsers_recycled"] == 2
+
+    @pytest.mark.asyncio
+    async def test_timeout_kills_audit_and_replaces_browser(self, make_runner):
+        """Test a hung audit reports TIMEOUT and the next audit gets a new browser."""
+        runner = make_runner(timeout=0.5)
+
+        timed_out = await runner.run_pagespeed(self._params("https://slow.com/30"))
+        recovered = await runner.run_pagespeed(self._params("https://fast.com"))
+        stats = runner.get_stats()
+        await runner.aclose()
+
+        assert timed_out["error_code"] == "TIMEOUT"
+        assert recovered["success"] is True
+        assert stats["timeouts"] == 1
+        assert stats["browsers_launched"] == 2
+
+    @pytest.mark.asyncio
+    async def test_failed_run_reports_lighthouse_error(self, make_runner):
+        """Test a non-zero exit is reported with Lighthouse's last stderr line."""
+        runner = make_runner()
+
+        result = await runner.run_pagespeed(self._params("https://crash.com"))
+        await runner.aclose()
+
+        assert result["success"] is False
+        assert result["error_code"] == "REQUEST_FAILED"
+        assert "NO_FCP" in result["error"]
+
+    @pytest.mark.asyncio
+    async def test_expired_deadline_starts_no_audit(self, make_runner):
+        """Test no browser is launched once the deadline has passed."""
+        runner = make_runner()
+
+        result = await runner.run_pagespeed(
+            self._params("https://a.com"), deadline=Deadline.after(0.1)
+        )
+
+        assert result["error_code"] == "TIMEOUT"
+        assert result["deadline_exceeded"] is True
+        assert runner.get_stats()["browsers_launched"] == 0
+
+    def test_new_event_loop_kills_previous_browsers(self, make_runner):
+        """Test browsers started on a previous loop are killed and cleaned up."""
+        runner = make_runner()
+        browsers = []
+
+        async def audit():
+            result = await runner.run_pagespeed(self._params("https://a.com"))
+            browsers.append(runner._browsers[0])
+            return result
+
+        assert asyncio.run(audit())["success"] is True
+        assert asyncio.run(audit())["success"] is True
+        asyncio.run(runner.aclose())
+
+        first, second = browsers
+        assert first is not second
+        deadline = time.monotonic() + 5
+        while _running(first.process.pid) and time.monotonic() < deadline:
+            time.sleep(0.05)
+        assert not _running(first.process.pid)
+        assert not os.path.exists(first.profile)
+        assert not os.path.exists(second.profile)
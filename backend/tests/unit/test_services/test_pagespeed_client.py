@@ -0,0 +1,238 @@
+"""
+Unit tests for PageSpeedClient.
+Tests pooled requests, retry classification and non-blocking backoff.
+"""
+
+import asyncio
+import time
+
+import httpx
+import pytest
+
+from src.services.pagespeed_client import PageSpeedClient, get_pagespeed_client
+from src.utils.deadline import Deadline
+
+PARAMS = {"url": "https://example.com", "strategy": "mobile", "key": "test"}
+
+
+def _client(handler, **kwargs) -> PageSpeedClient:
+    kwargs.setdefault("backoff_seconds", 0.0)
+    return PageSpeedClient(transport=httpx.MockTransport(handler), **kwargs)
+
+
+class TestPageSpeedClient:
+    """Test cases for PageSpeedClient."""
+
+    def test_validate_input(self):
+        """Test params must be a dict with a URL."""
+        client = PageSpeedClient()
+
+        assert client.validate_input(PARAMS) is True
+        assert client.validate_input({"strategy": "mobile"}) is False
+        assert client.validate_input("https://example.com") is False
+
+    @pytest.mark.asyncio
+    async def test_success(self):
+        """Test a successful audit returns the parsed payload."""
+
+        def handler(request):
+            assert request.url.params["url"] == "https://example.com"
+            assert request.url.params["strategy"] == "mobile"
+            assert request.headers["User-Agent"] == "LeadGen-Makeover-Agent/1.0"
+            return httpx.Response(200, json={"lighthouseResult": {"categories": {}}})
+
+        client = _client(handler)
+        result = await client.run_pagespeed(PARAMS)
+        await client.aclose()
+
+        assert result == {
+            "success": True,
+            "data": {"lighthouseResult": {"categories": {}}},
+            "status_code": 200,
+        }
+        assert client.get_stats()["retries"] == 0
+
+    @pytest.mark.asyncio
+    async def test_retries_transient_failures(self):
+        """Test 5xx responses and timeouts are retried until one succeeds."""
+        responses = iter(["timeout", 503, 200])
+
+        def handler(request):
+            outcome = next(responses)
+            if outcome == "timeout":
+                raise httpx.ReadTimeout("timed out", request=request)
+            return httpx.Response(outcome, json={"ok": True})
+
+        client = _client(handler)
+        result = await client.run_pagespeed(PARAMS)
+
+        assert result["success"] is True
+        assert client.requests == 3
+        assert client.retries == 2
+
+    @pytest.mark.asyncio
+    async def test_gives_up_after_attempts(self):
+        """Test the last failure is reported once attempts run out."""
+
+        def handler(request):
+            raise httpx.ConnectTimeout("timed out", request=request)
+
+        client = _client(handler, retry_attempts=2)
+        result = await client.run_pagespeed(PARAMS)
+
+        assert result["success"] is False
+        assert result["error_code"] == "TIMEOUT"
+        assert result["attempts"] == 2
+        assert client.requests == 2
+
+    @pytest.mark.asyncio
+    async def test_rate_limited(self):
+        """Test exhausted 429 responses map to RATE_LIMIT_EXCEEDED."""
+
+        def handler(request):
+            return httpx.Response(429, headers={"Retry-After": "0"})
+
+        client = _client(handler)
+        result = await client.run_pagespeed(PARAMS, attempts=2)
+
+        assert result["error_code"] == "RATE_LIMIT_EXCEEDED"
+        assert result["status_code"] == 429
+        assert "retry_after" not in result
+
+    @pytest.mark.asyncio
+    async def test_client_errors_not_retried(self):
+        """Test a 400 response fails immediately."""
+
+        def handler(request):
+            return httpx.Response(400, json={"error": "bad url"})
+
+        client = _client(handler)
+        result = await client.run_pagespeed(PARAMS)
+
+        assert result["error_code"] == "REQUEST_FAILED"
+        assert result["status_code"] == 400
+        assert client.requests == 1
+
+    @pytest.mark.asyncio
+    async def test_backoff_does_not_block_loop(self):
+        """Test other coroutines keep running while a retry waits."""
+        attempts = []
+
+        def handler(request):
+            attempts.append(time.monotonic())
+            if len(attempts) == 1:
+                return httpx.Response(503)
+            return httpx.Response(200, json={})
+
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while len(attempts) < 2:
+                ticks += 1
+                await asyncio.sleep(0.01)
+
+        client = _client(handler, backoff_seconds=0.2)
+        client._backoff = lambda attempt, retry_after: 0.1
+        result, _ = await asyncio.gather(client.run_pagespeed(PARAMS), ticker())
+
+        assert result["success"] is True
+        assert attempts[1] - attempts[0] >= 0.1
+        assert ticks >= 5
+
+    def test_backoff_bounds(self):
+        """Test jittered backoff stays under the exponential ceiling."""
+        client = PageSpeedClient(backoff_seconds=1.0, max_backoff_seconds=3.0)
+
+        assert all(0 <= client._backoff(1, None) <= 1.0 for _ in range(50))
+        assert all(0 <= client._backoff(5, None) <= 3.0 for _ in range(50))
+        assert client._backoff(1, 2.5) == 2.5
+        assert client._backoff(1, 60.0) == 3.0
+
+    def test_adaptive_timeout(self):
+        """Test timeouts follow host latencies, then overall ones, within bounds."""
+        client = PageSpeedClient()
+        client.min_samples = 3
+        client.min_timeout = 2.0
+        client.read_timeout = 25
+
+        assert client.timeout_for("a.example.com") == 25
+        for seconds in (4.0, 4.0, 4.0):
+            client.latency.record("a.example.com", seconds)
+        assert client.timeout_for("a.example.com") == pytest.approx(4.0 * 1.5)
+        assert client.timeout_for("new.example.com") == pytest.approx(4.0 * 1.5)
+
+        for seconds in (0.1, 0.1, 0.1):
+            client.latency.record("fast.example.com", seconds)
+        assert client.timeout_for("fast.example.com") == 2.0
+
+        client.adaptive_timeouts = False
+        assert client.timeout_for("a.example.com") == 25
+
+    @pytest.mark.asyncio
+    async def test_records_successful_latency_per_host(self):
+        """Test successful audits feed the host's latency samples."""
+        client = _client(lambda request: httpx.Response(200, json={}))
+        await client.run_pagespeed(PARAMS)
+
+        assert client.latency.percentile(50, key="example.com") is not None
+
+    @pytest.mark.asyncio
+    async def test_timeouts_feed_latency_and_retry_with_full_timeout(self):
+        """Test a timeout is a latency sample and the retry gets the full timeout."""
+        timeouts = []
+
+        def handler(request):
+            timeouts.append(request.extensions["timeout"]["read"])
+            if len(timeouts) == 1:
+                raise httpx.ReadTimeout("timed out", request=request)
+            return httpx.Response(200, json={})
+
+        client = _client(handler)
+        client.min_samples = 3
+        client.min_timeout = 2.0
+        client.read_timeout = 25
+        for _ in range(3):
+            client.latency.record("example.com", 2.0)
+
+        result = await client.run_pagespeed(PARAMS)
+
+        assert result["success"] is True
+        assert timeouts == [pytest.approx(3.0), 25]
+        assert client.latency.percentile(100, key="example.com") >= 3.0
+
+    @pytest.mark.asyncio
+    async def test_deadline_caps_attempt_timeout_and_retries(self):
+        """Test attempts only get the time left and retries stop at the deadline."""
+        timeouts = []
+
+        def handler(request):
+            timeouts.append(request.extensions["timeout"]["read"])
+            return httpx.Response(503)
+
+        client = _client(handler)
+        client._backoff = lambda attempt, retry_after: 1.0
+        start = time.monotonic()
+        result = await client.run_pagespeed(PARAMS, deadline=Deadline.after(1.5))
+
+        assert time.monotonic() - start < 0.5
+        assert len(timeouts) == 1 and timeouts[0] <= 1.5
+        assert result["error_code"] == "REQUEST_FAILED"
+        assert result["deadline_exceeded"] is True
+        assert result["attempts"] == 1
+        assert client.get_stats()["deadline_exceeded"] == 1
+
+    @pytest.mark.asyncio
+    async def test_expired_deadline_makes_no_request(self):
+        """Test no attempt starts without enough time left."""
+        client = _client(lambda request: httpx.Response(200, json={}))
+        result = await client.run_pagespeed(PARAMS, deadline=Deadline.after(0.2))
+
+        assert result["error_code"] == "TIMEOUT"
+        assert result["deadline_exceeded"] is True
+        assert result["attempts"] == 0
+        assert client.requests == 0
+
+    def test_shared_client(self):
+        """Test get_pagespeed_client returns one process-wide instance."""
+        assert get_pagespeed_client() is get_pagespeed_client()
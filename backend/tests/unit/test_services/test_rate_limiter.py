@@ -0,0 +1,278 @@
+"""
+Unit tests for the process-wide rate limiter registry.
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from src.services.heuristic_evaluation_service import HeuristicEvaluationService
+from src.services.lighthouse_service import LighthouseService
+from src.services.rate_limit_monitor import RateLimitMonitor
+from src.services.rate_limiter import (
+    RateLimiter,
+    RequestPriority,
+    get_rate_limiter,
+    reset_rate_limiter,
+)
+from src.utils.rate_limit_store import MemoryRateLimitStore
+
+
+class TestSharedRateLimiter:
+    """Test cases for get_rate_limiter."""
+
+    def test_services_share_one_limiter(self):
+        """Test every service and the monitor see the same windows."""
+        limiter = get_rate_limiter()
+
+        assert LighthouseService().rate_limiter is limiter
+        assert HeuristicEvaluationService().rate_limiter is limiter
+        assert RateLimitMonitor().rate_limiter is limiter
+
+        LighthouseService().rate_limiter.record_request("lighthouse", True)
+        info = RateLimitMonitor().rate_limiter.get_rate_limit_info("lighthouse")
+        assert info["current_usage"] == 1
+
+    def test_concurrent_threads_are_counted_exactly(self):
+        """Test no request is lost when many threads record at once."""
+        limiter = get_rate_limiter()
+        barrier = threading.Barrier(8)
+
+        def record():
+            barrier.wait()
+            for _ in range(200):
+                limiter.record_request("validation", True)
+                limiter.get_rate_limit_info("validation")
+
+        threads = [threading.Thread(target=record) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert limiter.get_rate_limit_info("validation")["current_usage"] == 1600
+
+    @pytest.mark.asyncio
+    async def test_event_loop_and_worker_threads_share_counts(self):
+        """Test coroutines and executor threads record into one window."""
+        limiter = get_rate_limiter()
+
+        def record_many():
+            for _ in range(100):
+                limiter.record_request("business_discovery", True)
+
+        async def record_async():
+            for _ in range(100):
+                limiter.record_request("business_discovery", True)
+                await asyncio.sleep(0)
+
+        await asyncio.gather(
+            *(asyncio.to_thread(record_many) for _ in range(4)),
+            *(record_async() for _ in range(4)),
+        )
+
+        info = limiter.get_rate_limit_info("business_discovery")
+        assert info["current_usage"] == 800
+        assert limiter.can_make_request("business_discovery")[0] is False
+
+    def test_reset_clears_shared_state_in_place(self):
+        """Test a reset empties the windows without replacing the instance."""
+        limiter = get_rate_limiter()
+        for _ in range(5):
+            limiter.record_request("fallback", False)
+        assert limiter.can_make_request("fallback")[0] is False
+
+        reset_rate_limiter()
+
+        assert get_rate_limiter() is limiter
+        assert limiter.can_make_request("fallback") == (True, "OK")
+        assert limiter.get_rate_limit_info("fallback")["current_usage"] == 0
+
+
+class TestAcquire:
+    """Test cases for waiting for capacity with acquire."""
+
+    @pytest.fixture
+    def limiter(self):
+        limiter = RateLimiter()
+        limiter._rate_limits["fallback"]["limit"] = 2
+        yield limiter
+        limiter.close()
+
+    @pytest.mark.asyncio
+    async def test_granted_slot_is_counted_once(self, limiter):
+        """Test record_request does not count an acquired slot again."""
+        reservation = await limiter.acquire("fallback", timeout=0)
+        assert (reservation.granted, reservation.reason) == (True, "OK")
+        assert limiter.get_rate_limit_info("fallback")["current_usage"] == 1
+
+        limiter.record_request("fallback", True, reservation=reservation)
+        limiter.record_request("fallback", True, reservation=reservation)
+
+        assert limiter.get_rate_limit_info("fallback")["current_usage"] == 1
+
+    @pytest.mark.asyncio
+    async def test_calls_without_a_reservation_are_counted(self, limiter):
+        """Test a grant only covers the caller holding it, not every record."""
+        await limiter.acquire("fallback", timeout=0)
+
+        limiter.record_request("fallback", True)
+
+        assert limiter.get_rate_limit_info("fallback")["current_usage"] == 2
+
+    @pytest.mark.asyncio
+    async def test_release_gives_the_slot_back(self, limiter):
+        """Test a released slot is uncounted and goes to the next waiter."""
+        held = [await limiter.acquire("fallback", timeout=0) for _ in range(2)]
+        waiter = asyncio.create_task(limiter.acquire("fallback", timeout=5))
+        while not limiter.get_queue_length("fallback"):
+            await asyncio.sleep(0)
+
+        limiter.release(held[0])
+        limiter.release(held[0])
+
+        assert (await asyncio.wait_for(waiter, 1)).granted
+        assert limiter.get_rate_limit_info("fallback")["current_usage"] == 2
+
+    @pytest.mark.asyncio
+    async def test_times_out_when_no_capacity_frees_up(self, limiter):
+        """Test a full window makes acquire give up after the timeout."""
+        for _ in range(2):
+            await limiter.acquire("fallback", timeout=0)
+
+        result = await limiter.acquire("fallback", timeout=0.05)
+
+        assert (result.granted, result.reason) == (False, "No capacity within 0.05s")
+        assert limiter.get_queue_length("fallback") == 0
+
+    @pytest.mark.asyncio
+    async def test_open_breaker_fails_without_waiting(self, limiter):
+        """Test an open circuit breaker is reported instead of waited out."""
+        for _ in range(limiter._circuit_breakers["fallback"]["threshold"]):
+            limiter.record_request("fallback", False)
+
+        result = await asyncio.wait_for(limiter.acquire("fallback"), 1)
+
+        assert (result.granted, result.reason) == (False, "Circuit breaker is OPEN")
+
+    @pytest.mark.asyncio
+    async def test_serves_priority_classes_then_arrival_order(self, limiter):
+        """Test higher classes go first and each class is first come, first served."""
+        for _ in range(2):
+            await limiter.acquire("fallback", timeout=0)
+        order = []
+
+        async def wait(name, priority):
+            assert (await limiter.acquire("fallback", 5, priority)).granted
+            order.append(name)
+
+        tasks = [
+            asyncio.create_task(wait(name, priority))
+            for name, priority in [
+                ("batch", RequestPriority.BATCH),
+                ("normal-1", RequestPriority.NORMAL),
+                ("interactive", RequestPriority.INTERACTIVE),
+                ("normal-2", RequestPriority.NORMAL),
+            ]
+        ]
+        while limiter.get_queue_length("fallback") < len(tasks):
+            await asyncio.sleep(0)
+
+        # Free four slots and wake the head; each grant wakes the next in line
+        limiter._rate_limits["fallback"]["limit"] = 6
+        limiter._queues["fallback"][0].wake()
+        await asyncio.wait_for(asyncio.gather(*tasks), 5)
+
+        assert order == ["interactive", "normal-1", "normal-2", "batch"]
+
+    def test_blocking_callers_never_exceed_the_limit(self, limiter):
+        """Test threads waiting together are granted only the free slots."""
+        results = []
+        barrier = threading.Barrier(4)
+
+        def wait():
+            barrier.wait()
+            results.append(limiter.acquire_blocking("fallback", timeout=0.1).granted)
+
+        threads = [threading.Thread(target=wait) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert sorted(results) == [False, False, True, True]
+        assert limiter.get_rate_limit_info("fallback")["current_usage"] == 2
+
+    def test_waiter_on_a_closed_loop_is_skipped(self, limiter):
+        """Test a waiter whose event loop has closed does not stall the queue."""
+        held = limiter.acquire_blocking("fallback", timeout=0)
+        limiter.acquire_blocking("fallback", timeout=0)
+        loop = asyncio.new_event_loop()
+        limiter._enqueue(
+            "fallback",
+            RequestPriority.INTERACTIVE,
+            lambda: loop.call_soon_threadsafe(lambda: None),
+        )
+        loop.close()
+        results = []
+        thread = threading.Thread(
+            target=lambda: results.append(
+                limiter.acquire_blocking("fallback", timeout=5).granted
+            )
+        )
+        thread.start()
+        while limiter.get_queue_length("fallback") < 2:
+            time.sleep(0.001)
+
+        limiter.release(held)
+        thread.join(5)
+
+        assert results == [True]
+        assert limiter.get_queue_length("fallback") == 0
+
+    @pytest.mark.asyncio
+    async def test_blocking_store_io_runs_off_the_event_loop(self):
+        """Test a slow shared store does not stall other coroutines."""
+        class SlowStore(MemoryRateLimitStore):
+            blocking = True
+
+            def try_add(self, api, now, limit):
+                time.sleep(0.2)
+                return super().try_add(api, now, limit)
+
+            def add(self, api, now):
+                time.sleep(0.2)
+                super().add(api, now)
+
+        limiter = RateLimiter(store=SlowStore())
+        longest_gap = 0.0
+
+        async def ticker():
+            nonlocal longest_gap
+            while True:
+                started = time.monotonic()
+                await asyncio.sleep(0.01)
+                longest_gap = max(longest_gap, time.monotonic() - started)
+
+        ticking = asyncio.create_task(ticker())
+        await asyncio.sleep(0.02)
+        try:
+            reservation = await limiter.acquire("fallback", timeout=0)
+            limiter.record_request("validation", True)
+            await asyncio.sleep(0.3)
+        finally:
+            ticking.cancel()
+
+        assert reservation.granted
+        # Each store call takes 0.2s; none of them held up the loop
+        assert longest_gap < 0.1
+        assert limiter.get_rate_limit_info("validation")["current_usage"] == 1
+        limiter.close()
+
+    def test_unknown_api(self, limiter):
+        """Test acquiring for an unconfigured API fails straight away."""
+        result = limiter.acquire_blocking("nope")
+
+        assert (result.granted, result.reason) == (False, "Unknown API: nope")
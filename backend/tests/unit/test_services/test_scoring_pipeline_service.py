@@ -0,0 +1,247 @@
+"""
+Unit tests for the website scoring pipeline.
+"""
+
+import asyncio
+import time
+from unittest.mock import Mock
+
+import pytest
+
+from src.schemas.website_scoring import ConfidenceLevel, HeuristicScore
+from src.services.fallback_scoring_service import FallbackScoringService
+from src.services.score_validation_service import ScoreValidationService
+from src.services.scoring_pipeline_service import ScoringPipelineService
+from src.utils.deadline import Deadline
+
+WEBSITE_URL = "https://example.com"
+
+
+def _lighthouse_success():
+    return {
+        "success": True,
+        "scores": {
+            "performance": 80.0,
+            "accessibility": 90.0,
+            "best_practices": 85.0,
+            "seo": 95.0,
+        },
+        "overall_score": 86.0,
+        "core_web_vitals": {"largest_contentful_paint": 1800.0},
+        "confidence": "high",
+    }
+
+
+def _heuristic_success():
+    return {
+        "success": True,
+        "scores": HeuristicScore(
+            trust_score=70.0,
+            cro_score=60.0,
+            mobile_score=80.0,
+            content_score=75.0,
+            social_score=50.0,
+            overall_heuristic_score=70.0,
+            confidence_level=ConfidenceLevel.MEDIUM,
+        ),
+        "trust_signals": {"has_https": True, "has_privacy_policy": True},
+        "cro_elements": {"has_cta_buttons": True},
+        "mobile_usability": {"has_viewport_meta": True},
+        "content_quality": {"has_proper_headings": True},
+        "social_proof": {"has_testimonials": False},
+        "confidence": "medium",
+    }
+
+
+def _delayed(result, delay, calls=None):
+    async def run(*args, **kwargs):
+        if calls is not None:
+            calls.append(args)
+        await asyncio.sleep(delay)
+        return result
+
+    return run
+
+
+class TestScoringPipelineService:
+    """Test cases for ScoringPipelineService."""
+
+    def setup_method(self):
+        self.lighthouse_service = Mock()
+        self.heuristic_service = Mock()
+        self.fallback_service = FallbackScoringService()
+        self.fallback_service.rate_limiter = Mock()
+        self.fallback_service.heuristic_service = Mock()
+        self.service = ScoringPipelineService(
+            lighthouse_service=self.lighthouse_service,
+            heuristic_service=self.heuristic_service,
+            fallback_service=self.fallback_service,
+            score_validation_service=ScoreValidationService(),
+        )
+
+    @pytest.mark.asyncio
+    async def test_runs_both_methods_concurrently_and_validates(self):
+        """Test the pipeline takes max(Lighthouse, heuristics), not their sum."""
+        self.lighthouse_service.run_lighthouse_audit_async = _delayed(
+            _lighthouse_success(), 0.1
+        )
+        self.heuristic_service.run_heuristic_evaluation_async = _delayed(
+            _heuristic_success(), 0.1
+        )
+
+        start = time.perf_counter()
+        result = await self.service.score_website(WEBSITE_URL, "biz-1", "run-1")
+        elapsed = time.perf_counter() - start
+
+        assert elapsed < 0.18
+        assert result["success"] is True
+        assert result["scoring_method"] == "comprehensive"
+        assert result["scoring_status"] == "completed"
+        assert result["lighthouse_scores"].overall == 86.0
+        assert result["heuristic_scores"].overall_heuristic_score == 70.0
+        assert result["validation_result"].run_id == "run-1"
+        assert result["overall_score"] == pytest.approx(86.0 * 0.8 + 70.0 * 0.2)
+        assert set(result["timings"]) == {
+            "lighthouse",
+            "heuristics",
+            "validation",
+            "total",
+        }
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_heuristics_without_reevaluating(self):
+        """Test a Lighthouse failure reuses the heuristic result for fallback."""
+        self.lighthouse_service.run_lighthouse_audit_async = _delayed(
+            {"success": False, "error": "Audit request timed out"}, 0
+        )
+        calls = []
+        self.heuristic_service.run_heuristic_evaluation_async = _delayed(
+            _heuristic_success(), 0, calls
+        )
+
+        result = await self.service.score_website(WEBSITE_URL, "biz-1", "run-1")
+
+        assert result["success"] is True
+        assert result["scoring_method"] == "fallback"
+        assert result["scoring_status"] == "degraded"
+        assert result["fallback_scores"].overall_score == 70.0
+        assert result["confidence_level"] == ConfidenceLevel.LOW
+        assert result["validation_result"] is None
+        assert len(calls) == 1
+        self.fallback_service.heuristic_service.run_heuristic_evaluation.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_lighthouse_only_when_heuristics_fail(self):
+        """Test a failed heuristic evaluation leaves the Lighthouse score."""
+        self.lighthouse_service.run_lighthouse_audit_async = _delayed(
+            _lighthouse_success(), 0
+        )
+        self.heuristic_service.run_heuristic_evaluation_async = _delayed(
+            {"success": False, "error": "HTTP 500", "error_code": "FETCH_FAILED"}, 0
+        )
+
+        result = await self.service.score_website(WEBSITE_URL, "biz-1", "run-1")
+
+        assert result["scoring_method"] == "lighthouse"
+        assert result["overall_score"] == 86.0
+        assert result["confidence_level"] == ConfidenceLevel.HIGH
+
+    @pytest.mark.asyncio
+    async def test_exception_in_one_stage_is_reported_as_failure(self):
+        """Test both stages failing, one by raising, yields an error result."""
+
+        async def boom(*args, **kwargs):
+            raise RuntimeError("boom")
+
+        self.lighthouse_service.run_lighthouse_audit_async = boom
+        self.heuristic_service.run_heuristic_evaluation_async = _delayed(
+            {"success": False, "error": "HTTP 500", "error_code": "FETCH_FAILED"}, 0
+        )
+
+        result = await self.service.score_website(WEBSITE_URL, "biz-1")
+
+        assert result["success"] is False
+        assert result["error_code"] == "FETCH_FAILED"
+        assert "boom" in result["error"]
+        assert result["run_id"]
+
+    @pytest.mark.asyncio
+    async def test_deadline_abandons_slow_stage(self):
+        """Test a stage still running at the deadline is reported as a timeout."""
+        calls = []
+        self.lighthouse_service.run_lighthouse_audit_async = _delayed(
+            _lighthouse_success(), 5, calls
+        )
+        self.heuristic_service.run_heuristic_evaluation_async = _delayed(
+            _heuristic_success(), 0
+        )
+        deadline = Deadline.after(0.1)
+
+        start = time.perf_counter()
+        result = await self.service.score_website(
+            WEBSITE_URL, "biz-1", "run-1", deadline=deadline
+        )
+
+        assert time.perf_counter() - start < 0.5
+        assert result["scoring_method"] == "fallback"
+        assert calls[0][-1] is deadline
+
+    @pytest.mark.asyncio
+    async def test_recovered_audit_is_scored_through_fallback(self):
+        """Test a reduced-scope recovery audit is not validated as a full audit."""
+        recovered = {
+            "success": True,
+            "fallback_used": True,
+            "estimated": True,
+            "scores": {
+                "performance": 40.0,
+                "accessibility": None,
+                "best_practices": None,
+                "seo": None,
+            },
+            "overall_score": 40.0,
+            "confidence": "low",
+        }
+        self.lighthouse_service.run_lighthouse_audit_async = _delayed(recovered, 0)
+        self.heuristic_service.run_heuristic_evaluation_async = _delayed(
+            _heuristic_success(), 0
+        )
+        self.service.score_validation_service = Mock()
+
+        result = await self.service.score_website(WEBSITE_URL, "biz-1", "run-1")
+
+        assert result["scoring_method"] == "fallback"
+        assert result["scoring_status"] == "degraded"
+        assert result["lighthouse_scores"].performance == 40.0
+        assert result["lighthouse_scores"].seo is None
+        assert result["fallback_scores"].overall_score == 70.0
+        assert result["validation_result"] is None
+        self.service.score_validation_service.validate_scores.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_recovered_audit_alone_has_low_confidence(self):
+        """Test a recovery audit without heuristics is reported as partial."""
+        recovered = {
+            "success": True,
+            "fallback_used": True,
+            "scores": {
+                "performance": 55.0,
+                "accessibility": None,
+                "best_practices": None,
+                "seo": None,
+            },
+            "overall_score": 55.0,
+            "confidence": "medium",
+        }
+        self.lighthouse_service.run_lighthouse_audit_async = _delayed(recovered, 0)
+        self.heuristic_service.run_heuristic_evaluation_async = _delayed(
+            {"success": False, "error": "HTTP 500", "error_code": "FETCH_FAILED"}, 0
+        )
+
+        result = await self.service.score_website(WEBSITE_URL, "biz-1", "run-1")
+
+        assert result["success"] is True
+        assert result["scoring_method"] == "lighthouse"
+        assert result["scoring_status"] == "degraded"
+        assert result["overall_score"] == 55.0
+        assert result["confidence_level"] == ConfidenceLevel.LOW
@@ -0,0 +1,399 @@
+"""
+Unit tests for WebFetcher.
+Tests pooled async fetching, error mapping, per-host connection limits and DNS caching.
+"""
+
+import asyncio
+
+import httpcore
+import httpx
+import pytest
+
+from src.services.web_fetcher import (
+    CachingDNSBackend,
+    DNSCache,
+    FetchResult,
+    WebFetcher,
+    get_web_fetcher,
+)
+from src.utils.http_cache import HTTPCache
+
+
+def _fetcher(handler, **kwargs) -> WebFetcher:
+    return WebFetcher(transport=httpx.MockTransport(handler), **kwargs)
+
+
+class TestWebFetcher:
+    """Test cases for WebFetcher."""
+
+    def test_validate_input(self):
+        """Test only absolute http(s) URLs are accepted."""
+        fetcher = WebFetcher()
+
+        assert fetcher.validate_input("https://example.com") is True
+        assert fetcher.validate_input("http://example.com/page") is True
+        assert fetcher.validate_input("ftp://example.com") is False
+        assert fetcher.validate_input("example.com") is False
+        assert fetcher.validate_input(None) is False
+
+    @pytest.mark.asyncio
+    async def test_fetch_success(self):
+        """Test a successful fetch returns content and response metadata."""
+
+        def handler(request):
+            assert request.headers["User-Agent"] == "test-agent"
+            return httpx.Response(
+                200, content=b"<html>ok</html>", headers={"Content-Type": "text/html"}
+            )
+
+        fetcher = _fetcher(handler)
+        result = await fetcher.fetch(
+            "https://example.com", headers={"User-Agent": "test-agent"}
+        )
+        await fetcher.aclose()
+
+        assert isinstance(result, FetchResult)
+        assert result.success is True
+        assert result.status_code == 200
+        assert result.content == b"<html>ok</html>"
+        assert result.headers["content-type"] == "text/html"
+
+    @pytest.mark.asyncio
+    async def test_fetch_follows_redirects(self):
+        """Test redirects are followed and the final URL recorded."""
+
+        def handler(request):
+            if request.url.path == "/old":
+                return httpx.Response(
+                    301, headers={"Location": "https://example.com/new"}
+                )
+            return httpx.Response(200, content=b"moved")
+
+        fetcher = _fetcher(handler)
+        result = await fetcher.fetch("https://example.com/old")
+
+        assert result.success is True
+        assert result.final_url == "https://example.com/new"
+        assert result.content == b"moved"
+
+    @pytest.mark.asyncio
+    async def test_fetch_http_error(self):
+        """Test error statuses are reported, not raised."""
+        fetcher = _fetcher(lambda request: httpx.Response(503))
+
+        result = await fetcher.fetch("https://example.com")
+
+        assert result.success is False
+        assert result.status_code == 503
+        assert result.error_code == "HTTP_ERROR"
+
+    @pytest.mark.asyncio
+    async def test_fetch_timeout(self):
+        """Test timeouts map to the TIMEOUT error code."""
+
+        def handler(request):
+            raise httpx.ReadTimeout("timed out", request=request)
+
+        result = await _fetcher(handler).fetch("https://example.com")
+
+        assert result.success is False
+        assert result.error_code == "TIMEOUT"
+
+    @pytest.mark.asyncio
+    async def test_fetch_connection_error(self):
+        """Test network errors map to the FETCH_FAILED error code."""
+
+        def handler(request):
+            raise httpx.ConnectError("refused", request=request)
+
+        result = await _fetcher(handler).fetch("https://example.com")
+
+        assert result.success is False
+        assert result.error_code == "FETCH_FAILED"
+
+    @pytest.mark.asyncio
+    async def test_fetch_invalid_url(self):
+        """Test invalid URLs are rejected without a request."""
+        result = await _fetcher(lambda request: httpx.Response(200)).fetch("nope")
+
+        assert result.error_code == "INVALID_URL"
+
+    @pytest.mark.asyncio
+    async def test_fetch_html_decodes_page(self):
+        """Test HTML is decoded with the charset from the response header."""
+        body = "<html><body>café €5</body></html>".encode("cp1252")
+
+        def handler(request):
+            return httpx.Response(
+                200,
+                content=body,
+                headers={"Content-Type": "text/html; charset=windows-1252"},
+            )
+
+        result = await _fetcher(handler).fetch_html("https://example.com")
+
+        assert result.success is True
+        assert result.text == "<html><body>café €5</body></html>"
+        assert result.encoding == "cp1252"
+        assert result.bytes_read == len(body)
+        assert result.truncated is False
+        assert result.content == b""
+
+    @pytest.mark.asyncio
+    async def test_fetch_html_truncates_at_budget(self):
+        """Test oversized pages are cut off at the byte budget."""
+        served = []
+
+        async def body():
+            for _ in range(100):
+                served.append(1)
+                yield b"<p>" + b"x" * 1021
+
+        def handler(request):
+            return httpx.Response(
+                200, content=body(), headers={"Content-Type": "text/html"}
+            )
+
+        fetcher = _fetcher(handler, max_page_bytes=4096)
+        result = await fetcher.fetch_html("https://example.com")
+
+        assert result.success is True
+        assert result.truncated is True
+        assert result.bytes_read == 4096
+        assert len(result.text) == 4096
+        assert len(served) < 100
+
+        result = await fetcher.fetch_html("https://example.com", max_bytes=0)
+        assert result.truncated is False
+        assert len(result.text) == 100 * 1024
+
+    @pytest.mark.asyncio
+    async def test_fetch_html_rejects_non_html_content_type(self):
+        """Test declared non-HTML responses abort with NOT_HTML."""
+
+        def handler(request):
+            return httpx.Response(
+                200, content=b"%PDF-1.7", headers={"Content-Type": "application/pdf"}
+            )
+
+        result = await _fetcher(handler).fetch_html("https://example.com/doc")
+
+        assert result.success is False
+        assert result.error_code == "NOT_HTML"
+
+    @pytest.mark.asyncio
+    async def test_fetch_html_rejects_sniffed_binary(self):
+        """Test binary bodies served with a generic type are sniffed and rejected."""
+
+        def handler(request):
+            return httpx.Response(
+                200,
+                content=b"\x89PNG\r\n\x1a\n" + b"\x00" * 10_000,
+                headers={"Content-Type": "application/octet-stream"},
+            )
+
+        result = await _fetcher(handler).fetch_html("https://example.com/image")
+
+        assert result.success is False
+        assert result.error_code == "NOT_HTML"
+
+    @pytest.mark.asyncio
+    async def test_fetch_html_deadline(self):
+        """Test the overall download deadline maps to TIMEOUT."""
+
+        async def body():
+            yield b"<html>"
+            await asyncio.sleep(1)
+            yield b"</html>"
+
+        def handler(request):
+            return httpx.Response(200, content=body())
+
+        fetcher = _fetcher(handler, timeout=0.05)
+        result = await fetcher.fetch_html("https://example.com")
+
+        assert result.success is False
+        assert result.error_code == "TIMEOUT"
+
+    @pytest.mark.asyncio
+    async def test_fetch_html_cache_revalidation(self, tmp_path):
+        """Test cached pages are served fresh, then revalidated with a 304."""
+        requests_seen = []
+
+        def handler(request):
+            requests_seen.append(request)
+            if request.headers.get("If-None-Match") == '"v1"':
+                return httpx.Response(304, headers={"ETag": '"v1"'})
+            return httpx.Response(
+                200,
+                content=b"<html><body>Fresh bread</body></html>",
+                headers={"Content-Type": "text/html", "ETag": '"v1"'},
+            )
+
+        cache = HTTPCache(tmp_path, ttl_seconds=60)
+        fetcher = _fetcher(handler)
+
+        first = await fetcher.fetch_html("https://example.com", cache=cache)
+        fresh = await fetcher.fetch_html("https://example.com", cache=cache)
+        cache.ttl_seconds = 0
+        revalidated = await fetcher.fetch_html("https://example.com", cache=cache)
+
+        assert first.from_cache is False
+        assert first.content_hash is not None
+        assert fresh.from_cache is True
+        assert revalidated.from_cache is True
+        assert revalidated.text == "<html><body>Fresh bread</body></html>"
+        assert revalidated.content_hash == first.content_hash
+        assert len(requests_seen) == 2
+        assert cache.revalidations == 1
+
+    @pytest.mark.asyncio
+    async def test_per_host_connection_limit(self):
+        """Test concurrent requests to one host are capped, other hosts are not."""
+        in_flight = {}
+        peak = {}
+
+        async def handler(request):
+            host = request.url.host
+            in_flight[host] = in_flight.get(host, 0) + 1
+            peak[host] = max(peak.get(host, 0), in_flight[host])
+            await asyncio.sleep(0.01)
+            in_flight[host] -= 1
+            return httpx.Response(200)
+
+        fetcher = _fetcher(handler, max_connections_per_host=2)
+        urls = [f"https://slow.example/{i}" for i in range(6)]
+        urls += [f"https://fast.example/{i}" for i in range(3)]
+
+        results = await asyncio.gather(*(fetcher.fetch(url) for url in urls))
+
+        assert all(result.success for result in results)
+        assert peak["slow.example"] == 2
+        assert peak["fast.example"] == 2
+
+    def test_client_is_kept_per_event_loop(self):
+        """Test each event loop gets its own client and keeps it."""
+        fetcher = _fetcher(lambda request: httpx.Response(200))
+        loops = [asyncio.new_event_loop() for _ in range(2)]
+        clients = []
+
+        async def fetch():
+            await fetcher.fetch("https://example.com")
+            clients.append(fetcher._clients[asyncio.get_running_loop()])
+
+        for loop in loops + loops:
+            loop.run_until_complete(fetch())
+
+        assert clients[0] is clients[2]
+        assert clients[1] is clients[3]
+        assert clients[0] is not clients[1]
+        assert not clients[0].is_closed
+
+        for loop in loops:
+            loop.run_until_complete(fetcher.aclose())
+            loop.close()
+        assert clients[0].is_closed and clients[1].is_closed
+        assert len(fetcher._clients) == 0
+
+    @pytest.mark.asyncio
+    async def test_idle_hosts_are_forgotten(self):
+        """Test per-host limits are dropped once a host has nothing in flight."""
+        fetcher = _fetcher(lambda request: httpx.Response(200))
+
+        await asyncio.gather(
+            *(fetcher.fetch(f"https://host-{i}.example/") for i in range(20))
+        )
+
+        assert fetcher.get_stats()["active_hosts"] == 0
+
+    def test_shared_fetcher(self):
+        """Test every caller gets the same process-wide fetcher."""
+        assert get_web_fetcher() is get_web_fetcher()
+
+    def test_get_stats(self):
+        """Test statistics expose pool limits and DNS cache counters."""
+        stats = WebFetcher(max_connections_per_host=3).get_stats()
+
+        assert stats["max_connections_per_host"] == 3
+        assert stats["dns_cache_hits"] == 0
+        assert stats["dns_cache_misses"] == 0
+
+
+class _RecordingBackend(httpcore.AsyncNetworkBackend):
+    """Network backend stub that records connection targets."""
+
+    def __init__(self, failing=()):
+        self.connected = []
+        self.failing = set(failing)
+
+    async def connect_tcp(
+        self, host, port, timeout=None, local_address=None, socket_options=None
+    ):
+        self.connected.append((host, port))
+        if host in self.failing:
+            raise httpcore.ConnectError(f"cannot reach {host}")
+        return httpcore.AsyncMockStream([])
+
+    async def sleep(self, seconds):
+        pass
+
+
+class TestDNSCaching:
+    """Test cases for DNSCache and CachingDNSBackend."""
+
+    @pytest.mark.asyncio
+    async def test_resolve_is_cached(self):
+        """Test repeated lookups are served from the cache until expiry."""
+        cache = DNSCache(ttl_seconds=60)
+
+        first = await cache.resolve("localhost", 80)
+        second = await cache.resolve("localhost", 80)
+
+        assert first == second
+        assert cache.misses == 1
+        assert cache.hits == 1
+
+    @pytest.mark.asyncio
+    async def test_expired_entries_are_resolved_again(self):
+        """Test entries past their TTL trigger a new lookup."""
+        cache = DNSCache(ttl_seconds=0)
+
+        await cache.resolve("localhost", 80)
+        await cache.resolve("localhost", 80)
+
+        assert cache.misses == 2
+
+    @pytest.mark.asyncio
+    async def test_backend_connects_to_resolved_address(self):
+        """Test connections go to the cached IP address."""
+        cache = DNSCache()
+        cache._entries[("example.test", 443)] = (float("inf"), ["192.0.2.1"])
+        backend = _RecordingBackend()
+
+        await CachingDNSBackend(cache, backend).connect_tcp("example.test", 443)
+
+        assert backend.connected == [("192.0.2.1", 443)]
+
+    @pytest.mark.asyncio
+    async def test_backend_tries_next_address(self):
+        """Test a failed address falls through to the next one."""
+        cache = DNSCache()
+        cache._entries[("example.test", 443)] = (
+            float("inf"),
+            ["192.0.2.1", "192.0.2.2"],
+        )
+        backend = _RecordingBackend(failing=["192.0.2.1"])
+
+        await CachingDNSBackend(cache, backend).connect_tcp("example.test", 443)
+
+        assert backend.connected == [("192.0.2.1", 443), ("192.0.2.2", 443)]
+
+    @pytest.mark.asyncio
+    async def test_backend_raises_when_all_addresses_fail(self):
+        """Test a connect error surfaces when no address is reachable."""
+        cache = DNSCache()
+        cache._entries[("example.test", 443)] = (float("inf"), ["192.0.2.1"])
+        backend = _RecordingBackend(failing=["192.0.2.1"])
+
+        with pytest.raises(httpcore.ConnectError):
+            await CachingDNSBackend(cache, backend).connect_tcp("example.test", 443)
@@ -0,0 +1,171 @@
+"""
+Unit tests for the audit result cache.
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from src.utils.audit_cache import AuditResultCache, audit_cache_key
+from src.utils.result_cache import MemoryCacheBackend, SQLiteCacheBackend, TieredCache
+
+
+def _cache(**kwargs) -> AuditResultCache:
+    kwargs.setdefault("ttl_seconds", 60)
+    return AuditResultCache(TieredCache(MemoryCacheBackend()), **kwargs)
+
+
+def _backdate(cache: AuditResultCache, key: str, seconds: float) -> None:
+    entry = cache.cache.get(key)
+    cache.cache.set(key, {**entry, "stored_at": entry["stored_at"] - seconds})
+
+
+def _counting_run(result=None, delay=0.0):
+    calls = []
+
+    async def run():
+        calls.append(time.monotonic())
+        await asyncio.sleep(delay)
+        return result or {"success": True, "score": len(calls)}
+
+    return run, calls
+
+
+def _cacheable(result):
+    return result["success"]
+
+
+class TestAuditCacheKey:
+    """Test cases for audit_cache_key."""
+
+    def test_key_normalizes_url_and_categories(self):
+        """Test equivalent URLs and category orders share a key."""
+        assert audit_cache_key("HTTPS://Example.com", "mobile", ["seo", "performance"]) == (
+            audit_cache_key("https://example.com/#x", "mobile", ["performance", "seo"])
+        )
+        assert audit_cache_key("https://example.com", "mobile", ["seo"]) != (
+            audit_cache_key("https://example.com", "desktop", ["seo"])
+        )
+
+
+class TestAuditResultCache:
+    """Test cases for AuditResultCache."""
+
+    @pytest.mark.asyncio
+    async def test_fresh_hit(self):
+        """Test a second lookup within the TTL does not run the audit."""
+        cache = _cache()
+        run, calls = _counting_run()
+
+        first = await cache.get_or_run("k", "mobile", run, _cacheable)
+        second = await cache.get_or_run("k", "mobile", run, _cacheable)
+
+        assert first[1] == "miss"
+        assert second[:2] == ({"success": True, "score": 1}, "hit")
+        assert len(calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_failures_not_cached(self):
+        """Test uncacheable results are returned but not stored."""
+        cache = _cache()
+        run, calls = _counting_run({"success": False})
+
+        await cache.get_or_run("k", "mobile", run, _cacheable)
+        await cache.get_or_run("k", "mobile", run, _cacheable)
+
+        assert len(calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_stale_while_revalidate(self):
+        """Test stale entries are served at once and refreshed in the background."""
+        cache = _cache(stale_seconds=600)
+        run, calls = _counting_run(delay=0.01)
+        await cache.get_or_run("k", "mobile", run, _cacheable)
+        _backdate(cache, "k", 120)
+
+        stale = await cache.get_or_run("k", "mobile", run, _cacheable)
+        again = await cache.get_or_run("k", "mobile", run, _cacheable)
+        await asyncio.sleep(0.05)
+        fresh = await cache.get_or_run("k", "mobile", run, _cacheable)
+
+        assert stale[:2] == ({"success": True, "score": 1}, "stale")
+        assert again[1] == "stale"
+        assert fresh[:2] == ({"success": True, "score": 2}, "hit")
+        assert len(calls) == 2
+        assert cache.get_stats()["refreshes"] == 1
+
+    @pytest.mark.asyncio
+    async def test_expired_beyond_stale_window(self):
+        """Test entries older than TTL plus the stale window are re-run."""
+        cache = _cache(stale_seconds=30)
+        run, calls = _counting_run()
+        await cache.get_or_run("k", "mobile", run, _cacheable)
+        _backdate(cache, "k", 120)
+
+        result = await cache.get_or_run("k", "mobile", run, _cacheable)
+
+        assert result[:2] == ({"success": True, "score": 2}, "miss")
+
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_coalesce(self):
+        """Test concurrent misses for one key share a single audit."""
+        cache = _cache()
+        run, calls = _counting_run(delay=0.02)
+
+        results = await asyncio.gather(
+            *(cache.get_or_run("k", "mobile", run, _cacheable) for _ in range(5))
+        )
+
+        assert len(calls) == 1
+        assert sorted(status for _, status, _ in results) == ["coalesced"] * 4 + ["miss"]
+        assert all(result == {"success": True, "score": 1} for result, _, _ in results)
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_does_not_cancel_shared_audit(self):
+        """Test one waiter giving up leaves the audit running for the others."""
+        cache = _cache()
+        run, calls = _counting_run(delay=0.05)
+
+        first = asyncio.create_task(cache.get_or_run("k", "mobile", run, _cacheable))
+        await asyncio.sleep(0)
+        second = asyncio.create_task(cache.get_or_run("k", "mobile", run, _cacheable))
+        await asyncio.sleep(0.01)
+        first.cancel()
+
+        result, status, _ = await second
+        assert status == "coalesced"
+        assert result["success"] is True
+        assert len(calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_strategy_ttls(self):
+        """Test per-strategy TTLs override the default."""
+        cache = _cache(ttl_seconds=600, strategy_ttls={"mobile": 10, "desktop": 0})
+        run, _ = _counting_run()
+        await cache.get_or_run("m", "mobile", run, _cacheable)
+        await cache.get_or_run("d", "desktop", run, _cacheable)
+        _backdate(cache, "m", 60)
+        _backdate(cache, "d", 60)
+
+        assert cache.ttl_for("desktop") == 600
+        assert cache.lookup("m", "mobile")[1] == "miss"
+        assert cache.lookup("d", "desktop")[1] == "hit"
+
+    @pytest.mark.asyncio
+    async def test_survives_restart(self, tmp_path):
+        """Test results in the SQLite tier are served by a new cache instance."""
+        path = tmp_path / "audits.sqlite3"
+        run, calls = _counting_run()
+        first = AuditResultCache(
+            TieredCache(MemoryCacheBackend(), SQLiteCacheBackend(path)), ttl_seconds=60
+        )
+        await first.get_or_run("k", "mobile", run, _cacheable)
+
+        second = AuditResultCache(
+            TieredCache(MemoryCacheBackend(), SQLiteCacheBackend(path)), ttl_seconds=60
+        )
+        result = await second.get_or_run("k", "mobile", run, _cacheable)
+
+        assert result[1] == "hit"
+        assert len(calls) == 1
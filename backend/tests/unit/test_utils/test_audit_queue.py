@@ -0,0 +1,57 @@
+"""
+Unit tests for the persistent audit queue.
+"""
+
+from src.utils.audit_queue import DONE, FAILED, PENDING, RUNNING, AuditQueue
+
+
+class TestAuditQueue:
+    """Test cases for AuditQueue."""
+
+    def test_pop_orders_by_priority_then_submission(self):
+        """Test lower priority values go first, FIFO within a priority."""
+        queue = AuditQueue()
+        queue.push([("https://a.com", "b1"), ("https://b.com", "b2")], "mobile", 1)
+        queue.push([("https://urgent.com", "b3")], "mobile", 0)
+
+        order = [queue.pop().url for _ in range(3)]
+
+        assert order == ["https://urgent.com", "https://a.com", "https://b.com"]
+        assert queue.pop() is None
+
+    def test_complete_and_counts(self):
+        """Test results are stored and counted per status and batch."""
+        queue = AuditQueue()
+        batch_id, ids = queue.push(
+            [("https://a.com", "b1"), ("https://b.com", "b2"), ("https://c.com", "b3")],
+            "desktop",
+            1,
+        )
+        first, second = queue.pop(), queue.pop()
+        queue.complete(first.id, {"success": True, "overall_score": 88.0})
+        queue.complete(second.id, {"success": False, "error": "HTTP 500"})
+
+        assert queue.counts(batch_id) == {PENDING: 1, RUNNING: 0, DONE: 1, FAILED: 1}
+        stored = queue.get(ids[0])
+        assert stored.result["overall_score"] == 88.0
+        assert stored.attempts == 1
+        assert queue.get(ids[1]).error == "HTTP 500"
+        assert queue.pending_ahead(1, ids[2]) == 0
+
+    def test_queue_survives_restart(self, tmp_path):
+        """Test pending and interrupted jobs are still there after reopening."""
+        path = tmp_path / "queue.sqlite3"
+        queue = AuditQueue(path)
+        batch_id, _ = queue.push(
+            [("https://a.com", "b1"), ("https://b.com", "b2")], "mobile", 1
+        )
+        queue.pop()
+        queue.set_state("daily_quota", ["2026-03-10", 12])
+        queue.close()
+
+        reopened = AuditQueue(path)
+
+        assert reopened.requeue_running() == 1
+        assert reopened.counts(batch_id)[PENDING] == 2
+        assert reopened.pop().attempts == 2
+        assert reopened.get_state("daily_quota") == ["2026-03-10", 12]
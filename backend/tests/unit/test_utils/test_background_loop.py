@@ -0,0 +1,72 @@
+"""
+Unit tests for the background event loop used by synchronous entry points.
+"""
+
+import asyncio
+
+import pytest
+
+from src.utils.background_loop import BackgroundLoop
+
+
+@pytest.fixture
+def background():
+    background = BackgroundLoop(name="test-background-loop")
+    yield background
+    background.close()
+
+
+async def _current_loop():
+    return asyncio.get_running_loop()
+
+
+class TestBackgroundLoop:
+    """Test cases for BackgroundLoop."""
+
+    def test_calls_share_one_loop(self, background):
+        """Test every call runs on the same long-lived loop."""
+        first = background.run(_current_loop())
+        second = background.run(_current_loop())
+
+        assert first is second
+        assert first.is_running()
+
+    @pytest.mark.asyncio
+    async def test_runs_from_inside_a_running_loop(self, background):
+        """Test a sync caller on another event loop is not refused."""
+        loop = background.run(_current_loop())
+
+        assert loop is not asyncio.get_running_loop()
+
+    def test_errors_propagate(self, background):
+        """Test an exception raised by the coroutine reaches the caller."""
+
+        async def fail():
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError, match="boom"):
+            background.run(fail())
+
+    def test_refuses_to_block_its_own_thread(self, background):
+        """Test a nested call from the background loop fails instead of hanging."""
+
+        async def nested():
+            return background.run(_current_loop())
+
+        with pytest.raises(RuntimeError, match="own thread"):
+            background.run(nested(), timeout=5)
+
+    def test_close_runs_shutdown_on_the_loop(self, background):
+        """Test the shutdown hook runs on the loop before it stops."""
+        loop = background.run(_current_loop())
+        seen = []
+
+        async def shutdown():
+            seen.append(asyncio.get_running_loop())
+
+        background.close(shutdown)
+
+        assert seen == [loop]
+        assert loop.is_closed()
+        # Started again on the next call
+        assert background.run(_current_loop()) is not loop
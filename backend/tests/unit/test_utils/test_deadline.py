@@ -0,0 +1,33 @@
+"""
+Unit tests for request deadlines.
+"""
+
+import time
+
+from src.utils.deadline import Deadline
+
+
+class TestDeadline:
+    """Test cases for Deadline."""
+
+    def test_remaining_and_clamp(self):
+        """Test the time left shrinks and caps longer timeouts."""
+        deadline = Deadline.after(10)
+
+        assert 9 < deadline.remaining() <= 10
+        assert deadline.clamp(3) == 3
+        assert 9 < deadline.clamp(30) <= 10
+        assert not deadline.expired
+
+    def test_expired_deadline_has_nothing_left(self):
+        """Test a past deadline reports zero, never a negative budget."""
+        deadline = Deadline(time.monotonic() - 5)
+
+        assert deadline.remaining() == 0.0
+        assert deadline.clamp(3) == 0.0
+        assert deadline.expired
+
+    def test_optional(self):
+        """Test no budget means no deadline."""
+        assert Deadline.optional(None) is None
+        assert Deadline.optional(5).remaining() > 4
@@ -0,0 +1,127 @@
+"""
+Unit tests for the HTML parser backends.
+Tests backend selection and parity of the streaming backend with the BeautifulSoup reference over saved HTML fixtures.
+"""
+
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from src.services.heuristic_evaluation_service import HeuristicEvaluationService
+from src.utils.html_parsers import (
+    DEFAULT_PARSER_BACKEND,
+    PARSER_BACKENDS,
+    PageParser,
+    SoupPageParser,
+    StreamingPageParser,
+    get_page_parser,
+    register_parser_backend,
+)
+from src.utils.page_features import PageFeatures
+
+FIXTURES_DIR = Path(__file__).resolve().parents[2] / "fixtures" / "html"
+FIXTURES = sorted(FIXTURES_DIR.glob("*.html"))
+
+
+@pytest.fixture(scope="module")
+def service():
+    """HeuristicEvaluationService with configuration and rate limiting mocked."""
+    with patch("src.services.heuristic_evaluation_service.get_api_config") as mock_config:
+        mock_config.return_value.HEURISTICS_HTML_PARSER = "bs4"
+        mock_config.return_value.HEURISTICS_FETCH_CACHE_ENABLED = False
+        mock_config.return_value.HEURISTICS_RESULT_CACHE_ENABLED = False
+        mock_config.return_value.HEURISTICS_PROCESS_POOL_WORKERS = 0
+        with patch("src.services.heuristic_evaluation_service.get_rate_limiter"):
+            yield HeuristicEvaluationService()
+
+
+def _evaluate(service, url, features):
+    signal_hits = service._match_signal_patterns(features)
+    return (
+        service._evaluate_trust_signals(url, features, signal_hits),
+        service._evaluate_cro_elements(features, signal_hits),
+        service._evaluate_mobile_usability(features),
+        service._evaluate_content_quality(features),
+        service._evaluate_social_proof(features, signal_hits),
+    )
+
+
+class TestParserBackendParity:
+    """Streaming backend must index every fixture exactly like the bs4 reference."""
+
+    def test_fixture_corpus_present(self):
+        """Test the parity corpus is not silently empty."""
+        assert len(FIXTURES) >= 5
+
+    @pytest.mark.parametrize("fixture", FIXTURES, ids=lambda path: path.stem)
+    def test_page_features_match_reference(self, fixture):
+        """Test both backends build identical page feature indexes."""
+        markup = fixture.read_bytes()
+
+        reference = SoupPageParser().parse(markup)
+        streaming = StreamingPageParser().parse(markup)
+
+        assert streaming == reference
+
+    @pytest.mark.parametrize("fixture", FIXTURES, ids=lambda path: path.stem)
+    def test_heuristic_results_match_reference(self, service, fixture):
+        """Test both backends yield identical heuristic evaluation results."""
+        markup = fixture.read_bytes()
+        url = "https://example.com"
+
+        reference = _evaluate(service, url, SoupPageParser().parse(markup))
+        streaming = _evaluate(service, url, StreamingPageParser().parse(markup))
+
+        assert streaming == reference
+
+    def test_str_and_bytes_markup(self):
+        """Test decoded and raw markup produce the same index."""
+        markup = (FIXTURES_DIR / "small_business.html").read_bytes()
+        parser = StreamingPageParser()
+
+        assert parser.parse(markup.decode("utf-8")) == parser.parse(markup)
+
+    def test_declared_legacy_encoding(self):
+        """Test documents in a declared legacy encoding are decoded before indexing."""
+        markup = (FIXTURES_DIR / "legacy_windows1252.html").read_bytes()
+
+        features = StreamingPageParser().parse(markup)
+
+        assert "café müller" in features.text
+        assert "€2" in features.text
+
+
+class TestGetPageParser:
+    """Test cases for parser backend selection."""
+
+    def test_default_backend(self):
+        """Test the default backend is returned when no name is given."""
+        parser = get_page_parser()
+
+        assert parser.name == DEFAULT_PARSER_BACKEND
+
+    def test_named_backends(self):
+        """Test built-in backends are selectable by name."""
+        assert isinstance(get_page_parser("bs4"), SoupPageParser)
+        assert isinstance(get_page_parser("streaming"), StreamingPageParser)
+
+    def test_unknown_backend(self):
+        """Test an unknown backend name is rejected."""
+        with pytest.raises(ValueError, match="Unknown HTML parser backend"):
+            get_page_parser("does-not-exist")
+
+    def test_register_backend(self):
+        """Test additional backends can be registered."""
+
+        class EmptyPageParser(PageParser):
+            name = "empty"
+
+            def parse(self, markup):
+                return PageFeatures()
+
+        register_parser_backend(EmptyPageParser)
+        try:
+            assert isinstance(get_page_parser("empty"), EmptyPageParser)
+        finally:
+            PARSER_BACKENDS.pop("empty")
@@ -0,0 +1,159 @@
+"""
+Unit tests for bounded streaming HTML decoding.
+Tests content-type checks, binary sniffing, charset detection and the byte budget.
+"""
+
+import pytest
+
+from src.utils.html_stream import (
+    SNIFF_BYTES,
+    HTMLStreamReader,
+    NotHTMLError,
+    check_content_type,
+    detect_encoding,
+    header_charset,
+    sniff_binary,
+)
+
+
+def _read(chunks, content_type="text/html", max_bytes=0):
+    reader = HTMLStreamReader(content_type, max_bytes)
+    for chunk in chunks:
+        if not reader.feed(chunk):
+            break
+    return reader, reader.finish()
+
+
+class TestContentType:
+    """Test cases for Content-Type handling."""
+
+    @pytest.mark.parametrize(
+        "content_type",
+        [None, "", "text/html", "TEXT/HTML; charset=UTF-8", "application/xhtml+xml"],
+    )
+    def test_html_and_ambiguous_types_accepted(self, content_type):
+        """Test HTML and generic types are let through for sniffing."""
+        check_content_type(content_type)
+
+    @pytest.mark.parametrize(
+        "content_type", ["application/pdf", "image/png", "video/mp4", "application/zip"]
+    )
+    def test_non_html_types_rejected(self, content_type):
+        """Test clearly non-HTML types abort before any body is read."""
+        with pytest.raises(NotHTMLError):
+            HTMLStreamReader(content_type)
+
+    def test_header_charset(self):
+        """Test the charset parameter is extracted from the header."""
+        assert header_charset('text/html; charset="ISO-8859-1"') == "iso-8859-1"
+        assert header_charset("text/html") is None
+        assert header_charset(None) is None
+
+
+class TestSniffing:
+    """Test cases for binary sniffing."""
+
+    @pytest.mark.parametrize(
+        "head",
+        [
+            b"%PDF-1.7\n",
+            b"\x89PNG\r\n\x1a\n\x00\x00",
+            b"\x00\x00\x00\x18ftypmp42",
+            b"PK\x03\x04\x14\x00",
+            b"<html>\x00\x00\x00",
+        ],
+    )
+    def test_binary_heads_detected(self, head):
+        """Test file signatures and control bytes mark a body as binary."""
+        assert sniff_binary(head) is not None
+
+    def test_html_head_not_binary(self):
+        """Test ordinary markup is not flagged."""
+        assert sniff_binary(b"  <!DOCTYPE html><html><body>hi</body></html>") is None
+
+    def test_binary_served_as_html_aborts(self):
+        """Test a mislabelled binary body is rejected once sniffed."""
+        with pytest.raises(NotHTMLError):
+            _read([b"%PDF-1.4\n" + b"0" * SNIFF_BYTES], content_type="text/html")
+
+
+class TestEncodingDetection:
+    """Test cases for charset detection."""
+
+    def test_byte_order_mark_wins(self):
+        """Test a BOM overrides declared encodings."""
+        head = b"\xef\xbb\xbf<meta charset='windows-1252'>"
+        assert detect_encoding(head, "text/html; charset=iso-8859-2") == "utf-8-sig"
+
+    def test_header_charset_before_meta(self):
+        """Test the HTTP charset is preferred over a meta declaration."""
+        head = b"<meta charset='iso-8859-2'>"
+        assert detect_encoding(head, "text/html; charset=koi8-r") == "koi8-r"
+
+    def test_meta_declaration(self):
+        """Test a meta charset declaration is honoured."""
+        assert detect_encoding(b'<meta charset="shift_jis">') == "shift_jis"
+
+    def test_latin1_decoded_as_windows_1252(self):
+        """Test latin-1 declarations use the browser superset."""
+        assert detect_encoding(b"<html>", "text/html; charset=ISO-8859-1") == "cp1252"
+
+    def test_fallbacks(self):
+        """Test undeclared documents fall back to UTF-8, then windows-1252."""
+        assert detect_encoding("<p>café</p>".encode("utf-8")) == "utf-8"
+        assert detect_encoding("<p>café</p>".encode("cp1252")) == "cp1252"
+
+
+class TestHTMLStreamReader:
+    """Test cases for HTMLStreamReader."""
+
+    def test_multibyte_characters_split_across_chunks(self):
+        """Test characters split over chunk boundaries decode intact."""
+        text = "<html><body>" + "héllo wörld €" * 2000 + "</body></html>"
+        data = text.encode("utf-8")
+        chunks = [data[i : i + 7] for i in range(0, len(data), 7)]
+
+        reader, decoded = _read(chunks)
+
+        assert decoded == text
+        assert reader.encoding == "utf-8"
+        assert reader.bytes_read == len(data)
+        assert reader.truncated is False
+
+    def test_encoding_detected_once_from_head(self):
+        """Test the header charset decodes the whole body."""
+        text = "<p>café müller</p>" * 500
+        data = text.encode("cp1252")
+
+        reader, decoded = _read(
+            [data[:100], data[100:]], content_type="text/html; charset=windows-1252"
+        )
+
+        assert decoded == text
+        assert reader.encoding == "cp1252"
+
+    def test_byte_budget_truncates_and_stops(self):
+        """Test reading stops once the byte budget is spent."""
+        chunks = [b"<p>" + b"x" * 997] * 20
+        reader = HTMLStreamReader("text/html", max_bytes=2500)
+
+        assert reader.feed(chunks[0]) is True
+        assert reader.feed(chunks[1]) is True
+        assert reader.feed(chunks[2]) is False
+        assert reader.truncated is True
+        assert reader.bytes_read == 2500
+        assert len(reader.finish()) == 2500
+
+    def test_short_document(self):
+        """Test documents smaller than the sniff window are decoded on finish."""
+        reader, decoded = _read([b"<html>", b"<body>ok</body></html>"])
+
+        assert decoded == "<html><body>ok</body></html>"
+        assert reader.encoding == "utf-8"
+
+    def test_no_budget(self):
+        """Test a budget of zero disables truncation."""
+        reader, decoded = _read([b"a" * 100_000], max_bytes=0)
+
+        assert len(decoded) == 100_000
+        assert reader.truncated is False
@@ -0,0 +1,157 @@
+"""
+Unit tests for the on-disk page cache.
+Tests lookups, conditional revalidation, content addressing and LRU size eviction.
+"""
+
+import time
+import zlib
+
+import pytest
+
+from src.utils.http_cache import HTTPCache
+
+PAGE = "<html><body>" + "Welcome to our bakery. " * 200 + "</body></html>"
+
+
+@pytest.fixture
+def cache(tmp_path):
+    """Cache in a temporary directory."""
+    cache = HTTPCache(tmp_path / "cache", ttl_seconds=60)
+    yield cache
+    cache.close()
+
+
+def _body_files(cache):
+    return list((cache.directory / "bodies").rglob("*.zz"))
+
+
+class TestHTTPCache:
+    """Test cases for HTTPCache."""
+
+    def test_miss_then_hit(self, cache):
+        """Test stored pages are returned with their metadata."""
+        assert cache.get("https://example.com") is None
+
+        cache.put(
+            "https://example.com",
+            PAGE,
+            {"ETag": '"v1"', "Last-Modified": "Mon, 01 Jan 2024 00:00:00 GMT"},
+            final_url="https://www.example.com/",
+            encoding="utf-8",
+        )
+        page = cache.get("https://example.com")
+
+        assert page.text == PAGE
+        assert page.final_url == "https://www.example.com/"
+        assert page.etag == '"v1"'
+        assert page.encoding == "utf-8"
+        assert cache.is_fresh(page) is True
+        assert cache.hits == 1
+        assert cache.misses == 1
+
+    def test_key_is_normalized_url(self, cache):
+        """Test equivalent URLs share an entry."""
+        cache.put("https://Example.com:443/#top", PAGE)
+
+        assert cache.get("https://example.com/").text == PAGE
+
+    def test_bodies_are_compressed_and_content_addressed(self, cache):
+        """Test identical bodies are stored once, compressed."""
+        cache.put("https://example.com/a", PAGE)
+        cache.put("https://example.com/b", PAGE)
+
+        files = _body_files(cache)
+        assert len(files) == 1
+        assert files[0].stat().st_size < len(PAGE) / 5
+        assert cache.get_stats()["entries"] == 2
+
+    def test_replaced_body_is_removed(self, cache):
+        """Test a changed page drops its unreferenced old body."""
+        cache.put("https://example.com", PAGE)
+        cache.put("https://example.com", PAGE + "<p>new</p>")
+
+        assert len(_body_files(cache)) == 1
+        assert cache.get("https://example.com").text.endswith("<p>new</p>")
+
+    def test_conditional_headers(self, cache):
+        """Test validators become conditional request headers."""
+        page = cache.put(
+            "https://example.com",
+            PAGE,
+            {"etag": '"abc"', "last-modified": "Mon, 01 Jan 2024 00:00:00 GMT"},
+        )
+
+        assert page.conditional_headers() == {
+            "If-None-Match": '"abc"',
+            "If-Modified-Since": "Mon, 01 Jan 2024 00:00:00 GMT",
+        }
+
+    def test_stale_entry_revalidated(self, tmp_path):
+        """Test a 304 refreshes a stale entry and its validators."""
+        cache = HTTPCache(tmp_path, ttl_seconds=0)
+        cache.put("https://example.com", PAGE, {"ETag": '"v1"'})
+        page = cache.get("https://example.com")
+        assert cache.is_fresh(page) is False
+
+        cache.ttl_seconds = 60
+        cache.revalidate(page, {"ETag": '"v2"'})
+        page = cache.get("https://example.com")
+
+        assert cache.is_fresh(page) is True
+        assert page.etag == '"v2"'
+        assert page.text == PAGE
+        assert cache.revalidations == 1
+
+    def test_no_store_is_respected(self, cache):
+        """Test responses marked no-store are not cached."""
+        headers = {"Cache-Control": "private, no-store"}
+
+        assert cache.put("https://example.com", PAGE, headers) is None
+        assert cache.get("https://example.com") is None
+
+    def test_lru_size_eviction(self, tmp_path):
+        """Test least recently used entries are evicted over the size limit."""
+        pages = {f"https://example.com/{i}": f"<p>{i}</p>" * 2000 for i in range(3)}
+        sizes = [len(zlib.compress(text.encode("utf-8"), 6)) for text in pages.values()]
+        cache = HTTPCache(tmp_path, max_bytes=sum(sizes) - 1)
+
+        cache.put("https://example.com/0", pages["https://example.com/0"])
+        time.sleep(0.01)
+        cache.put("https://example.com/1", pages["https://example.com/1"])
+        time.sleep(0.01)
+        cache.get("https://example.com/0")  # now most recently used
+        time.sleep(0.01)
+        cache.put("https://example.com/2", pages["https://example.com/2"])
+
+        assert cache.get("https://example.com/1") is None
+        assert cache.get("https://example.com/0") is not None
+        assert cache.get("https://example.com/2") is not None
+        assert cache.evictions == 1
+        assert len(_body_files(cache)) == 2
+
+    def test_persists_across_instances(self, tmp_path):
+        """Test entries survive reopening the cache directory."""
+        HTTPCache(tmp_path).put("https://example.com", PAGE, {"ETag": '"v1"'})
+
+        page = HTTPCache(tmp_path).get("https://example.com")
+
+        assert page.text == PAGE
+        assert page.etag == '"v1"'
+
+    def test_missing_body_is_a_miss(self, cache):
+        """Test an entry whose body file vanished is dropped."""
+        cache.put("https://example.com", PAGE)
+        for path in _body_files(cache):
+            path.unlink()
+
+        assert cache.get("https://example.com") is None
+        assert cache.get_stats()["entries"] == 0
+
+    def test_clear(self, cache):
+        """Test clearing removes entries and bodies."""
+        cache.put("https://example.com", PAGE)
+
+        cache.clear()
+
+        assert cache.get("https://example.com") is None
+        assert _body_files(cache) == []
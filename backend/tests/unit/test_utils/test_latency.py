@@ -0,0 +1,103 @@
+"""
+Unit tests for latency statistics helpers.
+"""
+
+import pytest
+
+from src.utils.latency import LatencyTracker, percentile, summarize_latencies
+
+
+class TestPercentile:
+    """Test cases for percentile."""
+
+    def test_interpolates_between_samples(self):
+        """Test percentiles between ranks are linearly interpolated."""
+        values = [4.0, 1.0, 3.0, 2.0]
+
+        assert percentile(values, 0) == 1.0
+        assert percentile(values, 50) == 2.5
+        assert percentile(values, 100) == 4.0
+        assert percentile(values, 90) == pytest.approx(3.7)
+
+    def test_single_and_empty_sample(self):
+        """Test degenerate samples."""
+        assert percentile([2.0], 99) == 2.0
+        assert percentile([], 50) == 0.0
+
+    @pytest.mark.parametrize("pct", [-1, 101])
+    def test_out_of_range(self, pct):
+        """Test percentiles outside 0-100 are rejected."""
+        with pytest.raises(ValueError):
+            percentile([1.0], pct)
+
+
+class TestSummarizeLatencies:
+    """Test cases for summarize_latencies."""
+
+    def test_summary(self):
+        """Test the summary includes counts, extremes and percentiles."""
+        summary = summarize_latencies([float(n) for n in range(1, 101)])
+
+        assert summary["count"] == 100
+        assert summary["mean"] == 50.5
+        assert summary["min"] == 1.0
+        assert summary["max"] == 100.0
+        assert summary["p50"] == pytest.approx(50.5)
+        assert summary["p99"] == pytest.approx(99.01)
+        assert set(summary) == {"count", "mean", "min", "max", "p50", "p90", "p95", "p99"}
+
+    def test_custom_percentiles(self):
+        """Test fractional percentiles get compact keys."""
+        summary = summarize_latencies([1.0, 2.0], percentiles=(99.9,))
+
+        assert "p99.9" in summary
+        assert "p50" not in summary
+
+    def test_empty(self):
+        """Test an empty sample summarizes to zeros."""
+        summary = summarize_latencies([])
+
+        assert summary["count"] == 0
+        assert summary["mean"] == 0.0
+        assert summary["p95"] == 0.0
+
+
+class TestLatencyTracker:
+    """Test cases for LatencyTracker."""
+
+    def test_per_key_and_overall_percentiles(self):
+        """Test samples count towards their key and the overall series."""
+        tracker = LatencyTracker(window=10)
+        for seconds in (1.0, 2.0, 3.0):
+            tracker.record("a.example.com", seconds)
+        tracker.record("b.example.com", 10.0)
+
+        assert tracker.percentile(50, key="a.example.com") == 2.0
+        assert tracker.percentile(100) == 10.0
+        assert tracker.get_stats()["count"] == 4
+        assert tracker.get_stats()["keys"] == 2
+
+    def test_min_samples(self):
+        """Test too few samples yield no percentile."""
+        tracker = LatencyTracker()
+        tracker.record("a", 1.0)
+
+        assert tracker.percentile(99, key="a", min_samples=2) is None
+        assert tracker.percentile(99, key="missing") is None
+
+    def test_window_keeps_recent_samples(self):
+        """Test old samples fall out of the window."""
+        tracker = LatencyTracker(window=3)
+        for seconds in (100.0, 1.0, 1.0, 1.0):
+            tracker.record("a", seconds)
+
+        assert tracker.percentile(100, key="a") == 1.0
+
+    def test_max_keys_evicts_oldest_key(self):
+        """Test the number of tracked keys is bounded."""
+        tracker = LatencyTracker(max_keys=2)
+        for key in ("a", "b", "c"):
+            tracker.record(key, 1.0)
+
+        assert tracker.percentile(50, key="a") is None
+        assert tracker.percentile(50, key="c") == 1.0
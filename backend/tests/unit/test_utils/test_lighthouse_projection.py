@@ -0,0 +1,108 @@
+"""
+Unit tests for the PageSpeed Insights result projection.
+"""
+
+from src.utils.lighthouse_projection import audit_savings, project_audit_result
+
+
+def _payload():
+    return {
+        "lighthouseResult": {
+            "lighthouseVersion": "12.0.0",
+            "requestedUrl": "https://example.com",
+            "finalDisplayedUrl": "https://www.example.com/",
+            "fetchTime": "2024-01-01T00:00:00.000Z",
+            "audits": {
+                "render-blocking-resources": {
+                    "id": "render-blocking-resources",
+                    "title": "Eliminate render-blocking resources",
+                    "score": 0.3,
+                    "scoreDisplayMode": "metricSavings",
+                    "displayValue": "Potential savings of 1,200 ms",
+                    "details": {"type": "opportunity", "overallSavingsMs": 1200},
+                },
+                "uses-optimized-images": {
+                    "id": "uses-optimized-images",
+                    "title": "Efficiently encode images",
+                    "score": 0.5,
+                    "scoreDisplayMode": "metricSavings",
+                    "details": {
+                        "type": "opportunity",
+                        "overallSavingsMs": 2400,
+                        "overallSavingsBytes": 512000,
+                    },
+                },
+                "document-title": {
+                    "id": "document-title",
+                    "title": "Document has a title element",
+                    "score": 0,
+                    "scoreDisplayMode": "binary",
+                },
+                "is-on-https": {"id": "is-on-https", "score": 1, "scoreDisplayMode": "binary"},
+                "diagnostics": {"id": "diagnostics", "score": None, "scoreDisplayMode": "informative"},
+                "screenshot-thumbnails": {
+                    "id": "screenshot-thumbnails",
+                    "score": None,
+                    "scoreDisplayMode": "informative",
+                    "details": {"type": "filmstrip", "items": [{"data": "data:image/jpeg;base64,AAAA"}]},
+                },
+            },
+        }
+    }
+
+
+class TestProjectAuditResult:
+    """Test cases for project_audit_result."""
+
+    def test_projection(self):
+        """Test failing audits and opportunities are kept and everything else dropped."""
+        summary = project_audit_result(_payload())
+
+        assert summary["lighthouse_version"] == "12.0.0"
+        assert summary["final_url"] == "https://www.example.com/"
+        assert summary["fetch_time"] == "2024-01-01T00:00:00.000Z"
+        assert summary["runtime_error"] is None
+        assert [audit["id"] for audit in summary["failing_audits"]] == [
+            "document-title",
+            "render-blocking-resources",
+            "uses-optimized-images",
+        ]
+        assert [audit["id"] for audit in summary["opportunities"]] == [
+            "uses-optimized-images",
+            "render-blocking-resources",
+        ]
+        assert summary["opportunities"][0]["savings_bytes"] == 512000
+        assert summary["estimated_savings_ms"] == 3600.0
+        assert "base64" not in str(summary)
+
+    def test_max_items(self):
+        """Test lists are capped, keeping the worst audits and largest savings."""
+        summary = project_audit_result(_payload(), max_items=1)
+
+        assert [audit["id"] for audit in summary["failing_audits"]] == ["document-title"]
+        assert [audit["id"] for audit in summary["opportunities"]] == ["uses-optimized-images"]
+        assert summary["estimated_savings_ms"] == 2400.0
+
+    def test_runtime_error_and_empty_payload(self):
+        """Test degenerate payloads project to empty lists."""
+        summary = project_audit_result(
+            {"lighthouseResult": {"runtimeError": {"code": "NO_FCP", "message": "No paint"}}}
+        )
+
+        assert summary["runtime_error"] == "No paint"
+        assert summary["failing_audits"] == []
+        assert project_audit_result({})["opportunities"] == []
+
+
+class TestAuditSavings:
+    """Test cases for audit_savings."""
+
+    def test_metric_savings_fallback(self):
+        """Test newer payloads without overallSavingsMs use the largest metric saving."""
+        audit = {"metricSavings": {"LCP": 300, "FCP": 150}, "details": {"overallSavingsBytes": 10}}
+
+        assert audit_savings(audit) == (300.0, 10)
+
+    def test_no_savings(self):
+        """Test audits without savings report None."""
+        assert audit_savings({}) == (None, None)
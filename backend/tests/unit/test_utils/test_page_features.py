@@ -0,0 +1,125 @@
+"""
+Unit tests for the page feature index.
+Tests single-traversal extraction of text, links, controls, forms, meta tags and attributes.
+"""
+
+from bs4 import BeautifulSoup
+
+from src.utils.page_features import Anchor, extract_page_features
+
+
+class TestExtractPageFeatures:
+    """Test cases for extract_page_features."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.html = """
+        <html>
+        <head>
+            <meta name="viewport" content="width=device-width">
+            <meta name="description" content="A test page">
+            <link rel="stylesheet" media="(max-width: 600px)" href="m.css">
+            <style>@media (min-width: 800px) { p { margin: 0 } }</style>
+            <script type="application/ld+json">{"@type": "Organization"}</script>
+            <script>var hidden = "Privacy Policy";</script>
+        </head>
+        <body>
+            <!-- About Us -->
+            <h1>Welcome</h1>
+            <h2>Services</h2>
+            <a href="/about">About <b>Us</b></a>
+            <a href="https://facebook.com/example">Facebook</a>
+            <a name="anchor-without-href">Skip</a>
+            <button class="btn cta">Get Started</button>
+            <img src="logo.png" alt="Company logo">
+            <img src="spacer.gif">
+            <form action="/contact">
+                <p>Send us a message</p>
+                <input type="email" name="email">
+            </form>
+            <div itemtype="https://schema.org/Organization" id="main">Text</div>
+        </body>
+        </html>
+        """
+        self.features = extract_page_features(BeautifulSoup(self.html, "html.parser"))
+
+    def test_text_matches_get_text(self):
+        """Test text equals lower-cased get_text(), excluding scripts and comments."""
+        soup = BeautifulSoup(self.html, "html.parser")
+
+        assert self.features.text == soup.get_text().lower()
+        assert "privacy policy" not in self.features.text
+        assert "about us" in self.features.text
+
+    def test_anchors(self):
+        """Test only links with an href are indexed, with their nested text."""
+        assert self.features.anchors == [
+            Anchor(text="About Us", href="/about"),
+            Anchor(text="Facebook", href="https://facebook.com/example"),
+        ]
+        assert self.features.anchors[0].is_internal is True
+        assert self.features.anchors[1].is_external is True
+
+    def test_controls(self):
+        """Test buttons, links and inputs are indexed as controls."""
+        names = [control.name for control in self.features.controls]
+        button = next(c for c in self.features.controls if c.name == "button")
+
+        assert names == ["a", "a", "a", "button", "input"]
+        assert button.string == "Get Started"
+        assert button.classes == ["btn", "cta"]
+        # Nested markup means no single string, as with Tag.string
+        assert self.features.controls[0].string is None
+
+    def test_forms(self):
+        """Test forms capture action, lower-cased text and inputs."""
+        form = self.features.forms[0]
+
+        assert form.action == "/contact"
+        assert "send us a message" in form.text
+        assert [(i.type, i.name) for i in form.inputs] == [("email", "email")]
+
+    def test_head_elements(self):
+        """Test meta tags, link media, styles and script types are indexed."""
+        assert self.features.find_meta("viewport") is not None
+        assert self.features.find_meta("description")["content"] == "A test page"
+        assert self.features.find_meta("keywords") is None
+        assert self.features.link_media == ["(max-width: 600px)"]
+        assert "@media" in self.features.style_texts[0]
+        assert self.features.script_types == ["application/ld+json", None]
+
+    def test_images_and_headings(self):
+        """Test image alt texts and heading tags are indexed in order."""
+        assert self.features.image_alts == ["Company logo", None]
+        assert self.features.headings == ["h1", "h2"]
+
+    def test_attributes_and_counts(self):
+        """Test attribute names/values are flattened and elements counted."""
+        assert "itemtype" in self.features.attribute_names
+        assert "cta" in self.features.attribute_values
+        assert "main" in self.features.attribute_values
+        assert self.features.count("a") == 3
+        assert self.features.count("button", "a", "input") == 5
+        assert self.features.count("table") == 0
+
+    def test_nested_forms_and_anchors_close_independently(self):
+        """Test text is attributed only to the enclosing anchors and forms."""
+        html = (
+            "<form action='/a'>outer <a href='#x'>link</a> "
+            "<form action='/b'>inner</form> tail</form>"
+        )
+
+        features = extract_page_features(BeautifulSoup(html, "html.parser"))
+
+        assert features.anchors[0].text == "link"
+        assert [form.action for form in features.forms] == ["/a", "/b"]
+        assert "inner" in features.forms[1].text
+        assert "tail" not in features.forms[1].text
+
+    def test_empty_document(self):
+        """Test an empty document yields an empty index."""
+        features = extract_page_features(BeautifulSoup("", "html.parser"))
+
+        assert features.text == ""
+        assert features.anchors == []
+        assert features.count("p", "div") == 0
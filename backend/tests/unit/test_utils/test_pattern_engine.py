@@ -0,0 +1,95 @@
+"""
+Unit tests for the compiled heuristic pattern engine.
+Tests single-pass signal detection, overlap handling and parity with per-pattern regex search.
+"""
+
+import re
+
+from src.utils.pattern_engine import (
+    PatternEngine,
+    SEGMENT_SEPARATOR,
+    build_pattern_engine,
+)
+
+
+class TestPatternEngine:
+    """Test cases for PatternEngine."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.signal_patterns = {
+            "trust.contact_info": [r"contact\s*us", r"\bcontact\b", r"email"],
+            "cro.cta_buttons": [r"contact\s*sales", r"get\s*started"],
+            "cro.testimonials": [r"testimonial", r"review"],
+            "social.testimonials": [r"testimonial", r"review"],
+            "cro.pricing_tables": [r"\$\d+", r"per\s*month"],
+        }
+        self.engine = PatternEngine(self.signal_patterns)
+
+    def _naive_scan(self, text):
+        return {
+            signal
+            for signal, patterns in self.signal_patterns.items()
+            if any(re.search(p, text, re.IGNORECASE) for p in patterns)
+        }
+
+    def test_scan_returns_all_hits(self):
+        """Test every matching signal is returned from one scan."""
+        hits = self.engine.scan("Get started today for $99 per month")
+
+        assert hits == {"cro.cta_buttons", "cro.pricing_tables"}
+
+    def test_scan_shared_patterns_hit_every_signal(self):
+        """Test a pattern shared by several signals reports all of them."""
+        hits = self.engine.scan("read a review")
+
+        assert "cro.testimonials" in hits
+        assert "social.testimonials" in hits
+
+    def test_scan_overlapping_matches(self):
+        """Test a signal shadowed by an overlapping match is still detected."""
+        # "contact sales" is consumed by the CTA branch, but \\bcontact\\b must
+        # still be reported for contact info.
+        hits = self.engine.scan("please contact sales")
+
+        assert hits == {"cro.cta_buttons", "trust.contact_info"}
+
+    def test_scan_segments_do_not_join(self):
+        """Test matches never span two segments."""
+        engine = PatternEngine({"trust.privacy_policy": [r"privacy\s*policy"]})
+
+        assert engine.scan("privacy", "policy") == set()
+        assert engine.scan("privacy policy") == {"trust.privacy_policy"}
+        assert SEGMENT_SEPARATOR not in "privacy policy"
+
+    def test_scan_empty_input(self):
+        """Test scanning empty segments returns no hits."""
+        assert self.engine.scan() == set()
+        assert self.engine.scan("", "") == set()
+
+    def test_scan_parity_with_naive_search(self):
+        """Test results match a per-pattern re.search over the same text."""
+        samples = [
+            "Contact us by email",
+            "CONTACT SALES now",
+            "testimonials and reviews",
+            "nothing relevant here",
+            "only $5",
+            "contactless payments, get  started",
+        ]
+        for text in samples:
+            assert self.engine.scan(text) == self._naive_scan(text), text
+
+    def test_signals_property(self):
+        """Test the engine exposes its signal names."""
+        assert self.engine.signals == frozenset(self.signal_patterns)
+
+    def test_build_pattern_engine_namespaces_and_reuses(self):
+        """Test builder namespaces signals and reuses compiled engines."""
+        groups = {"trust": {"about_page": [r"about\s*us"]}}
+
+        engine = build_pattern_engine(groups)
+
+        assert engine.signals == frozenset({"trust.about_page"})
+        assert build_pattern_engine(groups) is engine
+        assert engine.scan("About Us") == {"trust.about_page"}
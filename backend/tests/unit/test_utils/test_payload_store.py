@@ -0,0 +1,73 @@
+"""
+Unit tests for the compressed payload store.
+"""
+
+import pytest
+
+from src.utils.payload_store import PayloadStore, compress_payload, decompress_payload
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = PayloadStore(tmp_path / "payloads.sqlite3")
+    yield store
+    store.close()
+
+
+class TestPayloadStore:
+    """Test cases for PayloadStore."""
+
+    def test_compression_round_trip(self):
+        """Test payloads survive compression and shrink."""
+        payload = {"audits": [{"id": f"audit-{i}", "score": 0.5} for i in range(200)]}
+        blob = compress_payload(payload)
+
+        assert decompress_payload(blob) == payload
+        assert len(blob) < len(str(payload)) / 5
+
+    def test_put_and_get(self, store):
+        """Test synchronous writes are readable."""
+        size = store.put("run-1", {"a": 1})
+
+        assert size > 0
+        assert store.get("run-1") == {"a": 1}
+        assert store.get("missing") is None
+
+    def test_submit_writes_in_background(self, store):
+        """Test queued writes are stored once flushed."""
+        key = store.submit("run-2", {"lighthouseResult": {"audits": {}}})
+        store.flush(timeout=5)
+
+        assert key == "run-2"
+        assert store.get("run-2") == {"lighthouseResult": {"audits": {}}}
+        assert store.get_stats()["entries"] == 1
+
+    def test_background_errors_are_counted(self, store):
+        """Test unserializable payloads fail quietly on the writer thread."""
+        store.submit("bad", {"value": object()})
+        store.flush(timeout=5)
+
+        assert store.get("bad") is None
+        assert store.get_stats()["write_errors"] == 1
+
+    def test_prune(self, tmp_path):
+        """Test the oldest payloads are pruned beyond max_entries."""
+        store = PayloadStore(tmp_path / "pruned.sqlite3", max_entries=2)
+        store.PRUNE_INTERVAL = 1
+        for i in range(4):
+            store.put(f"run-{i}", {"i": i})
+
+        assert store.get_stats()["entries"] == 2
+        assert store.get("run-3") == {"i": 3}
+        store.close()
+
+    def test_persists_across_instances(self, tmp_path):
+        """Test payloads are read back by a new store on the same file."""
+        path = tmp_path / "shared.sqlite3"
+        first = PayloadStore(path)
+        first.put("run-1", [1, 2, 3])
+        first.close()
+
+        second = PayloadStore(path)
+        assert second.get("run-1") == [1, 2, 3]
+        second.close()
@@ -0,0 +1,293 @@
+"""
+Unit tests for the rate-limit stores.
+The Redis store runs against the in-process fake server.
+"""
+
+import multiprocessing
+import socket
+import threading
+
+import pytest
+
+from src.services.rate_limiter import RateLimiter
+from src.utils.rate_limit_store import (
+    MemoryRateLimitStore,
+    RateLimitStoreError,
+    RedisConnection,
+    RedisRateLimitStore,
+    SQLiteRateLimitStore,
+    create_rate_limit_store,
+)
+from tests.fake_redis import FakeRedisServer
+
+
+def _claim_slots(kind, target, attempts, barrier, claimed):
+    """Worker process: try to claim ``attempts`` slots from a shared store."""
+    if kind == "sqlite":
+        store = SQLiteRateLimitStore(target)
+    else:
+        store = RedisRateLimitStore(target, prefix="test")
+    store.configure("places", 10, 60)
+    barrier.wait()
+    granted = sum(store.try_add("places", 1_230.0, 10) for _ in range(attempts))
+    with claimed.get_lock():
+        claimed.value += granted
+    store.close()
+
+
+@pytest.fixture
+def fake_redis():
+    with FakeRedisServer() as server:
+        yield server
+
+
+@pytest.fixture(params=["memory", "sqlite", "redis"])
+def make_store(request, tmp_path):
+    """Factory for stores of one kind; every store it makes shares state."""
+    stores = []
+    server = FakeRedisServer().start() if request.param == "redis" else None
+
+    def make():
+        if request.param == "memory":
+            store = stores[0] if stores else MemoryRateLimitStore()
+        elif request.param == "sqlite":
+            store = SQLiteRateLimitStore(tmp_path / "limits.sqlite3")
+        else:
+            store = RedisRateLimitStore(server.url, prefix="test")
+        store.configure("places", 10, 60)
+        stores.append(store)
+        return store
+
+    yield make
+    for store in stores:
+        store.close()
+    if server is not None:
+        server.stop()
+
+
+class TestRateLimitStores:
+    """Behaviour every store must share."""
+
+    def test_sliding_window_counts(self, make_store):
+        """Test the two-bucket estimate and the window end."""
+        store = make_store()
+        for _ in range(8):
+            store.add("places", 1_230.0)
+        assert store.usage("places", 1_259.0) == 8
+
+        store.add("places", 1_265.0)
+        # 45s into the next bucket a quarter of the previous one still counts
+        assert store.usage("places", 1_305.0) == 3
+        assert store.reset_at("places", 1_305.0) == 1_320.0
+
+    def test_breaker_opens_at_threshold(self, make_store):
+        """Test failures accumulate and open the breaker."""
+        store = make_store()
+        assert store.get_breaker("places") == {
+            "state": "CLOSED",
+            "failures": 0,
+            "last_failure": None,
+        }
+
+        store.record_failure("places", 1_000.0, threshold=2)
+        breaker = store.record_failure("places", 1_001.5, threshold=2)
+
+        assert breaker == {"state": "OPEN", "failures": 2, "last_failure": 1_001.5}
+        store.set_breaker("places", "HALF_OPEN", 2, 1_001.5)
+        assert store.get_breaker("places")["state"] == "HALF_OPEN"
+
+    def test_clear(self, make_store):
+        """Test clear forgets windows and breakers."""
+        store = make_store()
+        store.add("places", 1_230.0)
+        store.record_failure("places", 1_230.0, threshold=1)
+
+        store.clear()
+
+        assert store.usage("places", 1_231.0) == 0
+        assert store.get_breaker("places")["state"] == "CLOSED"
+
+    def test_try_add_stops_at_the_limit(self, make_store):
+        """Test try_add counts requests only while under the limit."""
+        store = make_store()
+
+        granted = [store.try_add("places", 1_230.0, 3) for _ in range(5)]
+
+        assert granted == [True, True, True, False, False]
+        assert store.usage("places", 1_231.0) == 3
+
+    def test_discard_gives_a_claimed_slot_back(self, make_store):
+        """Test discard uncounts one request in the bucket it was counted in."""
+        store = make_store()
+        for _ in range(3):
+            store.try_add("places", 1_230.0, 3)
+
+        store.discard("places", 1_230.0)
+
+        assert store.try_add("places", 1_231.0, 3) is True
+        assert store.try_add("places", 1_231.0, 3) is False
+        # Buckets that are already empty stay at zero
+        for _ in range(4):
+            store.discard("places", 1_150.0)
+        assert store.usage("places", 1_232.0) == 3
+
+    def test_workers_share_counts(self, make_store):
+        """Test concurrent workers with their own connections lose no request."""
+        stores = [make_store() for _ in range(4)]
+        barrier = threading.Barrier(len(stores))
+
+        def record(store):
+            barrier.wait()
+            for _ in range(50):
+                store.add("places", 1_230.0)
+
+        threads = [threading.Thread(target=record, args=(s,)) for s in stores]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert all(s.usage("places", 1_231.0) == 200 for s in stores)
+
+
+class TestSharedQuota:
+    """Separate processes claiming slots from one shared store."""
+
+    @pytest.mark.parametrize("kind", ["sqlite", "redis"])
+    def test_processes_never_exceed_the_limit(self, kind, tmp_path, fake_redis):
+        """Test concurrent check-and-add in several processes stops at the limit."""
+        target = fake_redis.url
+        if kind == "sqlite":
+            target = str(tmp_path / "limits.sqlite3")
+        # Spawned, not forked: forking copies locks held by the parent's threads
+        context = multiprocessing.get_context("spawn")
+        barrier = context.Barrier(4)
+        claimed = context.Value("i", 0)
+        workers = [
+            context.Process(
+                target=_claim_slots, args=(kind, target, 20, barrier, claimed)
+            )
+            for _ in range(4)
+        ]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join(60)
+
+        assert all(worker.exitcode == 0 for worker in workers)
+        assert claimed.value == 10
+
+
+class TestRedisRateLimitStore:
+    """Redis-specific behaviour."""
+
+    def test_clear_scans_in_pages(self, fake_redis):
+        """Test clear walks the keyspace with SCAN and leaves other keys alone."""
+        store = RedisRateLimitStore(fake_redis.url, prefix="test")
+        store.configure("places", 10, 60)
+        for now in range(0, 60 * 1_200, 60):
+            store.add("places", float(now))
+        fake_redis.call("SET", "other:key", "1")
+
+        store.clear()
+
+        assert fake_redis.call("GET", "other:key") == "1"
+        assert store.usage("places", 60 * 1_199.0) == 0
+        store.close()
+
+    def test_scripts_are_reloaded_after_a_flush(self, fake_redis):
+        """Test EVALSHA falls back to EVAL when the server forgot a script."""
+        store = RedisRateLimitStore(fake_redis.url)
+        store.configure("places", 10, 60)
+        store.add("places", 1_230.0)
+        fake_redis.flush_scripts()
+
+        store.add("places", 1_230.0)
+
+        assert store.usage("places", 1_230.0) == 2
+        store.close()
+
+
+class TestSharedRateLimiter:
+    """RateLimiter instances standing in for separate workers."""
+
+    def test_quota_is_enforced_across_workers(self, fake_redis, monkeypatch):
+        """Test two workers together never exceed one quota."""
+        monkeypatch.setenv("RATE_LIMITER_STORE", "redis")
+        monkeypatch.setenv("RATE_LIMITER_REDIS_URL", fake_redis.url)
+        workers = [RateLimiter(), RateLimiter()]
+        limit = workers[0]._rate_limits["validation"]["limit"]
+
+        allowed = 0
+        for i in range(limit * 2):
+            worker = workers[i % 2]
+            if worker.can_make_request("validation")[0]:
+                worker.record_request("validation", True)
+                allowed += 1
+
+        assert allowed == limit
+        assert workers[1].get_rate_limit_info("validation")["remaining"] == 0
+        for worker in workers:
+            worker.close()
+
+    def test_breaker_opened_by_one_worker_blocks_the_other(self, tmp_path):
+        """Test circuit breakers are shared through the store."""
+        path = tmp_path / "limits.sqlite3"
+        first = RateLimiter(store=SQLiteRateLimitStore(path))
+        second = RateLimiter(store=SQLiteRateLimitStore(path))
+
+        for _ in range(first._circuit_breakers["fallback"]["threshold"]):
+            first.record_request("fallback", False)
+
+        assert second.can_make_request("fallback") == (False, "Circuit breaker is OPEN")
+        assert second.get_circuit_breaker("fallback")["state"] == "OPEN"
+        second.reset_circuit_breaker("fallback")
+        assert first.can_make_request("fallback") == (True, "OK")
+        first.close()
+        second.close()
+
+    def test_unreachable_store_fails_open(self):
+        """Test requests are allowed while Redis is down."""
+        with socket.socket() as sock:
+            sock.bind(("127.0.0.1", 0))
+            port = sock.getsockname()[1]
+        limiter = RateLimiter(
+            store=create_rate_limit_store("redis", url=f"redis://127.0.0.1:{port}/0")
+        )
+
+        assert limiter.can_make_request("validation") == (
+            True,
+            "Rate limit store unavailable",
+        )
+        limiter.record_request("validation", True)
+        assert limiter.get_rate_limit_info("validation")["current_usage"] == 0
+
+    def test_lost_reply_is_not_resent(self):
+        """Test a command whose reply never arrives is sent only once."""
+        received = []
+        with socket.socket() as server:
+            server.bind(("127.0.0.1", 0))
+            server.listen()
+            port = server.getsockname()[1]
+
+            def drop_after_reading():
+                # Read each command, then hang up without replying
+                while True:
+                    try:
+                        conn, _ = server.accept()
+                    except OSError:
+                        return
+                    with conn:
+                        received.append(conn.recv(1024))
+
+            thread = threading.Thread(target=drop_after_reading, daemon=True)
+            thread.start()
+            connection = RedisConnection(f"redis://127.0.0.1:{port}/0", timeout=1.0)
+
+            with pytest.raises(RateLimitStoreError, match="reply lost"):
+                connection.execute("INCR", "counter")
+            connection.close()
+
+        thread.join(1)
+        assert len(received) == 1
+        assert b"INCR" in received[0]
@@ -0,0 +1,121 @@
+"""
+Unit tests for the rate limiter window engines.
+"""
+
+import sys
+import time
+
+import pytest
+
+from src.services.rate_limiter import RateLimiter
+from src.utils.rate_windows import (
+    SlidingWindowCounter,
+    TokenBucketWindow,
+    create_window,
+)
+
+
+class TestSlidingWindowCounter:
+    """Test cases for SlidingWindowCounter."""
+
+    def test_counts_within_one_bucket_exactly(self):
+        """Test usage is exact while every request falls in the current bucket."""
+        window = SlidingWindowCounter(limit=10, window=60)
+        for second in range(5):
+            window.add(1_200.0 + second)
+
+        assert window.usage(1_210.0) == 5
+        assert window.reset_at(1_210.0) == 1_260.0
+
+    def test_previous_bucket_is_weighted_by_overlap(self):
+        """Test the previous bucket fades out as the window slides over it."""
+        window = SlidingWindowCounter(limit=100, window=60)
+        for _ in range(40):
+            window.add(1_230.0)
+        window.add(1_265.0)
+
+        # 45s into the new bucket a quarter of the previous one still overlaps
+        assert window.usage(1_305.0) == 11
+        assert window.usage(1_319.0) == 2
+        # Once two buckets have passed nothing is left
+        assert window.usage(1_400.0) == 0
+
+    def test_state_does_not_grow_with_requests(self):
+        """Test memory is constant however many requests are recorded."""
+        window = SlidingWindowCounter(limit=10, window=60)
+        before = sys.getsizeof(window.__dict__)
+        for i in range(100_000):
+            window.add(1_200.0 + i * 0.0001)
+
+        assert window.usage(1_215.0) == 100_000
+        assert sys.getsizeof(window.__dict__) == before
+
+
+class TestTokenBucketWindow:
+    """Test cases for TokenBucketWindow."""
+
+    def test_usage_refills_over_the_window(self):
+        """Test spent tokens come back at limit/window per second."""
+        window = TokenBucketWindow(limit=60, window=60)
+        window.usage(1_000.0)
+        for _ in range(30):
+            window.add(1_000.0)
+
+        assert window.usage(1_000.0) == 30
+        assert window.reset_at(1_000.0) == pytest.approx(1_030.0)
+        assert window.usage(1_010.0) == 20
+
+
+class TestCreateWindow:
+    """Test cases for create_window and the RateLimiter engine setting."""
+
+    def test_unknown_engine(self):
+        """Test an unknown engine name is rejected."""
+        with pytest.raises(ValueError):
+            create_window("leaky", 10, 60)
+
+    @pytest.mark.parametrize("engine", ["sliding_window", "token_bucket", "exact"])
+    def test_every_engine_gives_released_slots_back(self, engine):
+        """Test a discarded request no longer counts on any engine."""
+        window = create_window(engine, 5, 60)
+        now = time.time()
+        window.add(now)
+        window.add(now)
+
+        window.discard(now)
+
+        assert window.usage(now) == 1
+
+    @pytest.mark.parametrize(
+        "engine,window_type",
+        [
+            ("sliding_window", "SlidingWindowCounter"),
+            ("token_bucket", "TokenBucketWindow"),
+            ("exact", "ExactWindow"),
+        ],
+    )
+    def test_every_engine_enforces_the_limit(self, monkeypatch, engine, window_type):
+        """Test RateLimiter keeps its behaviour and info shape on each engine."""
+        monkeypatch.setenv("RATE_LIMITER_ENGINE", engine)
+        limiter = RateLimiter()
+        counter = limiter.store._counters["fallback"]
+        assert type(counter).__name__ == window_type
+
+        limit = limiter._rate_limits["validation"]["limit"]
+        for _ in range(limit):
+            assert limiter.can_make_request("validation")[0] is True
+            limiter.record_request("validation", True)
+
+        allowed, reason = limiter.can_make_request("validation")
+        info = limiter.get_rate_limit_info("validation")
+        assert allowed is False
+        assert reason.startswith("Rate limit exceeded")
+        assert info["current_usage"] == limit
+        assert info["remaining"] == 0
+        assert set(info) == {
+            "api_name",
+            "current_usage",
+            "limit",
+            "remaining",
+            "reset_time",
+        }
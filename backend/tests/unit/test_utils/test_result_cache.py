@@ -0,0 +1,194 @@
+"""
+Unit tests for the two-tier result cache.
+Tests the in-process LRU tier, the SQLite tier, promotion between tiers and backend selection.
+"""
+
+import threading
+
+import pytest
+
+from src.utils.result_cache import (
+    CACHE_BACKENDS,
+    CacheBackend,
+    MemoryCacheBackend,
+    SQLiteCacheBackend,
+    TieredCache,
+    create_cache_backend,
+    register_cache_backend,
+)
+
+RESULT = {
+    "scores": {"overall": 72.5, "confidence_level": "high"},
+    "flags": [True, False],
+}
+
+
+class TestMemoryCacheBackend:
+    """Test cases for MemoryCacheBackend."""
+
+    def test_get_and_set(self):
+        """Test values round-trip."""
+        cache = MemoryCacheBackend()
+        cache.set("a", RESULT)
+
+        assert cache.get("a") == RESULT
+        assert cache.get("missing") is None
+
+    def test_least_recently_used_evicted(self):
+        """Test the least recently used entry is dropped at capacity."""
+        cache = MemoryCacheBackend(max_entries=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+        assert len(cache) == 2
+
+
+class TestSQLiteCacheBackend:
+    """Test cases for SQLiteCacheBackend."""
+
+    def test_values_persist(self, tmp_path):
+        """Test values survive reopening the database."""
+        path = tmp_path / "results.sqlite3"
+        SQLiteCacheBackend(path).set("a", RESULT)
+
+        assert SQLiteCacheBackend(path).get("a") == RESULT
+
+    def test_delete_and_clear(self, tmp_path):
+        """Test entries can be removed."""
+        cache = SQLiteCacheBackend(tmp_path / "results.sqlite3")
+        cache.set("a", 1)
+        cache.set("b", 2)
+
+        cache.delete("a")
+        assert cache.get("a") is None
+        assert len(cache) == 1
+
+        cache.clear()
+        assert len(cache) == 0
+
+    def test_pruned_to_max_entries(self, tmp_path):
+        """Test old entries are pruned once the table exceeds its bound."""
+        cache = SQLiteCacheBackend(tmp_path / "results.sqlite3", max_entries=10)
+
+        for index in range(SQLiteCacheBackend.PRUNE_INTERVAL):
+            cache.set(f"key-{index}", index)
+
+        assert len(cache) == 10
+        assert cache.get(f"key-{SQLiteCacheBackend.PRUNE_INTERVAL - 1}") is not None
+
+    def test_invalid_table_name(self, tmp_path):
+        """Test table names are restricted to identifiers."""
+        with pytest.raises(ValueError):
+            SQLiteCacheBackend(tmp_path / "results.sqlite3", table="x; DROP")
+
+
+class TestTieredCache:
+    """Test cases for TieredCache."""
+
+    def test_memory_only(self):
+        """Test a cache without a persistent tier."""
+        cache = TieredCache(MemoryCacheBackend())
+
+        assert cache.get("a") is None
+        cache.set("a", RESULT)
+        assert cache.get("a") == RESULT
+        assert cache.get_stats()["memory_hits"] == 1
+        assert cache.get_stats()["misses"] == 1
+
+    def test_persistent_hits_are_promoted(self, tmp_path):
+        """Test a persistent hit is copied into memory."""
+        persistent = SQLiteCacheBackend(tmp_path / "results.sqlite3")
+        persistent.set("a", RESULT)
+        cache = TieredCache(MemoryCacheBackend(), persistent)
+
+        assert cache.get("a") == RESULT
+        assert cache.get("a") == RESULT
+
+        stats = cache.get_stats()
+        assert stats["persistent_hits"] == 1
+        assert stats["memory_hits"] == 1
+        assert stats["persistent_backend"] == "sqlite"
+
+    def test_writes_reach_every_tier(self, tmp_path):
+        """Test set stores in memory and on disk."""
+        persistent = SQLiteCacheBackend(tmp_path / "results.sqlite3")
+        cache = TieredCache(MemoryCacheBackend(), persistent)
+
+        cache.set("a", RESULT)
+
+        assert cache.memory.get("a") == RESULT
+        assert persistent.get("a") == RESULT
+
+    @pytest.mark.asyncio
+    async def test_async_access_keeps_persistent_tier_off_the_loop(self):
+        """Test coroutines reach the persistent tier only from worker threads."""
+        threads = []
+
+        class RecordingBackend(MemoryCacheBackend):
+            def get(self, key):
+                threads.append(threading.current_thread())
+                return super().get(key)
+
+            def set(self, key, value):
+                threads.append(threading.current_thread())
+                super().set(key, value)
+
+        cache = TieredCache(MemoryCacheBackend(), RecordingBackend())
+
+        assert await cache.get_async("a") is None
+        await cache.set_async("a", RESULT)
+        cache.memory.clear()
+        assert await cache.get_async("a") == RESULT
+        # Served from memory without touching the persistent tier
+        assert await cache.get_async("a") == RESULT
+
+        assert len(threads) == 3
+        assert threading.main_thread() not in threads
+        assert cache.get_stats()["persistent_hits"] == 1
+
+
+class TestCacheBackendRegistry:
+    """Test cases for persistent backend selection."""
+
+    def test_create_sqlite_backend(self, tmp_path):
+        """Test the built-in SQLite backend is selectable by name."""
+        backend = create_cache_backend("sqlite", path=tmp_path / "results.sqlite3")
+
+        assert isinstance(backend, SQLiteCacheBackend)
+
+    def test_unknown_backend(self):
+        """Test an unknown backend name is rejected."""
+        with pytest.raises(ValueError, match="Unknown cache backend"):
+            create_cache_backend("does-not-exist")
+
+    def test_register_backend(self):
+        """Test additional persistent backends can be registered."""
+
+        class DictCacheBackend(CacheBackend):
+            name = "dict"
+
+            def __init__(self):
+                self.entries = {}
+
+            def get(self, key):
+                return self.entries.get(key)
+
+            def set(self, key, value):
+                self.entries[key] = value
+
+            def delete(self, key):
+                self.entries.pop(key, None)
+
+            def clear(self):
+                self.entries.clear()
+
+        register_cache_backend(DictCacheBackend)
+        try:
+            assert isinstance(create_cache_backend("dict"), DictCacheBackend)
+        finally:
+            CACHE_BACKENDS.pop("dict")
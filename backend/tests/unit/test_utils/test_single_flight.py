@@ -0,0 +1,171 @@
+"""
+Unit tests for single-flight request coalescing.
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from src.utils.single_flight import SingleFlight, flight_key
+
+
+class TestFlightKey:
+    """Test cases for flight_key."""
+
+    def test_key_normalizes_url_and_option_order(self):
+        """Test equivalent URLs and keyword orders produce one key."""
+        assert flight_key("heuristics", "HTTPS://Example.com/#top", a=1, b=2) == (
+            flight_key("heuristics", "https://example.com", b=2, a=1)
+        )
+        assert flight_key("heuristics", "https://example.com") != (
+            flight_key("lighthouse", "https://example.com")
+        )
+
+
+class TestSingleFlight:
+    """Test cases for SingleFlight."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_share_one_execution(self):
+        """Test concurrent calls with one key run the work once."""
+        flight = SingleFlight()
+        calls = []
+
+        async def work():
+            calls.append(1)
+            await asyncio.sleep(0.05)
+            return {"score": 90}
+
+        results = await asyncio.gather(
+            *(flight.do(("svc", "a"), work) for _ in range(5))
+        )
+
+        assert len(calls) == 1
+        assert [result for result, _ in results] == [{"score": 90}] * 5
+        assert sum(shared for _, shared in results) == 4
+
+        stats = flight.get_stats()
+        assert stats["in_flight"] == 0
+        assert stats["namespaces"]["svc"] == {
+            "calls": 5,
+            "executions": 1,
+            "deduplicated": 4,
+            "dedup_ratio": 0.8,
+        }
+
+    @pytest.mark.asyncio
+    async def test_sequential_calls_run_again(self):
+        """Test nothing is cached once the shared work finishes."""
+        flight = SingleFlight()
+        calls = []
+
+        async def work():
+            calls.append(1)
+            return len(calls)
+
+        assert await flight.do("k", work) == (1, False)
+        assert await flight.do("k", work) == (2, False)
+
+    @pytest.mark.asyncio
+    async def test_exception_reaches_every_waiter(self):
+        """Test a failure of the shared work is raised in every caller."""
+        flight = SingleFlight()
+
+        async def work():
+            await asyncio.sleep(0.01)
+            raise ValueError("boom")
+
+        results = await asyncio.gather(
+            flight.do("k", work), flight.do("k", work), return_exceptions=True
+        )
+
+        assert all(isinstance(result, ValueError) for result in results)
+        assert not flight.in_flight("k")
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_does_not_cancel_work(self):
+        """Test cancelling one caller leaves the execution running for others."""
+        flight = SingleFlight()
+
+        async def work():
+            await asyncio.sleep(0.05)
+            return "done"
+
+        first = asyncio.create_task(flight.do("k", work))
+        second = asyncio.create_task(flight.do("k", work))
+        await asyncio.sleep(0.01)
+        first.cancel()
+
+        assert await second == ("done", True)
+
+    @pytest.mark.asyncio
+    async def test_cancelling_every_waiter_cancels_work(self):
+        """Test the execution stops once no caller is waiting for it."""
+        flight = SingleFlight()
+        cancelled = asyncio.Event()
+
+        async def work():
+            try:
+                await asyncio.sleep(5)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        waiter = asyncio.create_task(flight.do("k", work))
+        await asyncio.sleep(0.01)
+        waiter.cancel()
+
+        await asyncio.wait_for(cancelled.wait(), 1)
+        await asyncio.sleep(0)
+        assert not flight.in_flight("k")
+
+    def test_threads_share_one_execution(self):
+        """Test blocking calls from several threads run the work once."""
+        flight = SingleFlight()
+        calls = []
+        started = threading.Event()
+        results = []
+
+        def work():
+            calls.append(1)
+            started.set()
+            time.sleep(0.05)
+            return "result"
+
+        def call():
+            results.append(flight.do_sync(("svc", "a"), work))
+
+        leader = threading.Thread(target=call)
+        leader.start()
+        started.wait()
+        followers = [threading.Thread(target=call) for _ in range(3)]
+        for thread in followers:
+            thread.start()
+        for thread in [leader, *followers]:
+            thread.join()
+
+        assert len(calls) == 1
+        assert sorted(results) == [("result", False)] + [("result", True)] * 3
+
+    def test_sync_exception_propagates(self):
+        """Test a failure in blocking work is raised and the key released."""
+        flight = SingleFlight()
+
+        def work():
+            raise RuntimeError("boom")
+
+        with pytest.raises(RuntimeError):
+            flight.do_sync("k", work)
+        assert not flight.in_flight("k")
+        assert flight.do_sync("k", lambda: 1) == (1, False)
+
+    def test_reset_stats(self):
+        """Test counters can be zeroed."""
+        flight = SingleFlight()
+        flight.do_sync(("svc", "a"), lambda: 1)
+
+        flight.reset_stats()
+
+        assert flight.get_stats()["namespaces"] == {}
@@ -0,0 +1,96 @@
+"""
+Unit tests for crawl link discovery.
+"""
+
+from src.utils.page_features import Anchor
+from src.utils.site_crawl import CrawlLink, discover_crawl_links, same_origin
+
+BASE_URL = "https://www.example.com/"
+
+
+class TestSameOrigin:
+    """Test cases for same_origin."""
+
+    def test_same_origin(self):
+        """Test scheme, host and port must match, ignoring www and default ports."""
+        assert same_origin("https://example.com/a", "https://www.example.com:443/b")
+        assert not same_origin("https://example.com/", "http://example.com/")
+        assert not same_origin("https://example.com/", "https://shop.example.com/")
+        assert not same_origin("https://example.com/", "https://example.com:8443/")
+
+
+class TestDiscoverCrawlLinks:
+    """Test cases for discover_crawl_links."""
+
+    def test_links_resolved_and_classified(self):
+        """Test relative and absolute same-origin links are picked by kind."""
+        anchors = [
+            Anchor("Home", "/"),
+            Anchor("Pricing", "/plans#monthly"),
+            Anchor("Privacy Policy", "https://example.com/legal/privacy"),
+            Anchor("Get in touch", "contact-us.html"),
+            Anchor("Our story", "/about"),
+        ]
+
+        links = discover_crawl_links(BASE_URL, anchors, max_pages=10)
+
+        assert links == [
+            CrawlLink("privacy", "https://example.com/legal/privacy"),
+            CrawlLink("contact", "https://www.example.com/contact-us.html"),
+            CrawlLink("about", "https://www.example.com/about"),
+            CrawlLink("pricing", "https://www.example.com/plans"),
+        ]
+
+    def test_anchor_text_match(self):
+        """Test links are classified by their text when the path is opaque."""
+        anchors = [Anchor("Terms and Conditions", "/page?id=17")]
+
+        links = discover_crawl_links(BASE_URL, anchors, max_pages=5)
+
+        assert links == [CrawlLink("terms", "https://www.example.com/page?id=17")]
+
+    def test_foreign_and_non_http_links_skipped(self):
+        """Test other origins and non-navigational links are ignored."""
+        anchors = [
+            Anchor("Privacy", "https://facebook.com/privacy"),
+            Anchor("Contact", "mailto:hello@example.com"),
+            Anchor("Call", "tel:+15551234567"),
+            Anchor("About", "#about"),
+            Anchor("About", "javascript:void(0)"),
+        ]
+
+        assert discover_crawl_links(BASE_URL, anchors, max_pages=5) == []
+
+    def test_one_page_per_kind(self):
+        """Test only the first link of each kind is kept."""
+        anchors = [
+            Anchor("Privacy", "/privacy"),
+            Anchor("Privacy (EU)", "/privacy-eu"),
+            Anchor("Contact", "/contact"),
+        ]
+
+        links = discover_crawl_links(BASE_URL, anchors, max_pages=5)
+
+        assert [link.url for link in links] == [
+            "https://www.example.com/privacy",
+            "https://www.example.com/contact",
+        ]
+
+    def test_page_budget(self):
+        """Test the highest priority kinds are kept within the page budget."""
+        anchors = [
+            Anchor("Pricing", "/pricing"),
+            Anchor("About", "/about"),
+            Anchor("Privacy", "/privacy"),
+        ]
+
+        links = discover_crawl_links(BASE_URL, anchors, max_pages=2)
+
+        assert [link.kind for link in links] == ["privacy", "about"]
+        assert discover_crawl_links(BASE_URL, anchors, max_pages=0) == []
+
+    def test_landing_page_excluded(self):
+        """Test a link back to the landing page is not crawled."""
+        anchors = [Anchor("About us", "https://www.example.com/#about")]
+
+        assert discover_crawl_links(BASE_URL, anchors, max_pages=5) == []
@@ -0,0 +1,125 @@
+"""
+Unit tests for structured service logging.
+"""
+
+import io
+import json
+import logging
+import queue
+from unittest.mock import patch
+
+import pytest
+
+from src.services.category_mapper_service import CategoryMapperService
+from src.utils.structured_logging import (
+    DeferredQueueHandler,
+    LogSampler,
+    configure_service_logging,
+    get_log_sampler,
+    shutdown_service_logging,
+)
+
+
+@pytest.fixture
+def output():
+    """Capture service logs as JSON lines, restoring the default setup after."""
+    stream = io.StringIO()
+    configure_service_logging("INFO", "json", stream=stream, force=True)
+
+    def lines():
+        shutdown_service_logging()
+        return [json.loads(line) for line in stream.getvalue().splitlines()]
+
+    yield lines
+    shutdown_service_logging()
+
+
+class TestServiceLogging:
+    """Test cases for BaseService logging through the queue handler."""
+
+    def test_operations_are_written_as_json(self, output):
+        """Test fields end up as keys of one JSON object per record."""
+        service = CategoryMapperService()
+
+        service.log_operation("map", run_id="run-1", categories=["gym"], skip=None)
+        service.log_error(ValueError("boom"), "map", business_id="biz-1")
+
+        info, error = output()
+        assert info["message"] == "Operation: map"
+        assert info["level"] == "INFO"
+        assert info["logger"] == "services.CategoryMapperService"
+        assert info["runId"] == "run-1"
+        assert info["agentName"] == "CategoryMapperService"
+        assert info["categories"] == ["gym"]
+        assert "skip" not in info
+        assert error["message"] == "Error in map: boom"
+        assert error["businessId"] == "biz-1"
+
+    def test_text_format(self):
+        """Test the classic line format is still available."""
+        stream = io.StringIO()
+        configure_service_logging("INFO", "text", stream=stream, force=True)
+
+        CategoryMapperService().log_operation("map", run_id="run-1")
+        shutdown_service_logging()
+
+        line = stream.getvalue().strip()
+        assert line.endswith(
+            "Operation: map | runId:run-1 | agentName:CategoryMapperService"
+        )
+
+    def test_disabled_level_builds_nothing(self, output):
+        """Test no fields are built when INFO is off."""
+        service = CategoryMapperService()
+        logging.getLogger("services").setLevel(logging.WARNING)
+
+        with patch.object(service, "_log_fields") as log_fields:
+            service.log_operation("map", categories=["gym"])
+
+        log_fields.assert_not_called()
+        assert output() == []
+
+    def test_callers_do_not_format(self):
+        """Test the queue handler enqueues records without rendering them."""
+        records = queue.SimpleQueue()
+        record = logging.LogRecord(
+            "services.Test", logging.INFO, __file__, 1, "Operation: %s", ("map",), None
+        )
+
+        DeferredQueueHandler(records).handle(record)
+
+        queued = records.get_nowait()
+        assert queued is record
+        assert queued.args == ("map",)
+        assert not hasattr(queued, "message")
+
+    def test_sampling_keeps_errors(self, output, monkeypatch):
+        """Test sampled services drop INFO records but never errors."""
+        monkeypatch.setenv("LOG_SAMPLE_RATES", '{"CategoryMapperService": 0.25}')
+        services = [CategoryMapperService(), CategoryMapperService()]
+
+        for i in range(8):
+            services[i % 2].log_operation("map")
+        services[0].log_error(ValueError("boom"), "map")
+
+        levels = [line["level"] for line in output()]
+        assert levels == ["INFO", "INFO", "ERROR"]
+
+
+class TestLogSampler:
+    """Test cases for LogSampler."""
+
+    @pytest.mark.parametrize(
+        "rate, kept", [(1.0, 100), (0.1, 10), (0.3, 34), (0.0, 0), (5.0, 100)]
+    )
+    def test_keeps_share_of_records(self, rate, kept):
+        """Test one in every 1 / rate records is kept."""
+        sampler = LogSampler(rate)
+        assert sum(sampler.keep() for _ in range(100)) == kept
+
+    def test_shared_per_service(self):
+        """Test instances of one service share a sampler until the rate changes."""
+        sampler = get_log_sampler("SampledService", 0.5)
+
+        assert get_log_sampler("SampledService", 0.5) is sampler
+        assert get_log_sampler("SampledService", 0.1) is not sampler
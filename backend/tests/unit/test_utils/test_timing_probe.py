@@ -0,0 +1,58 @@
+"""
+Unit tests for the local timing probe.
+"""
+
+import pytest
+
+from src.utils.timing_probe import count_requests, metric_score, summarize_probe
+
+
+class TestTimingProbe:
+    """Test cases for the timing probe helpers."""
+
+    def test_metric_score_curve(self):
+        """Test the score hits 90 at the good and 50 at the poor threshold."""
+        assert metric_score(0, 800, 1800) == 100.0
+        assert metric_score(800, 800, 1800) == 90.0
+        assert metric_score(1300, 800, 1800) == 70.0
+        assert metric_score(1800, 800, 1800) == 50.0
+        assert metric_score(3600, 800, 1800) == 0.0
+        assert metric_score(10_000, 800, 1800) == 0.0
+
+    def test_count_requests(self):
+        """Test the document and its fetched subresources are counted."""
+        html = """
+            <link rel="stylesheet" href="site.css">
+            <link rel="canonical" href="https://example.com">
+            <script src="app.js"></script>
+            <script>window.inline = true;</script>
+            <IMG SRC="hero.jpg">
+            <a href="/about">About</a>
+        """
+
+        assert count_requests(html) == 4
+        assert count_requests("") == 1
+
+    def test_summarize_fast_small_page(self):
+        """Test a fast, light page is estimated as performing well."""
+        summary = summarize_probe(0.2, 30_000, '<img src="a.png">')
+
+        assert summary["ttfb_ms"] == 200.0
+        assert summary["document_bytes"] == 30_000
+        assert summary["request_count"] == 2
+        assert summary["estimated_performance"] > 90
+
+    def test_summarize_slow_heavy_page(self):
+        """Test slow TTFB and a heavy document drag the estimate down."""
+        html = '<script src="x.js"></script>' * 200
+
+        summary = summarize_probe(3.0, 900_000, html)
+
+        assert summary["request_count"] == 201
+        assert summary["estimated_performance"] < 30
+        assert summary["estimated_performance"] == pytest.approx(
+            0.5 * metric_score(3000, 800, 1800)
+            + 0.25 * metric_score(900_000, 100_000, 500_000)
+            + 0.25 * metric_score(201, 50, 150),
+            abs=0.1,
+        )
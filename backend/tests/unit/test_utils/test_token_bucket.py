@@ -0,0 +1,110 @@
+"""
+Unit tests for the token bucket and daily quota.
+"""
+
+from datetime import datetime, timezone
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from src.utils.token_bucket import DailyQuota, TokenBucket
+
+
+class FakeClock:
+    def __init__(self, now: float = 0.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestTokenBucket:
+    """Test cases for TokenBucket."""
+
+    def test_burst_then_refill(self):
+        """Test a full bucket allows a burst, then refills at the rate."""
+        clock = FakeClock()
+        bucket = TokenBucket(rate=2.0, capacity=3, clock=clock)
+
+        assert [bucket.try_acquire() for _ in range(4)] == [True, True, True, False]
+        assert bucket.wait_time() == pytest.approx(0.5)
+
+        clock.now = 0.5
+        assert bucket.try_acquire() is True
+        assert bucket.try_acquire() is False
+
+        clock.now = 100.0
+        assert bucket.tokens == 3
+
+    def test_time_for_counts_available_tokens(self):
+        """Test the time to spend N tokens accounts for those already held."""
+        bucket = TokenBucket(rate=4.0, capacity=10, clock=FakeClock())
+
+        assert bucket.time_for(10) == 0.0
+        assert bucket.time_for(50) == pytest.approx(10.0)
+
+    def test_for_window_never_exceeds_limit(self):
+        """Test no 60-second window admits more than the per-minute limit."""
+        clock = FakeClock()
+        bucket = TokenBucket.for_window(240, 60.0, burst=10, clock=clock)
+        granted = []
+        while clock.now < 300:
+            if bucket.try_acquire():
+                granted.append(clock.now)
+            clock.now += 0.01
+
+        worst = max(
+            sum(1 for t in granted if start <= t < start + 60) for start in granted
+        )
+        assert worst <= 240
+        assert len(granted) > 1100
+
+    def test_invalid_parameters(self):
+        """Test a bucket that could never grant a request is rejected."""
+        with pytest.raises(ValueError):
+            TokenBucket(rate=0, capacity=1)
+
+
+class TestDailyQuota:
+    """Test cases for DailyQuota."""
+
+    def test_limit_and_reset_at_midnight(self):
+        """Test the allowance runs out and comes back the next day."""
+        now = FakeClock(datetime(2026, 3, 10, 23, 0, tzinfo=timezone.utc).timestamp())
+        quota = DailyQuota(2, "UTC", now=now)
+
+        assert quota.try_acquire() and quota.try_acquire()
+        assert quota.try_acquire() is False
+        assert quota.wait_time() == pytest.approx(3600)
+
+        now.now += 3601
+        assert quota.remaining == 2
+        assert quota.try_acquire() is True
+
+    def test_usage_restored_only_for_same_day(self):
+        """Test persisted usage carries over a restart but not a day change."""
+        now = FakeClock(datetime(2026, 3, 10, 12, 0, tzinfo=timezone.utc).timestamp())
+
+        assert DailyQuota(100, "UTC", used=40, day="2026-03-10", now=now).remaining == 60
+        assert DailyQuota(100, "UTC", used=40, day="2026-03-09", now=now).remaining == 100
+
+    def test_quota_day_follows_time_zone(self):
+        """Test the quota day is the calendar day in the configured zone."""
+        now = FakeClock(datetime(2026, 3, 10, 3, 0, tzinfo=timezone.utc).timestamp())
+
+        quota = DailyQuota(100, "America/Los_Angeles", now=now)
+
+        assert quota.snapshot() == ("2026-03-09", 0)
+
+    def test_reset_follows_daylight_saving_changes(self):
+        """Test the reset lands on local midnight on 23- and 25-hour days."""
+        pacific = ZoneInfo("America/Los_Angeles")
+        for day, hours in (((2026, 3, 8), 23), ((2026, 11, 1), 25)):
+            now = FakeClock(datetime(*day, tzinfo=pacific).timestamp())
+            quota = DailyQuota(1, "America/Los_Angeles", now=now)
+            assert quota.try_acquire() is True
+
+            assert quota.wait_time() == pytest.approx(hours * 3600)
+
+            now.now += quota.wait_time()
+            assert quota.remaining == 1
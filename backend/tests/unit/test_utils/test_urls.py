@@ -0,0 +1,32 @@
+"""
+Unit tests for URL helpers.
+"""
+
+import pytest
+
+from src.utils.urls import normalize_url
+
+
+class TestNormalizeURL:
+    """Test cases for normalize_url."""
+
+    @pytest.mark.parametrize(
+        "url, expected",
+        [
+            ("HTTPS://Example.COM", "https://example.com/"),
+            ("https://example.com:443/about", "https://example.com/about"),
+            ("http://example.com:80/", "http://example.com/"),
+            ("http://example.com:8080/", "http://example.com:8080/"),
+            ("https://example.com/page#section", "https://example.com/page"),
+            ("https://example.com/?b=2&a=1", "https://example.com/?a=1&b=2"),
+            ("https://example.com/?", "https://example.com/"),
+            ("https://[2001:DB8::1]:8443/x", "https://[2001:db8::1]:8443/x"),
+        ],
+    )
+    def test_normalize(self, url, expected):
+        """Test equivalent spellings collapse to one canonical URL."""
+        assert normalize_url(url) == expected
+
+    def test_path_case_preserved(self):
+        """Test paths stay case-sensitive."""
+        assert normalize_url("https://example.com/About") == "https://example.com/About"
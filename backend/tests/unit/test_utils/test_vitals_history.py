@@ -0,0 +1,199 @@
+"""
+Unit tests for the web-vitals history store.
+"""
+
+import sqlite3
+import threading
+from datetime import datetime, timezone
+
+import pytest
+from unittest.mock import Mock, patch
+
+from src.utils.vitals_history import (
+    VitalsHistoryStore,
+    close_vitals_history_store,
+    get_vitals_history_store,
+)
+
+
+def _ts(*args) -> float:
+    return datetime(*args, tzinfo=timezone.utc).timestamp()
+
+
+def _audit(business_id, url, timestamp, performance, lcp=2500.0, strategy="mobile"):
+    return {
+        "success": True,
+        "business_id": business_id,
+        "website_url": url,
+        "strategy": strategy,
+        "audit_timestamp": timestamp,
+        "scores": {
+            "performance": performance,
+            "accessibility": 90.0,
+            "best_practices": 80.0,
+            "seo": 70.0,
+        },
+        "overall_score": performance,
+        "core_web_vitals": {
+            "first_contentful_paint": 1200.4,
+            "largest_contentful_paint": lcp,
+            "cumulative_layout_shift": 0.123,
+            "total_blocking_time": None,
+            "speed_index": 3000.0,
+        },
+    }
+
+
+class TestVitalsHistoryStore:
+    """Test cases for VitalsHistoryStore."""
+
+    def test_history_range_query(self):
+        """Test points come back in time order, filtered by range and URL."""
+        store = VitalsHistoryStore()
+        for day in range(1, 6):
+            store.record_audit(
+                _audit("biz", "https://a.com", _ts(2026, 3, day), 50.0 + day)
+            )
+        store.record_audit(_audit("biz", "https://b.com", _ts(2026, 3, 3), 10.0))
+        store.record_audit(_audit("other", "https://a.com", _ts(2026, 3, 3), 99.0))
+
+        points = store.history(
+            "biz", "https://a.com", start=_ts(2026, 3, 2), end=_ts(2026, 3, 5)
+        )
+
+        assert [p["scores"]["performance"] for p in points] == [52.0, 53.0, 54.0]
+        assert points[0]["core_web_vitals"]["cumulative_layout_shift"] == 0.123
+        assert points[0]["core_web_vitals"]["first_contentful_paint"] == 1200.0
+        assert points[0]["core_web_vitals"]["total_blocking_time"] is None
+        assert len(store.history("biz")) == 6
+        assert len(store.history("biz", limit=2)) == 2
+
+    def test_trend_downsamples_by_calendar_month(self):
+        """Test monthly buckets average every audit of the month."""
+        store = VitalsHistoryStore()
+        for month, scores in ((1, [40.0, 50.0]), (2, [60.0]), (3, [70.0, 90.0])):
+            for day, score in enumerate(scores, start=1):
+                store.record_audit(
+                    _audit("biz", "https://a.com", _ts(2026, month, day * 10), score)
+                )
+
+        trend = store.trend("biz", bucket="month")
+
+        assert [b["start"] for b in trend["buckets"]] == [
+            _ts(2026, 1, 1),
+            _ts(2026, 2, 1),
+            _ts(2026, 3, 1),
+        ]
+        assert [b["overall"] for b in trend["buckets"]] == [45.0, 60.0, 80.0]
+        assert [b["count"] for b in trend["buckets"]] == [2, 1, 2]
+        assert trend["summary"]["trend"] == 35.0
+
+    def test_weekly_buckets_start_on_monday(self):
+        """Test a Sunday and the following Monday fall in different weeks."""
+        store = VitalsHistoryStore()
+        store.record_audit(_audit("biz", "https://a.com", _ts(2026, 3, 8, 12), 50.0))
+        store.record_audit(_audit("biz", "https://a.com", _ts(2026, 3, 9, 12), 70.0))
+
+        buckets = store.trend("biz", bucket="week")["buckets"]
+
+        assert [b["start"] for b in buckets] == [_ts(2026, 3, 2), _ts(2026, 3, 9)]
+
+    def test_before_after_comparison(self):
+        """Test averages on each side of the pivot, for several businesses."""
+        store = VitalsHistoryStore()
+        pivot = _ts(2026, 3, 15)
+        for day, score, lcp in ((10, 40.0, 4000.0), (12, 50.0, 3800.0)):
+            store.record_audit(
+                _audit("biz-1", "https://a.com", _ts(2026, 3, day), score, lcp)
+            )
+        store.record_audit(
+            _audit("biz-1", "https://a.com", _ts(2026, 3, 20), 75.0, 2000.0)
+        )
+        store.record_audit(_audit("biz-2", "https://b.com", _ts(2026, 3, 16), 60.0))
+
+        comparison = store.compare(["biz-1", "biz-2", "biz-3"], pivot, 7 * 86_400)
+
+        assert comparison["biz-1"]["before"]["overall"] == 45.0
+        assert comparison["biz-1"]["after_count"] == 1
+        assert comparison["biz-1"]["change"]["overall"] == 30.0
+        assert comparison["biz-1"]["change"]["largest_contentful_paint"] == -1900.0
+        assert comparison["biz-2"]["before"] is None
+        assert comparison["biz-2"]["change"] is None
+        assert comparison["biz-3"]["after_count"] == 0
+
+    def test_points_survive_reopening(self, tmp_path):
+        """Test buffered points are written on close and duplicates ignored."""
+        path = tmp_path / "history.sqlite3"
+        store = VitalsHistoryStore(path)
+        audit = _audit("biz", "https://a.com", _ts(2026, 3, 1), 50.0)
+        store.record_audit(audit)
+        store.record_audit(audit)
+        store.close()
+
+        reopened = VitalsHistoryStore(path)
+
+        assert reopened.get_stats()["points"] == 1
+        assert reopened.history("biz")[0]["scores"]["overall"] == 50.0
+
+    def test_failed_and_estimated_results_are_skipped(self):
+        """Test only real, successful audits are recorded."""
+        store = VitalsHistoryStore()
+        estimated = {**_audit("biz", "https://a.com", _ts(2026, 3, 1), 50.0)}
+        estimated["estimated"] = True
+
+        assert store.record_audit({"success": False, "error": "timeout"}) is False
+        assert store.record_audit(estimated) is False
+        assert store.get_stats()["points"] == 0
+
+    def test_submitted_audits_are_written_in_background(self):
+        """Test queued audits are written off the caller thread and seen by queries."""
+        store = VitalsHistoryStore()
+        threads = []
+        append = store.append
+
+        def recording_append(*args):
+            threads.append(threading.current_thread().name)
+            append(*args)
+
+        store.append = recording_append
+        audit = _audit("biz", "https://a.com", _ts(2026, 3, 1), 50.0)
+
+        assert store.submit_audit(audit) is True
+        audit["scores"]["performance"] = 0.0
+        assert store.submit_audit({"success": False, "error": "timeout"}) is False
+        points = store.history("biz")
+
+        assert threads and threads[0].startswith("vitals-history")
+        assert len(points) == 1
+        assert points[0]["scores"]["performance"] == 50.0
+
+    def test_writer_flushes_when_its_queue_drains(self, tmp_path):
+        """Test submitted points reach the database without a later append or query."""
+        path = tmp_path / "history.sqlite3"
+        store = VitalsHistoryStore(path)
+        for day in range(1, 4):
+            store.submit_audit(_audit("biz", "https://a.com", _ts(2026, 3, day), 50.0))
+        store._last_write.result()
+
+        with sqlite3.connect(path) as db:
+            count = db.execute("SELECT COUNT(*) FROM vitals_points").fetchone()[0]
+        store.close()
+
+        assert count == 3
+
+    def test_unknown_bucket(self):
+        """Test an unsupported bucket width is rejected."""
+        with pytest.raises(ValueError):
+            VitalsHistoryStore().trend("biz", bucket="fortnight")
+
+    def test_shared_store_defaults_to_data_dir(self, tmp_path):
+        """Test the shared history lives under DATA_DIR when no path is set."""
+        config = Mock(LIGHTHOUSE_HISTORY_PATH="", DATA_DIR=str(tmp_path / "data"))
+        close_vitals_history_store()
+        with patch("src.utils.vitals_history.get_api_config", return_value=config):
+            store = get_vitals_history_store()
+        try:
+            assert store.path == tmp_path / "data" / "leadgen_vitals_history.sqlite3"
+            assert store.path.parent.is_dir()
+        finally:
+            close_vitals_history_store()